@@ -82,6 +82,11 @@ class Settings(BaseSettings):
     AXESSO_API_KEY: str = ""
     AXESSO_API_KEY_SECONDARY: str = ""  # Optional fallback when primary returns 502/503 or auth errors
     AXESSO_URL: str = "https://api.axesso.de/zil"
+    # Hedge slow interactive Zillow requests on the secondary key: once the
+    # primary has not answered by its observed p90 latency, the same request is
+    # sent on AXESSO_API_KEY_SECONDARY and the first success wins. Extra calls
+    # are capped at ~10% of requests. Needs the secondary key.
+    AXESSO_HEDGING_ENABLED: bool = False
 
     REDFIN_API_KEY: str = ""
     RAPIDAPI_HOST: str = "redfin-base.p.rapidapi.com"
@@ -100,6 +105,12 @@ class Settings(BaseSettings):
     AIRROI_API_URL: str = "https://api.airroi.com"
     AIRROI_STR_ENABLED: bool = False
 
+    # Point every provider client at the offline stand-in server
+    # (scripts/provider_standin.py) instead of the real upstreams: requests go
+    # to "<url>/<provider>/<endpoint>". Local benchmarking and load tests only;
+    # refused in production.
+    PROVIDER_STANDIN_URL: str = ""
+
     ANTHROPIC_API_KEY: str = ""
 
     # Shared secret for triggering scheduled jobs from an external cron
@@ -125,6 +136,39 @@ class Settings(BaseSettings):
     # address within the day do not consume quota. Set to 0 to require login.
     ANON_ANALYSES_PER_DAY: int = 3
 
+    # Batch property analysis (POST /api/v1/properties/batch). Uncached
+    # addresses are fetched at most BATCH_ANALYSIS_CONCURRENCY at a time; each
+    # fetch calls every provider once, so this is also the per-provider ceiling.
+    BATCH_ANALYSIS_MAX_ADDRESSES: int = 500
+    BATCH_ANALYSIS_CONCURRENCY: int = 4
+
+    # Interactive property searches answer within this many seconds: providers
+    # still pending at the deadline are left out of the response (flagged in
+    # data_quality.is_partial / pending_sources) and keep running in the
+    # background to complete the cached entry. 0 disables the deadline.
+    PROPERTY_SEARCH_DEADLINE_SECONDS: float = 4.0
+    # Leave Zillow enrichment (tax history, schools, walk/transit/bike scores,
+    # zestimate trend) out of cold searches unless already cached: the response
+    # sets data_quality.enrichment_pending and GET /properties/{id}/enrichment
+    # fetches it once and writes it back into the cached property.
+    PROPERTY_LAZY_ENRICHMENT: bool = False
+
+    # Fleet-wide provider budgets, checked before every outbound call and shared
+    # by all web workers and the Arq worker through Redis (see
+    # app/services/provider_budget.py). Each is a comma-separated list of
+    # "<provider>=<value>" pairs keyed by provider name (RentCast, AXESSO,
+    # REDFIN, REALTOR, MASHVISOR, AirROI); providers left out are unlimited.
+    # Lower-priority work (map search, scheduled jobs, background cache
+    # refreshes) stops short of the full budget so interactive searches keep
+    # a reserve. Example: PROVIDER_RATE_LIMITS="RentCast=5,AXESSO=20"
+    PROVIDER_RATE_LIMITS: str = ""  # sustained requests per second
+    PROVIDER_MONTHLY_BUDGETS_USD: str = ""  # spend cap per calendar month (UTC)
+    PROVIDER_COST_PER_REQUEST_USD: str = ""  # what one call costs, counted against the cap
+    # Per-endpoint prices for the provider_cost_usd_total metric, overriding
+    # PROVIDER_COST_PER_REQUEST_USD for that endpoint only. Keys are
+    # "<provider>:<endpoint>", e.g. "AirROI:calculator/estimate=0.05".
+    PROVIDER_ENDPOINT_COSTS_USD: str = ""
+
     # Run the APScheduler-based job scheduler inside the web process (with a
     # Redis leader lock so exactly one scheduler runs across workers/replicas).
     # Set to false when a dedicated Arq worker service is deployed, so jobs
@@ -343,6 +387,34 @@ class Settings(BaseSettings):
         """Max upload size in bytes."""
         return self.MAX_UPLOAD_SIZE_MB * 1024 * 1024
 
+    @staticmethod
+    def _provider_values(raw: str) -> dict[str, float]:
+        """Parse "<provider>=<number>" pairs, keyed by lower-cased provider name."""
+        values: dict[str, float] = {}
+        for pair in raw.split(","):
+            name, _, value = pair.partition("=")
+            try:
+                values[name.strip().lower()] = float(value)
+            except ValueError:
+                continue
+        return values
+
+    @property
+    def provider_rate_limits(self) -> dict[str, float]:
+        return self._provider_values(self.PROVIDER_RATE_LIMITS)
+
+    @property
+    def provider_monthly_budgets_usd(self) -> dict[str, float]:
+        return self._provider_values(self.PROVIDER_MONTHLY_BUDGETS_USD)
+
+    @property
+    def provider_cost_per_request_usd(self) -> dict[str, float]:
+        return self._provider_values(self.PROVIDER_COST_PER_REQUEST_USD)
+
+    @property
+    def provider_endpoint_costs_usd(self) -> dict[str, float]:
+        return self._provider_values(self.PROVIDER_ENDPOINT_COSTS_USD)
+
     @property
     def cron_allowed_ips_list(self) -> list[str]:
         """Parse CRON_ALLOWED_IPS into a clean list for IP allow-list checks."""
@@ -424,6 +496,9 @@ def validate_settings(settings: Settings) -> None:
         if not settings.DATABASE_URL or "localhost" in settings.DATABASE_URL:
             errors.append("DATABASE_URL must be set to a production database in production mode")
 
+        if settings.PROVIDER_STANDIN_URL:
+            errors.append("PROVIDER_STANDIN_URL must not be set in production mode")
+
         # Redis is strongly recommended in production — in-memory rate
         # limiting doesn't survive multi-worker deployments.  However, the
         # RateLimitMiddleware already falls back to per-worker in-memory
@@ -1,6 +1,7 @@
 """
 Middleware stack: rate limiting, security headers, CSRF protection,
-request timing, request-ID injection, and correlation-ID logging.
+request timing, request-ID injection, correlation-ID logging, and
+provider-call origin labels.
 """
 
 import contextvars
@@ -300,6 +301,21 @@ class RequestIDMiddleware(BaseHTTPMiddleware):
             request_id_ctx.reset(token)
 
 
+class CallOriginMiddleware(BaseHTTPMiddleware):
+    """Label outbound provider calls with the route that made them.
+
+    Provider metrics (``app.services.provider_metrics``) read the matched
+    route template from the request scope, so spend and latency can be
+    broken down by API route.
+    """
+
+    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        from app.services.provider_metrics import request_scope
+
+        with request_scope(request.scope):
+            return await call_next(request)
+
+
 # ============================================
 # AUDIT LOGGING MIDDLEWARE
 # ============================================
@@ -180,26 +180,26 @@ async def lifespan(app: FastAPI):
     else:
         logger.info("Embedded scheduler disabled — background jobs delegated to Arq worker")
 
-    # Flush stale property caches on deploy so updated extraction logic takes effect
+    # No property-cache flush on deploy: keys are namespaced by formula and
+    # extraction version (app/services/property/cache.py), so a version bump
+    # moves reads to fresh keys and the old ones expire by TTL.
+
+    # Open pooled provider HTTP clients (keep-alive) before the first request
+    try:
+        from app.services.base_client import open_api_clients
+
+        await open_api_clients()
+        logger.info("Provider HTTP connection pools opened")
+    except Exception as e:
+        logger.warning("Failed to open provider HTTP clients (non-fatal): %s", e)
+
+    # Drop this worker's L1 cache entries when another worker deletes them
     try:
         from app.services.cache_service import get_cache_service
 
-        cache = get_cache_service()
-        if cache.use_redis and cache.redis_client:
-            keys = []
-            async for key in cache.redis_client.scan_iter(match="property:*"):
-                keys.append(key)
-            async for key in cache.redis_client.scan_iter(match="prop_id:*"):
-                keys.append(key)
-            if keys:
-                await cache.redis_client.delete(*keys)
-                logger.info("Flushed %d stale property cache keys on deploy", len(keys))
-            else:
-                logger.info("No property cache keys to flush")
-        else:
-            logger.info("No Redis — in-memory cache already empty on startup")
+        await get_cache_service().start_invalidation_listener()
     except Exception as e:
-        logger.warning("Failed to flush property cache on startup (non-fatal): %s", e)
+        logger.warning("Failed to start cache invalidation listener (non-fatal): %s", e)
 
     logger.info("Lifespan startup complete - yielding to app")
 
@@ -218,6 +218,19 @@ async def lifespan(app: FastAPI):
         await stop_embedded_scheduler()
     except Exception:
         pass
+    try:
+        from app.services.base_client import close_api_clients
+
+        await close_api_clients()
+        logger.info("Provider HTTP connection pools closed")
+    except Exception:
+        pass
+    try:
+        from app.services.cache_service import get_cache_service
+
+        await get_cache_service().close()
+    except Exception:
+        pass
     if close_db:
         await close_db()
         logger.info("Database connections closed")
@@ -290,6 +303,7 @@ try:
     from app.core.middleware import (
         APIVersionDeprecationMiddleware,
         AuditLoggingMiddleware,
+        CallOriginMiddleware,
         CSRFMiddleware,
         RateLimitMiddleware,
         RequestIDMiddleware,
@@ -301,6 +315,7 @@ try:
     app.add_middleware(CSRFMiddleware)
     app.add_middleware(AuditLoggingMiddleware)
     app.add_middleware(RequestIDMiddleware)
+    app.add_middleware(CallOriginMiddleware)
     app.add_middleware(RequestTimingMiddleware)
     app.add_middleware(APIVersionDeprecationMiddleware)
     app.add_middleware(
@@ -420,12 +420,16 @@ async def clear_property_cache(
     address: str | None = Query(None, description="Address to clear. Omit to flush all property keys."),
     admin_user: User = Depends(require_permission("admin:manage")),
 ):
-    """Clear cached property data. Pass `address` for a single property, or omit to flush all."""
+    """Clear cached property data. Pass `address` for a single property, or omit to flush all.
+
+    Raw provider payloads (``provider:*``) go too, so a cleared property is re-fetched.
+    """
     from app.services.cache_service import get_cache_service
+    from app.services.property_service import property_service
 
     cache = get_cache_service()
     if address:
-        ok = await cache.clear_property_cache(address)
+        ok = await property_service.clear_cached_property(address)
         return {"cleared": 1 if ok else 0, "address": address}
 
     if cache.use_redis and cache.redis_client:
@@ -436,8 +440,11 @@ async def clear_property_cache(
             keys.append(key)
         async for key in cache.redis_client.scan_iter(match="prop_id:*"):
             keys.append(key)
+        async for key in cache.redis_client.scan_iter(match="provider:*"):
+            keys.append(key)
         if keys:
             await cache.redis_client.delete(*keys)
+        await cache.broadcast_invalidation("*")
         return {"cleared": len(keys), "backend": "redis"}
 
     count = len(cache._memory_cache)
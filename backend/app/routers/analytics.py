@@ -1,10 +1,11 @@
 """
-Analytics router — IQ Verdict, Deal Score, and defaults endpoints.
+Analytics router — IQ Verdict, risk simulation, Deal Score, and defaults endpoints.
 
 Thin HTTP layer. All business logic lives in ``app.services.iq_verdict_service``.
 Schemas live in ``app.schemas.analytics``.
 """
 
+import asyncio
 import logging
 
 from fastapi import APIRouter, HTTPException, Query
@@ -16,12 +17,16 @@ from app.schemas.analytics import (
     DealScoreResponse,
     IQVerdictInput,
     IQVerdictResponse,
+    RiskSimulationInput,
+    RiskSimulationResponse,
 )
 from app.schemas.property import AnalyticsRequest, AnalyticsResponse
 from app.services.assumption_resolver import resolve_assumptions
 from app.services.assumptions_service import get_default_assumptions as get_db_default_assumptions
+from app.services.calculators import CalculationInputError
 from app.services.iq_verdict_service import compute_deal_score, compute_iq_verdict
 from app.services.property_service import property_service
+from app.services.risk_simulation import simulate_deal_risk
 
 logger = logging.getLogger(__name__)
 
@@ -64,6 +69,33 @@ async def calculate_iq_verdict(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# ===========================================
+# Risk Simulation
+# ===========================================
+
+
+@router.post("/api/v1/analysis/risk", response_model=RiskSimulationResponse)
+async def simulate_risk(
+    input_data: RiskSimulationInput,
+    db: DbSession,
+    current_user: OptionalUser = None,
+):
+    """Monte Carlo distribution of LTR/STR cash flow, LTR IRR and flip profit.
+
+    Pass ``seed`` to reproduce a run; the seed used is echoed in the response.
+    The simulation is CPU-bound, so it runs in a worker thread.
+    """
+    try:
+        assumptions = await resolve_assumptions(db, user=current_user)
+        result = await asyncio.to_thread(simulate_deal_risk, input_data, assumptions)
+        return JSONResponse(content=result.model_dump(mode="json", by_alias=True))
+    except CalculationInputError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Risk simulation error: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 # ===========================================
 # Deal Score
 # ===========================================
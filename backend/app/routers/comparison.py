@@ -10,9 +10,15 @@ from sqlalchemy import select
 from app.core.deps import CurrentUser, DbSession
 from app.models.saved_property import SavedProperty
 from app.models.search_history import SearchHistory
-from app.schemas.property import SensitivityRequest, SensitivityResponse
+from app.schemas.property import (
+    SensitivityGridAxis,
+    SensitivityGridResponse,
+    SensitivityRequest,
+    SensitivityResponse,
+)
 from app.services.assumptions_service import get_default_assumptions as get_db_default_assumptions
 from app.services.property_service import property_service
+from app.services.sensitivity_grid import compute_sensitivity_grid, grid_to_lists
 
 logger = logging.getLogger(__name__)
 
@@ -43,7 +49,12 @@ async def _user_has_cached_property_access(db: DbSession, user_id, property_id:
 
 @router.post("/api/v1/sensitivity/analyze")
 async def run_sensitivity_analysis(request: SensitivityRequest, current_user: CurrentUser, db: DbSession):
-    """Run sensitivity analysis on a key variable."""
+    """Run sensitivity analysis on one key variable, or a grid of two or three.
+
+    With ``grid``, returns a ``SensitivityGridResponse`` cube; otherwise a
+    ``SensitivityResponse`` row per ``range_pct`` step of ``variable``. Both
+    are computed in one vectorized pass over the cached property.
+    """
     try:
         if not await _user_has_cached_property_access(db, current_user.id, request.property_id):
             raise HTTPException(status_code=404, detail="Property not found")
@@ -52,69 +63,46 @@ async def run_sensitivity_analysis(request: SensitivityRequest, current_user: Cu
         if not property_data:
             raise HTTPException(status_code=404, detail="Property not found")
 
-        # Mashvisor's per-bed monthly STR revenue, when present, lets us
-        # derive a more accurate ADR fallback than the legacy $200 magic
-        # number. occupancy still falls back to 0.75 for pure-percentage
-        # math when no source provides a real number.
-        str_stats = property_data.rentals.str_market_stats
-        mash_monthly = str_stats.monthly_revenue_per_bed if str_stats else None
-        mash_occupancy = property_data.rentals.occupancy_rate or 0.65
-        mash_adr_estimate = mash_monthly / 30 / mash_occupancy if (mash_monthly and mash_occupancy > 0) else None
-        variable_mapping = {
-            "purchase_price": request.assumptions.financing.purchase_price
-            or property_data.valuations.current_value_avm
-            or 425000,
-            "interest_rate": request.assumptions.financing.interest_rate,
-            "down_payment_pct": request.assumptions.financing.down_payment_pct,
-            "monthly_rent": property_data.rentals.monthly_rent_ltr or 2100,
-            "occupancy_rate": property_data.rentals.occupancy_rate or 0.75,
-            "average_daily_rate": (property_data.rentals.average_daily_rate or mash_adr_estimate or 200),
-        }
-
-        base_value = variable_mapping.get(request.variable)
-        if base_value is None:
-            raise HTTPException(status_code=400, detail=f"Unknown variable: {request.variable}")
-
-        results = []
-        for variation in request.range_pct:
-            modified = request.assumptions.model_copy(deep=True)
-
-            if request.variable == "purchase_price":
-                modified.financing.purchase_price = base_value * (1 + variation)
-            elif request.variable == "interest_rate":
-                modified.financing.interest_rate = base_value * (1 + variation)
-            elif request.variable == "down_payment_pct":
-                modified.financing.down_payment_pct = base_value * (1 + variation)
+        axes = (
+            [(axis.variable, axis.range_pct) for axis in request.grid]
+            if request.grid
+            else [(request.variable, request.range_pct)]
+        )
+        try:
+            grid = compute_sensitivity_grid(property_data, request.assumptions, axes, request.strategies)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
 
-            analytics = await property_service.calculate_analytics(
+        if request.grid:
+            return SensitivityGridResponse(
                 property_id=request.property_id,
-                assumptions=modified,
-                strategies=request.strategies,
+                axes=[
+                    SensitivityGridAxis(
+                        variable=axis.variable,
+                        baseline_value=axis.baseline_value,
+                        range_pct=axis.range_pct,
+                        values=axis.values.tolist(),
+                    )
+                    for axis in grid.axes
+                ],
+                shape=list(grid.shape),
+                metrics={name: grid_to_lists(values) for name, values in grid.metrics.items()},
             )
 
-            result_row = {
-                "variation_pct": variation,
-                "variable_value": base_value * (1 + variation),
-                "results": {},
-            }
-
-            if analytics.ltr:
-                result_row["results"]["ltr_cash_flow"] = analytics.ltr.annual_cash_flow
-                result_row["results"]["ltr_coc"] = analytics.ltr.cash_on_cash_return
-            if analytics.str_results:
-                result_row["results"]["str_cash_flow"] = analytics.str_results.annual_cash_flow
-                result_row["results"]["str_coc"] = analytics.str_results.cash_on_cash_return
-            if analytics.flip:
-                result_row["results"]["flip_profit"] = analytics.flip.net_profit_before_tax
-                result_row["results"]["flip_roi"] = analytics.flip.roi
-
-            results.append(result_row)
-
+        axis = grid.axes[0]
+        metrics = {name: grid_to_lists(values) for name, values in grid.metrics.items()}
         return SensitivityResponse(
             property_id=request.property_id,
-            variable=request.variable,
-            baseline_value=base_value,
-            results=results,
+            variable=axis.variable,
+            baseline_value=axis.baseline_value,
+            results=[
+                {
+                    "variation_pct": variation,
+                    "variable_value": value,
+                    "results": {name: cells[i] for name, cells in metrics.items()},
+                }
+                for i, (variation, value) in enumerate(zip(axis.range_pct, axis.values.tolist(), strict=True))
+            ],
         )
     except HTTPException:
         raise
@@ -17,6 +17,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
 from app.db.session import get_db, get_engine
+from app.services.concurrency_limiter import limiter_snapshots
+from app.services.provider_budget import budget_snapshots
 
 logger = logging.getLogger(__name__)
 
@@ -279,6 +281,12 @@ async def deep_health_check(db: AsyncSession = Depends(get_db)):
         "email_verification_required": settings.FEATURE_EMAIL_VERIFICATION_REQUIRED,
     }
 
+    # 6. Outbound concurrency (per-provider adaptive limits in this worker)
+    checks["outbound_concurrency"] = limiter_snapshots()
+
+    # 7. Provider budgets (fleet-wide rate / monthly spend)
+    checks["provider_budgets"] = await budget_snapshots()
+
     return {
         "status": overall_status,
         "version": settings.APP_VERSION,
@@ -5,29 +5,37 @@ Extracted from main.py for cleaner architecture.
 """
 
 import hashlib
+import json
 import logging
 import re
 from datetime import UTC, datetime, timedelta
 from io import BytesIO
 
-from fastapi import APIRouter, HTTPException, Query, Request, status
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, File, HTTPException, Query, Request, UploadFile, status
+from fastapi.responses import Response, StreamingResponse
 from sqlalchemy import select
 
 from app.core.config import settings
-from app.core.deps import CurrentUser, DbSession, OptionalUser
+from app.core.deps import CurrentUser, DbSession, OptionalUser, ProUser
 from app.core.exceptions import ExternalAPIError, SubscriptionLimitError
 from app.core.posthog_client import posthog_client
+from app.db.session import get_session_factory
 from app.models.saved_property import SavedProperty
 from app.models.search_history import SearchHistory
 from app.schemas.property import (
+    BatchAnalysisRequest,
+    BatchAnalysisResult,
     MapSearchRequest,
     MapSearchResponse,
+    PropertyEnrichment,
     PropertyResponse,
     PropertySearchRequest,
 )
+from app.services.assumption_resolver import resolve_assumptions
+from app.services.batch_analysis_service import addresses_from_csv, analyze_addresses
 from app.services.billing_service import billing_service
 from app.services.cache_service import get_cache_service
+from app.services.iq_verdict_service import compute_iq_verdict
 from app.services.property_export_service import generate_property_data_report_excel
 from app.services.property_service import property_service
 from app.services.resilience import CircuitOpenError
@@ -150,11 +158,12 @@ async def _check_anonymous_quota(http_request: Request, full_address: str) -> tu
     counter_key = f"anon_quota:{ip}:{today}"
     marker_key = f"anon_seen:{ip}:{_address_fingerprint(full_address)}"
 
-    if await cache.exists(marker_key):
+    seen = await cache.get_many([marker_key, counter_key])
+    if marker_key in seen:
         return counter_key, marker_key, True
 
     limit = settings.ANON_ANALYSES_PER_DAY
-    used = await cache.get(counter_key) or 0
+    used = seen.get(counter_key) or 0
     if int(used) >= limit:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -177,115 +186,99 @@ async def _record_anonymous_analysis(counter_key: str, marker_key: str) -> None:
     """Count one anonymous analysis after a successful fetch (24h windows)."""
     cache = get_cache_service()
     used = await cache.get(counter_key) or 0
-    await cache.set(counter_key, int(used) + 1, ttl_seconds=86400)
-    await cache.set(marker_key, 1, ttl_seconds=86400)
-
-
-@router.post("/properties/search", response_model=PropertyResponse)
-async def search_property(
-    request: PropertySearchRequest,
-    http_request: Request,
-    db: DbSession,
-    current_user: OptionalUser = None,
-):
-    """
-    Search for a property by address.
+    await cache.set_many({counter_key: int(used) + 1, marker_key: 1}, ttl_seconds=86400)
 
-    Fetches data from RentCast and AXESSO APIs, normalizes into unified schema.
-    Returns property details, valuations, rental estimates, and data provenance.
-    Automatically records the search in the user's search history when authenticated.
 
-    Usage limits are enforced server-side: free-tier users get
-    ``searches_per_month`` distinct properties per month; anonymous users get
-    ``ANON_ANALYSES_PER_DAY`` distinct properties per IP per day. Returns 403
-    with a structured detail payload when the limit is reached.
-    """
-    full_address = _build_full_address(request)
-    search_source = request.search_source or "web"
+def _search_failure_http_error(e: Exception, full_address: str) -> HTTPException:
+    """Log a failed property search and map it to the HTTP error returned to the client."""
+    if isinstance(e, CircuitOpenError):
+        friendly_message = "Data providers are temporarily unavailable. Please try again in a few minutes."
+        logger.warning("Property search failed due to circuit breaker: %s", full_address)
+        return HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=friendly_message)
+    if isinstance(e, ExternalAPIError):
+        logger.error(f"External API error during property search: {e.message}")
+        return HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=e.message)
+    # Always log the full traceback — `str(e)` alone strips the call site
+    # and the wrapping HTTPException prevents Starlette from logging it.
+    logger.error("Property search error for %s: %s", full_address, e, exc_info=e)
+    return HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
 
-    # --- Pre-flight metering (cheap checks before the expensive fetch) ---
-    is_repeat = False
-    anon_counter_key: str | None = None
-    anon_marker_key: str | None = None
-    if current_user:
-        is_repeat = await _has_recent_successful_search(db, current_user.id, full_address)
-        if not is_repeat:
-            try:
-                await billing_service.check_analysis_allowance(db, current_user.id)
-            except SubscriptionLimitError as e:
-                if posthog_client is not None:
-                    try:
-                        posthog_client.capture(
-                            distinct_id=str(current_user.id),
-                            event="analysis_limit_reached",
-                            properties={"limit": e.limit, "current": e.current},
-                        )
-                    except Exception:
-                        pass
-                raise _analysis_limit_http_error(e)
-    else:
-        anon_counter_key, anon_marker_key, is_repeat = await _check_anonymous_quota(http_request, full_address)
 
-    logger.info(f"Searching for property: {full_address}")
+async def _preflight_search_metering(
+    db: DbSession, http_request: Request, current_user: OptionalUser, full_address: str
+) -> tuple[bool, str | None, str | None]:
+    """Cheap quota checks before the expensive fetch.
 
+    Returns ``(is_repeat, anon_counter_key, anon_marker_key)``; raises 403
+    when the caller has no analyses left.
+    """
+    if not current_user:
+        counter_key, marker_key, is_repeat = await _check_anonymous_quota(http_request, full_address)
+        return is_repeat, counter_key, marker_key
+    is_repeat = await _has_recent_successful_search(db, current_user.id, full_address)
+    if not is_repeat:
+        try:
+            await billing_service.check_analysis_allowance(db, current_user.id)
+        except SubscriptionLimitError as e:
+            if posthog_client is not None:
+                try:
+                    posthog_client.capture(
+                        distinct_id=str(current_user.id),
+                        event="analysis_limit_reached",
+                        properties={"limit": e.limit, "current": e.current},
+                    )
+                except Exception:
+                    pass
+            raise _analysis_limit_http_error(e)
+    return is_repeat, None, None
+
+
+async def _record_failed_search(
+    db: DbSession,
+    current_user: OptionalUser,
+    request: PropertySearchRequest,
+    full_address: str,
+    search_source: str,
+    error_message: str,
+) -> None:
+    """Record a failed search in the user's history (authenticated users only)."""
+    if not current_user:
+        return
     try:
-        result = await property_service.search_property(full_address, zpid=request.zpid)
-    except (ExternalAPIError, CircuitOpenError) as e:
-        # Record failed search for authenticated users
-        if current_user:
-            try:
-                await search_history_service.record_search(
-                    db=db,
-                    user_id=str(current_user.id),
-                    search_query=full_address,
-                    address_parts={
-                        "street": request.address,
-                        "city": request.city,
-                        "state": request.state,
-                        "zip": request.zip_code,
-                    },
-                    search_source=search_source,
-                    was_successful=False,
-                    error_message=getattr(e, "message", str(e)),
-                )
-            except Exception as rec_err:
-                logger.error(f"Failed to record search history: {rec_err}", exc_info=True)
-
-        if isinstance(e, CircuitOpenError):
-            friendly_message = (
-                "Data providers are temporarily unavailable. Please try again in a few minutes."
-            )
-            logger.warning("Property search failed due to circuit breaker: %s", full_address)
-            raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=friendly_message)
+        await search_history_service.record_search(
+            db=db,
+            user_id=str(current_user.id),
+            search_query=full_address,
+            address_parts={
+                "street": request.address,
+                "city": request.city,
+                "state": request.state,
+                "zip": request.zip_code,
+            },
+            search_source=search_source,
+            was_successful=False,
+            error_message=error_message,
+        )
+    except Exception as rec_err:
+        logger.error(f"Failed to record search history: {rec_err}", exc_info=True)
 
-        logger.error(f"External API error during property search: {e.message}")
-        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=e.message)
-    except Exception as e:
-        # Record failed search for authenticated users
-        if current_user:
-            try:
-                await search_history_service.record_search(
-                    db=db,
-                    user_id=str(current_user.id),
-                    search_query=full_address,
-                    address_parts={
-                        "street": request.address,
-                        "city": request.city,
-                        "state": request.state,
-                        "zip": request.zip_code,
-                    },
-                    search_source=search_source,
-                    was_successful=False,
-                    error_message=str(e),
-                )
-            except Exception as rec_err:
-                logger.error(f"Failed to record search history: {rec_err}", exc_info=True)
-        # Always log the full traceback — `str(e)` alone strips the call site
-        # and the wrapping HTTPException prevents Starlette from logging it.
-        logger.exception("Property search error for %s: %s", full_address, e)
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
 
-    # Record successful search for authenticated users
+async def _record_successful_search(
+    db: DbSession,
+    current_user: OptionalUser,
+    request: PropertySearchRequest,
+    full_address: str,
+    search_source: str,
+    result: PropertyResponse,
+    metering: tuple[bool, str | None, str | None],
+    *,
+    charge: bool = True,
+) -> None:
+    """Record search history and charge the analysis once a search succeeded.
+
+    ``charge=False`` skips the charge when ``_charge_search`` already ran.
+    """
+    is_repeat = metering[0]
     if current_user:
         try:
             addr = result.address
@@ -320,15 +313,8 @@ async def search_property(
         except Exception as rec_err:
             logger.error(f"Failed to record search history: {rec_err}", exc_info=True)
 
-        # Count the analysis only after a successful fetch of a new property.
-        if not is_repeat:
-            try:
-                await billing_service.record_analysis(db, current_user.id, property_address=full_address)
-            except SubscriptionLimitError:
-                # Lost a pre-flight race; the data was already fetched, so serve it.
-                logger.warning("Analysis limit race for user %s on %s", current_user.id, full_address)
-            except Exception as usage_err:
-                logger.error(f"Failed to record analysis usage: {usage_err}", exc_info=True)
+        if charge:
+            await _charge_search(db, current_user, full_address, metering)
 
         if posthog_client is not None:
             try:
@@ -347,13 +333,241 @@ async def search_property(
                 pass
     else:
         logger.debug("Search history not recorded: no authenticated user")
-        if not is_repeat and anon_counter_key and anon_marker_key:
+        if charge:
+            await _charge_search(db, current_user, full_address, metering)
+
+
+async def _charge_search(
+    db: DbSession,
+    current_user: OptionalUser,
+    full_address: str,
+    metering: tuple[bool, str | None, str | None],
+) -> None:
+    """Count the analysis against the caller's quota (repeat searches are free)."""
+    is_repeat, anon_counter_key, anon_marker_key = metering
+    if is_repeat:
+        return
+    if current_user:
+        try:
+            await billing_service.record_analysis(db, current_user.id, property_address=full_address)
+        except SubscriptionLimitError:
+            # Lost a pre-flight race; the data was already fetched, so serve it.
+            logger.warning("Analysis limit race for user %s on %s", current_user.id, full_address)
+        except Exception as usage_err:
+            logger.error(f"Failed to record analysis usage: {usage_err}", exc_info=True)
+    elif anon_counter_key and anon_marker_key:
+        try:
+            await _record_anonymous_analysis(anon_counter_key, anon_marker_key)
+        except Exception as anon_err:
+            logger.warning("Failed to record anonymous analysis quota: %s", anon_err)
+
+
+@router.post("/properties/search", response_model=PropertyResponse)
+async def search_property(
+    request: PropertySearchRequest,
+    http_request: Request,
+    db: DbSession,
+    current_user: OptionalUser = None,
+):
+    """
+    Search for a property by address.
+
+    Fetches data from RentCast and AXESSO APIs, normalizes into unified schema.
+    Returns property details, valuations, rental estimates, and data provenance.
+    Automatically records the search in the user's search history when authenticated.
+
+    Usage limits are enforced server-side: free-tier users get
+    ``searches_per_month`` distinct properties per month; anonymous users get
+    ``ANON_ANALYSES_PER_DAY`` distinct properties per IP per day. Returns 403
+    with a structured detail payload when the limit is reached.
+    """
+    full_address = _build_full_address(request)
+    search_source = request.search_source or "web"
+    metering = await _preflight_search_metering(db, http_request, current_user, full_address)
+
+    logger.info(f"Searching for property: {full_address}")
+
+    try:
+        result = await property_service.search_property(full_address, zpid=request.zpid)
+    except Exception as e:
+        # Record failed search for authenticated users
+        await _record_failed_search(
+            db, current_user, request, full_address, search_source, getattr(e, "message", None) or str(e)
+        )
+        raise _search_failure_http_error(e, full_address)
+
+    await _record_successful_search(db, current_user, request, full_address, search_source, result, metering)
+
+    # ``result`` is already a validated PropertyResponse; serialize it directly
+    # instead of letting response_model dump and re-validate it.
+    return Response(content=result.model_dump_json(), media_type="application/json")
+
+
+def _sse(event: str, data: str) -> str:
+    """One server-sent event frame; ``data`` is a single line of JSON."""
+    return f"event: {event}\ndata: {data}\n\n"
+
+
+@router.post("/properties/search/stream", summary="Progressive property search (server-sent events)")
+async def search_property_stream(
+    request: PropertySearchRequest,
+    http_request: Request,
+    db: DbSession,
+    current_user: OptionalUser = None,
+):
+    """
+    Streaming variant of ``POST /properties/search`` that shows data as it arrives.
+
+    Streams ``text/event-stream`` events:
+
+    - ``partial``: ``{"stage": <provider>, "property": PropertyResponse}`` as
+      each provider answers a cold search, built from the providers so far
+      (``data_quality.pending_sources`` lists the rest).
+    - ``property``: the complete ``PropertyResponse`` (AirROI estimate and
+      enrichment included), identical to the non-streaming response.
+    - ``verdict``: the IQ Verdict against the caller's saved assumptions
+      (omitted without a usable price).
+    - ``error``: ``{"status": ..., "detail": ...}`` when the search fails; ends the stream.
+
+    Metering and search history work as for ``POST /properties/search``;
+    an exhausted quota is a plain 403 before the stream starts.
+    """
+    full_address = _build_full_address(request)
+    search_source = request.search_source or "web"
+    metering = await _preflight_search_metering(db, http_request, current_user, full_address)
+    assumptions = await resolve_assumptions(db, user=current_user)
+
+    logger.info(f"Searching for property (stream): {full_address}")
+
+    async def _events():
+        # The request's DB session is closed once the response starts
+        # streaming, so history is written through a session of our own.
+        result: PropertyResponse | None = None
+        charged = False
+        try:
+            async for stage, response in property_service.search_property_progressive(full_address, zpid=request.zpid):
+                if stage == "complete":
+                    result = response
+                    continue
+                # Partials already carry most of the analysis: charge before
+                # the first one, so closing the stream early isn't free.
+                if not charged:
+                    async with get_session_factory()() as billing_db:
+                        await _charge_search(billing_db, current_user, full_address, metering)
+                    charged = True
+                payload = {"stage": stage, "property": response.model_dump(mode="json")}
+                yield _sse("partial", json.dumps(payload))
+        except Exception as e:
+            async with get_session_factory()() as history_db:
+                await _record_failed_search(
+                    history_db,
+                    current_user,
+                    request,
+                    full_address,
+                    search_source,
+                    getattr(e, "message", None) or str(e),
+                )
+            error = _search_failure_http_error(e, full_address)
+            yield _sse("error", json.dumps({"status": error.status_code, "detail": error.detail}))
+            return
+
+        # Charge (unless a partial already did) before the complete property
+        # goes out, so closing the stream as soon as it arrives doesn't skip metering.
+        async with get_session_factory()() as history_db:
+            await _record_successful_search(
+                history_db, current_user, request, full_address, search_source, result, metering, charge=not charged
+            )
+
+        yield _sse("property", result.model_dump_json())
+        verdict_input = property_service.build_verdict_input(result)
+        if verdict_input is not None:
             try:
-                await _record_anonymous_analysis(anon_counter_key, anon_marker_key)
-            except Exception as anon_err:
-                logger.warning("Failed to record anonymous analysis quota: %s", anon_err)
+                verdict = compute_iq_verdict(verdict_input, assumptions=assumptions)
+                yield _sse("verdict", verdict.model_dump_json(by_alias=True))
+            except Exception:
+                logger.exception("Streamed search verdict failed for %s", full_address)
 
-    return result
+    return StreamingResponse(
+        _events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+async def _record_batch_search(db, user_id: str, result: BatchAnalysisResult) -> None:
+    """Record one batch result in search history (grants GET /properties/{id} access)."""
+    await search_history_service.record_search(
+        db=db,
+        user_id=user_id,
+        search_query=result.address,
+        property_cache_id=result.property_id,
+        zpid=result.zpid,
+        search_source="batch",
+        was_successful=result.status == "ok",
+        error_message=result.error,
+    )
+
+
+async def _batch_analysis_response(
+    addresses: list[str], concurrency: int | None, db: DbSession, current_user: ProUser
+) -> StreamingResponse:
+    if len(addresses) > settings.BATCH_ANALYSIS_MAX_ADDRESSES:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"At most {settings.BATCH_ANALYSIS_MAX_ADDRESSES} addresses per batch",
+        )
+    assumptions = await resolve_assumptions(db, user=current_user)
+    ceiling = min(concurrency or settings.BATCH_ANALYSIS_CONCURRENCY, settings.BATCH_ANALYSIS_CONCURRENCY)
+    user_id = str(current_user.id)
+    logger.info("Batch analysis: %d addresses for user %s (concurrency=%d)", len(addresses), user_id, ceiling)
+
+    async def _lines():
+        # The request's DB session is closed once the response starts
+        # streaming, so history is written through a session of our own.
+        async with get_session_factory()() as history_db:
+            async for result in analyze_addresses(addresses, assumptions=assumptions, concurrency=ceiling):
+                yield result.model_dump_json() + "\n"
+                if result.property_id:
+                    try:
+                        await _record_batch_search(history_db, user_id, result)
+                    except Exception as rec_err:
+                        logger.error(f"Failed to record batch search history: {rec_err}", exc_info=True)
+
+    return StreamingResponse(_lines(), media_type="application/x-ndjson")
+
+
+@router.post("/properties/batch", summary="Analyze a list of addresses (NDJSON stream)")
+async def batch_analyze_properties(request: BatchAnalysisRequest, db: DbSession, current_user: ProUser):
+    """
+    Search and score up to ``BATCH_ANALYSIS_MAX_ADDRESSES`` addresses in one call.
+
+    Streams ``application/x-ndjson``: one ``BatchAnalysisResult`` line per
+    distinct address, in completion order, each with the IQ Verdict computed
+    against the caller's saved assumptions. Cached properties come back
+    first; uncached ones are fetched ``BATCH_ANALYSIS_CONCURRENCY`` at a
+    time. Invalid or failed addresses are reported in-stream with
+    ``status: "error"`` rather than failing the batch. Requires Pro.
+    """
+    return await _batch_analysis_response(request.addresses, request.concurrency, db, current_user)
+
+
+@router.post("/properties/batch/csv", summary="Analyze addresses from a CSV upload (NDJSON stream)")
+async def batch_analyze_properties_csv(
+    db: DbSession,
+    current_user: ProUser,
+    file: UploadFile = File(...),
+    concurrency: int | None = Query(None, ge=1, description="Lower the fetch concurrency (capped server-side)"),
+):
+    """
+    Same as ``POST /properties/batch``, reading addresses from a CSV file.
+
+    Use an ``address`` column (plus optional ``city``, ``state`` and ``zip``
+    columns), or one full address per line without a header.
+    """
+    addresses = addresses_from_csv(await file.read())
+    if not addresses:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="No addresses found in CSV")
+    return await _batch_analysis_response(addresses, concurrency, db, current_user)
 
 
 @router.post(
@@ -429,19 +643,22 @@ async def search_property_area(
 async def get_property(property_id: str, current_user: CurrentUser, db: DbSession):
     """
     Get cached property data by ID.
+
+    The cached payload is served as-is, so it is encoded straight to JSON
+    rather than round-tripping through ``PropertyResponse``.
     """
     try:
         if not await _user_has_cached_property_access(db, current_user.id, property_id):
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Property not found")
 
-        cached = await property_service.get_cached_property(property_id)
+        cached = await property_service.get_cached_property_json(property_id)
         if not cached:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Property not found in cache. Please search for the property first.",
             )
 
-        return cached
+        return Response(content=cached, media_type="application/json")
 
     except HTTPException:
         raise
@@ -450,6 +667,35 @@ async def get_property(property_id: str, current_user: CurrentUser, db: DbSessio
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
 
 
+@router.get("/properties/{property_id}/enrichment", response_model=PropertyEnrichment)
+async def get_property_enrichment(property_id: str, current_user: CurrentUser, db: DbSession):
+    """
+    Get Zillow enrichment (tax history, nearby schools, walk/transit/bike
+    scores, zestimate trend) for a cached property.
+
+    With ``PROPERTY_LAZY_ENRICHMENT`` searches return before enrichment is
+    fetched (``data_quality.enrichment_pending``); the first call here fetches
+    it once and stores it in the cached property.
+    """
+    try:
+        if not await _user_has_cached_property_access(db, current_user.id, property_id):
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Property not found")
+
+        enrichment = await property_service.get_property_enrichment(property_id)
+        if enrichment is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Property not found in cache. Please search for the property first.",
+            )
+        return enrichment
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Get property enrichment error: {e!s}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+
+
 # ============================================
 # PHOTOS
 # ============================================
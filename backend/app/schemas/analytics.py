@@ -495,3 +495,76 @@ class DealScoreResponse(BaseModel):
     grade: str = Field("C")
     color: str = Field("#f97316")
     calculation_details: dict
+
+
+# ===========================================
+# Risk Simulation
+# ===========================================
+
+
+class RiskDriverSpreads(BaseModel):
+    """Standard deviation of each simulated driver around its base value."""
+
+    model_config = ConfigDict(alias_generator=_to_camel, populate_by_name=True)
+
+    rent: float = Field(0.10, ge=0, le=1, description="Log-scale spread of market rent (and STR ADR)")
+    vacancy: float = Field(0.03, ge=0, le=0.5, description="Absolute spread of the LTR vacancy rate")
+    appreciation: float = Field(0.03, ge=0, le=0.5, description="Absolute spread of annual appreciation")
+    interest_rate: float = Field(0.0075, ge=0, le=0.1, description="Absolute spread of the loan rate")
+    rehab_overrun: float = Field(0.20, ge=0, le=2, description="Log-scale spread of the rehab cost multiplier")
+    str_occupancy: float = Field(0.08, ge=0, le=0.5, description="Absolute spread of STR occupancy")
+
+
+class RiskSimulationInput(BaseModel):
+    """Input for Monte Carlo deal-risk simulation."""
+
+    model_config = ConfigDict(alias_generator=_to_camel, populate_by_name=True)
+
+    purchase_price: float = Field(..., gt=0, le=100_000_000)
+    monthly_rent: float = Field(0, ge=0, le=1_000_000)
+    property_taxes: float = Field(0, ge=0, le=1_000_000, description="Annual property taxes")
+    insurance: float | None = Field(None, ge=0, le=1_000_000, description="Annual insurance (insurance_pct if omitted)")
+    hoa_fees_monthly: float = Field(0, ge=0, le=10_000)
+    arv: float | None = Field(None, gt=0, le=100_000_000, description="Flip ARV (purchase price x 1.06 if omitted)")
+    rehab_cost: float | None = Field(None, ge=0, le=10_000_000, description="Flip rehab budget (from ARV if omitted)")
+    average_daily_rate: float | None = Field(None, ge=0, le=100_000, description="STR ADR; STR is skipped without one")
+    occupancy_rate: float | None = Field(None, ge=0.0, le=1.0, description="STR occupancy (0.75 if omitted)")
+    strategies: list[Literal["ltr", "str", "flip"]] = Field(default_factory=lambda: ["ltr", "str", "flip"])
+    paths: int = Field(10_000, ge=100, le=20_000, description="Number of simulated scenarios")
+    seed: int | None = Field(None, ge=0, description="Seed for reproducible draws (random when omitted)")
+    horizon_years: int = Field(5, ge=1, le=10, description="LTR hold period for IRR, sold at the end")
+    spreads: RiskDriverSpreads = Field(default_factory=RiskDriverSpreads)
+
+
+class RiskDistribution(BaseModel):
+    """Summary of one simulated outcome across paths."""
+
+    model_config = ConfigDict(alias_generator=_to_camel, populate_by_name=True)
+
+    mean: float
+    std: float
+    percentiles: dict[str, float] = Field(..., description="p5, p10, p25, p50, p75, p90, p95")
+
+
+class StrategyRiskResult(BaseModel):
+    """Simulated outcome distribution for one strategy."""
+
+    model_config = ConfigDict(alias_generator=_to_camel, populate_by_name=True)
+
+    metric: str = Field(..., description="annual_cash_flow (LTR, STR) or net_profit (flip)")
+    distribution: RiskDistribution
+    probability_negative: float = Field(..., description="Share of paths where the metric is below $0")
+    value_at_risk_95: float = Field(..., description="Loss exceeded on only 5% of paths (0 when p5 is a gain)")
+    expected_shortfall_95: float = Field(..., description="Average loss over the worst 5% of paths")
+    irr: RiskDistribution | None = Field(None, description="LTR IRR over horizon_years, on paths where it exists")
+
+
+class RiskSimulationResponse(BaseModel):
+    """Monte Carlo deal-risk results."""
+
+    model_config = ConfigDict(alias_generator=_to_camel, populate_by_name=True)
+
+    paths: int
+    seed: int
+    horizon_years: int
+    strategies: dict[str, StrategyRiskResult]
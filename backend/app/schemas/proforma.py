@@ -3,11 +3,15 @@ Financial Proforma Schemas - Accounting-Standard Export
 Pydantic models for proforma generation and export
 """
 
+from collections.abc import Iterator, Sequence
 from datetime import datetime
 from enum import StrEnum
-from typing import Any, Literal
+from functools import cached_property
+from typing import Any, Literal, overload
 
-from pydantic import BaseModel, Field
+import numpy as np
+from pydantic import BaseModel, Field, GetCoreSchemaHandler
+from pydantic_core import core_schema
 
 
 class DepreciationMethod(StrEnum):
@@ -89,6 +93,102 @@ class AmortizationRow(BaseModel):
     cumulative_interest: float
 
 
+class AmortizationTable(Sequence[AmortizationRow]):
+    """Amortization schedule stored as one array per ``AmortizationRow`` field.
+
+    Reads as a sequence of ``AmortizationRow``, building each row only when it
+    is indexed or iterated (the Excel tab). Serializes straight from the
+    columns to the same JSON as ``list[AmortizationRow]``, and answers yearly
+    rollups from a per-year index built once.
+    """
+
+    COLUMNS = tuple(AmortizationRow.model_fields)
+    INT_COLUMNS = ("month", "year", "payment_number")
+
+    def __init__(self, **columns: Any):
+        missing = set(self.COLUMNS) - set(columns)
+        if missing:
+            raise ValueError(f"Missing amortization columns: {sorted(missing)}")
+        self._columns: dict[str, np.ndarray] = {}
+        for name in self.COLUMNS:
+            column = np.array(columns[name], dtype=np.int64 if name in self.INT_COLUMNS else np.float64)
+            column.flags.writeable = False
+            self._columns[name] = column
+        if len({column.shape for column in self._columns.values()}) > 1:
+            raise ValueError("Amortization columns must have the same length")
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[AmortizationRow]) -> "AmortizationTable":
+        return cls(**{name: [getattr(row, name) for row in rows] for name in cls.COLUMNS})
+
+    def column(self, name: str) -> np.ndarray:
+        """Read-only array for one field, e.g. ``column("ending_balance")``."""
+        return self._columns[name]
+
+    def __len__(self) -> int:
+        return len(self._columns["month"])
+
+    @overload
+    def __getitem__(self, index: int) -> AmortizationRow: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "AmortizationTable": ...
+
+    def __getitem__(self, index: int | slice) -> "AmortizationRow | AmortizationTable":
+        if isinstance(index, slice):
+            return AmortizationTable(**{name: column[index] for name, column in self._columns.items()})
+        return AmortizationRow(**{name: column[index].item() for name, column in self._columns.items()})
+
+    def __iter__(self) -> Iterator[AmortizationRow]:
+        for row in self.to_dicts():
+            yield AmortizationRow(**row)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, AmortizationTable):
+            return NotImplemented
+        return all(np.array_equal(self._columns[name], other._columns[name]) for name in self.COLUMNS)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"AmortizationTable({len(self)} rows)"
+
+    def to_dicts(self) -> list[dict[str, Any]]:
+        """Rows as plain dicts, without building ``AmortizationRow`` objects."""
+        values = [column.tolist() for column in self._columns.values()]
+        return [dict(zip(self.COLUMNS, row, strict=True)) for row in zip(*values, strict=True)]
+
+    @cached_property
+    def _yearly(self) -> dict[int, tuple[float, float, float]]:
+        years = self._columns["year"]
+        if not len(years):
+            return {}
+        ends = np.flatnonzero(np.append(years[1:] != years[:-1], True))
+        starts = np.append(0, ends[:-1] + 1)
+        interest = np.add.reduceat(self._columns["interest_payment"], starts)
+        principal = np.add.reduceat(self._columns["principal_payment"], starts)
+        balance = self._columns["ending_balance"][ends]
+        return {
+            year: (i, p, b)
+            for year, i, p, b in zip(
+                years[ends].tolist(), interest.tolist(), principal.tolist(), balance.tolist(), strict=True
+            )
+        }
+
+    def year_totals(self, year: int) -> tuple[float, float, float]:
+        """Interest paid, principal paid and ending balance for ``year``; zeros past the term."""
+        return self._yearly.get(year, (0, 0, 0))
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source: Any, handler: GetCoreSchemaHandler) -> core_schema.CoreSchema:
+        from_rows = core_schema.no_info_after_validator_function(cls.from_rows, handler(list[AmortizationRow]))
+        return core_schema.json_or_python_schema(
+            json_schema=from_rows,
+            python_schema=core_schema.union_schema([core_schema.is_instance_schema(cls), from_rows]),
+            serialization=core_schema.plain_serializer_function_ser_schema(lambda table: table.to_dicts()),
+        )
+
+
 class AmortizationSummary(BaseModel):
     """Summary of loan amortization."""
 
@@ -331,7 +431,7 @@ class FinancialProforma(BaseModel):
     projections: Projections
 
     # Amortization
-    amortization_schedule: list[AmortizationRow]
+    amortization_schedule: AmortizationTable
     amortization_summary: AmortizationSummary
 
     # Exit Analysis
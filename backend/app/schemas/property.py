@@ -383,6 +383,13 @@ class DataQuality(BaseModel):
     missing_fields: list[str] = []
     stale_fields: list[str] = []
     conflict_fields: list[str] = []
+    # Built before every provider answered (search deadline); the cached entry
+    # is completed in the background once ``pending_sources`` arrive.
+    is_partial: bool = False
+    pending_sources: list[str] = []
+    # Zillow enrichment (tax history, schools, scores, zestimate trend) was
+    # deferred; GET /properties/{id}/enrichment computes it.
+    enrichment_pending: bool = False
 
 
 class PriceHistoryEvent(BaseModel):
@@ -1109,6 +1116,18 @@ class PropertyResponse(BaseModel):
     fetched_at: datetime
 
 
+class PropertyEnrichment(BaseModel):
+    """Zillow enrichment for a cached property (``GET /properties/{id}/enrichment``)."""
+
+    property_id: str
+    tax_history: list[TaxHistoryEntry] | None = None
+    nearby_schools: list[NearbySchool] | None = None
+    zestimate_history: list[ZestimateHistoryPoint] | None = None
+    walk_score: int | None = Field(None, ge=0, le=100)
+    transit_score: int | None = Field(None, ge=0, le=100)
+    bike_score: int | None = Field(None, ge=0, le=100)
+
+
 class AnalyticsRequest(BaseModel):
     """Request to calculate analytics."""
 
@@ -1136,15 +1155,33 @@ class AnalyticsResponse(BaseModel):
     model_config = {"populate_by_name": True}
 
 
+class SensitivityAxis(BaseModel):
+    """One variable swept by a sensitivity grid."""
+
+    variable: str  # e.g., "purchase_price", "interest_rate", "monthly_rent"
+    range_pct: list[float] = Field(default=[-0.10, -0.05, 0, 0.05, 0.10], min_length=1, max_length=41)
+
+
 class SensitivityRequest(BaseModel):
-    """Request for sensitivity analysis."""
+    """Request for sensitivity analysis.
+
+    Either ``variable`` (one-variable sweep over ``range_pct``) or ``grid``
+    (two or three variables swept together into a dense metric cube).
+    """
 
     property_id: str
     assumptions: AllAssumptions
-    variable: str  # e.g., "purchase_price", "interest_rate", "occupancy"
-    range_pct: list[float] = [-0.10, -0.05, 0, 0.05, 0.10]
+    variable: str | None = None  # e.g., "purchase_price", "interest_rate", "occupancy_rate"
+    range_pct: list[float] = Field(default=[-0.10, -0.05, 0, 0.05, 0.10], min_length=1, max_length=41)
+    grid: list[SensitivityAxis] | None = Field(default=None, min_length=1, max_length=3)
     strategies: list[StrategyType] | None = None
 
+    @model_validator(mode="after")
+    def _require_variable_or_grid(self) -> "SensitivityRequest":
+        if not self.variable and not self.grid:
+            raise ValueError("either variable or grid is required")
+        return self
+
 
 class SensitivityResponse(BaseModel):
     """Sensitivity analysis results."""
@@ -1155,6 +1192,30 @@ class SensitivityResponse(BaseModel):
     results: list[dict[str, Any]]
 
 
+class SensitivityGridAxis(BaseModel):
+    """A swept variable and its value at each grid step."""
+
+    variable: str
+    baseline_value: float
+    range_pct: list[float]
+    values: list[float]
+
+
+class SensitivityGridResponse(BaseModel):
+    """Dense sensitivity cube.
+
+    ``metrics`` maps each metric (``ltr_cash_flow``, ``ltr_coc``,
+    ``str_cash_flow``, ``str_coc``, ``flip_profit``, ``flip_roi``) to nested
+    lists indexed by the axes in order, e.g. ``metrics["ltr_cash_flow"][i][j]``
+    for ``axes[0].values[i]`` × ``axes[1].values[j]``.
+    """
+
+    property_id: str
+    axes: list[SensitivityGridAxis]
+    shape: list[int]
+    metrics: dict[str, Any]
+
+
 class ExportRequest(BaseModel):
     """Request to export analysis."""
 
@@ -1172,6 +1233,39 @@ class ExportResponse(BaseModel):
     expires_at: datetime
 
 
+# ============================================
+# BATCH ANALYSIS
+# ============================================
+
+
+class BatchAnalysisRequest(BaseModel):
+    """Request to analyze a list of addresses in one call."""
+
+    addresses: list[str] = Field(
+        ...,
+        min_length=1,
+        description="Full addresses (example: '1451 NW 10 St, Boca Raton, FL 33486')",
+    )
+    concurrency: int | None = Field(
+        default=None,
+        ge=1,
+        description="Lower the number of uncached addresses fetched at once (capped server-side)",
+    )
+
+
+class BatchAnalysisResult(BaseModel):
+    """One NDJSON line of a batch analysis stream, emitted per distinct address."""
+
+    indexes: list[int]  # Positions in the request that resolved to this address
+    address: str
+    status: Literal["ok", "error"]
+    cached: bool = False  # Served from the property cache without a provider fetch
+    property_id: str | None = None
+    zpid: str | None = None
+    verdict: dict[str, Any] | None = None  # Same shape as POST /api/v1/analysis/verdict
+    error: str | None = None
+
+
 # ============================================
 # MAP SEARCH
 # ============================================
@@ -9,6 +9,7 @@ Uses BaseAPIClient for shared request logic including:
 """
 
 import logging
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from enum import StrEnum
@@ -89,6 +90,8 @@ class RentCastClient(BaseAPIClient[APIResponse]):
             connect_timeout=5.0,
             max_retries=3,
             enable_circuit_breaker=True,
+            max_connections=20,
+            max_keepalive_connections=10,
         )
 
     def _get_headers(self) -> dict[str, str]:
@@ -355,6 +358,12 @@ class AXESSOClient(BaseAPIClient[APIResponse]):
             connect_timeout=5.0,
             max_retries=3,
             enable_circuit_breaker=True,
+            max_connections=20,
+            max_keepalive_connections=10,
+            http2=True,
+            # Shares the "AXESSO" concurrency window with ZillowClient; match its
+            # pool size so whichever client is built first sets the same bounds.
+            max_concurrency=50,
         )
 
     def _get_headers(self) -> dict[str, str]:
@@ -482,6 +491,9 @@ class RedfinClient(BaseAPIClient[APIResponse]):
             connect_timeout=5.0,
             max_retries=2,
             enable_circuit_breaker=True,
+            max_connections=10,
+            max_keepalive_connections=5,
+            http2=True,
         )
         self.rapidapi_host = rapidapi_host
 
@@ -772,6 +784,9 @@ class RealtorClient(BaseAPIClient[APIResponse]):
             connect_timeout=5.0,
             max_retries=2,
             enable_circuit_breaker=True,
+            max_connections=10,
+            max_keepalive_connections=5,
+            http2=True,
         )
         self.rapidapi_host = rapidapi_host
 
@@ -991,6 +1006,9 @@ class MashvisorClient(BaseAPIClient[APIResponse]):
             connect_timeout=5.0,
             max_retries=2,
             enable_circuit_breaker=True,
+            max_connections=10,
+            max_keepalive_connections=5,
+            http2=True,
         )
         self.rapidapi_host = rapidapi_host
 
@@ -1022,6 +1040,15 @@ class MashvisorClient(BaseAPIClient[APIResponse]):
     def _get_provider_name(self) -> str:
         return "MASHVISOR"
 
+    def _get_metrics_endpoint(self, endpoint: str) -> str:
+        """Collapse the state/city/neighborhood path segments into placeholders."""
+        parts = endpoint.split("/")
+        if parts[0] == "city" and len(parts) == 4:
+            return f"city/{parts[1]}/{{state}}/{{city}}"
+        if parts[0] == "neighborhood" and len(parts) > 2:
+            return "/".join(["neighborhood", "{id}", *parts[2:]])
+        return endpoint
+
     async def str_lookup(
         self,
         state: str,
@@ -1380,6 +1407,8 @@ class AirROIClient(BaseAPIClient[APIResponse]):
             connect_timeout=5.0,
             max_retries=2,
             enable_circuit_breaker=True,
+            max_connections=5,
+            max_keepalive_connections=2,
         )
 
     def _get_headers(self) -> dict[str, str]:
@@ -1506,6 +1535,50 @@ class AirROIClient(BaseAPIClient[APIResponse]):
         return result
 
 
+# Fields RentCast returns keyed by year; the latest year's entry holds the value.
+# e.g. propertyTaxes: {"2024": {"year": 2024, "total": 6471}, ...}
+_LATEST_YEAR_FIELDS = {"propertyTaxes": "total", "taxAssessments": "value"}
+
+
+def _compile_field_path(path: str | None) -> Callable[[dict[str, Any] | None], Any] | None:
+    """Compile a dotted ``FIELD_MAPPING`` path into an accessor over a provider payload.
+
+    Paths are split once, at class definition, instead of on every
+    ``normalize`` call. ``None`` (provider has no such field) stays ``None``.
+    """
+    if path is None:
+        return None
+    if path in _LATEST_YEAR_FIELDS:
+        leaf = _LATEST_YEAR_FIELDS[path]
+
+        def latest_year(data: dict[str, Any] | None) -> Any:
+            value = data.get(path) if isinstance(data, dict) else None
+            if not isinstance(value, dict):
+                return value
+            years = [k for k in value if k.isdigit()]
+            if not years:
+                return None
+            year_data = value.get(max(years))
+            return year_data.get(leaf) if isinstance(year_data, dict) else None
+
+        return latest_year
+
+    keys = tuple(path.split("."))
+    if len(keys) == 1:
+        key = keys[0]
+        return lambda data: data.get(key) if isinstance(data, dict) else None
+
+    def nested(data: dict[str, Any] | None) -> Any:
+        value: Any = data
+        for k in keys:
+            if not isinstance(value, dict):
+                return None
+            value = value.get(k)
+        return value
+
+    return nested
+
+
 class DataNormalizer:
     """
     Normalizes and merges data from multiple API providers
@@ -1570,6 +1643,12 @@ class DataNormalizer:
         "hoa_fees_monthly": (None, "monthlyHoaFee", "axesso"),
     }
 
+    # FIELD_MAPPING with both paths compiled: (canonical_field, rentcast_get, axesso_get, priority)
+    _FIELD_ACCESSORS = tuple(
+        (canonical, _compile_field_path(rc_field), _compile_field_path(ax_field), priority)
+        for canonical, (rc_field, ax_field, priority) in FIELD_MAPPING.items()
+    )
+
     def __init__(self):
         self.conflict_threshold = 0.15  # 15% difference triggers conflict flag
         self.iq_outlier_threshold = 0.20  # 20% median-band filter for IQ estimates
@@ -1589,10 +1668,11 @@ class DataNormalizer:
         """
         normalized = {}
         provenance = {}
+        ts = timestamp.isoformat()
 
-        for canonical_field, (rc_field, ax_field, priority) in self.FIELD_MAPPING.items():
-            rc_value = self._get_nested_value(rentcast_data, rc_field) if rc_field else None
-            ax_value = self._get_nested_value(axesso_data, ax_field) if ax_field else None
+        for canonical_field, rc_get, ax_get, priority in self._FIELD_ACCESSORS:
+            rc_value = rc_get(rentcast_data) if rc_get else None
+            ax_value = ax_get(axesso_data) if ax_get else None
 
             # Determine final value based on priority and availability
             final_value = None
@@ -1649,7 +1729,7 @@ class DataNormalizer:
 
             provenance[canonical_field] = {
                 "source": source or "missing",
-                "fetched_at": timestamp.isoformat(),
+                "fetched_at": ts,
                 "confidence": confidence,
                 "raw_values": raw_values if raw_values else None,
                 "conflict_flag": conflict,
@@ -1668,7 +1748,7 @@ class DataNormalizer:
                     normalized["hoa_fees_monthly"] = hoa_monthly
                     provenance["hoa_fees_monthly"] = {
                         "source": "axesso",
-                        "fetched_at": timestamp.isoformat(),
+                        "fetched_at": ts,
                         "confidence": "medium",
                         "raw_values": {"axesso_resoFacts": hoa_monthly},
                         "conflict_flag": False,
@@ -2263,10 +2343,11 @@ class DataNormalizer:
             "page_view_count",
             "favorite_count",
         ]
+        ts = timestamp.isoformat()
         for fname in listing_fields:
             provenance[fname] = {
                 "source": "axesso",
-                "fetched_at": timestamp.isoformat(),
+                "fetched_at": ts,
                 "confidence": "high",
                 "raw_values": None,
                 "conflict_flag": False,
@@ -2289,6 +2370,9 @@ class DataNormalizer:
             return
 
         events: list[dict[str, Any]] = []
+        # Index of the most recent "Listed ..." event: the start of the current
+        # listing cycle (events are most-recent-first).
+        cycle_end_idx: int | None = None
         for item in raw:
             if not isinstance(item, dict):
                 continue
@@ -2314,10 +2398,13 @@ class DataNormalizer:
             except (TypeError, ValueError):
                 rate_num = None
 
+            event = item.get("event")
+            if cycle_end_idx is None and "list" in str(event or "").lower():
+                cycle_end_idx = len(events)
             events.append(
                 {
                     "date": date_str,
-                    "event": item.get("event"),
+                    "event": event,
                     "price": price_num,
                     "price_change_rate": rate_num,
                     "source": item.get("source"),
@@ -2334,11 +2421,8 @@ class DataNormalizer:
         # even on real cuts), so we cannot count on it. We also restrict to the
         # current cycle (from the most recent "Listed for sale" forward) so a
         # prior rental cycle's price changes aren't counted as sale reductions.
-        cycle_end_idx = len(events) - 1  # default: whole history (no listing marker)
-        for idx, e in enumerate(events):  # events are most-recent-first
-            if "list" in str(e.get("event") or "").lower():
-                cycle_end_idx = idx
-                break
+        if cycle_end_idx is None:
+            cycle_end_idx = len(events) - 1  # default: whole history (no listing marker)
         cycle_chron = list(reversed(events[: cycle_end_idx + 1]))  # oldest -> newest
 
         reduction_count = 0
@@ -2578,40 +2662,6 @@ class DataNormalizer:
             return round(amount * 26.0 / 12.0, 2)
         return amount
 
-    def _get_nested_value(self, data: dict | None, field: str) -> Any:
-        """Get value from potentially nested dict using dot notation."""
-        if data is None or field is None:
-            return None
-
-        keys = field.split(".")
-        value = data
-        for key in keys:
-            if isinstance(value, dict) and key in value:
-                value = value[key]
-            else:
-                return None
-
-        # Handle special cases where the API returns yearly data as a dict
-        # e.g., propertyTaxes: {"2024": {"year": 2024, "total": 6471}, ...}
-        if field == "propertyTaxes" and isinstance(value, dict):
-            years = [k for k in value.keys() if k.isdigit()]
-            if years:
-                latest_year = max(years)
-                year_data = value.get(latest_year, {})
-                return year_data.get("total") if isinstance(year_data, dict) else None
-            return None
-
-        # taxAssessments: {"2024": {"year": 2024, "value": 346274}, ...}
-        if field == "taxAssessments" and isinstance(value, dict):
-            years = [k for k in value.keys() if k.isdigit()]
-            if years:
-                latest_year = max(years)
-                year_data = value.get(latest_year, {})
-                return year_data.get("value") if isinstance(year_data, dict) else None
-            return None
-
-        return value
-
     def calculate_data_quality(self, normalized: dict[str, Any], provenance: dict[str, Any]) -> dict[str, Any]:
         """Calculate data quality metrics."""
         total_fields = len(self.FIELD_MAPPING)
@@ -5,7 +5,12 @@ This module provides a reusable base class that handles:
 - Retry logic with exponential backoff
 - Rate limit handling (429 responses)
 - Circuit breaker pattern for fault tolerance
+- Adaptive per-provider concurrency limits
+- Fleet-wide provider rate / spend budgets with priority classes
+- Request-scoped deadlines (see ``app.services.deadline``)
+- Prometheus latency, retry and cost metrics (see ``app.services.provider_metrics``)
 - Timeout management
+- Persistent, pooled HTTP connections (keep-alive, optional HTTP/2)
 - Standardized response wrapping
 - Logging
 
@@ -14,73 +19,33 @@ specific authentication and response handling.
 """
 
 import asyncio
+import importlib.util
 import logging
+import weakref
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
-from enum import StrEnum
 from typing import Any, Generic, TypeVar
 
 import httpx
 
-logger = logging.getLogger(__name__)
-
-
-class CircuitState(StrEnum):
-    """Circuit breaker states."""
-
-    CLOSED = "closed"
-    OPEN = "open"
-    HALF_OPEN = "half-open"
+from app.core.config import settings
+from app.services import deadline, provider_metrics
+from app.services.concurrency_limiter import get_limiter
+from app.services.provider_budget import ProviderBudgetExceeded, get_provider_budget
 
+# Re-exported: the breaker implementation is shared with the @resilient decorator.
+from app.services.resilience import CircuitBreaker, CircuitState, get_circuit_breaker  # noqa: F401
 
-class CircuitBreaker:
-    """
-    Circuit breaker implementation for fault tolerance.
-
-    When failures exceed the threshold, the circuit opens and
-    subsequent requests fail fast. After the recovery timeout,
-    a test request is allowed through (half-open state).
-    """
-
-    def __init__(self, failure_threshold: int = 3, recovery_timeout: float = 30.0):
-        self.failure_threshold = failure_threshold
-        self.recovery_timeout = recovery_timeout
-        self.failures = 0
-        self.last_failure_time: datetime | None = None
-        self.state = CircuitState.CLOSED
+logger = logging.getLogger(__name__)
 
-    def record_failure(self) -> None:
-        """Record a failed request."""
-        self.failures += 1
-        self.last_failure_time = datetime.now(UTC)
-        if self.failures >= self.failure_threshold:
-            self.state = CircuitState.OPEN
-            logger.warning(f"Circuit breaker opened after {self.failures} failures")
+# HTTP/2 needs the optional ``h2`` package (``httpx[http2]``). Clients that
+# request it fall back to HTTP/1.1 keep-alive when it is not installed.
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
 
-    def record_success(self) -> None:
-        """Record a successful request."""
-        self.failures = 0
-        self.state = CircuitState.CLOSED
-
-    def can_execute(self) -> bool:
-        """Check if a request can proceed."""
-        if self.state == CircuitState.CLOSED:
-            return True
-        if self.state == CircuitState.OPEN:
-            if self.last_failure_time:
-                elapsed = (datetime.now(UTC) - self.last_failure_time).total_seconds()
-                if elapsed >= self.recovery_timeout:
-                    self.state = CircuitState.HALF_OPEN
-                    return True
-            return False
-        return True  # half-open allows one request
-
-    def reset(self) -> None:
-        """Reset the circuit breaker to closed state."""
-        self.failures = 0
-        self.last_failure_time = None
-        self.state = CircuitState.CLOSED
+# Every constructed client registers here so the app lifespan / Arq worker can
+# open and close all pooled connections without tracking instances by hand.
+_registered_clients: "weakref.WeakSet[BaseAPIClient]" = weakref.WeakSet()
 
 
 @dataclass
@@ -106,7 +71,12 @@ class BaseAPIClient(ABC, Generic[T]):
     - Retry logic with exponential backoff
     - Rate limit handling
     - Circuit breaker
+    - Adaptive concurrency limit per provider (see ``concurrency_limiter``)
+    - Rate / monthly-spend budget per provider (see ``provider_budget``)
     - Timeout management
+    - One long-lived ``httpx.AsyncClient`` per instance, so repeat calls
+      reuse TCP/TLS connections instead of handshaking every request.
+      Pool size and HTTP/2 are set per provider via the constructor.
 
     Subclasses must implement:
     - _get_headers(): Return authentication headers
@@ -122,14 +92,38 @@ class BaseAPIClient(ABC, Generic[T]):
         connect_timeout: float = 5.0,
         max_retries: int = 3,
         enable_circuit_breaker: bool = True,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        keepalive_expiry: float = 30.0,
+        http2: bool = False,
+        max_concurrency: int | None = None,
     ):
         self.api_key = api_key
         self.base_url = base_url.rstrip("/")
+        if settings.PROVIDER_STANDIN_URL:
+            # Offline stand-in (scripts/provider_standin.py) serves every provider under its own prefix.
+            self.base_url = f"{settings.PROVIDER_STANDIN_URL.rstrip('/')}/{self._get_limiter_name().lower()}"
         self.timeout = httpx.Timeout(timeout, connect=connect_timeout)
         self.max_retries = max_retries
-        self.circuit_breaker = CircuitBreaker() if enable_circuit_breaker else None
+        # One breaker per provider name, shared by every client instance and,
+        # through Redis, every worker.
+        self.circuit_breaker = get_circuit_breaker(self._get_provider_name()) if enable_circuit_breaker else None
+        # One AIMD window per provider, shared by every client instance
+        # calling it; bounded by the connection pool unless set explicitly.
+        self.limiter = get_limiter(self._get_limiter_name(), max_limit=max_concurrency or max_connections)
+        # Fleet-wide quota for the same upstream; None when unlimited.
+        self.budget = get_provider_budget(self._get_limiter_name())
         self._failure_count = 0
         self._last_success: datetime | None = None
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.http2 = http2 and _HTTP2_AVAILABLE
+        self._http_client: httpx.AsyncClient | None = None
+        self._http_client_loop: asyncio.AbstractEventLoop | None = None
+        _registered_clients.add(self)
 
     @abstractmethod
     def _get_headers(self) -> dict[str, str]:
@@ -154,6 +148,52 @@ class BaseAPIClient(ABC, Generic[T]):
         """Return the provider name for logging."""
         pass
 
+    def _get_limiter_name(self) -> str:
+        """Return the upstream name this client's concurrency limit and budget are kept under.
+
+        Defaults to the provider name; clients that call the same upstream
+        under different names override it so they share one window and budget.
+        """
+        return self._get_provider_name()
+
+    def _get_metrics_endpoint(self, endpoint: str) -> str:
+        """Return the endpoint label metrics are recorded under.
+
+        Defaults to the endpoint itself; clients whose endpoints embed IDs or
+        place names override it to keep the label set bounded.
+        """
+        return endpoint
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Return the pooled HTTP client, creating it on first use.
+
+        Pooled connections are bound to the event loop that opened them, so a
+        client first used on another loop (e.g. per-test loops) is replaced
+        rather than reused.
+        """
+        loop = asyncio.get_running_loop()
+        client = self._http_client
+        if client is None or client.is_closed or self._http_client_loop is not loop:
+            client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=self.limits,
+                http2=self.http2,
+            )
+            self._http_client = client
+            self._http_client_loop = loop
+        return client
+
+    async def open(self) -> None:
+        """Open the pooled HTTP client ahead of the first request."""
+        self._get_http_client()
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client and release its connections."""
+        client, self._http_client = self._http_client, None
+        self._http_client_loop = None
+        if client is not None and not client.is_closed:
+            await client.aclose()
+
     def _create_circuit_open_response(self) -> T:
         """Create response for when circuit breaker is open."""
         return self._create_response(
@@ -177,14 +217,14 @@ class BaseAPIClient(ABC, Generic[T]):
         Every call emits a structured ``ext_api`` log at INFO level with
         ``provider``, ``endpoint``, ``status``, ``latency_ms``, and
         ``attempt`` so external-call performance is observable in log
-        aggregators and dashboards.
+        aggregators and dashboards. Each attempt is also recorded in the
+        ``provider_metrics`` Prometheus series.
         """
-        import time as _time
-
-        provider = self._get_provider_name()
-
         # Check circuit breaker
-        if self.circuit_breaker and not self.circuit_breaker.can_execute():
+        breaker = self.circuit_breaker
+        if breaker and not await breaker.allow():
+            provider = self._get_provider_name()
+            provider_metrics.record_circuit_open(provider, self._get_metrics_endpoint(endpoint))
             logger.warning(
                 "ext_api provider=%s endpoint=%s status=circuit_open",
                 provider,
@@ -192,6 +232,28 @@ class BaseAPIClient(ABC, Generic[T]):
             )
             return self._create_circuit_open_response()
 
+        probe = breaker.probe_token if breaker else None
+        try:
+            return await self._request_with_retries(endpoint, params, method, json_data, **response_kwargs)
+        finally:
+            if probe is not None:
+                # A probe ending without an outcome (a 404, a deadline cut)
+                # must not keep the half-open circuit shut until the lock expires.
+                await breaker.release_probe(probe)
+
+    async def _request_with_retries(
+        self,
+        endpoint: str,
+        params: dict[str, Any] | None,
+        method: str,
+        json_data: dict[str, Any] | None,
+        **response_kwargs,
+    ) -> T:
+        """Send the request through the retry loop of ``_make_request``."""
+        import time as _time
+
+        provider = self._get_provider_name()
+        metrics_endpoint = self._get_metrics_endpoint(endpoint)
         headers = self._get_headers()
         url = f"{self.base_url}/{endpoint}"
 
@@ -202,121 +264,144 @@ class BaseAPIClient(ABC, Generic[T]):
         t0 = _time.monotonic()
 
         for attempt in range(self.max_retries):
+            time_left = deadline.remaining()
+            if time_left is not None and time_left <= 0:
+                return self._deadline_exceeded(provider, endpoint, attempt, **response_kwargs)
             try:
-                async with httpx.AsyncClient(timeout=self.timeout) as client:
-                    if method.upper() == "GET":
-                        response = await client.get(url, headers=headers, params=params)
-                    elif method.upper() == "POST":
-                        response = await client.post(url, headers=headers, params=params, json=json_data)
-                    elif method.upper() == "PUT":
-                        response = await client.put(url, headers=headers, params=params, json=json_data)
-                    elif method.upper() == "DELETE":
-                        response = await client.delete(url, headers=headers, params=params)
-                    else:
-                        raise ValueError(f"Unsupported HTTP method: {method}")
-
-                    latency = (_time.monotonic() - t0) * 1000  # ms
-
-                    if response.status_code == 200:
-                        data = response.json()
-                        self._record_success()
-                        logger.info(
-                            "ext_api provider=%s endpoint=%s status=%s latency_ms=%.1f attempt=%d",
-                            provider,
-                            endpoint,
-                            response.status_code,
-                            latency,
-                            attempt + 1,
-                        )
-                        return self._create_response(
-                            success=True,
-                            data=data,
-                            error=None,
-                            status_code=response.status_code,
-                            raw_response=data,
-                            **response_kwargs,
-                        )
-
-                    elif response.status_code == 429:
-                        wait_time = 2**attempt
-                        logger.warning(
-                            "ext_api provider=%s endpoint=%s status=429 latency_ms=%.1f attempt=%d retry_after=%ds",
-                            provider,
-                            endpoint,
-                            latency,
-                            attempt + 1,
-                            wait_time,
-                        )
+                async with asyncio.timeout(time_left):
+                    response = await self._send(method, url, headers, params, json_data)
+
+                latency = (_time.monotonic() - t0) * 1000  # ms
+                provider_metrics.observe_attempt(
+                    provider, metrics_endpoint, attempt + 1, latency / 1000, response.status_code
+                )
+
+                if response.status_code == 200:
+                    data = response.json()
+                    await self._record_success()
+                    logger.info(
+                        "ext_api provider=%s endpoint=%s status=%s latency_ms=%.1f attempt=%d",
+                        provider,
+                        endpoint,
+                        response.status_code,
+                        latency,
+                        attempt + 1,
+                    )
+                    return self._create_response(
+                        success=True,
+                        data=data,
+                        error=None,
+                        status_code=response.status_code,
+                        raw_response=data,
+                        **response_kwargs,
+                    )
+
+                elif response.status_code == 429:
+                    wait_time = 2**attempt
+                    logger.warning(
+                        "ext_api provider=%s endpoint=%s status=429 latency_ms=%.1f attempt=%d retry_after=%ds",
+                        provider,
+                        endpoint,
+                        latency,
+                        attempt + 1,
+                        wait_time,
+                    )
+                    if not deadline.allows(wait_time):
+                        return self._deadline_exceeded(provider, endpoint, attempt, **response_kwargs)
+                    if attempt < self.max_retries - 1:
+                        provider_metrics.record_retry(provider, metrics_endpoint, "429")
+                    await asyncio.sleep(wait_time)
+                    t0 = _time.monotonic()  # reset for next attempt
+                    continue
+
+                elif response.status_code in (502, 503):
+                    wait_time = 2**attempt
+                    logger.warning(
+                        "ext_api provider=%s endpoint=%s status=%s latency_ms=%.1f attempt=%d retrying_in=%ds",
+                        provider,
+                        endpoint,
+                        response.status_code,
+                        latency,
+                        attempt + 1,
+                        wait_time,
+                    )
+                    if attempt < self.max_retries - 1 and deadline.allows(wait_time):
+                        provider_metrics.record_retry(provider, metrics_endpoint, "5xx")
                         await asyncio.sleep(wait_time)
-                        t0 = _time.monotonic()  # reset for next attempt
+                        t0 = _time.monotonic()
                         continue
+                    await self._record_failure()
+                    return self._create_response(
+                        success=False,
+                        data=None,
+                        error=f"{provider} API error: {response.status_code} (after {attempt + 1} attempts)",
+                        status_code=response.status_code,
+                        **response_kwargs,
+                    )
+
+                elif response.status_code == 404:
+                    logger.info(
+                        "ext_api provider=%s endpoint=%s status=404 latency_ms=%.1f attempt=%d",
+                        provider,
+                        endpoint,
+                        latency,
+                        attempt + 1,
+                    )
+                    return self._create_response(
+                        success=False,
+                        data=None,
+                        error="Resource not found",
+                        status_code=response.status_code,
+                        **response_kwargs,
+                    )
+
+                else:
+                    error_msg = f"{provider} API error: {response.status_code}"
+                    try:
+                        error_msg += f" - {response.text[:200]}"
+                    except Exception:
+                        pass
+                    logger.error(
+                        "ext_api provider=%s endpoint=%s status=%s latency_ms=%.1f attempt=%d error=%s",
+                        provider,
+                        endpoint,
+                        response.status_code,
+                        latency,
+                        attempt + 1,
+                        error_msg,
+                    )
+                    await self._record_failure()
+                    return self._create_response(
+                        success=False,
+                        data=None,
+                        error=error_msg,
+                        status_code=response.status_code,
+                        **response_kwargs,
+                    )
+
+            except ProviderBudgetExceeded as e:
+                # Our own refusal, not a provider failure: leave the breaker alone.
+                logger.warning(
+                    "ext_api provider=%s endpoint=%s status=budget_deferred priority=%s reason=%s attempt=%d",
+                    provider,
+                    endpoint,
+                    e.priority.value,
+                    e.reason,
+                    attempt + 1,
+                )
+                return self._create_response(
+                    success=False, data=None, error=e.message, status_code=None, **response_kwargs
+                )
 
-                    elif response.status_code in (502, 503):
-                        wait_time = 2**attempt
-                        logger.warning(
-                            "ext_api provider=%s endpoint=%s status=%s latency_ms=%.1f attempt=%d retrying_in=%ds",
-                            provider,
-                            endpoint,
-                            response.status_code,
-                            latency,
-                            attempt + 1,
-                            wait_time,
-                        )
-                        if attempt < self.max_retries - 1:
-                            await asyncio.sleep(wait_time)
-                            t0 = _time.monotonic()
-                            continue
-                        self._record_failure()
-                        return self._create_response(
-                            success=False,
-                            data=None,
-                            error=f"{provider} API error: {response.status_code} (after {attempt + 1} attempts)",
-                            status_code=response.status_code,
-                            **response_kwargs,
-                        )
-
-                    elif response.status_code == 404:
-                        logger.info(
-                            "ext_api provider=%s endpoint=%s status=404 latency_ms=%.1f attempt=%d",
-                            provider,
-                            endpoint,
-                            latency,
-                            attempt + 1,
-                        )
-                        return self._create_response(
-                            success=False,
-                            data=None,
-                            error="Resource not found",
-                            status_code=response.status_code,
-                            **response_kwargs,
-                        )
-
-                    else:
-                        error_msg = f"{provider} API error: {response.status_code}"
-                        try:
-                            error_msg += f" - {response.text[:200]}"
-                        except Exception:
-                            pass
-                        logger.error(
-                            "ext_api provider=%s endpoint=%s status=%s latency_ms=%.1f attempt=%d error=%s",
-                            provider,
-                            endpoint,
-                            response.status_code,
-                            latency,
-                            attempt + 1,
-                            error_msg,
-                        )
-                        self._record_failure()
-                        return self._create_response(
-                            success=False,
-                            data=None,
-                            error=error_msg,
-                            status_code=response.status_code,
-                            **response_kwargs,
-                        )
+            except TimeoutError:
+                # asyncio.timeout above: the request deadline, not the provider, ran out.
+                return self._deadline_exceeded(provider, endpoint, attempt, **response_kwargs)
 
             except httpx.TimeoutException:
                 latency = (_time.monotonic() - t0) * 1000
+                provider_metrics.observe_attempt(
+                    provider, metrics_endpoint, attempt + 1, latency / 1000, None, "timeout"
+                )
                 logger.warning(
                     "ext_api provider=%s endpoint=%s status=timeout latency_ms=%.1f attempt=%d",
                     provider,
@@ -324,11 +409,16 @@ class BaseAPIClient(ABC, Generic[T]):
                     latency,
                     attempt + 1,
                 )
+                if not deadline.allows(2**attempt):
+                    return self._deadline_exceeded(provider, endpoint, attempt, **response_kwargs)
+                if attempt < self.max_retries - 1:
+                    provider_metrics.record_retry(provider, metrics_endpoint, "timeout")
                 await asyncio.sleep(2**attempt)
                 t0 = _time.monotonic()
 
             except Exception as e:
                 latency = (_time.monotonic() - t0) * 1000
+                provider_metrics.observe_attempt(provider, metrics_endpoint, attempt + 1, latency / 1000, None, "error")
                 logger.error(
                     "ext_api provider=%s endpoint=%s status=error latency_ms=%.1f attempt=%d error=%s",
                     provider,
@@ -337,7 +427,7 @@ class BaseAPIClient(ABC, Generic[T]):
                     attempt + 1,
                     e,
                 )
-                self._record_failure()
+                await self._record_failure()
                 return self._create_response(
                     success=False, data=None, error=str(e), status_code=None, **response_kwargs
                 )
@@ -350,23 +440,77 @@ class BaseAPIClient(ABC, Generic[T]):
             total_latency,
             self.max_retries,
         )
-        self._record_failure()
+        await self._record_failure()
         return self._create_response(
             success=False, data=None, error="Max retries exceeded", status_code=None, **response_kwargs
         )
 
-    def _record_success(self) -> None:
+    def _deadline_exceeded(self, provider: str, endpoint: str, attempt: int, **response_kwargs) -> T:
+        """Failure response for a call cut short by the request deadline.
+
+        The caller chose to stop waiting, so the circuit breaker is left alone.
+        """
+        logger.info(
+            "ext_api provider=%s endpoint=%s status=deadline attempt=%d",
+            provider,
+            endpoint,
+            attempt + 1,
+        )
+        return self._create_response(
+            success=False, data=None, error="Request deadline exceeded", status_code=None, **response_kwargs
+        )
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str],
+        params: dict[str, Any] | None,
+        json_data: dict[str, Any] | None,
+    ) -> httpx.Response:
+        """Send one HTTP attempt through the provider's budget and concurrency limiter.
+
+        Every attempt is charged against the budget (raising
+        ``ProviderBudgetExceeded`` when its priority class may not spend
+        more). The limiter slot is held only for the call itself (never
+        across retry backoff), and the outcome feeds the limiter's window.
+        """
+        import time as _time
+
+        if self.budget is not None:
+            await self.budget.acquire()
+        client = self._get_http_client()
+        async with self.limiter.slot():
+            sent = _time.monotonic()
+            try:
+                if method.upper() == "GET":
+                    response = await client.get(url, headers=headers, params=params)
+                elif method.upper() == "POST":
+                    response = await client.post(url, headers=headers, params=params, json=json_data)
+                elif method.upper() == "PUT":
+                    response = await client.put(url, headers=headers, params=params, json=json_data)
+                elif method.upper() == "DELETE":
+                    response = await client.delete(url, headers=headers, params=params)
+                else:
+                    raise ValueError(f"Unsupported HTTP method: {method}")
+            except httpx.TransportError:
+                self.limiter.on_response(None, _time.monotonic() - sent)
+                raise
+            self.limiter.on_response(response.status_code, _time.monotonic() - sent)
+        return response
+
+    async def _record_success(self) -> None:
         """Record a successful request."""
         self._failure_count = 0
         self._last_success = datetime.now(UTC)
         if self.circuit_breaker:
-            self.circuit_breaker.record_success()
+            await self.circuit_breaker.record_success()
 
-    def _record_failure(self) -> None:
+    async def _record_failure(self) -> None:
         """Record a failed request."""
         self._failure_count += 1
         if self.circuit_breaker:
-            self.circuit_breaker.record_failure()
+            await self.circuit_breaker.record_failure()
 
     def get_health_status(self) -> dict[str, Any]:
         """Get health status of the API client."""
@@ -375,4 +519,20 @@ class BaseAPIClient(ABC, Generic[T]):
             "failure_count": self._failure_count,
             "last_success": self._last_success.isoformat() if self._last_success else None,
             "circuit_state": self.circuit_breaker.state.value if self.circuit_breaker else "disabled",
+            "concurrency": self.limiter.snapshot(),
         }
+
+
+async def open_api_clients() -> None:
+    """Open the pooled HTTP client of every registered API client."""
+    for client in list(_registered_clients):
+        await client.open()
+
+
+async def close_api_clients() -> None:
+    """Close every registered API client's pooled connections."""
+    for client in list(_registered_clients):
+        try:
+            await client.aclose()
+        except Exception as e:
+            logger.warning("Error closing %s HTTP client: %s", client._get_provider_name(), e)
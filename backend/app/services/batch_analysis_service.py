@@ -0,0 +1,137 @@
+"""
+Batch property analysis: search + IQ Verdict for a list of addresses.
+
+Addresses are validated and deduplicated up front, and the ones with a fresh
+property cache entry are served without waiting for a fetch slot. The rest
+(uncached, stale or invalid, all of which may call providers) run through
+``property_service.search_property`` behind a semaphore, and each result is yielded as soon as it is ready, so a caller can
+stream them without waiting for the slowest address.
+"""
+
+import asyncio
+import csv
+import io
+import logging
+from collections.abc import AsyncIterator
+
+from pydantic import ValidationError
+
+from app.core.exceptions import ExternalAPIError
+from app.schemas.property import AllAssumptions, BatchAnalysisResult, PropertySearchRequest
+from app.services.cache_service import CacheService, get_cache_service
+from app.services.concurrency_limiter import Priority, outbound_priority
+from app.services.iq_verdict_service import compute_iq_verdict
+from app.services.property_service import property_service
+from app.services.resilience import CircuitOpenError
+
+logger = logging.getLogger(__name__)
+
+
+def addresses_from_csv(content: bytes) -> list[str]:
+    """Read addresses from a CSV upload.
+
+    With an ``address`` header column, ``city``/``state``/``zip`` (or
+    ``zip_code``) columns are appended when all three are present. Without
+    one, each row's non-empty cells are joined, so an unquoted
+    ``street, city, ST 12345`` line still reads as one address.
+    """
+    rows = list(csv.reader(io.StringIO(content.decode("utf-8-sig", errors="replace"))))
+    if not rows:
+        return []
+    header = [cell.strip().lower() for cell in rows[0]]
+    if "address" not in header:
+        return [", ".join(c.strip() for c in row if c.strip()) for row in rows if any(c.strip() for c in row)]
+
+    columns = {name: header.index(name) for name in ("address", "city", "state", "zip", "zip_code") if name in header}
+    zip_column = columns.get("zip_code", columns.get("zip"))
+
+    def _cell(row: list[str], column: int | None) -> str:
+        return row[column].strip() if column is not None and column < len(row) else ""
+
+    addresses = []
+    for row in rows[1:]:
+        street = _cell(row, columns["address"])
+        if not street:
+            continue
+        city, state, zip_code = _cell(row, columns.get("city")), _cell(row, columns.get("state")), _cell(row, zip_column)
+        addresses.append(f"{street}, {city}, {state} {zip_code}" if city and state and zip_code else street)
+    return addresses
+
+
+def _parse_address(raw: str) -> str:
+    """Validate one address the same way ``POST /properties/search`` does."""
+    return PropertySearchRequest(address=raw).address
+
+
+def _error_message(exc: Exception) -> str:
+    if isinstance(exc, CircuitOpenError):
+        return "Data providers are temporarily unavailable. Please try again in a few minutes."
+    if isinstance(exc, ExternalAPIError):
+        return exc.message
+    return "Property search failed"
+
+
+async def analyze_addresses(
+    addresses: list[str],
+    *,
+    assumptions: AllAssumptions | None = None,
+    concurrency: int = 4,
+) -> AsyncIterator[BatchAnalysisResult]:
+    """Yield one result per distinct address, in completion order."""
+    cache = get_cache_service()
+    groups: dict[str, tuple[str, list[int]]] = {}
+    for index, raw in enumerate(addresses):
+        try:
+            address = _parse_address(raw)
+        except ValidationError as e:
+            message = e.errors()[0].get("msg", "invalid address") if e.errors() else "invalid address"
+            yield BatchAnalysisResult(indexes=[index], address=raw, status="error", error=message)
+            continue
+        groups.setdefault(CacheService.property_key(address), (address, []))[1].append(index)
+
+    cached_keys = set(await cache.get_many(groups))
+    semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+    async def _analyze(key: str, address: str, indexes: list[int]) -> BatchAnalysisResult:
+        cached = key in cached_keys
+        try:
+            # Bulk priority: no interactive search deadline, so every result is complete.
+            with outbound_priority(Priority.BULK):
+                # Only a fresh hit skips the queue: an invalid or stale entry
+                # re-fetches or refreshes from the providers.
+                if cached and await property_service.cached_property_is_fresh(address):
+                    response = await property_service.search_property(address)
+                else:
+                    async with semaphore:
+                        response = await property_service.search_property(address)
+        except Exception as e:
+            if not isinstance(e, (ExternalAPIError, CircuitOpenError)):
+                logger.exception("Batch analysis search failed for %s", address)
+            return BatchAnalysisResult(indexes=indexes, address=address, status="error", error=_error_message(e))
+
+        verdict = None
+        verdict_input = property_service.build_verdict_input(response)
+        if verdict_input is not None:
+            try:
+                result = compute_iq_verdict(verdict_input, assumptions=assumptions)
+                verdict = result.model_dump(mode="json", by_alias=True)
+            except Exception:
+                logger.exception("Batch analysis verdict failed for %s", address)
+        return BatchAnalysisResult(
+            indexes=indexes,
+            address=address,
+            status="ok",
+            cached=cached,
+            property_id=response.property_id,
+            zpid=response.zpid,
+            verdict=verdict,
+        )
+
+    tasks = [asyncio.create_task(_analyze(key, address, indexes)) for key, (address, indexes) in groups.items()]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        # Client went away mid-stream: stop fetching for nobody.
+        for task in tasks:
+            task.cancel()
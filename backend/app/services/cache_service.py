@@ -3,17 +3,94 @@ Cache service with Redis support and in-memory fallback.
 Provides a unified caching interface for property data.
 """
 
+import asyncio
 import hashlib
 import json
 import logging
 import re
+import secrets
+import zlib
+from collections.abc import Iterable, Mapping
 from typing import Any
 
+from app.services.local_cache import LocalLRUCache
+from app.services.property.cache import _PROPERTY_CACHE_NAMESPACE, _property_cache_prefix
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover — stdlib json writes the same format
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 # Default TTL for property cache (24 hours)
 DEFAULT_TTL_SECONDS = 86400
 
+# Hot key prefixes also served from a per-process L1 in front of Redis, with
+# the longest a worker may serve its copy. Deletes are broadcast to every
+# worker over INVALIDATION_CHANNEL; overwrites by another worker are picked up
+# once the local copy expires.
+L1_TTL_CAPS: dict[str, int] = {
+    "defaults:assumptions": 60,
+    "property:": 30,
+    "prop_id:": 30,
+    "provider:": 60,
+    "airroi:estimate:": 300,
+}
+INVALIDATION_CHANNEL = "cache:invalidate"
+# Per-process byte budget for L1 entries, and for everything when Redis is
+# unavailable.
+LOCAL_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+# Compact codec for large blobs (the canonical PropertyResponse per property).
+# Keys under these prefixes are written as a one-byte format header followed
+# by JSON, zlib-compressed above _COMPRESS_MIN_BYTES. Reads are
+# self-describing, so a value without a header still decodes as plain JSON.
+COMPACT_KEY_PREFIXES: tuple[str, ...] = (f"{_property_cache_prefix('prop_id')}:",)
+_CODEC_JSON = b"\x01"
+_CODEC_JSON_ZLIB = b"\x02"
+# Below this size compression costs more CPU than it saves memory.
+_COMPRESS_MIN_BYTES = 1024
+
+
+def encode_json(value: Any) -> bytes:
+    """Compact UTF-8 JSON, via orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(value, default=str, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(value, default=str, separators=(",", ":")).encode()
+
+
+def encode_compact(value: Any) -> bytes:
+    """Serialize ``value`` for a compact-codec key."""
+    body = encode_json(value)
+    if len(body) < _COMPRESS_MIN_BYTES:
+        return _CODEC_JSON + body
+    return _CODEC_JSON_ZLIB + zlib.compress(body, 1)
+
+
+def decode_compact(blob: bytes | str) -> Any:
+    """Inverse of ``encode_compact``; plain JSON values pass through."""
+    loads = orjson.loads if orjson is not None else json.loads
+    if isinstance(blob, str):
+        return json.loads(blob)
+    header = blob[:1]
+    if header == _CODEC_JSON_ZLIB:
+        return loads(zlib.decompress(blob[1:]))
+    if header == _CODEC_JSON:
+        return loads(blob[1:])
+    # Plain JSON from json.dumps, which (unlike orjson) may contain NaN.
+    return json.loads(blob)
+
+
+# Compare-and-delete so a lock holder whose TTL lapsed never releases a lock
+# that another worker has since acquired.
+_RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
 
 class CacheService:
     """
@@ -23,8 +100,12 @@ class CacheService:
 
     def __init__(self, redis_url: str | None = None):
         self.redis_client = None
+        # Second pool without response decoding for compact-codec keys.
+        self._redis_binary = None
         self.use_redis = False
-        self._memory_cache: dict[str, dict[str, Any]] = {}
+        # L1 for hot keys in front of Redis; the whole cache without Redis.
+        self._memory_cache = LocalLRUCache(max_bytes=LOCAL_CACHE_MAX_BYTES)
+        self._invalidation_task: asyncio.Task | None = None
 
         if redis_url:
             try:
@@ -38,6 +119,13 @@ class CacheService:
                     socket_timeout=5,
                     max_connections=20,
                 )
+                self._redis_binary = redis.from_url(
+                    redis_url,
+                    decode_responses=False,
+                    socket_connect_timeout=5,
+                    socket_timeout=5,
+                    max_connections=10,
+                )
                 self.use_redis = True
                 logger.info("Redis cache initialized (max_connections=20)")
             except Exception as e:
@@ -53,31 +141,46 @@ class CacheService:
         hash_part = hashlib.sha256(normalized.encode()).hexdigest()[:16]
         return f"{prefix}:{hash_part}"
 
+    @staticmethod
+    def is_compact_key(key: str) -> bool:
+        """True when ``key`` is stored with the compact codec."""
+        return key.startswith(COMPACT_KEY_PREFIXES)
+
+    def _l1_ttl(self, key: str) -> int:
+        """L1 TTL cap for ``key``; 0 when the key is not served from L1."""
+        for prefix, cap in L1_TTL_CAPS.items():
+            if key.startswith(prefix):
+                return cap
+        return 0
+
     async def get(self, key: str) -> Any | None:
         """Get value from cache."""
         try:
             if self.use_redis and self.redis_client:
-                value = await self.redis_client.get(key)
-                if value:
-                    return json.loads(value)
-                return None
+                l1_ttl = self._l1_ttl(key)
+                if l1_ttl:
+                    blob = self._memory_cache.get(key)
+                    if blob is not None:
+                        return decode_compact(blob)
+                if self.is_compact_key(key):
+                    blob = await self._redis_binary.get(key)
+                else:
+                    blob = await self.redis_client.get(key)
+                if not blob:
+                    return None
+                if l1_ttl:
+                    self._memory_cache.set(key, blob if isinstance(blob, bytes) else blob.encode(), l1_ttl)
+                return decode_compact(blob)
             else:
                 # In-memory fallback
-                cached = self._memory_cache.get(key)
-                if cached:
-                    import time
-
-                    if time.time() < cached.get("expires_at", 0):
-                        return cached.get("data")
-                    else:
-                        # Expired - remove it
-                        del self._memory_cache[key]
-                return None
+                blob = self._memory_cache.get(key)
+                return decode_compact(blob) if blob is not None else None
         except Exception as e:
             logger.warning(f"Cache get error for {key}: {e}")
             if self.use_redis:
                 self.use_redis = False
                 self.redis_client = None
+                self._redis_binary = None
                 return await self.get(key)
             return None
 
@@ -85,46 +188,46 @@ class CacheService:
         """Set value in cache with TTL."""
         try:
             if self.use_redis and self.redis_client:
-                serialized = json.dumps(value, default=str)
-                await self.redis_client.setex(key, ttl_seconds, serialized)
+                if self.is_compact_key(key):
+                    blob = encode_compact(value)
+                    await self._redis_binary.setex(key, ttl_seconds, blob)
+                else:
+                    serialized = json.dumps(value, default=str)
+                    await self.redis_client.setex(key, ttl_seconds, serialized)
+                    blob = serialized.encode()
+                l1_ttl = self._l1_ttl(key)
+                if l1_ttl:
+                    self._memory_cache.set(key, blob, min(ttl_seconds, l1_ttl))
                 return True
             else:
-                # In-memory fallback
-                import time
-
-                self._memory_cache[key] = {
-                    "data": value,
-                    "expires_at": time.time() + ttl_seconds,
-                }
-
-                # Clean up old entries if cache is too large
-                if len(self._memory_cache) > 1000:
-                    self._cleanup_memory_cache()
-
+                # In-memory fallback (bounded LRU)
+                self._memory_cache.set(key, _CODEC_JSON + encode_json(value), ttl_seconds)
                 return True
         except Exception as e:
             logger.warning(f"Cache set error for {key}: {e}")
             if self.use_redis:
                 self.use_redis = False
                 self.redis_client = None
+                self._redis_binary = None
                 return await self.set(key, value, ttl_seconds)
             return False
 
     async def delete(self, key: str) -> bool:
-        """Delete value from cache."""
+        """Delete value from cache (and from every worker's L1)."""
         try:
             if self.use_redis and self.redis_client:
                 await self.redis_client.delete(key)
+                await self.broadcast_invalidation(key)
                 return True
             else:
-                if key in self._memory_cache:
-                    del self._memory_cache[key]
+                self._memory_cache.delete(key)
                 return True
         except Exception as e:
             logger.warning(f"Cache delete error for {key}: {e}")
             if self.use_redis:
                 self.use_redis = False
                 self.redis_client = None
+                self._redis_binary = None
                 return await self.delete(key)
             return False
 
@@ -139,15 +242,253 @@ class CacheService:
             logger.warning(f"Cache exists error for {key}: {e}")
             return False
 
-    async def get_property(self, address: str) -> dict | None:
-        """Get cached property data by address."""
-        key = self.generate_key("property", address)
-        return await self.get(key)
+    async def get_many(self, keys: Iterable[str]) -> dict[str, Any]:
+        """Get several values in one round trip (MGET per pool).
 
-    async def set_property(self, address: str, data: dict, ttl_seconds: int = DEFAULT_TTL_SECONDS) -> bool:
-        """Cache property data with 24h TTL."""
-        key = self.generate_key("property", address)
-        return await self.set(key, data, ttl_seconds)
+        Returns a dict of the keys that were found; misses are omitted.
+        """
+        keys = list(dict.fromkeys(keys))
+        found: dict[str, Any] = {}
+        try:
+            if self.use_redis and self.redis_client:
+                remote: list[str] = []
+                for key in keys:
+                    blob = self._memory_cache.get(key) if self._l1_ttl(key) else None
+                    if blob is not None:
+                        found[key] = decode_compact(blob)
+                    else:
+                        remote.append(key)
+                compact = [k for k in remote if self.is_compact_key(k)]
+                text = [k for k in remote if not self.is_compact_key(k)]
+                for client, batch in ((self._redis_binary, compact), (self.redis_client, text)):
+                    if not batch:
+                        continue
+                    for key, blob in zip(batch, await client.mget(batch), strict=True):
+                        if not blob:
+                            continue
+                        l1_ttl = self._l1_ttl(key)
+                        if l1_ttl:
+                            self._memory_cache.set(key, blob if isinstance(blob, bytes) else blob.encode(), l1_ttl)
+                        found[key] = decode_compact(blob)
+                return found
+            else:
+                for key in keys:
+                    blob = self._memory_cache.get(key)
+                    if blob is not None:
+                        found[key] = decode_compact(blob)
+                return found
+        except Exception as e:
+            logger.warning(f"Cache get_many error for {len(keys)} keys: {e}")
+            if self.use_redis:
+                self.use_redis = False
+                self.redis_client = None
+                self._redis_binary = None
+                return await self.get_many(keys)
+            return {}
+
+    async def set_many(self, items: Mapping[str, Any], ttl_seconds: int = DEFAULT_TTL_SECONDS) -> bool:
+        """Set several values with one TTL in one pipelined round trip per pool."""
+        try:
+            if self.use_redis and self.redis_client:
+                encoded: dict[str, bytes | str] = {}
+                for key, value in items.items():
+                    if self.is_compact_key(key):
+                        encoded[key] = encode_compact(value)
+                    else:
+                        encoded[key] = json.dumps(value, default=str)
+                for client, compact in ((self._redis_binary, True), (self.redis_client, False)):
+                    batch = [k for k in encoded if self.is_compact_key(k) == compact]
+                    if not batch:
+                        continue
+                    async with client.pipeline(transaction=False) as pipe:
+                        for key in batch:
+                            pipe.setex(key, ttl_seconds, encoded[key])
+                        await pipe.execute()
+                for key, blob in encoded.items():
+                    l1_ttl = self._l1_ttl(key)
+                    if l1_ttl:
+                        self._memory_cache.set(
+                            key, blob if isinstance(blob, bytes) else blob.encode(), min(ttl_seconds, l1_ttl)
+                        )
+                return True
+            else:
+                for key, value in items.items():
+                    self._memory_cache.set(key, _CODEC_JSON + encode_json(value), ttl_seconds)
+                return True
+        except Exception as e:
+            logger.warning(f"Cache set_many error for {len(items)} keys: {e}")
+            if self.use_redis:
+                self.use_redis = False
+                self.redis_client = None
+                self._redis_binary = None
+                return await self.set_many(items, ttl_seconds)
+            return False
+
+    async def delete_many(self, keys: Iterable[str]) -> bool:
+        """Delete several keys in one round trip (and from every worker's L1)."""
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            return True
+        try:
+            if self.use_redis and self.redis_client:
+                await self.redis_client.delete(*keys)
+                await self.broadcast_invalidation(*keys)
+                return True
+            else:
+                for key in keys:
+                    self._memory_cache.delete(key)
+                return True
+        except Exception as e:
+            logger.warning(f"Cache delete_many error for {len(keys)} keys: {e}")
+            if self.use_redis:
+                self.use_redis = False
+                self.redis_client = None
+                self._redis_binary = None
+                return await self.delete_many(keys)
+            return False
+
+    async def broadcast_invalidation(self, *keys: str) -> None:
+        """Drop ``keys`` from this and every other worker's L1.
+
+        ``"*"`` drops every L1 entry. Only L1-cached keys are published.
+        """
+        published = [k for k in keys if k == "*" or self._l1_ttl(k)]
+        for key in published:
+            self._drop_local(key)
+        if not (published and self.use_redis and self.redis_client):
+            return
+        try:
+            for key in published:
+                await self.redis_client.publish(INVALIDATION_CHANNEL, key)
+        except Exception as e:
+            logger.warning(f"Cache invalidation publish failed for {published}: {e}")
+
+    async def start_invalidation_listener(self) -> None:
+        """Subscribe to L1 invalidations from other workers (no-op without Redis)."""
+        if not (self.use_redis and self.redis_client) or self._invalidation_task is not None:
+            return
+        self._invalidation_task = asyncio.create_task(self._listen_for_invalidations())
+
+    async def _listen_for_invalidations(self) -> None:
+        while self.use_redis and self.redis_client:
+            pubsub = self.redis_client.pubsub()
+            try:
+                await pubsub.subscribe(INVALIDATION_CHANNEL)
+                # Anything published while we weren't subscribed was missed.
+                self._memory_cache.clear()
+                while True:
+                    # Bounded wait instead of listen(): a blocking read would
+                    # trip the client's 5s socket timeout on a quiet channel.
+                    message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                    if message and message.get("type") == "message":
+                        self._drop_local(message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Cache invalidation listener error, resubscribing: {e}")
+                await asyncio.sleep(5)
+            finally:
+                try:
+                    await pubsub.reset()
+                except Exception:
+                    pass
+
+    def _drop_local(self, key: str) -> None:
+        if key == "*":
+            self._memory_cache.clear()
+        else:
+            self._memory_cache.delete(key)
+
+    async def acquire_lock(self, key: str, ttl_seconds: int) -> str | None:
+        """Try to take a short-lived exclusive lock (Redis ``SET NX EX``).
+
+        Returns an ownership token to pass to ``release_lock``, or ``None``
+        when another holder owns the key. Cache errors fail open (a token is
+        returned) so a Redis outage never blocks the caller.
+        """
+        token = secrets.token_hex(8)
+        try:
+            if self.use_redis and self.redis_client:
+                acquired = await self.redis_client.set(key, token, nx=True, ex=ttl_seconds)
+                return token if acquired else None
+            if key in self._memory_cache:
+                return None
+            self._memory_cache.set(key, _CODEC_JSON + encode_json(token), ttl_seconds)
+            return token
+        except Exception as e:
+            logger.warning(f"Cache lock error for {key}: {e}")
+            return token
+
+    async def release_lock(self, key: str, token: str) -> bool:
+        """Release a lock taken with ``acquire_lock`` if ``token`` still owns it."""
+        try:
+            if self.use_redis and self.redis_client:
+                return bool(await self.redis_client.eval(_RELEASE_LOCK_SCRIPT, 1, key, token))
+            held = self._memory_cache.get(key)
+            if held is not None and decode_compact(held) == token:
+                return self._memory_cache.delete(key)
+            return False
+        except Exception as e:
+            logger.warning(f"Cache unlock error for {key}: {e}")
+            return False
+
+    @classmethod
+    def property_key(cls, address: str, namespace: str = _PROPERTY_CACHE_NAMESPACE) -> str:
+        """Versioned cache key for a property address."""
+        return cls.generate_key(_property_cache_prefix("property", namespace), address)
+
+    @staticmethod
+    def property_id_key(property_id: str, namespace: str = _PROPERTY_CACHE_NAMESPACE) -> str:
+        """Versioned cache key for a property id."""
+        return f"{_property_cache_prefix('prop_id', namespace)}:{property_id}"
+
+    async def get_property(self, address: str, namespace: str = _PROPERTY_CACHE_NAMESPACE) -> dict | None:
+        """Get cached property data by address.
+
+        The address key holds the property id of the canonical ``prop_id``
+        blob; older layouts stored the full payload there, which is returned
+        as-is.
+        """
+        value = await self.get(self.property_key(address, namespace))
+        if isinstance(value, str):
+            return await self.get_property_by_id(value, namespace)
+        return value
+
+    async def set_property(
+        self,
+        address: str,
+        data: dict,
+        ttl_seconds: int = DEFAULT_TTL_SECONDS,
+        namespace: str = _PROPERTY_CACHE_NAMESPACE,
+    ) -> bool:
+        """Cache property data with 24h TTL.
+
+        Writes one ``prop_id`` blob and a small address → property id pointer.
+        """
+        property_id = data.get("property_id")
+        if not property_id:
+            return await self.set(self.property_key(address, namespace), data, ttl_seconds)
+        return await self.set_many(
+            {
+                self.property_id_key(property_id, namespace): data,
+                self.property_key(address, namespace): property_id,
+            },
+            ttl_seconds,
+        )
+
+    async def get_property_by_id(self, property_id: str, namespace: str = _PROPERTY_CACHE_NAMESPACE) -> dict | None:
+        """Get cached property data by property id."""
+        return await self.get(self.property_id_key(property_id, namespace))
+
+    async def set_property_by_id(
+        self,
+        property_id: str,
+        data: dict,
+        ttl_seconds: int = DEFAULT_TTL_SECONDS,
+        namespace: str = _PROPERTY_CACHE_NAMESPACE,
+    ) -> bool:
+        """Cache property data under its property id."""
+        return await self.set(self.property_id_key(property_id, namespace), data, ttl_seconds)
 
     async def get_calculation(self, property_id: str, assumptions_hash: str) -> dict | None:
         """Get cached calculation result."""
@@ -162,9 +503,11 @@ class CacheService:
         return await self.set(key, data, ttl_seconds)
 
     async def clear_property_cache(self, address: str) -> bool:
-        """Clear cached data for a specific property."""
-        key = self.generate_key("property", address)
-        return await self.delete(key)
+        """Clear cached data for a specific property.
+
+        Raw provider payloads are left alone; ``PropertyService.clear_cached_property`` drops those too.
+        """
+        return await self.delete(self.property_key(address))
 
     async def get_stats(self) -> dict[str, Any]:
         """Get cache statistics."""
@@ -186,28 +529,24 @@ class CacheService:
             else:
                 stats["connected"] = True  # Memory is always available
                 stats["keys"] = len(self._memory_cache)
+            stats["local_keys"] = len(self._memory_cache)
+            stats["local_bytes"] = self._memory_cache.bytes_used
 
         except Exception as e:
             logger.warning(f"Failed to get cache stats: {e}")
 
         return stats
 
-    def _cleanup_memory_cache(self):
-        """Remove expired entries from memory cache."""
-        import time
-
-        now = time.time()
-        expired_keys = [k for k, v in self._memory_cache.items() if now >= v.get("expires_at", 0)]
-        for key in expired_keys:
-            del self._memory_cache[key]
-
-        logger.info(f"Cleaned up {len(expired_keys)} expired cache entries")
-
     async def close(self):
         """Close Redis connection if active."""
+        if self._invalidation_task is not None:
+            self._invalidation_task.cancel()
+            self._invalidation_task = None
         if self.redis_client:
             try:
                 await self.redis_client.close()
+                if self._redis_binary:
+                    await self._redis_binary.close()
                 logger.info("Redis connection closed")
             except Exception as e:
                 logger.warning(f"Error closing Redis connection: {e}")
@@ -5,6 +5,14 @@ All public symbols are re-exported here so existing imports like
 ``from app.services.calculators import calculate_ltr`` continue to work.
 """
 
+from app.services.calculators.batch import (
+    calculate_brrrr_batch,
+    calculate_flip_batch,
+    calculate_house_hack_batch,
+    calculate_ltr_batch,
+    calculate_str_batch,
+    calculate_wholesale_batch,
+)
 from app.services.calculators.brrrr import calculate_brrrr
 from app.services.calculators.common import (
     CalculationInputError,
@@ -38,6 +46,7 @@ __all__ = [
     "AVAILABILITY_RANKINGS",
     "CalculationInputError",
     "calculate_brrrr",
+    "calculate_brrrr_batch",
     "calculate_cap_rate",
     "calculate_cash_on_cash",
     "calculate_deal_gap_score",
@@ -45,15 +54,20 @@ __all__ = [
     "calculate_dom_score",
     "calculate_dscr",
     "calculate_flip",
+    "calculate_flip_batch",
     "calculate_grm",
     "calculate_house_hack",
+    "calculate_house_hack_batch",
     "calculate_ltr",
+    "calculate_ltr_batch",
     "calculate_ltr_breakeven",
     "calculate_monthly_mortgage",
     "calculate_noi",
     "calculate_seller_motivation",
     "calculate_str",
+    "calculate_str_batch",
     "calculate_wholesale",
+    "calculate_wholesale_batch",
     "extract_condition_keywords",
     "get_availability_ranking",
     "run_sensitivity_analysis",
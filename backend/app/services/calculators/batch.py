@@ -0,0 +1,925 @@
+"""Vectorized batch kernels for the six strategy calculators.
+
+Each ``calculate_<strategy>_batch`` takes the same keyword arguments as its
+scalar counterpart, but every argument may be a column (1-D array-like) or a
+scalar broadcast across the batch. It returns a dict with the same keys as
+the scalar function, each holding a NumPy column with one entry per row.
+
+The kernels repeat the scalar arithmetic operation for operation, so every
+row is bit-identical to calling the scalar function with that row's inputs
+(``tests/test_calculator_batch.py`` holds them to that). Keep the two in
+step: a formula change in a scalar calculator must be mirrored here.
+
+Representation differences from the scalar dicts:
+  - ``None`` (optional inputs and outputs, e.g. house-hack scenario B) is NaN.
+  - ``ten_year_projection`` (LTR) is a dict of ``(rows, 10)`` arrays.
+  - ``seasonality_analysis`` (STR) keeps one entry per season, with the
+    ``adr`` and ``revenue`` fields as columns.
+
+Pure calculation module — accepts only explicit, fully-resolved parameters.
+No imports from app.core.defaults allowed.
+"""
+
+from typing import Any
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from .common import CalculationInputError, validate_financial_inputs
+from .str_calc import DEFAULT_SEASONALITY, SeasonConfig
+
+Column = NDArray[np.float64]
+
+
+def _columns(**inputs: ArrayLike | None) -> dict[str, Column]:
+    """Broadcast every input to one float64 column; ``None`` becomes NaN."""
+    arrays = [
+        np.atleast_1d(np.asarray(np.nan if value is None else value, dtype=np.float64)) for value in inputs.values()
+    ]
+    if any(array.ndim != 1 for array in arrays):
+        raise CalculationInputError("Batch inputs must be scalars or one-dimensional columns")
+    try:
+        broadcast = np.broadcast_arrays(*arrays)
+    except ValueError as e:
+        raise CalculationInputError(f"Batch input columns differ in length: {e}") from None
+    return dict(zip(inputs, broadcast, strict=True))
+
+
+def _validate(invalid: NDArray[np.bool_], **columns: Column | None) -> None:
+    """Raise ``CalculationInputError`` for the first row ``invalid`` flags.
+
+    The message comes from ``validate_financial_inputs`` on that row, so
+    batch and scalar callers see the same wording.
+    """
+    if not invalid.any():
+        return
+    row = int(np.argmax(invalid))
+    try:
+        validate_financial_inputs(
+            **{name: None if column is None else column[row].item() for name, column in columns.items()}
+        )
+    except CalculationInputError as e:
+        raise CalculationInputError(f"Row {row}: {e}") from None
+
+
+def _outside(column: Column, lo: float, hi: float, *, lo_inclusive: bool = True) -> NDArray[np.bool_]:
+    """Rows outside ``validate_financial_inputs``' bounds (NaN passes, as in the scalar check)."""
+    below = column < lo if lo_inclusive else column <= lo
+    return below | (column > hi)
+
+
+# ``np.power`` (``**``) dispatches to SIMD kernels that can differ from libm's ``pow``
+# in the last bit; ``np.float_power`` runs the plain libm loop, so rows stay
+# bit-identical to Python's ``float ** float`` in the scalar calculators.
+_pow = np.float_power
+
+
+def _monthly_mortgage(principal: Column, annual_rate: Column, years: Column) -> Column:
+    """``calculate_monthly_mortgage`` over columns."""
+    monthly_rate = annual_rate / 12
+    num_payments = years * 12
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        growth = _pow(1 + monthly_rate, num_payments)
+        amortizing = principal * (monthly_rate * growth) / (growth - 1)
+        interest_free = principal / num_payments
+    payment = np.where(annual_rate == 0, interest_free, amortizing)
+    return np.where((principal <= 0) | (years < 1), 0.0, payment)
+
+
+def _seller_term(term_years: Column) -> Column:
+    """``max(1, int(term_years or 30))``."""
+    return np.maximum(1.0, np.trunc(np.where(term_years == 0, 30.0, term_years)))
+
+
+def _seller_monthly_payment(
+    principal: Column, annual_rate: Column, term_years: Column, interest_only: Column
+) -> Column:
+    """``seller_monthly_payment`` over columns (``interest_only`` as 0/1)."""
+    deferred = np.where(annual_rate <= 0, 0.0, principal * annual_rate / 12)
+    amortizing = _monthly_mortgage(principal, annual_rate, _seller_term(term_years))
+    return np.where(principal <= 0, 0.0, np.where(interest_only != 0, deferred, amortizing))
+
+
+def _combined_pi(
+    bank_loan: Column,
+    bank_rate: Column,
+    bank_term_years: Column,
+    seller_principal: Column,
+    seller_rate: Column,
+    seller_term_years: Column,
+    seller_interest_only: Column,
+) -> tuple[Column, Column, Column]:
+    """``combined_bank_and_seller_pi`` over columns."""
+    bank_pi = _monthly_mortgage(bank_loan, bank_rate, bank_term_years)
+    seller_pi = np.where(
+        seller_principal <= 0,
+        0.0,
+        _seller_monthly_payment(seller_principal, seller_rate, seller_term_years, seller_interest_only),
+    )
+    return bank_pi, seller_pi, np.where(seller_principal <= 0, bank_pi, bank_pi + seller_pi)
+
+
+def _bank_loan_after_seller_carry(purchase_price: Column, down_payment: Column, seller_carry: Column) -> Column:
+    conventional_loan = np.maximum(0.0, purchase_price - np.maximum(0.0, down_payment))
+    return np.maximum(0.0, conventional_loan - np.maximum(0.0, seller_carry))
+
+
+def _divide(numerator: Column, denominator: Column, when: NDArray[np.bool_], otherwise: float) -> Column:
+    """``numerator / denominator if when else otherwise``, without warnings for the masked rows."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(when, numerator / denominator, otherwise)
+
+
+def _seller_carry(amount: Column) -> Column:
+    """``max(0.0, float(seller_carry_amount or 0.0))`` (NaN counts as unset)."""
+    return np.maximum(0.0, np.nan_to_num(amount, nan=0.0))
+
+
+def calculate_ltr_batch(
+    purchase_price: ArrayLike,
+    monthly_rent: ArrayLike,
+    property_taxes_annual: ArrayLike,
+    down_payment_pct: ArrayLike,
+    interest_rate: ArrayLike,
+    loan_term_years: ArrayLike,
+    closing_costs_pct: ArrayLike,
+    vacancy_rate: ArrayLike,
+    property_management_pct: ArrayLike,
+    maintenance_pct: ArrayLike,
+    insurance_annual: ArrayLike,
+    utilities_monthly: ArrayLike,
+    landscaping_annual: ArrayLike,
+    pest_control_annual: ArrayLike,
+    appreciation_rate: ArrayLike,
+    rent_growth_rate: ArrayLike,
+    expense_growth_rate: ArrayLike,
+    hoa_monthly: ArrayLike = 0,
+    rehab_costs: ArrayLike = 0.0,
+    seller_carry_amount: ArrayLike = 0.0,
+    seller_carry_rate: ArrayLike = 0.0,
+    seller_carry_term_years: ArrayLike = 30,
+    seller_carry_interest_only: ArrayLike = False,
+) -> dict[str, Any]:
+    """Column-wise ``calculate_ltr``."""
+    c = _columns(**locals())
+    pp, rent, rate, dpp, term = (
+        c["purchase_price"],
+        c["monthly_rent"],
+        c["interest_rate"],
+        c["down_payment_pct"],
+        c["loan_term_years"],
+    )
+    _validate(
+        _outside(pp, 0, 100_000_000, lo_inclusive=False)
+        | _outside(rent, 0, 1_000_000)
+        | _outside(rate, 0, 0.30)
+        | _outside(dpp, -1.0, 1.0)
+        | _outside(term, 1, 50),
+        purchase_price=pp,
+        monthly_rent=rent,
+        interest_rate=rate,
+        down_payment_pct=dpp,
+        loan_term_years=term,
+    )
+
+    down_payment = pp * dpp
+    closing_costs = pp * c["closing_costs_pct"]
+    sc = _seller_carry(c["seller_carry_amount"])
+    loan_amount = _bank_loan_after_seller_carry(pp, down_payment, sc)
+    cash_equity_at_close = np.maximum(0.0, pp - loan_amount - sc)
+    total_cash_required = pp + closing_costs + c["rehab_costs"] - loan_amount - sc
+
+    bank_pi, seller_pi, monthly_pi = _combined_pi(
+        loan_amount,
+        rate,
+        term,
+        sc,
+        c["seller_carry_rate"],
+        c["seller_carry_term_years"],
+        c["seller_carry_interest_only"],
+    )
+    annual_debt_service = monthly_pi * 12
+
+    vacancy_rate = c["vacancy_rate"]
+    annual_gross_rent = rent * 12
+    vacancy_loss = annual_gross_rent * vacancy_rate
+    effective_gross_income = annual_gross_rent - vacancy_loss
+
+    property_management = annual_gross_rent * c["property_management_pct"]
+    maintenance = annual_gross_rent * c["maintenance_pct"]
+    utilities_annual = c["utilities_monthly"] * 12
+    hoa_annual = c["hoa_monthly"] * 12
+    total_operating_expenses = (
+        c["property_taxes_annual"]
+        + c["insurance_annual"]
+        + property_management
+        + maintenance
+        + utilities_annual
+        + c["landscaping_annual"]
+        + c["pest_control_annual"]
+        + hoa_annual
+    )
+
+    noi = effective_gross_income - total_operating_expenses
+    annual_cash_flow = noi - annual_debt_service
+    monthly_cash_flow = annual_cash_flow / 12
+
+    cap_rate = _divide(noi, pp, pp != 0, 0.0)
+    cash_on_cash = _divide(annual_cash_flow, total_cash_required, total_cash_required > 0, 0.0)
+    dscr = _divide(noi, annual_debt_service, annual_debt_service != 0, np.inf)
+    grm = _divide(pp, annual_gross_rent, annual_gross_rent != 0, np.inf)
+    one_percent_rule = rent / pp
+
+    # 10-year projection: rows x years
+    year = np.arange(1, 11, dtype=np.float64)
+    col = np.newaxis
+    monthly_rate = rate / 12
+    total_payments = term * 12
+    year_gross_rent = annual_gross_rent[:, col] * _pow(1 + c["rent_growth_rate"][:, col], year - 1)
+    year_expenses = total_operating_expenses[:, col] * _pow(1 + c["expense_growth_rate"][:, col], year - 1)
+    year_noi = year_gross_rent * (1 - vacancy_rate[:, col]) - year_expenses
+    year_cash_flow = year_noi - annual_debt_service[:, col]
+    property_value = pp[:, col] * _pow(1 + c["appreciation_rate"][:, col], year)
+    payments_made = year * 12
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        growth = 1 + monthly_rate[:, col]
+        amortized_balance = loan_amount[:, col] * (
+            (_pow(growth, total_payments[:, col]) - _pow(growth, payments_made))
+            / (_pow(growth, total_payments[:, col]) - 1)
+        )
+        linear_balance = loan_amount[:, col] * (1 - payments_made / total_payments[:, col])
+    remaining_balance = np.where(rate[:, col] == 0, linear_balance, amortized_balance)
+    rows = pp.shape[0]
+
+    return {
+        "monthly_rent": rent,
+        "annual_gross_rent": annual_gross_rent,
+        "vacancy_loss": vacancy_loss,
+        "effective_gross_income": effective_gross_income,
+        "property_taxes": c["property_taxes_annual"],
+        "insurance": c["insurance_annual"],
+        "property_management": property_management,
+        "maintenance": maintenance,
+        "utilities": utilities_annual,
+        "landscaping": c["landscaping_annual"],
+        "pest_control": c["pest_control_annual"],
+        "hoa_fees": hoa_annual,
+        "total_operating_expenses": total_operating_expenses,
+        "loan_amount": loan_amount,
+        "seller_carry_amount": sc,
+        "bank_monthly_pi": bank_pi,
+        "seller_monthly_pi": seller_pi,
+        "monthly_pi": monthly_pi,
+        "annual_debt_service": annual_debt_service,
+        "noi": noi,
+        "monthly_cash_flow": monthly_cash_flow,
+        "annual_cash_flow": annual_cash_flow,
+        "cap_rate": cap_rate,
+        "cash_on_cash_return": cash_on_cash,
+        "dscr": dscr,
+        "grm": grm,
+        "one_percent_rule": one_percent_rule,
+        "total_cash_required": total_cash_required,
+        "down_payment": down_payment,
+        "cash_equity_at_close": cash_equity_at_close,
+        "closing_costs": closing_costs,
+        "ten_year_projection": {
+            "year": np.broadcast_to(year, (rows, 10)),
+            "gross_rent": year_gross_rent,
+            "operating_expenses": year_expenses,
+            "noi": year_noi,
+            "debt_service": np.broadcast_to(annual_debt_service[:, col], (rows, 10)),
+            "cash_flow": year_cash_flow,
+            "property_value": property_value,
+            "equity": property_value - remaining_balance,
+        },
+    }
+
+
+def calculate_str_batch(
+    purchase_price: ArrayLike,
+    average_daily_rate: ArrayLike,
+    occupancy_rate: ArrayLike,
+    property_taxes_annual: ArrayLike,
+    down_payment_pct: ArrayLike,
+    interest_rate: ArrayLike,
+    loan_term_years: ArrayLike,
+    closing_costs_pct: ArrayLike,
+    furniture_setup_cost: ArrayLike,
+    platform_fees_pct: ArrayLike,
+    str_management_pct: ArrayLike,
+    cleaning_cost_per_turnover: ArrayLike,
+    cleaning_fee_revenue: ArrayLike,
+    avg_length_of_stay_days: ArrayLike,
+    supplies_monthly: ArrayLike,
+    additional_utilities_monthly: ArrayLike,
+    insurance_annual: ArrayLike,
+    maintenance_annual: ArrayLike,
+    landscaping_annual: ArrayLike,
+    pest_control_annual: ArrayLike,
+    hoa_monthly: ArrayLike = 0,
+    seasonality: list[dict[str, Any]] | None = None,
+    monthly_revenue_override: ArrayLike | None = None,
+    rehab_costs: ArrayLike = 0.0,
+    seller_carry_amount: ArrayLike = 0.0,
+    seller_carry_rate: ArrayLike = 0.0,
+    seller_carry_term_years: ArrayLike = 30,
+    seller_carry_interest_only: ArrayLike = False,
+) -> dict[str, Any]:
+    """Column-wise ``calculate_str``. ``seasonality`` is shared by every row."""
+    c = _columns(**{k: v for k, v in locals().items() if k != "seasonality"})
+    pp, rate, dpp, term = c["purchase_price"], c["interest_rate"], c["down_payment_pct"], c["loan_term_years"]
+    _validate(
+        _outside(pp, 0, 100_000_000, lo_inclusive=False)
+        | _outside(rate, 0, 0.30)
+        | _outside(dpp, -1.0, 1.0)
+        | _outside(term, 1, 50),
+        purchase_price=pp,
+        interest_rate=rate,
+        down_payment_pct=dpp,
+        loan_term_years=term,
+    )
+
+    down_payment = pp * dpp
+    closing_costs = pp * c["closing_costs_pct"]
+    sc = _seller_carry(c["seller_carry_amount"])
+    loan_amount = _bank_loan_after_seller_carry(pp, down_payment, sc)
+    cash_equity_at_close = np.maximum(0.0, pp - loan_amount - sc)
+    total_cash_required = pp + closing_costs + c["furniture_setup_cost"] + c["rehab_costs"] - loan_amount - sc
+
+    bank_pi, seller_pi, monthly_pi = _combined_pi(
+        loan_amount,
+        rate,
+        term,
+        sc,
+        c["seller_carry_rate"],
+        c["seller_carry_term_years"],
+        c["seller_carry_interest_only"],
+    )
+    annual_debt_service = monthly_pi * 12
+
+    adr = c["average_daily_rate"]
+    stay = c["avg_length_of_stay_days"]
+    override = c["monthly_revenue_override"]
+    nights_occupied = 365 * c["occupancy_rate"]
+    num_bookings = nights_occupied / stay
+    rental_revenue = np.where(override > 0, override * 12, adr * nights_occupied)
+    cleaning_fee_revenue_total = c["cleaning_fee_revenue"] * num_bookings
+    total_gross_revenue = rental_revenue + cleaning_fee_revenue_total
+
+    platform_fees = total_gross_revenue * c["platform_fees_pct"]
+    str_management = total_gross_revenue * c["str_management_pct"]
+    cleaning_costs = c["cleaning_cost_per_turnover"] * num_bookings
+    supplies_annual = c["supplies_monthly"] * 12
+    utilities_annual = c["additional_utilities_monthly"] * 12
+    hoa_annual = c["hoa_monthly"] * 12
+    taxes, insurance = c["property_taxes_annual"], c["insurance_annual"]
+    maintenance, landscaping, pest = c["maintenance_annual"], c["landscaping_annual"], c["pest_control_annual"]
+    total_operating_expenses = (
+        taxes
+        + insurance
+        + platform_fees
+        + str_management
+        + cleaning_costs
+        + supplies_annual
+        + utilities_annual
+        + maintenance
+        + landscaping
+        + pest
+        + hoa_annual
+    )
+
+    noi = total_gross_revenue - total_operating_expenses
+    annual_cash_flow = noi - annual_debt_service
+    monthly_cash_flow = annual_cash_flow / 12
+
+    cap_rate = _divide(noi, pp, pp != 0, 0.0)
+    cash_on_cash = _divide(annual_cash_flow, total_cash_required, total_cash_required > 0, 0.0)
+    dscr = _divide(noi, annual_debt_service, annual_debt_service != 0, np.inf)
+    revenue_per_night = total_gross_revenue / 365
+
+    fixed_costs = taxes + insurance + maintenance + landscaping + pest + hoa_annual + annual_debt_service
+    variable_cost_per_night = (adr * (c["platform_fees_pct"] + c["str_management_pct"])) + (
+        c["cleaning_cost_per_turnover"] / stay
+    )
+    revenue_per_night_net = adr - variable_cost_per_night
+    break_even_nights = _divide(fixed_costs, revenue_per_night_net, revenue_per_night_net > 0, 365.0)
+    break_even_occupancy = break_even_nights / 365
+
+    seasons = (
+        [
+            SeasonConfig(
+                name=s.get("name", s.get("season", f"Season {i + 1}")),
+                months=s["months"],
+                occupancy_multiplier=s.get("occupancy_multiplier", s.get("occupancy", 0.75)),
+                adr_multiplier=s.get("adr_multiplier", 1.0),
+            )
+            for i, s in enumerate(seasonality)
+        ]
+        if seasonality
+        else list(DEFAULT_SEASONALITY)
+    )
+    seasonality_analysis = [
+        {
+            "season": season.name,
+            "months": season.months,
+            "occupancy": season.occupancy_multiplier,
+            "adr": adr * season.adr_multiplier,
+            "revenue": adr * season.adr_multiplier * season.occupancy_multiplier * (season.months * 30),
+        }
+        for season in seasons
+    ]
+
+    return {
+        "average_daily_rate": adr,
+        "occupancy_rate": c["occupancy_rate"],
+        "nights_occupied": nights_occupied,
+        "num_bookings": num_bookings,
+        "rental_revenue": rental_revenue,
+        "cleaning_fee_revenue": cleaning_fee_revenue_total,
+        "total_gross_revenue": total_gross_revenue,
+        "property_taxes": taxes,
+        "insurance": insurance,
+        "platform_fees": platform_fees,
+        "str_management": str_management,
+        "cleaning_costs": cleaning_costs,
+        "supplies": supplies_annual,
+        "utilities": utilities_annual,
+        "maintenance": maintenance,
+        "landscaping": landscaping,
+        "pest_control": pest,
+        "total_operating_expenses": total_operating_expenses,
+        "loan_amount": loan_amount,
+        "seller_carry_amount": sc,
+        "bank_monthly_pi": bank_pi,
+        "seller_monthly_pi": seller_pi,
+        "monthly_pi": monthly_pi,
+        "annual_debt_service": annual_debt_service,
+        "noi": noi,
+        "monthly_cash_flow": monthly_cash_flow,
+        "annual_cash_flow": annual_cash_flow,
+        "cap_rate": cap_rate,
+        "cash_on_cash_return": cash_on_cash,
+        "dscr": dscr,
+        "revenue_per_available_night": revenue_per_night,
+        "break_even_occupancy": break_even_occupancy,
+        "total_cash_required": total_cash_required,
+        "down_payment": down_payment,
+        "cash_equity_at_close": cash_equity_at_close,
+        "closing_costs": closing_costs,
+        "furniture_setup": c["furniture_setup_cost"],
+        "seasonality_analysis": seasonality_analysis,
+    }
+
+
+def calculate_brrrr_batch(
+    market_value: ArrayLike,
+    arv: ArrayLike,
+    monthly_rent_post_rehab: ArrayLike,
+    property_taxes_annual: ArrayLike,
+    purchase_discount_pct: ArrayLike,
+    down_payment_pct: ArrayLike,
+    interest_rate: ArrayLike,
+    loan_term_years: ArrayLike,
+    closing_costs_pct: ArrayLike,
+    renovation_budget: ArrayLike,
+    contingency_pct: ArrayLike,
+    holding_period_months: ArrayLike,
+    monthly_holding_costs: ArrayLike,
+    refinance_ltv: ArrayLike,
+    refinance_interest_rate: ArrayLike,
+    refinance_term_years: ArrayLike,
+    refinance_closing_costs: ArrayLike,
+    vacancy_rate: ArrayLike,
+    operating_expense_pct: ArrayLike,
+    insurance_annual: ArrayLike,
+    hoa_monthly: ArrayLike = 0,
+    seller_carry_amount: ArrayLike = 0.0,
+    seller_carry_rate: ArrayLike = 0.0,
+    seller_carry_term_years: ArrayLike = 30,
+) -> dict[str, Any]:
+    """Column-wise ``calculate_brrrr``."""
+    c = _columns(**locals())
+    mv, arv_, rent, rate, dpp, term = (
+        c["market_value"],
+        c["arv"],
+        c["monthly_rent_post_rehab"],
+        c["interest_rate"],
+        c["down_payment_pct"],
+        c["loan_term_years"],
+    )
+    renovation, hold = c["renovation_budget"], c["holding_period_months"]
+    _validate(
+        _outside(mv, 0, 100_000_000, lo_inclusive=False)
+        | _outside(arv_, 0, 100_000_000, lo_inclusive=False)
+        | _outside(rent, 0, 1_000_000)
+        | _outside(rate, 0, 0.30)
+        | _outside(dpp, -1.0, 1.0)
+        | _outside(term, 1, 50)
+        | _outside(renovation, 0, 10_000_000)
+        | _outside(hold, 1, 120),
+        purchase_price=mv,
+        arv=arv_,
+        monthly_rent=rent,
+        interest_rate=rate,
+        down_payment_pct=dpp,
+        loan_term_years=term,
+        rehab_cost=renovation,
+        holding_period_months=hold,
+    )
+
+    purchase_price = mv * (1 - c["purchase_discount_pct"])
+    down_payment = purchase_price * dpp
+    closing_costs = purchase_price * c["closing_costs_pct"]
+    sc = _seller_carry(c["seller_carry_amount"])
+    initial_loan_amount = _bank_loan_after_seller_carry(purchase_price, down_payment, sc)
+    cash_equity_phase1 = np.maximum(0.0, down_payment - sc)
+    cash_required_phase1 = np.maximum(0.0, np.maximum(0.0, down_payment) + np.maximum(0.0, closing_costs) - sc)
+
+    contingency = renovation * c["contingency_pct"]
+    total_rehab = renovation + contingency
+    holding_costs = c["monthly_holding_costs"] * hold
+    cash_required_phase2 = total_rehab + holding_costs
+    total_cash_invested = cash_required_phase1 + cash_required_phase2
+
+    annual_gross_rent = rent * 12
+    effective_gross_income = annual_gross_rent * (1 - c["vacancy_rate"])
+    hoa_annual = c["hoa_monthly"] * 12
+    operating_expenses = (
+        annual_gross_rent * c["operating_expense_pct"] + c["property_taxes_annual"] + c["insurance_annual"] + hoa_annual
+    )
+    noi = effective_gross_income - operating_expenses
+    estimated_cap_rate = _divide(noi, arv_, arv_ > 0, 0.0)
+
+    refinance_loan_amount = arv_ * c["refinance_ltv"]
+    cash_out = refinance_loan_amount - initial_loan_amount - c["refinance_closing_costs"]
+    _, seller_pi, new_monthly_pi = _combined_pi(
+        refinance_loan_amount,
+        c["refinance_interest_rate"],
+        c["refinance_term_years"],
+        sc,
+        c["seller_carry_rate"],
+        c["seller_carry_term_years"],
+        np.zeros_like(sc),
+    )
+    new_annual_debt_service = new_monthly_pi * 12
+
+    capital_recycled_pct = _divide(cash_out, total_cash_invested, total_cash_invested > 0, 0.0)
+    cash_left_in_deal = total_cash_invested - cash_out
+    equity_position = arv_ - refinance_loan_amount
+    equity_pct = _divide(equity_position, arv_, arv_ > 0, 0.0)
+
+    post_refi_annual_cash_flow = noi - new_annual_debt_service
+    post_refi_monthly_cash_flow = post_refi_annual_cash_flow / 12
+    post_refi_cash_on_cash = _divide(post_refi_annual_cash_flow, cash_left_in_deal, cash_left_in_deal > 0, np.inf)
+
+    return {
+        "purchase_price": purchase_price,
+        "down_payment": down_payment,
+        "cash_equity_at_close": cash_equity_phase1,
+        "seller_carry_amount": sc,
+        "seller_monthly_pi": seller_pi,
+        "closing_costs": closing_costs,
+        "initial_loan_amount": initial_loan_amount,
+        "cash_required_phase1": cash_required_phase1,
+        "renovation_budget": renovation,
+        "contingency": contingency,
+        "holding_costs": holding_costs,
+        "cash_required_phase2": cash_required_phase2,
+        "arv": arv_,
+        "post_rehab_monthly_rent": rent,
+        "annual_gross_rent": annual_gross_rent,
+        "hoa_annual": hoa_annual,
+        "estimated_cap_rate": estimated_cap_rate,
+        "refinance_loan_amount": refinance_loan_amount,
+        "refinance_costs": c["refinance_closing_costs"],
+        "original_loan_payoff": initial_loan_amount,
+        "cash_out_at_refinance": cash_out,
+        "new_monthly_pi": new_monthly_pi,
+        "total_cash_invested": total_cash_invested,
+        "capital_recycled_pct": capital_recycled_pct,
+        "cash_left_in_deal": cash_left_in_deal,
+        "equity_position": equity_position,
+        "equity_pct": equity_pct,
+        "post_refi_annual_cash_flow": post_refi_annual_cash_flow,
+        "post_refi_monthly_cash_flow": post_refi_monthly_cash_flow,
+        "post_refi_cash_on_cash": post_refi_cash_on_cash,
+        "infinite_roi_achieved": cash_left_in_deal <= 0,
+        "total_months_to_repeat": hold + 2 + 1,
+    }
+
+
+def calculate_flip_batch(
+    market_value: ArrayLike,
+    arv: ArrayLike,
+    purchase_discount_pct: ArrayLike,
+    hard_money_ltv: ArrayLike,
+    hard_money_rate: ArrayLike,
+    closing_costs_pct: ArrayLike,
+    renovation_budget: ArrayLike,
+    contingency_pct: ArrayLike,
+    holding_period_months: ArrayLike,
+    property_taxes_annual: ArrayLike,
+    insurance_annual: ArrayLike,
+    utilities_monthly: ArrayLike,
+    selling_costs_pct: ArrayLike,
+    capital_gains_rate: ArrayLike,
+    inspection_costs: ArrayLike = 1000,
+    security_maintenance_monthly: ArrayLike = 83,
+    hoa_monthly: ArrayLike = 0,
+    seller_carry_amount: ArrayLike = 0.0,
+    seller_carry_rate: ArrayLike = 0.0,
+    seller_carry_term_years: ArrayLike = 30,
+) -> dict[str, Any]:
+    """Column-wise ``calculate_flip``."""
+    c = _columns(**locals())
+    mv, arv_, rate, renovation, hold = (
+        c["market_value"],
+        c["arv"],
+        c["hard_money_rate"],
+        c["renovation_budget"],
+        c["holding_period_months"],
+    )
+    # The scalar check skips a zero holding period and truncates the rest to whole months.
+    hold_months = np.where(hold != 0, np.trunc(hold), np.nan)
+    _validate(
+        _outside(mv, 0, 100_000_000, lo_inclusive=False)
+        | _outside(arv_, 0, 100_000_000, lo_inclusive=False)
+        | _outside(rate, 0, 0.30)
+        | _outside(renovation, 0, 10_000_000)
+        | _outside(hold_months, 1, 120),
+        purchase_price=mv,
+        arv=arv_,
+        interest_rate=rate,
+        rehab_cost=renovation,
+        holding_period_months=hold_months,
+    )
+
+    purchase_price = mv * (1 - c["purchase_discount_pct"])
+    nominal_equity = purchase_price * (1 - c["hard_money_ltv"])
+    sc = _seller_carry(c["seller_carry_amount"])
+    nominal_cash = np.maximum(0.0, nominal_equity)
+    hard_money_loan = np.maximum(0.0, purchase_price - np.maximum(nominal_cash, sc))
+    cash_equity_at_close = np.maximum(0.0, nominal_cash - sc)
+    closing_costs = purchase_price * c["closing_costs_pct"]
+    inspection = c["inspection_costs"]
+    total_acquisition_cash = cash_equity_at_close + closing_costs + inspection
+
+    contingency = renovation * c["contingency_pct"]
+    total_renovation = renovation + contingency
+
+    hard_money_interest = hard_money_loan * rate * (hold / 12)
+    property_taxes_holding = c["property_taxes_annual"] * (hold / 12)
+    insurance_holding = c["insurance_annual"] * (hold / 12)
+    utilities_total = c["utilities_monthly"] * hold
+    security_maintenance = c["security_maintenance_monthly"] * hold
+    hoa_holding = c["hoa_monthly"] * hold
+    total_holding_costs = (
+        hard_money_interest
+        + property_taxes_holding
+        + insurance_holding
+        + utilities_total
+        + security_maintenance
+        + hoa_holding
+    )
+
+    total_project_cost = purchase_price + closing_costs + inspection + total_renovation + total_holding_costs
+    total_cash_required = total_acquisition_cash + total_renovation + total_holding_costs
+
+    selling_costs_pct = c["selling_costs_pct"]
+    total_selling_costs = arv_ * selling_costs_pct
+    net_sale_proceeds = arv_ - total_selling_costs
+
+    gross_profit = arv_ - total_project_cost
+    net_profit_before_tax = net_sale_proceeds - total_project_cost
+    capital_gains_tax = np.maximum(0.0, net_profit_before_tax * c["capital_gains_rate"])
+    net_profit_after_tax = net_profit_before_tax - capital_gains_tax
+
+    roi = _divide(net_profit_before_tax, total_cash_required, total_cash_required > 0, 0.0)
+    annualized_roi = np.where(hold > 0, roi * _divide(np.full_like(hold, 12.0), hold, hold > 0, 0.0), 0.0)
+    profit_margin = _divide(net_profit_before_tax, arv_, arv_ > 0, 0.0)
+
+    seventy_pct_max_price = (arv_ * 0.70) - renovation
+    minimum_sale_for_breakeven = _divide(total_project_cost, 1 - selling_costs_pct, selling_costs_pct < 1, 0.0)
+
+    return {
+        "purchase_price": purchase_price,
+        "hard_money_loan": hard_money_loan,
+        "down_payment": nominal_equity,
+        "cash_equity_at_close": cash_equity_at_close,
+        "seller_carry_amount": sc,
+        "closing_costs": closing_costs,
+        "inspection_costs": inspection,
+        "total_acquisition_cash": total_acquisition_cash,
+        "renovation_budget": renovation,
+        "contingency": contingency,
+        "total_renovation": total_renovation,
+        "hard_money_interest": hard_money_interest,
+        "property_taxes": property_taxes_holding,
+        "insurance": insurance_holding,
+        "utilities": utilities_total,
+        "security_maintenance": security_maintenance,
+        "hoa_holding": hoa_holding,
+        "total_holding_costs": total_holding_costs,
+        "arv": arv_,
+        "total_selling_costs": total_selling_costs,
+        "net_sale_proceeds": net_sale_proceeds,
+        "total_project_cost": total_project_cost,
+        "gross_profit": gross_profit,
+        "net_profit_before_tax": net_profit_before_tax,
+        "capital_gains_tax": capital_gains_tax,
+        "net_profit_after_tax": net_profit_after_tax,
+        "roi": roi,
+        "annualized_roi": annualized_roi,
+        "profit_margin": profit_margin,
+        "total_cash_required": total_cash_required,
+        "seventy_pct_max_price": seventy_pct_max_price,
+        "meets_70_rule": purchase_price <= seventy_pct_max_price,
+        "minimum_sale_for_breakeven": minimum_sale_for_breakeven,
+    }
+
+
+def calculate_house_hack_batch(
+    purchase_price: ArrayLike,
+    monthly_rent_per_room: ArrayLike,
+    rooms_rented: ArrayLike,
+    property_taxes_annual: ArrayLike,
+    down_payment_pct: ArrayLike,
+    interest_rate: ArrayLike,
+    loan_term_years: ArrayLike,
+    closing_costs_pct: ArrayLike,
+    fha_mip_rate: ArrayLike,
+    insurance_annual: ArrayLike,
+    owner_unit_market_rent: ArrayLike = 1500,
+    utilities_shared_monthly: ArrayLike = 150,
+    maintenance_monthly: ArrayLike = 200,
+    conversion_cost: ArrayLike | None = None,
+    unit2_rent: ArrayLike | None = None,
+    hoa_monthly: ArrayLike = 0,
+    seller_carry_amount: ArrayLike = 0.0,
+    seller_carry_rate: ArrayLike = 0.0,
+    seller_carry_term_years: ArrayLike = 30,
+) -> dict[str, Any]:
+    """Column-wise ``calculate_house_hack``. Rows without scenario B have NaN scenario-B metrics."""
+    c = _columns(**locals())
+    pp, room_rent, rate, dpp, term = (
+        c["purchase_price"],
+        c["monthly_rent_per_room"],
+        c["interest_rate"],
+        c["down_payment_pct"],
+        c["loan_term_years"],
+    )
+    _validate(
+        _outside(pp, 0, 100_000_000, lo_inclusive=False)
+        | _outside(room_rent, 0, 1_000_000)
+        | _outside(rate, 0, 0.30)
+        | _outside(dpp, -1.0, 1.0)
+        | _outside(term, 1, 50),
+        purchase_price=pp,
+        monthly_rent=room_rent,
+        interest_rate=rate,
+        down_payment_pct=dpp,
+        loan_term_years=term,
+    )
+
+    down_payment = pp * dpp
+    closing_costs = pp * c["closing_costs_pct"]
+    sc = _seller_carry(c["seller_carry_amount"])
+    loan_amount = _bank_loan_after_seller_carry(pp, down_payment, sc)
+    cash_equity_at_close = np.maximum(0.0, pp - loan_amount - sc)
+    total_cash_required = pp + closing_costs - loan_amount - sc
+
+    bank_pi, seller_pi, monthly_pi = _combined_pi(
+        loan_amount,
+        rate,
+        term,
+        sc,
+        c["seller_carry_rate"],
+        c["seller_carry_term_years"],
+        np.zeros_like(sc),
+    )
+    hoa = c["hoa_monthly"]
+    monthly_mip = (loan_amount * c["fha_mip_rate"]) / 12
+    monthly_taxes = c["property_taxes_annual"] / 12
+    monthly_insurance = c["insurance_annual"] / 12
+    monthly_piti = monthly_pi + monthly_mip + monthly_taxes + monthly_insurance + hoa
+
+    utilities, maintenance, owner_rent = (
+        c["utilities_shared_monthly"],
+        c["maintenance_monthly"],
+        c["owner_unit_market_rent"],
+    )
+    total_monthly_income = room_rent * c["rooms_rented"]
+    total_monthly_expenses = monthly_piti + utilities + maintenance
+    net_housing_cost_a = total_monthly_expenses - total_monthly_income
+    savings_vs_renting_a = owner_rent - net_housing_cost_a
+    annual_savings_a = savings_vs_renting_a * 12
+
+    # Scenario B applies when both conversion cost and unit-2 rent are set and non-zero.
+    conversion, unit2 = c["conversion_cost"], c["unit2_rent"]
+    has_b = (np.nan_to_num(conversion) != 0) & (np.nan_to_num(unit2) != 0)
+    heloc = _monthly_mortgage(conversion, np.full_like(conversion, 0.08), np.full_like(conversion, 10.0))
+    heloc_payment = np.where(has_b, heloc, np.nan)
+    scenario_b_expenses = monthly_piti + heloc_payment + utilities + (maintenance * 1.25)
+    net_housing_cost_b = np.where(has_b, scenario_b_expenses - unit2, np.nan)
+    savings_vs_renting_b = np.where(has_b, owner_rent - net_housing_cost_b, np.nan)
+
+    housing_cost_offset_pct = _divide(total_monthly_income, total_monthly_expenses, total_monthly_expenses > 0, 0.0)
+    roi_on_savings = _divide(annual_savings_a, total_cash_required, total_cash_required > 0, 0.0)
+
+    return {
+        "purchase_price": pp,
+        "down_payment": down_payment,
+        "cash_equity_at_close": cash_equity_at_close,
+        "closing_costs": closing_costs,
+        "loan_amount": loan_amount,
+        "seller_carry_amount": sc,
+        "bank_monthly_pi": bank_pi,
+        "seller_monthly_pi": seller_pi,
+        "total_cash_required": total_cash_required,
+        "monthly_pi": monthly_pi,
+        "monthly_mip": monthly_mip,
+        "monthly_hoa": hoa,
+        "monthly_piti": monthly_piti,
+        "rooms_rented": c["rooms_rented"],
+        "room_rent": room_rent,
+        "total_monthly_income": total_monthly_income,
+        "utilities_shared": utilities,
+        "maintenance": maintenance,
+        "total_monthly_expenses": total_monthly_expenses,
+        "net_housing_cost_scenario_a": net_housing_cost_a,
+        "savings_vs_renting_a": savings_vs_renting_a,
+        "annual_savings_a": annual_savings_a,
+        "conversion_cost": conversion,
+        "unit2_rent": unit2,
+        "heloc_payment": heloc_payment,
+        "net_housing_cost_scenario_b": net_housing_cost_b,
+        "savings_vs_renting_b": savings_vs_renting_b,
+        "housing_cost_offset_pct": housing_cost_offset_pct,
+        "live_free_threshold": total_monthly_expenses,
+        "roi_on_savings": roi_on_savings,
+    }
+
+
+def calculate_wholesale_batch(
+    arv: ArrayLike,
+    estimated_rehab_costs: ArrayLike,
+    assignment_fee: ArrayLike,
+    marketing_costs: ArrayLike,
+    earnest_money_deposit: ArrayLike,
+    arv_discount_pct: ArrayLike,
+    days_to_close: ArrayLike,
+    time_investment_hours: ArrayLike = 50,
+) -> dict[str, Any]:
+    """Column-wise ``calculate_wholesale``."""
+    c = _columns(**locals())
+    arv_, rehab, fee = c["arv"], c["estimated_rehab_costs"], c["assignment_fee"]
+    _validate(
+        _outside(arv_, 0, 100_000_000, lo_inclusive=False)
+        | _outside(rehab, 0, 10_000_000)
+        | _outside(fee, 0, 1_000_000),
+        arv=arv_,
+        rehab_cost=rehab,
+        assignment_fee=fee,
+    )
+
+    marketing, days, hours = c["marketing_costs"], c["days_to_close"], c["time_investment_hours"]
+    seventy_pct_max_offer = (arv_ * (1 - c["arv_discount_pct"])) - rehab
+    contract_price = seventy_pct_max_offer
+    total_cash_at_risk = c["earnest_money_deposit"] + marketing
+    net_profit = fee - marketing
+
+    roi = _divide(net_profit, total_cash_at_risk, total_cash_at_risk > 0, np.inf)
+    annualized_roi = np.where(days > 0, roi * _divide(np.full_like(days, 365.0), days, days > 0, 0.0), 0.0)
+    effective_hourly_rate = _divide(net_profit, hours, hours > 0, 0.0)
+
+    spread_available = arv_ - contract_price - rehab
+    deal_viability = np.select(
+        [spread_available >= fee + 20000, spread_available >= fee + 10000, spread_available >= fee],
+        ["Strong", "Moderate", "Tight"],
+        "Not Viable",
+    )
+
+    return {
+        "contract_price": contract_price,
+        "earnest_money": c["earnest_money_deposit"],
+        "assignment_fee": fee,
+        "end_buyer_price": contract_price + fee,
+        "marketing_costs": marketing,
+        "total_cash_at_risk": total_cash_at_risk,
+        "gross_profit": fee,
+        "net_profit": net_profit,
+        "roi": roi,
+        "annualized_roi": annualized_roi,
+        "effective_hourly_rate": effective_hourly_rate,
+        "time_investment_hours": hours,
+        "arv": arv_,
+        "estimated_rehab": rehab,
+        "seventy_pct_max_offer": seventy_pct_max_offer,
+        "spread_available": spread_available,
+        "deal_viability": deal_viability,
+        "deals_needed_50k": _divide(np.full_like(net_profit, 50000.0), net_profit, net_profit > 0, np.inf),
+        "deals_needed_100k": _divide(np.full_like(net_profit, 100000.0), net_profit, net_profit > 0, np.inf),
+        "timeline_days": days,
+        "breakeven_assignment_fee": marketing,
+    }
@@ -0,0 +1,275 @@
+"""
+Adaptive per-provider concurrency limits for outbound API calls.
+
+Every ``BaseAPIClient`` request takes a slot from its provider's limiter for
+the duration of the HTTP call. The window adjusts AIMD-style from what the
+provider tells us:
+
+- a success grows the window by ``1 / limit`` (about one slot per window of
+  successful calls), but only while the window is actually in use;
+- a 429, 5xx, timeout or transport error halves it, at most once per
+  ``cooldown`` so one burst of throttled responses counts as one signal;
+- a success far slower than the running latency baseline shrinks it
+  slightly, backing off before the provider starts returning errors.
+
+Callers queue when the window is full. Anything below interactive priority
+(map-search fan-out, scheduled jobs, background refreshes) is marked with
+``outbound_priority(...)`` and may together hold at most ``bulk_share`` of the
+window, and waiters are woken in priority order, so a heavy map search cannot
+starve property searches.
+
+Limits are per process; they track the provider's capacity as seen by this
+worker rather than a fleet-wide quota.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager, suppress
+from contextvars import ContextVar
+from enum import StrEnum
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Weight of each new sample in the latency baseline (EWMA).
+_LATENCY_ALPHA = 0.1
+# Samples needed before latency alone may shrink the window.
+_LATENCY_WARMUP_SAMPLES = 10
+
+
+class Priority(StrEnum):
+    """Scheduling class of an outbound request, highest first."""
+
+    INTERACTIVE = "interactive"  # a user is waiting on this one call
+    BULK = "bulk"  # user-facing fan-out (map search)
+    BACKGROUND = "background"  # scheduled jobs (gap alerts)
+    PREFETCH = "prefetch"  # speculative refreshes of still-servable cache entries
+
+
+_RANK: dict[Priority, int] = {priority: rank for rank, priority in enumerate(Priority)}
+
+
+_priority: ContextVar[Priority] = ContextVar("outbound_priority", default=Priority.INTERACTIVE)
+
+
+def current_priority() -> Priority:
+    """Priority of outbound requests made in the current context."""
+    return _priority.get()
+
+
+@contextmanager
+def outbound_priority(priority: Priority) -> Iterator[None]:
+    """Run outbound requests made in this context (and tasks it spawns) at ``priority``."""
+    token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def _is_overload(status_code: int | None) -> bool:
+    """Whether a response says the provider is at capacity (``None`` = timeout/transport error)."""
+    return status_code is None or status_code == 429 or status_code >= 500
+
+
+class AdaptiveConcurrencyLimiter:
+    """AIMD concurrency window for one provider, with priority-aware queueing."""
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        initial_limit: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 32,
+        bulk_share: float = 0.75,
+        backoff_ratio: float = 0.5,
+        latency_tolerance: float = 2.5,
+        cooldown: float = 1.0,
+    ):
+        self.name = name
+        self.min_limit = max(min_limit, 1)
+        self.max_limit = max(max_limit, self.min_limit)
+        self.limit = float(min(max(initial_limit, self.min_limit), self.max_limit))
+        self.bulk_share = bulk_share
+        self.backoff_ratio = backoff_ratio
+        self.latency_tolerance = latency_tolerance
+        self.cooldown = cooldown
+        self.in_flight = 0
+        self.in_flight_bulk = 0
+        self.throttled = 0
+        self._waiters: dict[Priority, deque[asyncio.Future[None]]] = {p: deque() for p in Priority}
+        self._latency_baseline: float | None = None
+        self._latency_samples = 0
+        self._last_decrease = float("-inf")
+
+    # ─── Window ─────────────────────────────────────────────────────────────
+
+    @property
+    def capacity(self) -> int:
+        """Requests allowed in flight right now."""
+        return max(int(self.limit), self.min_limit)
+
+    @property
+    def bulk_capacity(self) -> int:
+        """Share of ``capacity`` non-interactive requests may hold."""
+        return max(math.floor(self.limit * self.bulk_share), 1)
+
+    @property
+    def queue_depth(self) -> int:
+        """Requests waiting for a slot."""
+        return sum(len(q) for q in self._waiters.values())
+
+    def _can_start(self, priority: Priority) -> bool:
+        if self.in_flight >= self.capacity:
+            return False
+        return priority is Priority.INTERACTIVE or self.in_flight_bulk < self.bulk_capacity
+
+    def _take(self, priority: Priority) -> None:
+        self.in_flight += 1
+        if priority is not Priority.INTERACTIVE:
+            self.in_flight_bulk += 1
+
+    def _wake(self) -> None:
+        """Hand free slots to waiters, highest priority first."""
+        for priority in Priority:
+            waiters = self._waiters[priority]
+            while waiters and self._can_start(priority):
+                waiter = waiters.popleft()
+                if waiter.done():
+                    continue
+                self._take(priority)
+                waiter.set_result(None)
+
+    # ─── Slots ──────────────────────────────────────────────────────────────
+
+    async def acquire(self, priority: Priority | None = None) -> Priority:
+        """Wait for a slot; returns the priority it was taken at (pass it to ``release``)."""
+        priority = priority or _priority.get()
+        queued_ahead = any(self._waiters[p] for p in Priority if _RANK[p] <= _RANK[priority])
+        if not queued_ahead and self._can_start(priority):
+            self._take(priority)
+            return priority
+
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters[priority].append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Granted a slot just as we were cancelled: give it back.
+                self.release(priority)
+            else:
+                with suppress(ValueError):
+                    self._waiters[priority].remove(waiter)
+            raise
+        return priority
+
+    def release(self, priority: Priority) -> None:
+        """Return a slot taken by ``acquire``."""
+        self.in_flight -= 1
+        if priority is not Priority.INTERACTIVE:
+            self.in_flight_bulk -= 1
+        self._wake()
+
+    @asynccontextmanager
+    async def slot(self, priority: Priority | None = None) -> AsyncIterator[None]:
+        """Hold one slot for the body of the ``async with``."""
+        taken = await self.acquire(priority)
+        try:
+            yield
+        finally:
+            self.release(taken)
+
+    # ─── Feedback ───────────────────────────────────────────────────────────
+
+    def on_response(self, status_code: int | None, latency: float) -> None:
+        """Adjust the window from one call's outcome.
+
+        ``status_code`` is ``None`` for a timeout or transport error; ``latency``
+        is the call's duration in seconds, excluding time spent queued. Call it
+        while still holding the slot.
+        """
+        if _is_overload(status_code):
+            self.throttled += 1
+            self._decrease(self.backoff_ratio, f"status={status_code or 'timeout'}")
+            return
+
+        baseline = self._latency_baseline
+        self._latency_samples += 1
+        self._latency_baseline = latency if baseline is None else baseline + _LATENCY_ALPHA * (latency - baseline)
+        if (
+            baseline is not None
+            and self._latency_samples > _LATENCY_WARMUP_SAMPLES
+            and latency > baseline * self.latency_tolerance
+        ):
+            self._decrease(0.9, f"latency={latency * 1000:.0f}ms baseline={baseline * 1000:.0f}ms")
+            return
+
+        # Only grow a window that is actually the bottleneck; an idle limiter
+        # drifting to max_limit would let the next burst hit the provider at once.
+        if self.in_flight >= self.capacity or self.queue_depth:
+            previous = self.capacity
+            self.limit = min(self.limit + 1 / self.limit, float(self.max_limit))
+            if self.capacity > previous:
+                self._wake()
+
+    def _decrease(self, ratio: float, reason: str) -> None:
+        now = time.monotonic()
+        if now - self._last_decrease < self.cooldown:
+            return
+        self._last_decrease = now
+        previous = self.capacity
+        self.limit = max(self.limit * ratio, float(self.min_limit))
+        if self.capacity < previous:
+            logger.info(
+                "Concurrency limit for %s lowered %d -> %d (%s, queued=%d)",
+                self.name,
+                previous,
+                self.capacity,
+                reason,
+                self.queue_depth,
+            )
+
+    def snapshot(self) -> dict[str, Any]:
+        """Current window, load and queue depth, for health endpoints."""
+        return {
+            "limit": self.capacity,
+            "bulk_limit": self.bulk_capacity,
+            "in_flight": self.in_flight,
+            "in_flight_bulk": self.in_flight_bulk,
+            "queue_depth": self.queue_depth,
+            "queued_bulk": self.queue_depth - len(self._waiters[Priority.INTERACTIVE]),
+            "latency_baseline_ms": (
+                round(self._latency_baseline * 1000, 1) if self._latency_baseline is not None else None
+            ),
+            "throttled": self.throttled,
+        }
+
+
+_limiters: dict[str, AdaptiveConcurrencyLimiter] = {}
+
+
+def get_limiter(name: str, *, max_limit: int = 32, initial_limit: int | None = None) -> AdaptiveConcurrencyLimiter:
+    """Return this process's limiter for ``name``, creating it on first use.
+
+    Every client calling the same provider shares one limiter; the first
+    caller's bounds apply. The window starts at half of ``max_limit`` unless
+    ``initial_limit`` is given.
+    """
+    limiter = _limiters.get(name)
+    if limiter is None:
+        initial = initial_limit if initial_limit is not None else max(max_limit // 2, 1)
+        limiter = _limiters[name] = AdaptiveConcurrencyLimiter(name, initial_limit=initial, max_limit=max_limit)
+    return limiter
+
+
+def limiter_snapshots() -> dict[str, dict[str, Any]]:
+    """Snapshot of every provider limiter in this process."""
+    return {name: limiter.snapshot() for name, limiter in sorted(_limiters.items())}
@@ -0,0 +1,64 @@
+"""
+Request-scoped deadlines for outbound work.
+
+A caller with a latency target opens ``deadline_after(seconds)``; every
+``BaseAPIClient`` request (and ``@resilient`` retry) made in that context, or
+in tasks it spawns, is clamped to the time left and is not retried past it.
+Nested scopes can only tighten the deadline. Work that should outlive the
+request (e.g. provider fetches left to fill the cache) runs under
+``no_deadline()``.
+
+Deadlines are ``time.monotonic()`` instants.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+_deadline: ContextVar[float | None] = ContextVar("request_deadline", default=None)
+
+
+@contextmanager
+def deadline_after(seconds: float | None) -> Iterator[None]:
+    """Run the block with a deadline ``seconds`` from now (``None``/``<= 0`` adds none)."""
+    current = _deadline.get()
+    deadline = current
+    if seconds is not None and seconds > 0:
+        candidate = time.monotonic() + seconds
+        deadline = candidate if current is None else min(current, candidate)
+    token = _deadline.set(deadline)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+@contextmanager
+def no_deadline() -> Iterator[None]:
+    """Run the block (and tasks created in it) without the enclosing deadline."""
+    token = _deadline.set(None)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining() -> float | None:
+    """Seconds left before the current deadline (may be negative), or ``None`` without one."""
+    deadline = _deadline.get()
+    return None if deadline is None else deadline - time.monotonic()
+
+
+def expired() -> bool:
+    """Whether the current deadline has passed."""
+    left = remaining()
+    return left is not None and left <= 0
+
+
+def allows(seconds: float) -> bool:
+    """Whether ``seconds`` more (e.g. a retry backoff) still ends before the deadline."""
+    left = remaining()
+    return left is None or seconds < left
@@ -12,7 +12,9 @@ twice.
 Designed for the cron-gated jobs router (same model as
 ``send_overdue_task_digests``): run once daily. Each check is one
 ``PropertyService.search_property`` call (Redis-cached, 24h TTL), so
-``max_checks`` caps provider spend per run.
+``max_checks`` caps provider spend per run. Checks run at background
+priority: once a provider budget is down to the share reserved for
+interactive searches, the rest of the run is deferred to the next one.
 """
 
 from __future__ import annotations
@@ -26,6 +28,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.saved_property import PropertyStatus, SavedProperty
+from app.services.concurrency_limiter import Priority, outbound_priority
 from app.services.property_service import property_service
 from app.services.push_notification_service import push_service
 
@@ -80,7 +83,9 @@ async def send_gap_alerts(db: AsyncSession, *, max_checks: int = 25) -> dict[str
     Prioritizes the least-recently-checked properties so the whole watchlist
     rotates through over successive runs even when it exceeds ``max_checks``.
 
-    Returns {checked, price_drops, alerts_sent, errors} for cron logging.
+    Returns {checked, price_drops, alerts_sent, errors, deferred} for cron
+    logging; ``deferred`` properties were skipped for lack of provider budget
+    and, never having been checked, are first in line next run.
     """
     result = await db.execute(
         select(SavedProperty)
@@ -95,8 +100,14 @@ async def send_gap_alerts(db: AsyncSession, *, max_checks: int = 25) -> dict[str
     price_drops = 0
     alerts_sent = 0
     errors = 0
+    deferred = 0
+
+    for index, prop in enumerate(properties):
+        if not await property_service.provider_budgets_allow(Priority.BACKGROUND):
+            deferred = len(properties) - index
+            logger.info("Gap alert run deferring %d checks — provider budget low", deferred)
+            break
 
-    for prop in properties:
         address = prop.full_address or ", ".join(
             [p for p in (prop.address_street, prop.address_city, prop.address_state, prop.address_zip) if p]
         )
@@ -104,7 +115,8 @@ async def send_gap_alerts(db: AsyncSession, *, max_checks: int = 25) -> dict[str
             continue
 
         try:
-            response = await property_service.search_property(address, zpid=prop.zpid)
+            with outbound_priority(Priority.BACKGROUND):
+                response = await property_service.search_property(address, zpid=prop.zpid)
         except Exception as exc:
             errors += 1
             logger.warning("Gap alert price check failed for %s: %s", prop.id, exc)
@@ -158,4 +170,5 @@ async def send_gap_alerts(db: AsyncSession, *, max_checks: int = 25) -> dict[str
         "price_drops": price_drops,
         "alerts_sent": alerts_sent,
         "errors": errors,
+        "deferred": deferred,
     }
@@ -0,0 +1,87 @@
+"""
+Bounded per-process LRU cache for encoded cache values.
+
+Used by ``CacheService`` in two roles:
+
+- L1 in front of Redis for a few hot key prefixes (admin assumptions,
+  property blobs, provider payloads), so repeat reads skip the network.
+- The whole cache when Redis is unavailable.
+
+Values are stored as the encoded bytes ``CacheService`` reads from or writes
+to Redis, so the byte budget is exact and callers always get a fresh decoded
+copy they are free to mutate.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+
+
+class LocalLRUCache:
+    """Least-recently-used cache of ``bytes`` values with per-entry expiry and a byte budget."""
+
+    def __init__(self, max_bytes: int, max_item_bytes: int | None = None):
+        self.max_bytes = max_bytes
+        # A single entry may use at most this much of the budget, so one huge
+        # value can't flush every hot key.
+        self.max_item_bytes = max_item_bytes if max_item_bytes is not None else max_bytes // 8
+        self.bytes_used = 0
+        self._entries: OrderedDict[str, tuple[bytes, float]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not None
+
+    def get(self, key: str) -> bytes | None:
+        """Return the value for ``key`` and mark it most recently used."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if time.monotonic() >= expires_at:
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: bytes, ttl_seconds: float) -> bool:
+        """Store ``value`` for ``ttl_seconds``, evicting LRU entries to fit the budget.
+
+        Returns False (and drops any previous value) when the entry is too
+        large to cache or the TTL is not positive.
+        """
+        self._remove(key)
+        if ttl_seconds <= 0 or len(value) > self.max_item_bytes:
+            return False
+        while self._entries and self.bytes_used + len(value) > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+        self._entries[key] = (value, time.monotonic() + ttl_seconds)
+        self.bytes_used += len(value)
+        return True
+
+    def delete(self, key: str) -> bool:
+        """Remove ``key``; True if it was present."""
+        return self._remove(key)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.bytes_used = 0
+
+    def purge_expired(self) -> int:
+        """Drop every expired entry; returns how many were removed."""
+        now = time.monotonic()
+        expired = [k for k, (_, expires_at) in self._entries.items() if now >= expires_at]
+        for key in expired:
+            self._remove(key)
+        return len(expired)
+
+    def _remove(self, key: str) -> bool:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        self.bytes_used -= len(entry[0])
+        return True
@@ -22,13 +22,13 @@ from app.data.motivated_seller_keywords import MOTIVATED_SELLER_KEYWORDS
 from app.schemas.property import MapListing, MapSearchRequest, MapSearchResponse
 from app.services.api_clients import MashvisorClient, RentCastClient, create_api_clients
 from app.services.cache_service import get_cache_service
+from app.services.concurrency_limiter import Priority, outbound_priority
 from app.services.zillow_client import ZillowClient, create_zillow_client
 
 logger = logging.getLogger(__name__)
 
 MAP_CACHE_TTL = 600  # 10 minutes
 MOTIVATED_SELLER_KEYWORD_CACHE_TTL = 1800  # 30 minutes per keyword + viewport
-MOTIVATED_SELLER_CONCURRENCY = 8
 
 # Average days per year (accounts for leap years) — used to translate an
 # owner-tenure window in years into RentCast's saleDateRange (days-ago) filter.
@@ -69,8 +69,10 @@ EXPIRED_MAX_AGE_DAYS = 120
 RECENT_RESALE_TIMEOUT_S = 12.0
 
 # Per-property expired validation: each delisted candidate gets a current-status
-# lookup on Zillow. Bounded by concurrency + per-call timeout + a candidate cap
-# so the (many, slow) lookups can't blow the request budget.
+# lookup on Zillow. Bounded by a per-call timeout + a candidate cap so the (many,
+# slow) lookups can't blow the request budget. At most this many (fewer when
+# the AXESSO limiter's bulk share is smaller) are started at once, so the
+# timeout covers the lookup rather than time spent queued for a slot.
 EXPIRED_VALIDATION_CONCURRENCY = 10
 EXPIRED_VALIDATION_TIMEOUT_S = 6.0
 EXPIRED_VALIDATION_MAX_CANDIDATES = 60
@@ -348,6 +350,17 @@ class MapSearchService:
         self._initialized = True
 
     async def search(self, req: MapSearchRequest) -> MapSearchResponse:
+        """Search listings in the viewport.
+
+        A search fans out to many provider calls (grid cells, keywords,
+        per-listing validation), so all of them run at bulk priority: they
+        share the provider concurrency windows with property searches without
+        being able to take all of them.
+        """
+        with outbound_priority(Priority.BULK):
+            return await self._search(req)
+
+    async def _search(self, req: MapSearchRequest) -> MapSearchResponse:
         self._ensure_clients()
         cache = get_cache_service()
 
@@ -1100,8 +1113,8 @@ class MapSearchService:
         contingent) or sold — leaving the genuinely off-market "listed but didn't
         sell, not relisted" set the user is after.
 
-        Bounded by concurrency, a per-call timeout, and a candidate cap so the
-        per-property lookups can't blow the request budget. Lookups that fail are
+        Bounded by a per-call timeout, a concurrency cap and a candidate cap so
+        the per-property lookups can't blow the request budget. Lookups that fail are
         kept (not *confirmed* relisted).
         """
         if not self.zillow or not candidates:
@@ -1114,7 +1127,13 @@ class MapSearchService:
                 EXPIRED_VALIDATION_MAX_CANDIDATES,
                 len(candidates),
             )
-        semaphore = asyncio.Semaphore(EXPIRED_VALIDATION_CONCURRENCY)
+
+        # Wait for a turn outside the timeout: the AXESSO limiter queues bulk
+        # calls past its bulk share, and a lookup timed out in that queue
+        # would keep an unverified candidate.
+        limiter = getattr(self.zillow, "limiter", None)
+        bulk_capacity = limiter.bulk_capacity if limiter is not None else EXPIRED_VALIDATION_CONCURRENCY
+        semaphore = asyncio.Semaphore(min(EXPIRED_VALIDATION_CONCURRENCY, bulk_capacity))
 
         async def _keep(candidate: MapListing) -> MapListing | None:
             async with semaphore:
@@ -1704,25 +1723,18 @@ class MapSearchService:
         self,
         req: MapSearchRequest,
         keyword: str,
-        cache: Any,
-    ) -> list[MapListing]:
-        """Fetch for-sale listings matching a single Zillow keyword within the viewport."""
+    ) -> list[MapListing] | None:
+        """Fetch for-sale listings matching a single Zillow keyword within the viewport.
+
+        Returns ``None`` when the fetch failed, so the caller does not cache it.
+        """
         if not self.zillow:
             return []
 
-        cache_key = _build_keyword_cache_key(keyword, req)
-        cached = await cache.get(cache_key)
-        if cached:
-            try:
-                return [MapListing(**item) for item in cached]
-            except Exception:
-                logger.warning("Motivated-seller keyword cache parse failed for %r", keyword)
-
         url = self._zillow_keyword_url(req.north, req.south, req.east, req.west, keyword)
         try:
             resp = await self.zillow.search_by_url(url)
             if not resp.success or not resp.data:
-                await cache.set(cache_key, [], ttl_seconds=MOTIVATED_SELLER_KEYWORD_CACHE_TTL)
                 return []
 
             raw_props = resp.data.get("results") or resp.data.get("props") or resp.data.get("searchResults") or []
@@ -1739,39 +1751,53 @@ class MapSearchService:
                 listing = self._normalize_zillow_listing(item)
                 results.append(listing.model_copy(update={"motivated_keywords": [keyword]}))
 
-            await cache.set(
-                cache_key,
-                [item.model_dump(mode="json") for item in results],
-                ttl_seconds=MOTIVATED_SELLER_KEYWORD_CACHE_TTL,
-            )
             if results:
                 logger.info("Zillow keyword %r: %d listings", keyword, len(results))
             return results
         except Exception:
             logger.exception("Zillow keyword %r listing fetch failed", keyword)
-            return []
+            return None
 
     async def _fetch_motivated_seller_listings(
         self,
         req: MapSearchRequest,
         cache: Any,
     ) -> list[MapListing]:
-        """Run parallel Zillow keyword searches for every motivated-seller phrase."""
+        """Run parallel Zillow keyword searches for every motivated-seller phrase.
+
+        Cached keyword results are read with one ``get_many`` up front and
+        fresh ones written back with one ``set_many``.
+        """
         if not self.zillow:
             return []
 
-        semaphore = asyncio.Semaphore(MOTIVATED_SELLER_CONCURRENCY)
         listings_by_addr: dict[str, MapListing] = {}
         hits_by_keyword: dict[str, int] = {}
+        cache_keys = {kw: _build_keyword_cache_key(kw, req) for kw in MOTIVATED_SELLER_KEYWORDS}
+        cached = await cache.get_many(cache_keys.values())
+        fresh: dict[str, list[dict]] = {}
 
         async def _run_keyword(keyword: str) -> None:
-            async with semaphore:
-                rows = await self._fetch_zillow_keyword(req, keyword, cache)
+            rows: list[MapListing] | None = None
+            cached_rows = cached.get(cache_keys[keyword])
+            if cached_rows:
+                try:
+                    rows = [MapListing(**item) for item in cached_rows]
+                except Exception:
+                    logger.warning("Motivated-seller keyword cache parse failed for %r", keyword)
+            if rows is None:
+                rows = await self._fetch_zillow_keyword(req, keyword)
+                if rows is None:
+                    rows = []
+                else:
+                    fresh[cache_keys[keyword]] = [item.model_dump(mode="json") for item in rows]
             hits_by_keyword[keyword] = len(rows)
             for item in rows:
                 self._merge_listing_into(listings_by_addr, item)
 
         await asyncio.gather(*(_run_keyword(kw) for kw in MOTIVATED_SELLER_KEYWORDS))
+        if fresh:
+            await cache.set_many(fresh, ttl_seconds=MOTIVATED_SELLER_KEYWORD_CACHE_TTL)
 
         keywords_with_hits = sum(1 for count in hits_by_keyword.values() if count > 0)
         logger.info(
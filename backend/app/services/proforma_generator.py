@@ -4,14 +4,15 @@ Compiles property data, calculations, and projections into a complete proforma
 """
 
 import logging
-import math
 from datetime import datetime
 from typing import Any
 
+import numpy as np
+
 from app.schemas.proforma import (
     AcquisitionDetails,
-    AmortizationRow,
     AmortizationSummary,
+    AmortizationTable,
     AnnualTaxProjection,
     DataSources,
     DealScoreSummary,
@@ -224,40 +225,43 @@ def calculate_depreciation(
 
 def calculate_amortization_schedule(
     principal: float, annual_rate: float, term_years: int
-) -> tuple[list[AmortizationRow], AmortizationSummary]:
-    """Generate full amortization schedule."""
+) -> tuple[AmortizationTable, AmortizationSummary]:
+    """Generate full amortization schedule.
+
+    Month-end balances come from the closed form
+    ``B_k = P(1 + r)^k - M((1 + r)^k - 1) / r`` (``P - kM`` at a zero rate),
+    evaluated for every month at once; interest and principal follow from
+    each month's opening balance.
+    """
     monthly_payment = calculate_monthly_mortgage(principal, annual_rate, term_years)
     monthly_rate = annual_rate / 12
     total_months = term_years * 12
 
-    balance = principal
-    cumulative_principal = 0
-    cumulative_interest = 0
-    schedule = []
-
-    for month in range(1, total_months + 1):
-        beginning_balance = balance
-        interest_payment = balance * monthly_rate
-        principal_payment = monthly_payment - interest_payment
-
-        cumulative_principal += principal_payment
-        cumulative_interest += interest_payment
-        balance = max(0, balance - principal_payment)
-
-        schedule.append(
-            AmortizationRow(
-                month=month,
-                year=math.ceil(month / 12),
-                payment_number=month,
-                beginning_balance=beginning_balance,
-                scheduled_payment=monthly_payment,
-                principal_payment=principal_payment,
-                interest_payment=interest_payment,
-                ending_balance=balance,
-                cumulative_principal=cumulative_principal,
-                cumulative_interest=cumulative_interest,
-            )
-        )
+    months = np.arange(1, total_months + 1)
+    if monthly_rate == 0:
+        closed_form = principal - months * monthly_payment
+    else:
+        growth = np.float_power(1 + monthly_rate, months)
+        closed_form = principal * growth - monthly_payment * (growth - 1) / monthly_rate
+    ending_balance = np.maximum(closed_form, 0.0)
+    beginning_balance = np.append(principal, ending_balance)[:total_months]
+    interest_payment = beginning_balance * monthly_rate
+    principal_payment = monthly_payment - interest_payment
+    cumulative_interest = np.cumsum(interest_payment)
+
+    schedule = AmortizationTable(
+        month=months,
+        year=(months + 11) // 12,
+        payment_number=months,
+        beginning_balance=beginning_balance,
+        scheduled_payment=np.full(total_months, monthly_payment),
+        principal_payment=principal_payment,
+        interest_payment=interest_payment,
+        ending_balance=ending_balance,
+        cumulative_principal=np.cumsum(principal_payment),
+        cumulative_interest=cumulative_interest,
+    )
+    total_interest = float(cumulative_interest[-1]) if total_months else 0
 
     # Payoff date
     payoff_date = datetime.now()
@@ -267,27 +271,18 @@ def calculate_amortization_schedule(
         monthly_payment=monthly_payment,
         total_payments=monthly_payment * total_months,
         total_principal=principal,
-        total_interest=cumulative_interest,
+        total_interest=total_interest,
         principal_percent=(principal / (monthly_payment * total_months)) * 100,
-        interest_percent=(cumulative_interest / (monthly_payment * total_months)) * 100,
+        interest_percent=(total_interest / (monthly_payment * total_months)) * 100,
         payoff_date=payoff_date.strftime("%Y-%m-%d"),
     )
 
     return schedule, summary
 
 
-def get_yearly_amortization(schedule: list[AmortizationRow], year: int) -> tuple[float, float, float]:
+def get_yearly_amortization(schedule: AmortizationTable, year: int) -> tuple[float, float, float]:
     """Get interest, principal, and ending balance for a specific year."""
-    year_payments = [row for row in schedule if row.year == year]
-
-    if not year_payments:
-        return 0, 0, 0
-
-    interest = sum(row.interest_payment for row in year_payments)
-    principal = sum(row.principal_payment for row in year_payments)
-    ending_balance = year_payments[-1].ending_balance
-
-    return interest, principal, ending_balance
+    return schedule.year_totals(year)
 
 
 # ============================================
@@ -366,7 +361,7 @@ def generate_multi_year_projections(
     base_year_expenses: dict[str, float],
     annual_gross_rent: float,
     vacancy_rate: float,
-    amortization_schedule: list[AmortizationRow],
+    amortization_schedule: AmortizationTable,
     annual_depreciation: float,
     hold_period_years: int,
     rent_growth_rate: float,
@@ -16,14 +16,20 @@ The public API remains stable; existing imports of PropertyService continue to w
 
 from app.services.property.cache import (
     _PROPERTY_CACHE_FORMULA_VERSION,
+    _PROPERTY_CACHE_NAMESPACE,
+    _classify_cached_property,
     _should_invalidate_cache,
     _strip_property_cache_meta,
+    _upgrade_cached_property,
 )
 from app.services.property.orchestrator import PropertyService
 
 __all__ = [
     "_PROPERTY_CACHE_FORMULA_VERSION",
+    "_PROPERTY_CACHE_NAMESPACE",
     "PropertyService",
+    "_classify_cached_property",
     "_should_invalidate_cache",
     "_strip_property_cache_meta",
+    "_upgrade_cached_property",
 ]
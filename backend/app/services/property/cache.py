@@ -18,26 +18,182 @@ from typing import Any
 #      str_market_stats / ADR / occupancy populate without waiting out the TTL.
 _PROPERTY_CACHE_FORMULA_VERSION = "11"
 
+# Bumped when provider extraction changes what a cached payload contains
+# (DataNormalizer field paths, enrichment parsing) without touching economics.
+# GET /properties/{id} serves cached payloads without re-validating them, so
+# an incompatible PropertyResponse schema change must bump this too.
+# v1: extraction logic as of the switch from deploy-time flushes to namespaces.
+_PROPERTY_CACHE_EXTRACTION_VERSION = "1"
+
+# Property keys live under ``property:<namespace>:`` / ``prop_id:<namespace>:``.
+# Bumping either version above moves reads to a fresh namespace; entries in
+# the old one are never read again and simply expire by TTL, so deploys no
+# longer need to SCAN + delete every property key.
+_PROPERTY_CACHE_NAMESPACE = f"v{_PROPERTY_CACHE_FORMULA_VERSION}.{_PROPERTY_CACHE_EXTRACTION_VERSION}"
+
+# Namespaces written by earlier deploys, newest first, that a current-namespace
+# miss may lazily migrate from. "" is the pre-namespace layout
+# (``property:<hash>`` / ``prop_id:<id>``). Drop entries once their hard TTL
+# has passed since the deploy that retired them.
+_PROPERTY_CACHE_PREVIOUS_NAMESPACES: tuple[str, ...] = ("",)
+
+# Extraction versions whose payloads are still correct under the current
+# extraction logic. Pre-namespace entries carry no stamp and count as "1".
+_PROPERTY_CACHE_COMPATIBLE_EXTRACTION_VERSIONS = frozenset({"1"})
+
+# Stale-while-revalidate windows. Past the soft TTL a cached property is still
+# served, but a background refresh is started; the hard TTL is the Redis
+# expiry, after which the next search fetches synchronously. Entries missing a
+# provider (Zillow/Redfin) get a shorter hard TTL so they're re-bought sooner.
+_PROPERTY_CACHE_SOFT_TTL_SECONDS = 6 * 3600
+_PROPERTY_CACHE_HARD_TTL_SECONDS = 24 * 3600
+_PROPERTY_CACHE_DEGRADED_HARD_TTL_SECONDS = 12 * 3600
+# A response built at the search deadline, before every provider answered, is
+# cached only until the background completion replaces it.
+_PROPERTY_CACHE_PARTIAL_TTL_SECONDS = 120
+
+# Raw provider payloads are cached separately from the merged property, one
+# key per provider (``provider:v<version>:<provider>:<hash>``), so a stale
+# merged entry is rebuilt from cached parts and only re-buys what changed.
+# They hold untouched API responses, so formula/extraction bumps don't touch
+# them; bump this only when the cached tuple shape changes. Entries are
+# ``{"payload": [...], "fetched_at": iso}``; a property built from them is as
+# old as its oldest part. Bare-list entries from before the timestamp are
+# read as misses rather than bumping the version, which would also drop the
+# per-zpid Zillow enrichment entries below.
+_PROVIDER_PAYLOAD_CACHE_VERSION = "1"
+
+# Per-provider lifetimes: listing-driven sources (AXESSO/Zillow, Redfin) turn
+# over with the soft TTL, AVMs and market analytics are stable for a day.
+_PROVIDER_PAYLOAD_TTL_SECONDS: dict[str, int] = {
+    "rentcast": 24 * 3600,
+    "axesso": 6 * 3600,
+    "redfin": 6 * 3600,
+    "realtor": 12 * 3600,
+    "mashvisor": 24 * 3600,
+}
+_PROVIDER_PAYLOAD_NAMES = frozenset(_PROVIDER_PAYLOAD_TTL_SECONDS)
+
+# Zillow enrichment sub-resources are cached per zpid, parsed, under the same
+# ``provider:`` prefix. They change yearly or less, so a rebuilt property
+# normally costs one AXESSO detail call instead of five. Past its refresh age
+# an entry is still served while a background re-fetch replaces it; it expires
+# from Redis at three times that age.
+_ZILLOW_ENRICHMENT_REFRESH_SECONDS: dict[str, int] = {
+    "tax_history": 7 * 86400,
+    "nearby_schools": 30 * 86400,
+    "accessibility_scores": 30 * 86400,
+    "zestimate_history": 7 * 86400,
+}
+_ZILLOW_ENRICHMENT_TTL_SECONDS: dict[str, int] = {
+    part: 3 * seconds for part, seconds in _ZILLOW_ENRICHMENT_REFRESH_SECONDS.items()
+}
+
+# Which raw payloads a staleness reason implicates. Reasons that only need a
+# rebuild (economics changed, AirROI retry — it has its own dedupe cache) map
+# to nothing; a soft-TTL refresh relies on the per-provider TTLs above.
+# Unlisted reasons re-fetch every provider.
+_STALE_PROVIDERS_BY_REASON: dict[str, frozenset[str]] = {
+    "Zillow data absent > 4h": frozenset({"axesso"}),
+    "Redfin data absent > 4h": frozenset({"redfin"}),
+    "STR estimate data absent > 4h": frozenset(),
+    "pre-valuation-snapshot-v5": frozenset(),
+    "degraded listing (zpid present, status+zestimate missing)": frozenset({"axesso"}),
+    "hoa_fees_monthly missing on HOA-likely property": frozenset({"axesso"}),
+    "soft TTL exceeded": frozenset(),
+}
+
+# Reasons that re-ask a provider which had no data for the property. A
+# rebuild keeps the ``fetched_at`` of its oldest payload, so the retry that
+# rebuilt the entry is stamped separately (``absent_retry_at``) and the next
+# retry waits 4h from that.
+_ABSENT_RETRY_REASONS = frozenset(
+    {"Zillow data absent > 4h", "Redfin data absent > 4h", "STR estimate data absent > 4h"}
+)
+
+# Cache states returned by ``_classify_cached_property``.
+CACHE_FRESH = "fresh"
+CACHE_REVALIDATE = "revalidate"
+CACHE_INVALID = "invalid"
+
 
 def _strip_property_cache_meta(payload: dict[str, Any]) -> dict[str, Any]:
     """Remove cache-only keys before ``PropertyResponse`` validation."""
     out = dict(payload)
     out.pop("valuation_formula_version", None)
     out.pop("str_estimate_source", None)
+    out.pop("extraction_version", None)
+    out.pop("absent_retry_at", None)
+    return out
+
+
+def _property_cache_prefix(kind: str, namespace: str = _PROPERTY_CACHE_NAMESPACE) -> str:
+    """Key prefix for ``kind`` ("property" / "prop_id") in a cache namespace."""
+    return f"{kind}:{namespace}" if namespace else kind
+
+
+def _provider_payload_prefix(provider: str) -> str:
+    """Key prefix for one provider's raw payload cache."""
+    return f"provider:v{_PROVIDER_PAYLOAD_CACHE_VERSION}:{provider}"
+
+
+def _stale_providers(reason: str | None) -> frozenset[str]:
+    """Providers whose raw payloads must be re-fetched for a staleness reason."""
+    if reason is None:
+        return frozenset()
+    return _STALE_PROVIDERS_BY_REASON.get(reason, _PROVIDER_PAYLOAD_NAMES)
+
+
+def _upgrade_cached_property(
+    cached_data: dict[str, Any],
+    *,
+    formula_version: str = _PROPERTY_CACHE_FORMULA_VERSION,
+    compatible_extraction_versions: frozenset[str] = _PROPERTY_CACHE_COMPATIBLE_EXTRACTION_VERSIONS,
+) -> dict[str, Any] | None:
+    """Carry a payload from a previous namespace into the current one.
+
+    Returns the payload restamped with the current extraction version, or
+    ``None`` when it was built by different economics or incompatible
+    extraction logic and must be re-fetched instead.
+    """
+    if cached_data.get("valuation_formula_version") != formula_version:
+        return None
+    if cached_data.get("extraction_version", "1") not in compatible_extraction_versions:
+        return None
+    out = dict(cached_data)
+    out["extraction_version"] = _PROPERTY_CACHE_EXTRACTION_VERSION
     return out
 
 
+def _cache_age_seconds(cached_data: dict[str, Any], field: str = "fetched_at") -> float | None:
+    """Seconds since the payload's ``fetched_at`` (or another timestamp ``field``); ``None`` when unknown."""
+    fetched_raw = cached_data.get(field)
+    if not fetched_raw:
+        return None
+    try:
+        fetched_dt = datetime.fromisoformat(str(fetched_raw)) if isinstance(fetched_raw, str) else fetched_raw
+        if fetched_dt.tzinfo is None:
+            fetched_dt = fetched_dt.replace(tzinfo=UTC)
+        return (datetime.now(UTC) - fetched_dt).total_seconds()
+    except (ValueError, TypeError):
+        return None
+
+
 def _should_invalidate_cache(
     cached_data: dict[str, Any] | None,
     *,
     redfin_enabled: bool = True,
     str_estimates_enabled: bool = False,
     formula_version: str = _PROPERTY_CACHE_FORMULA_VERSION,
+    absent_retries: bool = True,
 ) -> tuple[bool, str | None]:
     """Pure, testable predicate: should we discard this cached property payload?
 
     Returns (should_invalidate, reason_str_or_None).
     All logic is side-effect free so we can achieve 100% coverage with unit tests.
+
+    ``absent_retries=False`` ignores the "provider data absent > 4h" retries
+    and reports only structural problems with the payload.
     """
     if not cached_data:
         return True, "no_cache_entry"
@@ -105,23 +261,15 @@ def _should_invalidate_cache(
         and cached_data.get("str_estimate_source") != "provider"
     )
 
-    def _cache_age_exceeds(seconds: int) -> bool:
-        fetched_raw = cached_data.get("fetched_at")
-        if not fetched_raw:
-            return True
-        try:
-            fetched_dt = (
-                datetime.fromisoformat(str(fetched_raw)) if isinstance(fetched_raw, str) else fetched_raw
-            )
-            if fetched_dt.tzinfo is None:
-                fetched_dt = fetched_dt.replace(tzinfo=UTC)
-            return (datetime.now(UTC) - fetched_dt).total_seconds() > seconds
-        except (ValueError, TypeError):
-            return True
-
-    zillow_stale = zillow_absent and _cache_age_exceeds(14400)
-    redfin_stale = redfin_absent and _cache_age_exceeds(14400)
-    str_stale = str_absent and _cache_age_exceeds(14400)
+    def _absent_retry_due() -> bool:
+        # Counted from the last absent retry when the entry records one.
+        ages = [_cache_age_seconds(cached_data, field) for field in ("fetched_at", "absent_retry_at")]
+        known = [age for age in ages if age is not None]
+        return not known or min(known) > 14400
+
+    zillow_stale = absent_retries and zillow_absent and _absent_retry_due()
+    redfin_stale = absent_retries and redfin_absent and _absent_retry_due()
+    str_stale = absent_retries and str_absent and _absent_retry_due()
 
     stale = (
         (
@@ -162,3 +310,47 @@ def _should_invalidate_cache(
         else "IQ estimate data missing"
     )
     return True, reason
+
+
+def _classify_cached_property(
+    cached_data: dict[str, Any] | None,
+    *,
+    redfin_enabled: bool = True,
+    str_estimates_enabled: bool = False,
+    formula_version: str = _PROPERTY_CACHE_FORMULA_VERSION,
+    soft_ttl_seconds: int = _PROPERTY_CACHE_SOFT_TTL_SECONDS,
+) -> tuple[str, str | None]:
+    """Stale-while-revalidate state of a cached property payload.
+
+    Returns ``(state, reason)`` where state is one of:
+
+    - ``CACHE_INVALID``: structurally wrong (legacy formula version, degraded
+      listing, missing HOA/IQ fields) — must be re-fetched before serving.
+    - ``CACHE_REVALIDATE``: servable, but past the soft TTL or still missing
+      a provider after the 4h absent window — refresh in the background.
+    - ``CACHE_FRESH``: serve as-is.
+    """
+    should_invalidate, reason = _should_invalidate_cache(
+        cached_data,
+        redfin_enabled=redfin_enabled,
+        str_estimates_enabled=str_estimates_enabled,
+        formula_version=formula_version,
+        absent_retries=False,
+    )
+    if should_invalidate:
+        return CACHE_INVALID, reason
+
+    assert cached_data is not None  # no_cache_entry is structural
+    _, reason = _should_invalidate_cache(
+        cached_data,
+        redfin_enabled=redfin_enabled,
+        str_estimates_enabled=str_estimates_enabled,
+        formula_version=formula_version,
+    )
+    if reason is not None:
+        return CACHE_REVALIDATE, reason
+
+    age = _cache_age_seconds(cached_data)
+    if age is None or age > soft_ttl_seconds:
+        return CACHE_REVALIDATE, "soft TTL exceeded"
+    return CACHE_FRESH, None
@@ -11,6 +11,9 @@ import logging
 import math
 import re
 import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextvars import ContextVar
+from dataclasses import dataclass, field, replace
 from datetime import UTC, datetime
 from typing import Any
 
@@ -36,6 +39,7 @@ from app.schemas.property import (
     NearbySchool,
     PriceHistoryEvent,
     PropertyDetails,
+    PropertyEnrichment,
     PropertyResponse,
     ProvenanceMap,
     RentalData,
@@ -51,9 +55,10 @@ from app.schemas.property import (
     WholesaleResults,
     ZestimateHistoryPoint,
 )
+from app.services import deadline
 from app.services.api_clients import AirROIClient, create_api_clients
 from app.services.assumptions_service import get_default_assumptions
-from app.services.cache_service import CacheService, get_cache_service
+from app.services.cache_service import CacheService, encode_json, get_cache_service
 from app.services.calculators import (
     calculate_brrrr,
     calculate_flip,
@@ -63,8 +68,10 @@ from app.services.calculators import (
     calculate_str,
     calculate_wholesale,
 )
+from app.services.concurrency_limiter import Priority, current_priority, outbound_priority
 from app.services.iq_verdict_service import compute_iq_verdict
 from app.services.resilience import resilient
+from app.services.single_flight import SingleFlight
 from app.services.zillow_client import ZillowDataExtractor, create_zillow_client
 
 logger = logging.getLogger(__name__)
@@ -72,9 +79,29 @@ logger = logging.getLogger(__name__)
 # Re-export from the new focused module so existing code continues to work.
 # Source of truth lives in app/services/property/cache.py
 from app.services.property.cache import (
+    _ABSENT_RETRY_REASONS,
+    _PROPERTY_CACHE_DEGRADED_HARD_TTL_SECONDS,
+    _PROPERTY_CACHE_EXTRACTION_VERSION,
     _PROPERTY_CACHE_FORMULA_VERSION,
-    _should_invalidate_cache,
+    _PROPERTY_CACHE_HARD_TTL_SECONDS,
+    _PROPERTY_CACHE_NAMESPACE,
+    _PROPERTY_CACHE_PARTIAL_TTL_SECONDS,
+    _PROPERTY_CACHE_PREVIOUS_NAMESPACES,
+    _PROPERTY_CACHE_SOFT_TTL_SECONDS,
+    _PROVIDER_PAYLOAD_NAMES,
+    _PROVIDER_PAYLOAD_TTL_SECONDS,
+    _ZILLOW_ENRICHMENT_REFRESH_SECONDS,
+    _ZILLOW_ENRICHMENT_TTL_SECONDS,
+    CACHE_FRESH,
+    CACHE_INVALID,
+    CACHE_REVALIDATE,
+    _cache_age_seconds,
+    _classify_cached_property,
+    _provider_payload_prefix,
+    _should_invalidate_cache,  # noqa: F401 — re-exported
+    _stale_providers,
     _strip_property_cache_meta,
+    _upgrade_cached_property,
 )
 
 
@@ -99,6 +126,50 @@ def _insurance_from_value(property_value: float | None, insurance_pct: float) ->
 # $0.20/call endpoint.
 _AIRROI_ESTIMATE_CACHE_TTL = 7 * 86400
 
+# Zillow enrichment part -> (ZillowClient method, parser). Parsed results are
+# cached per zpid (see ``_ZILLOW_ENRICHMENT_REFRESH_SECONDS``).
+_ZILLOW_ENRICHMENT_SOURCES: dict[str, tuple[str, Callable[[Any], Any]]] = {
+    "tax_history": ("get_price_tax_history", ZillowDataExtractor.parse_tax_history),
+    "nearby_schools": ("get_nearby_schools", ZillowDataExtractor.parse_nearby_schools),
+    "accessibility_scores": ("get_accessibility_scores", ZillowDataExtractor.extract_scores),
+    "zestimate_history": ("get_zestimate_history", ZillowDataExtractor.parse_zestimate_history),
+}
+
+# Cross-worker single-flight for cold property searches: the lock outlives a
+# worst-case provider fan-out, and waiters give up on a silent peer after 30s.
+_SEARCH_LOCK_TTL_SECONDS = 60
+_SEARCH_WAIT_TIMEOUT_SECONDS = 30.0
+
+# Set by ``search_property_progressive``: each provider fetch started for the
+# search reports ``(provider, task)`` here as it finishes.
+_provider_progress: ContextVar[asyncio.Queue[tuple[str, asyncio.Future[Any]]] | None] = ContextVar(
+    "provider_progress", default=None
+)
+
+
+@dataclass
+class ProviderPayloads:
+    """Raw provider data that one ``PropertyResponse`` is built from."""
+
+    rentcast: dict[str, Any] = field(default_factory=dict)
+    axesso: dict[str, Any] | None = None
+    zillow_zpid: str | None = None
+    redfin: dict[str, Any] | None = None
+    realtor: dict[str, Any] | None = None
+    mashvisor: dict[str, Any] | None = None
+    fetched_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    # Providers still fetching when the search deadline passed (their fields
+    # above are left empty); each task resolves to its ``(*payload, elapsed_ms)``.
+    pending: dict[str, asyncio.Future[tuple[Any, ...]]] = field(default_factory=dict)
+
+
+def _provider_payload_fields(provider: str, result: tuple[Any, ...]) -> dict[str, Any]:
+    """Map one provider fetch result ``(*payload, elapsed_ms)`` onto ``ProviderPayloads`` fields."""
+    if provider == "axesso":
+        axesso, zillow_zpid, _ = result
+        return {"axesso": axesso, "zillow_zpid": zillow_zpid}
+    return {provider: result[0]}
+
 
 def _has_plausible_provider_str_data(normalized: dict[str, Any]) -> bool:
     """True when a listing provider (AXESSO) already supplied a usable
@@ -164,10 +235,16 @@ class PropertyService:
             api_key=settings.AXESSO_API_KEY,
             base_url=settings.AXESSO_URL,
             fallback_api_key=settings.AXESSO_API_KEY_SECONDARY or None,
+            hedge_requests=settings.AXESSO_HEDGING_ENABLED,
         )
 
         # Redis cache with in-memory fallback (24h TTL)
         self._cache: CacheService = get_cache_service()
+        self._search_flight = SingleFlight(
+            self._cache,
+            lock_ttl_seconds=_SEARCH_LOCK_TTL_SECONDS,
+            wait_timeout_seconds=_SEARCH_WAIT_TIMEOUT_SECONDS,
+        )
 
     def _generate_property_id(self, address: str) -> str:
         """Generate consistent property ID from address."""
@@ -186,17 +263,111 @@ class PropertyService:
         Uses the ``prop_id:<id>`` key set during ``search_property``.
         Returns ``None`` if not found or deserialization fails.
         """
-        cached = await self._cache.get(f"prop_id:{property_id}")
-        if cached:
+        payload = await self._load_cached_property_payload(property_id)
+        if payload:
             try:
-                # Same recompute as the search cache-hit path: exports must not
-                # quote an insurance figure the admin percentage has moved past.
-                cached = self._apply_insurance_to_cached(cached, await self._resolve_insurance_pct())
-                return PropertyResponse(**_strip_property_cache_meta(cached))
+                return PropertyResponse(**payload)
             except Exception as e:
                 logger.warning("Failed to deserialize cached property %s: %s", property_id, e)
         return None
 
+    async def get_cached_property_json(self, property_id: str) -> bytes | None:
+        """``get_cached_property`` encoded straight to JSON, skipping the model.
+
+        For endpoints that return the cached property unchanged: the payload
+        was validated when it was written, so re-validating it only to
+        serialize it again is wasted work on the hottest read path.
+        """
+        payload = await self._load_cached_property_payload(property_id)
+        if not payload:
+            return None
+        fetched_at = payload.get("fetched_at")
+        if fetched_at is not None:
+            # Match the model serializer's datetime format ("...Z" for UTC).
+            if isinstance(fetched_at, str):
+                fetched_at = datetime.fromisoformat(fetched_at)
+            payload["fetched_at"] = fetched_at.isoformat().replace("+00:00", "Z")
+        return encode_json(payload)
+
+    async def get_property_enrichment(self, property_id: str) -> PropertyEnrichment | None:
+        """Zillow enrichment for a cached property, computed at most once if it was deferred.
+
+        Searches under ``PROPERTY_LAZY_ENRICHMENT`` cache the property with
+        ``data_quality.enrichment_pending``; the first call here fetches the
+        enrichment (coalesced in-process and across workers) and writes it
+        back into the cached property. Returns ``None`` when the property is
+        not cached.
+        """
+        payload = await self._cache.get_property_by_id(property_id)
+        if payload and (payload.get("data_quality") or {}).get("enrichment_pending"):
+            key = f"enrichment:{property_id}"
+            payload = await self._search_flight.do(
+                key,
+                lambda: self._search_flight.do_exclusive(
+                    key,
+                    lambda: self._complete_property_enrichment(property_id),
+                    poll=lambda: self._enriched_property_payload(property_id),
+                ),
+            )
+        if not payload:
+            return None
+        market = payload.get("market") or {}
+        return PropertyEnrichment(
+            property_id=property_id,
+            tax_history=payload.get("tax_history"),
+            nearby_schools=payload.get("nearby_schools"),
+            zestimate_history=payload.get("zestimate_history"),
+            walk_score=market.get("walk_score"),
+            transit_score=market.get("transit_score"),
+            bike_score=market.get("bike_score"),
+        )
+
+    async def _enriched_property_payload(self, property_id: str) -> dict[str, Any] | None:
+        """Cached payload once its enrichment is no longer pending (``do_exclusive`` poll)."""
+        payload = await self._cache.get_property_by_id(property_id)
+        if payload and not (payload.get("data_quality") or {}).get("enrichment_pending"):
+            return payload
+        return None
+
+    async def _complete_property_enrichment(self, property_id: str) -> dict[str, Any] | None:
+        """Fetch deferred enrichment and write it into the cached property for the rest of its TTL."""
+        payload = await self._cache.get_property_by_id(property_id)
+        if not payload or not (payload.get("data_quality") or {}).get("enrichment_pending"):
+            return payload
+        zpid = payload.get("zpid")
+        enrichment = self._zillow_enrichment_fields({})
+        if zpid:
+            enrichment, enrichment_ms = await self._fetch_zillow_enrichment(zpid)
+            logger.info("Deferred Zillow enrichment for %s took %.1fms", property_id, enrichment_ms)
+        payload["tax_history"] = [
+            TaxHistoryEntry(**r).model_dump(mode="json") for r in enrichment["tax_history"]
+        ] or None
+        payload["nearby_schools"] = [
+            NearbySchool(**r).model_dump(mode="json") for r in enrichment["nearby_schools"]
+        ] or None
+        payload["zestimate_history"] = [
+            ZestimateHistoryPoint(**r).model_dump(mode="json") for r in enrichment["zestimate_history"]
+        ] or None
+        market = payload.setdefault("market", {})
+        for score in ("walk_score", "transit_score", "bike_score"):
+            if enrichment.get(score) is not None:
+                market[score] = enrichment[score]
+        payload["data_quality"]["enrichment_pending"] = False
+        await self._cache.set_property_by_id(property_id, payload, ttl_seconds=self._property_cache_ttl(payload))
+        return payload
+
+    async def _load_cached_property_payload(self, property_id: str) -> dict[str, Any] | None:
+        """Cached ``PropertyResponse`` payload for ``property_id``, ready to serve."""
+        cached = await self._cache.get_property_by_id(property_id)
+        if not cached:
+            cached = await self._migrate_cached_property(property_id=property_id)
+        if not cached:
+            return None
+        # Same recompute as the search cache-hit path: exports must not
+        # quote an insurance figure the admin percentage has moved past.
+        cached = self._apply_insurance_to_cached(cached, await self._resolve_insurance_pct())
+        return _strip_property_cache_meta(cached)
+
     async def _fetch_raw_rentcast(self, address: str) -> dict[str, Any]:
         """Fetch raw RentCast data (property, value, rent, optional market_stats). Used for export.
         Always records each endpoint response so the export shows either data or error (for auditing).
@@ -587,112 +758,569 @@ class PropertyService:
         Fetches from both APIs, normalizes, and returns unified response.
         Uses Redis cache with 24h TTL when available (when pre_fetched is None).
 
+        Concurrent searches for the same normalized address are coalesced:
+        one fetch runs per ``property:<hash>`` key (in-process via a shared
+        task, across workers via a short Redis lock) and every caller gets
+        the same ``PropertyResponse``.
+
         When pre_fetched=(rentcast_merged, (axesso_unwrapped, axesso_export)) is provided,
         uses that data (no cache, no fetch) and returns (response, rentcast_merged, axesso_export).
         """
+        if pre_fetched is not None:
+            rentcast_merged, (axesso_unwrapped, axesso_export) = pre_fetched
+            payloads = ProviderPayloads(
+                rentcast=rentcast_merged,
+                axesso=axesso_unwrapped,
+                zillow_zpid=axesso_unwrapped.get("zpid") if axesso_unwrapped else None,
+            )
+            response, _ = await self._build_property_response(
+                address,
+                payloads,
+                zpid=None,
+                insurance_pct=await self._resolve_insurance_pct(),
+                timings={},
+            )
+            return (response, rentcast_merged, axesso_export or {})
+
+        cache_key = CacheService.property_key(address)
+        return await self._search_flight.do(cache_key, lambda: self._search_property(address, cache_key, zpid))
+
+    async def search_property_progressive(
+        self, address: str, zpid: str | None = None
+    ) -> AsyncIterator[tuple[str, PropertyResponse]]:
+        """``search_property`` that yields ``(stage, response)`` as the property fills in.
+
+        Each provider that answers with data, bar the last, yields a preview
+        (stage = provider name):
+        the providers so far run through the same normalizer as the final
+        build, flagged ``data_quality.is_partial`` with the rest in
+        ``pending_sources``. The full response (AirROI estimate and
+        enrichment included) follows as ``"complete"``; a cached or
+        coalesced search yields only that.
+        """
+        progress: asyncio.Queue[tuple[str, asyncio.Future[Any]]] = asyncio.Queue()
+        token = _provider_progress.set(progress)
+        try:
+            search = asyncio.ensure_future(self.search_property(address, zpid=zpid))
+        finally:
+            _provider_progress.reset(token)
+
+        fields: dict[str, Any] = {}
+        arrived: set[str] = set()
+        fetched_at = datetime.now(UTC)
+        insurance_pct: float | None = None
+        try:
+            while True:
+                arrival = asyncio.ensure_future(progress.get())
+                await asyncio.wait((search, arrival), return_when=asyncio.FIRST_COMPLETED)
+                if not arrival.done():
+                    arrival.cancel()
+                    break
+                provider, task = arrival.result()
+                if task.cancelled() or task.exception() is not None:
+                    continue
+                new_fields = _provider_payload_fields(provider, task.result())
+                fields.update(new_fields)
+                arrived.add(provider)
+                if arrived >= _PROVIDER_PAYLOAD_NAMES or all(v is None for v in new_fields.values()):
+                    continue  # nothing new to show, or the full build is already under way
+                if insurance_pct is None:
+                    insurance_pct = await self._resolve_insurance_pct()
+                preview, _ = await self._build_property_response(
+                    address,
+                    ProviderPayloads(**fields, fetched_at=fetched_at),
+                    zpid=zpid,
+                    insurance_pct=insurance_pct,
+                    timings={},
+                    preview=True,
+                )
+                preview.data_quality.is_partial = True
+                preview.data_quality.pending_sources = sorted(_PROVIDER_PAYLOAD_NAMES - arrived)
+                yield provider, preview
+            yield "complete", await search
+        finally:
+            # Client went away: the shared search keeps running and fills the cache.
+            search.cancel()
+
+    async def _search_property(self, address: str, cache_key: str, zpid: str | None) -> PropertyResponse:
+        """Cache-or-fetch body of ``search_property`` (runs once per in-flight key)."""
         t0 = time.perf_counter()
         timings: dict[str, float] = {}
-        property_id = self._generate_property_id(address)
-        timestamp = datetime.now(UTC)
         # Resolved once for both the cache-hit and fresh-build paths below.
         insurance_pct = await self._resolve_insurance_pct()
-        rentcast_data: dict[str, Any] = {}
-        axesso_data: dict[str, Any] | None = None
-        axesso_export_for_return: dict[str, Any] | None = None
 
-        zillow_zpid = None
-        redfin_data: dict[str, Any] | None = None
-        realtor_data: dict[str, Any] | None = None
-        mashvisor_data: dict[str, Any] | None = None
-        if pre_fetched is not None:
-            rentcast_merged, (axesso_unwrapped, axesso_export) = pre_fetched
-            rentcast_data = rentcast_merged
-            axesso_data = axesso_unwrapped
-            axesso_export_for_return = axesso_export
-            if axesso_data:
-                zillow_zpid = axesso_data.get("zpid")
-        else:
-            # Check Redis/in-memory cache first (skip when zpid is provided — map search
-            # often has a reliable Zillow ID while address-only AXESSO lookup failed).
+        # Check Redis/in-memory cache first (skip when zpid is provided — map search
+        # often has a reliable Zillow ID while address-only AXESSO lookup failed).
+        if not zpid:
             t_cache = time.perf_counter()
-            cached_data = None if zpid else await self._cache.get_property(address)
+            cached = await self._read_cached_property(address, insurance_pct)
             timings["cache_lookup_ms"] = (time.perf_counter() - t_cache) * 1000
-            if cached_data:
-                valuations = cached_data.get("valuations") or {}
-                listing = cached_data.get("listing") or {}
-                is_off_market_cached = listing.get("listing_status") in (
-                    None,
-                    "OFF_MARKET",
-                    "SOLD",
-                    "FOR_RENT",
-                    "OTHER",
-                )
-                rentals_cached = cached_data.get("rentals") or {}
-                rental_stats_cached = rentals_cached.get("rental_stats") or {}
-                has_source_value = (
-                    valuations.get("zestimate") is not None
-                    or valuations.get("current_value_avm") is not None
-                    or rentals_cached.get("monthly_rent_ltr") is not None
-                )
-                missing_iq_fields = has_source_value and (
-                    valuations.get("value_iq_estimate") is None and not rental_stats_cached
-                )
-                market_cached = cached_data.get("market") or {}
-                legacy_valuation_formula = (
-                    cached_data.get("valuation_formula_version") != _PROPERTY_CACHE_FORMULA_VERSION
+            if cached is not None:
+                logger.info(f"Cache hit for property: {address}")
+                timings["total_ms"] = (time.perf_counter() - t0) * 1000
+                logger.info("search_property timings (cache hit): %s", timings)
+                return cached
+
+        async def _fetch() -> PropertyResponse:
+            response = await self._fetch_and_cache_property(address, zpid, insurance_pct, timings)
+            timings["total_ms"] = (time.perf_counter() - t0) * 1000
+            logger.info("search_property timings (cache miss): %s", timings)
+            return response
+
+        # Another worker may already be fetching this address — wait for its
+        # cached result rather than buying the same provider data twice. The
+        # deadline covers that wait too: once it passes, answer from whatever
+        # provider payloads are already cached and leave the fetch to the peer.
+        with deadline.deadline_after(self._search_deadline_seconds()):
+            return await self._search_flight.do_exclusive(
+                cache_key,
+                _fetch,
+                poll=lambda: self._read_cached_property(address, insurance_pct, validate=False),
+                on_deadline=lambda: self._cached_payload_preview(address, zpid, insurance_pct),
+            )
+
+    async def _cached_payload_preview(self, address: str, zpid: str | None, insurance_pct: float) -> PropertyResponse:
+        """Partial property built from the provider payloads already in cache.
+
+        Starts no provider fetch and writes nothing to the property cache:
+        it answers a search whose deadline passed while another worker was
+        still fetching (and will cache) the full property.
+        """
+        keys = {provider: self._provider_payload_key(provider, address, zpid) for provider in _PROVIDER_PAYLOAD_NAMES}
+        cached_payloads = await self._cache.get_many(keys.values())
+        fields: dict[str, Any] = {}
+        fetched_at: list[datetime] = []
+        for provider, key in keys.items():
+            cached = cached_payloads.get(key)
+            if isinstance(cached, dict):
+                fields.update(_provider_payload_fields(provider, (*cached["payload"], 0.0)))
+                fetched_at.append(datetime.fromisoformat(cached["fetched_at"]))
+        preview, _ = await self._build_property_response(
+            address,
+            ProviderPayloads(**fields, fetched_at=min(fetched_at, default=datetime.now(UTC))),
+            zpid=zpid,
+            insurance_pct=insurance_pct,
+            timings={},
+            preview=True,
+        )
+        preview.data_quality.is_partial = True
+        preview.data_quality.pending_sources = sorted(
+            provider for provider, key in keys.items() if not isinstance(cached_payloads.get(key), dict)
+        )
+        return preview
+
+    @staticmethod
+    def _search_deadline_seconds() -> float | None:
+        """Deadline for a cold search: interactive callers only, so bulk work gets complete results."""
+        if current_priority() is not Priority.INTERACTIVE:
+            return None
+        return settings.PROPERTY_SEARCH_DEADLINE_SECONDS or None
+
+    async def _fetch_and_cache_property(
+        self,
+        address: str,
+        zpid: str | None,
+        insurance_pct: float,
+        timings: dict[str, float],
+        refetch: frozenset[str] = frozenset(),
+        max_age_seconds: float | None = None,
+        absent_retry: bool = False,
+    ) -> PropertyResponse:
+        """Fetch every provider, build the response and write it to cache.
+
+        Providers named in ``refetch``, or whose cached payload is older than
+        ``max_age_seconds``, bypass their raw payload cache. ``absent_retry``
+        stamps the entry as just having re-asked a provider that had no data. When the
+        request deadline passes first, the response is built from the
+        providers that answered, flagged partial, cached briefly, and
+        completed in the background.
+        """
+        payloads = await self._fetch_provider_payloads(
+            address, zpid, timings, refetch=refetch, max_age_seconds=max_age_seconds
+        )
+        response, str_estimate_source = await self._build_property_response(
+            address,
+            payloads,
+            zpid=zpid,
+            insurance_pct=insurance_pct,
+            timings=timings,
+        )
+        if payloads.pending or deadline.expired():
+            response.data_quality.is_partial = True
+            response.data_quality.pending_sources = sorted(payloads.pending)
+            await self._cache_property_response(
+                address, response, str_estimate_source, ttl_seconds=_PROPERTY_CACHE_PARTIAL_TTL_SECONDS
+            )
+            self._schedule_property_completion(address, zpid, insurance_pct, payloads)
+            return response
+        await self._cache_property_response(
+            address, response, str_estimate_source, absent_retry_at=datetime.now(UTC) if absent_retry else None
+        )
+        return response
+
+    def _schedule_property_completion(
+        self, address: str, zpid: str | None, insurance_pct: float, payloads: ProviderPayloads
+    ) -> None:
+        """Rebuild a partial property once its pending providers answer (one per key).
+
+        The pending fetches were started without the request deadline and
+        keep running after the response went out; their payloads are cached
+        as they land, and the full property replaces the partial entry.
+        """
+        cache_key = CacheService.property_key(address)
+
+        async def _complete() -> None:
+            t0 = time.perf_counter()
+            timings: dict[str, float] = {}
+            fields: dict[str, Any] = {}
+            results = await asyncio.gather(*payloads.pending.values(), return_exceptions=True)
+            for provider, result in zip(payloads.pending, results, strict=True):
+                if isinstance(result, BaseException):
+                    logger.warning("Late %s fetch failed for %s: %s", provider, address, result)
+                    continue
+                fields.update(_provider_payload_fields(provider, result))
+                timings[f"{provider}_ms"] = result[-1]
+            try:
+                response, str_estimate_source = await self._build_property_response(
+                    address,
+                    replace(payloads, pending={}, **fields),
+                    zpid=zpid,
+                    insurance_pct=insurance_pct,
+                    timings=timings,
                 )
-                # HOA / condo / co-op fees are mandatory for property types
-                # where they almost always apply (Condo, Townhouse, Co-op,
-                # Multi-Family). Cached entries pre-dating the AXESSO HOA
-                # field-mapping fix recorded `hoa_fees_monthly: null` for
-                # these properties and showed $0 across Strategy / DealMaker /
-                # Property pages — re-fetch so `monthlyHoaFee` is captured.
-                details_cached = cached_data.get("details") or {}
-                ptype = str(details_cached.get("property_type") or "").lower()
-                hoa_likely = any(tok in ptype for tok in ("condo", "town", "co-op", "coop", "multi", "apartment"))
-                missing_hoa = hoa_likely and market_cached.get("hoa_fees_monthly") in (None, 0)
-                should_invalidate, reason = _should_invalidate_cache(
-                    cached_data,
-                    redfin_enabled=self.redfin is not None,
-                    str_estimates_enabled=self.airroi is not None,
-                    formula_version=_PROPERTY_CACHE_FORMULA_VERSION,
+                await self._cache_property_response(address, response, str_estimate_source)
+            except Exception as e:
+                logger.warning("Background completion failed for %s: %s", address, e)
+                return
+            timings["total_ms"] = (time.perf_counter() - t0) * 1000
+            logger.info("search_property timings (background completion): %s", timings)
+
+        with deadline.no_deadline():
+            if self._search_flight.spawn(f"complete:{cache_key}", _complete):
+                logger.info(
+                    "Serving partial %s (pending: %s) — completing in background",
+                    address,
+                    ", ".join(sorted(payloads.pending)) or "enrichment",
                 )
-                if should_invalidate:
-                    logger.info("Cache hit for %s but %s — forcing re-fetch", address, reason)
-                    await self._cache.clear_property_cache(address)
-                else:
-                    logger.info(f"Cache hit for property: {address}")
-                    try:
-                        cached_data = self._apply_market_price_to_cached(cached_data)
-                        cached_data = self._apply_insurance_to_cached(cached_data, insurance_pct)
-                        timings["total_ms"] = (time.perf_counter() - t0) * 1000
-                        logger.info("search_property timings (cache hit): %s", timings)
-                        return PropertyResponse(**_strip_property_cache_meta(cached_data))
-                    except Exception as e:
-                        logger.warning(f"Failed to deserialize cached property: {e}")
-
-            # Fetch from all providers in parallel (RentCast, Zillow, Redfin, Realtor, Mashvisor)
-            (
-                (rentcast_data, rentcast_ms),
-                (axesso_data, zillow_zpid, zillow_ms),
-                (redfin_data, redfin_ms),
-                (realtor_data, realtor_ms),
-                (mashvisor_data, mashvisor_ms),
-            ) = await asyncio.gather(
-                self._fetch_rentcast_provider(address),
-                self._fetch_zillow_by_zpid(zpid) if zpid else self._fetch_zillow_provider(address),
-                self._fetch_redfin_provider(address),
-                self._fetch_realtor_provider(address),
-                self._fetch_mashvisor_provider(address),
+
+    async def cached_property_is_fresh(self, address: str) -> bool:
+        """Whether a search for ``address`` would be a plain cache hit.
+
+        False for a miss and for entries a search would re-fetch (invalid) or
+        refresh in the background (stale), i.e. whenever it may call providers.
+        """
+        cached_data = await self._cache.get_property(address)
+        if not cached_data:
+            return False
+        state, _ = _classify_cached_property(
+            cached_data,
+            redfin_enabled=self.redfin is not None,
+            str_estimates_enabled=self.airroi is not None,
+            formula_version=_PROPERTY_CACHE_FORMULA_VERSION,
+        )
+        return state == CACHE_FRESH
+
+    async def _read_cached_property(
+        self, address: str, insurance_pct: float, *, validate: bool = True
+    ) -> PropertyResponse | None:
+        """Return the cached property for ``address``, or ``None`` on a miss.
+
+        With ``validate`` (the default) the entry's stale-while-revalidate
+        state decides what happens: structurally invalid entries are evicted
+        and treated as a miss; entries past the soft TTL are served while a
+        deduplicated background refresh rewrites them.
+        """
+        cached_data = await self._cache.get_property(address)
+        if not cached_data and validate:
+            cached_data = await self._migrate_cached_property(address=address)
+        if not cached_data:
+            return None
+        if validate:
+            state, reason = _classify_cached_property(
+                cached_data,
+                redfin_enabled=self.redfin is not None,
+                str_estimates_enabled=self.airroi is not None,
+                formula_version=_PROPERTY_CACHE_FORMULA_VERSION,
+            )
+            if state == CACHE_INVALID:
+                logger.info("Cache hit for %s but %s — forcing re-fetch", address, reason)
+                await self._cache.clear_property_cache(address)
+                await self._drop_provider_payloads(address, cached_data.get("zpid"), _stale_providers(reason))
+                return None
+            if state == CACHE_REVALIDATE:
+                self._schedule_property_refresh(address, insurance_pct, reason)
+        try:
+            cached_data = self._apply_market_price_to_cached(cached_data)
+            cached_data = self._apply_insurance_to_cached(cached_data, insurance_pct)
+            return PropertyResponse(**_strip_property_cache_meta(cached_data))
+        except Exception as e:
+            logger.warning(f"Failed to deserialize cached property: {e}")
+            return None
+
+    async def _migrate_cached_property(
+        self, *, address: str | None = None, property_id: str | None = None
+    ) -> dict[str, Any] | None:
+        """Lazily carry a still-valid entry from a previous cache namespace forward.
+
+        Looks the property up by ``address`` or ``property_id`` in each of
+        ``_PROPERTY_CACHE_PREVIOUS_NAMESPACES``; the first compatible entry is
+        rewritten under the current namespace for the rest of its hard TTL.
+        Old keys are left to expire on their own.
+        """
+        for namespace in _PROPERTY_CACHE_PREVIOUS_NAMESPACES:
+            if address is not None:
+                legacy = await self._cache.get_property(address, namespace=namespace)
+            else:
+                legacy = await self._cache.get_property_by_id(property_id, namespace=namespace)
+            upgraded = _upgrade_cached_property(legacy) if legacy else None
+            if upgraded is None:
+                continue
+            ttl = self._property_cache_ttl(upgraded)
+            if address is not None:
+                await self._cache.set_property(address, upgraded, ttl_seconds=ttl)
+            elif upgraded.get("property_id"):
+                await self._cache.set_property_by_id(upgraded["property_id"], upgraded, ttl_seconds=ttl)
+            logger.info(
+                "Migrated cached property %s from namespace %r to %r",
+                address or property_id,
+                namespace,
+                _PROPERTY_CACHE_NAMESPACE,
+            )
+            return upgraded
+        return None
+
+    def _schedule_property_refresh(self, address: str, insurance_pct: float, reason: str | None) -> None:
+        """Refresh a stale cached property in the background (one per key).
+
+        The refresh is speculative (the caller was already served), so it runs
+        at prefetch priority and is skipped while any provider budget is too
+        low for it: the stale entry keeps being served until it is refreshed
+        or hits its hard TTL.
+        """
+        cache_key = CacheService.property_key(address)
+        # Past the soft TTL, parts that are themselves older than it are
+        # re-bought so the rebuilt entry comes back fresh.
+        max_age_seconds = _PROPERTY_CACHE_SOFT_TTL_SECONDS if reason == "soft TTL exceeded" else None
+
+        async def _refresh() -> None:
+            if not await self.provider_budgets_allow(Priority.PREFETCH):
+                logger.info("Background refresh of %s deferred — provider budget low", address)
+                return
+            t0 = time.perf_counter()
+            timings: dict[str, float] = {}
+            try:
+                with outbound_priority(Priority.PREFETCH):
+                    refreshed = await self._search_flight.try_exclusive(
+                        cache_key,
+                        lambda: self._fetch_and_cache_property(
+                            address,
+                            None,
+                            insurance_pct,
+                            timings,
+                            refetch=_stale_providers(reason),
+                            max_age_seconds=max_age_seconds,
+                            absent_retry=reason in _ABSENT_RETRY_REASONS,
+                        ),
+                    )
+            except Exception as e:
+                logger.warning("Background refresh failed for %s: %s", address, e)
+                return
+            if refreshed is not None:
+                timings["total_ms"] = (time.perf_counter() - t0) * 1000
+                logger.info("search_property timings (background refresh): %s", timings)
+
+        if self._search_flight.spawn(f"refresh:{cache_key}", _refresh):
+            logger.info("Serving cached %s (%s) — refreshing in background", address, reason)
+
+    async def provider_budgets_allow(self, priority: Priority) -> bool:
+        """Whether every budgeted provider has headroom for a call at ``priority``.
+
+        Lets low-priority work defer up front instead of building (and
+        caching) a property from a partial set of providers.
+        """
+        for client in (self.rentcast, self.zillow, self.redfin, self.realtor, self.mashvisor, self.airroi):
+            budget = getattr(client, "budget", None)
+            if budget is not None and not await budget.has_headroom(priority):
+                return False
+        return True
+
+    def _provider_payload_key(self, provider: str, address: str, zpid: str | None = None) -> str:
+        """Raw payload cache key; AXESSO lookups by zpid get their own key."""
+        if provider == "axesso" and zpid:
+            return CacheService.generate_key(_provider_payload_prefix("axesso_zpid"), zpid)
+        return CacheService.generate_key(_provider_payload_prefix(provider), address)
+
+    async def _cached_provider_fetch(
+        self,
+        provider: str,
+        key: str,
+        fetch: Callable[[], Awaitable[tuple[Any, ...]]],
+        *,
+        cached: Any,
+        force: bool = False,
+        max_age_seconds: float | None = None,
+    ) -> tuple[tuple[Any, ...], datetime]:
+        """Serve one provider's raw payload from cache, or fetch and cache it.
+
+        ``cached`` is the entry already read from ``key`` (``None`` on a
+        miss): ``{"payload": [...], "fetched_at": iso}``. ``fetch`` is a
+        provider helper returning ``(*payload, elapsed_ms)``; only the payload
+        part is cached, and only when non-empty so failed fetches are retried
+        on the next search. A forced re-fetch (``force``, or a cached payload
+        older than ``max_age_seconds``) that comes back empty or raises falls
+        back to the cached payload.
+
+        Returns ``(*payload, elapsed_ms)`` and when that payload was fetched.
+        """
+        if not isinstance(cached, dict):
+            cached = None  # miss, or a pre-timestamp entry of unknown age
+        cached_at = datetime.fromisoformat(cached["fetched_at"]) if cached else None
+        if cached_at is not None and max_age_seconds is not None:
+            force = force or (datetime.now(UTC) - cached_at).total_seconds() > max_age_seconds
+        if cached is not None and not force:
+            logger.info("Provider payload cache hit: %s", provider)
+            return (*cached["payload"], 0.0), cached_at
+        try:
+            *payload, elapsed_ms = await fetch()
+        except Exception:
+            if cached is None:
+                raise
+            logger.warning("%s re-fetch failed — serving cached payload", provider)
+            return (*cached["payload"], 0.0), cached_at
+        fetched_at = datetime.now(UTC)
+        if payload[0]:
+            await self._cache.set(
+                key,
+                {"payload": payload, "fetched_at": fetched_at.isoformat()},
+                ttl_seconds=_PROVIDER_PAYLOAD_TTL_SECONDS[provider],
             )
-            timings["rentcast_ms"] = rentcast_ms
-            timings["zillow_ms"] = zillow_ms
-            if redfin_ms > 0:
-                timings["redfin_ms"] = redfin_ms
-            if realtor_ms > 0:
-                timings["realtor_ms"] = realtor_ms
-            if mashvisor_ms > 0:
-                timings["mashvisor_ms"] = mashvisor_ms
+        elif cached is not None:
+            logger.info("%s re-fetch returned nothing — keeping cached payload", provider)
+            return (*cached["payload"], elapsed_ms), cached_at
+        return (*payload, elapsed_ms), fetched_at
+
+    async def clear_cached_property(self, address: str) -> bool:
+        """Evict a property and every raw provider payload it was built from.
+
+        Without the payloads the next search re-buys each provider instead of
+        silently rebuilding from the old responses.
+        """
+        cached = await self._cache.get_property(address)
+        cleared = await self._cache.clear_property_cache(address)
+        await self._drop_provider_payloads(address, (cached or {}).get("zpid"), _PROVIDER_PAYLOAD_NAMES)
+        return cleared
+
+    async def _drop_provider_payloads(self, address: str, zpid: str | None, providers: frozenset[str]) -> None:
+        """Evict cached raw payloads so the next build re-fetches those providers."""
+        keys = [self._provider_payload_key(provider, address) for provider in providers]
+        if "axesso" in providers and zpid:
+            keys.append(self._provider_payload_key("axesso", address, zpid))
+        await self._cache.delete_many(keys)
+
+    async def _fetch_provider_payloads(
+        self,
+        address: str,
+        zpid: str | None,
+        timings: dict[str, float],
+        refetch: frozenset[str] = frozenset(),
+        max_age_seconds: float | None = None,
+    ) -> ProviderPayloads:
+        """Fetch from all providers in parallel (RentCast, Zillow, Redfin, Realtor, Mashvisor).
+
+        Each provider's raw payload is served from its own cache entry when
+        present, so rebuilding a stale property only re-buys the providers in
+        ``refetch``, whose payload has expired, or whose payload is older than
+        ``max_age_seconds``. The result is stamped with the oldest payload's
+        fetch time.
+
+        Under a request deadline, providers that have not answered by then are
+        returned in ``ProviderPayloads.pending`` instead of being waited for.
+        They are started outside the deadline, so they run to completion and
+        still cache their payload.
+        """
+        keys = {provider: self._provider_payload_key(provider, address, zpid) for provider in _PROVIDER_PAYLOAD_NAMES}
+        cached_payloads = await self._cache.get_many(keys.values())
+        fetched_at: dict[str, datetime] = {}
+
+        async def _cached(provider: str, fetch: Callable[[], Awaitable[tuple[Any, ...]]]) -> tuple[Any, ...]:
+            key = keys[provider]
+            result, fetched_at[provider] = await self._cached_provider_fetch(
+                provider,
+                key,
+                fetch,
+                cached=cached_payloads.get(key),
+                force=provider in refetch,
+                max_age_seconds=max_age_seconds,
+            )
+            return result
+
+        with deadline.no_deadline():
+            tasks = {
+                "rentcast": asyncio.ensure_future(_cached("rentcast", lambda: self._fetch_rentcast_provider(address))),
+                "axesso": asyncio.ensure_future(
+                    _cached(
+                        "axesso",
+                        (lambda: self._fetch_zillow_by_zpid(zpid))
+                        if zpid
+                        else (lambda: self._fetch_zillow_provider(address)),
+                    )
+                ),
+                "redfin": asyncio.ensure_future(_cached("redfin", lambda: self._fetch_redfin_provider(address))),
+                "realtor": asyncio.ensure_future(_cached("realtor", lambda: self._fetch_realtor_provider(address))),
+                "mashvisor": asyncio.ensure_future(
+                    _cached("mashvisor", lambda: self._fetch_mashvisor_provider(address))
+                ),
+            }
+        progress = _provider_progress.get()
+        if progress is not None:
+            for provider, task in tasks.items():
+                task.add_done_callback(lambda t, provider=provider: progress.put_nowait((provider, t)))
+        time_left = deadline.remaining()
+        await asyncio.wait(tasks.values(), timeout=None if time_left is None else max(time_left, 0.0))
+
+        fields: dict[str, Any] = {}
+        pending: dict[str, asyncio.Future[tuple[Any, ...]]] = {}
+        for provider, task in tasks.items():
+            if not task.done():
+                pending[provider] = task
+                continue
+            result = task.result()
+            fields.update(_provider_payload_fields(provider, result))
+            elapsed_ms = result[-1]
+            if provider in ("rentcast", "axesso") or elapsed_ms > 0:
+                timings["zillow_ms" if provider == "axesso" else f"{provider}_ms"] = elapsed_ms
+        if pending:
+            logger.info("Search deadline passed for %s — pending providers: %s", address, ", ".join(pending))
+        # The response is as old as the oldest payload it is built from, so a
+        # rebuild from cached parts doesn't restart the stale-while-revalidate clock.
+        built_from = [stamp for provider, stamp in fetched_at.items() if provider not in pending]
+        return ProviderPayloads(**fields, fetched_at=min(built_from, default=datetime.now(UTC)), pending=pending)
+
+    async def _build_property_response(
+        self,
+        address: str,
+        payloads: ProviderPayloads,
+        *,
+        zpid: str | None,
+        insurance_pct: float,
+        timings: dict[str, float],
+        preview: bool = False,
+    ) -> tuple[PropertyResponse, str | None]:
+        """Normalize provider payloads into a ``PropertyResponse``.
+
+        Also runs the steps that depend on merged data (AirROI estimate,
+        Zillow enrichment) unless ``preview`` is set, which builds from the
+        payloads alone without any further calls. Returns the response plus
+        the STR estimate source, which is cache-only meta.
+        """
+        property_id = self._generate_property_id(address)
+        timestamp = payloads.fetched_at
+        rentcast_data = payloads.rentcast
+        axesso_data = payloads.axesso
+        zillow_zpid = payloads.zillow_zpid
+        redfin_data = payloads.redfin
+        realtor_data = payloads.realtor
+        mashvisor_data = payloads.mashvisor
 
         # Normalize and merge data
         t_norm = time.perf_counter()
@@ -726,7 +1354,7 @@ class PropertyService:
         if _has_plausible_provider_str_data(normalized):
             str_estimate_source = "provider"
             logger.info("AirROI: provider ADR/occupancy present — skipping paid estimate call")
-        else:
+        elif not preview:
             str_estimate_data, airroi_ms = await self._fetch_str_estimate_provider(normalized)
             if airroi_ms > 0:
                 timings["airroi_ms"] = airroi_ms
@@ -766,7 +1394,15 @@ class PropertyService:
         # Zillow enrichment — tax history, schools, walk scores (zpid-gated, best-effort)
         resolved_zpid = str(zpid or zillow_zpid or "").strip() or None
         enrichment: dict[str, Any] = {}
-        if resolved_zpid:
+        fetch_enrichment = resolved_zpid is not None and not preview
+        if fetch_enrichment and settings.PROPERTY_LAZY_ENRICHMENT:
+            # Deferred: serve whatever is cached, the rest via get_property_enrichment.
+            parts, missing, stale = await self._read_zillow_enrichment_cache(resolved_zpid)
+            if stale:
+                self._schedule_enrichment_refresh(resolved_zpid, stale)
+            enrichment = self._zillow_enrichment_fields(parts)
+            data_quality["enrichment_pending"] = bool(missing)
+        elif fetch_enrichment:
             enrichment, enrichment_ms = await self._fetch_zillow_enrichment(resolved_zpid)
             timings["zillow_enrichment_ms"] = enrichment_ms
 
@@ -982,34 +1618,58 @@ class PropertyService:
             fetched_at=timestamp,
         )
 
-        # Cache result (skip when pre_fetched; return raw sources with response)
-        if pre_fetched is None:
-            try:
-                serialized = response.model_dump()
-                serialized["valuation_formula_version"] = _PROPERTY_CACHE_FORMULA_VERSION
-                # Cache-only meta: lets the staleness check distinguish
-                # "STR data deliberately skipped (provider had it)" from
-                # "AirROI fetch failed — retry after 4h".
-                serialized["str_estimate_source"] = str_estimate_source
-                # Shorter TTL when Zillow or Redfin data is absent so APIs
-                # are retried sooner (4 h vs default 24 h).
-                _has_zillow = response.zpid is not None or (
-                    response.valuations and response.valuations.zestimate is not None
-                )
-                _has_redfin = self.redfin is None or (
-                    response.valuations and response.valuations.redfin_estimate is not None
-                )
-                _cache_ttl = 86400 if (_has_zillow and _has_redfin) else 14400
-                await self._cache.set_property(address, serialized, ttl_seconds=_cache_ttl)
-                await self._cache.set(f"prop_id:{property_id}", serialized, ttl_seconds=_cache_ttl)
-                logger.info(f"Cached property: {address} (backend={'redis' if self._cache.use_redis else 'memory'})")
-            except Exception as e:
-                logger.warning(f"Failed to cache property: {e}")
-            timings["total_ms"] = (time.perf_counter() - t0) * 1000
-            logger.info("search_property timings (cache miss): %s", timings)
-            return response
-        timings["total_ms"] = (time.perf_counter() - t0) * 1000
-        return (response, rentcast_data, axesso_export_for_return or {})
+        return response, str_estimate_source
+
+    def _property_cache_ttl(self, payload: dict[str, Any]) -> int:
+        """Hard TTL left for a serialized property, counted from its ``fetched_at``.
+
+        ``fetched_at`` is the oldest provider payload the property was built
+        from. Entries missing Zillow or Redfin data get the shorter degraded
+        TTL (the 4h absent retry refreshes them sooner in the background while
+        they are still served); partial entries live only until completion.
+        Used both for new entries and to rewrite an existing one in place
+        without extending it.
+        """
+        if (payload.get("data_quality") or {}).get("is_partial"):
+            return _PROPERTY_CACHE_PARTIAL_TTL_SECONDS
+        valuations = payload.get("valuations") or {}
+        has_zillow = payload.get("zpid") is not None or valuations.get("zestimate") is not None
+        has_redfin = self.redfin is None or valuations.get("redfin_estimate") is not None
+        hard_ttl = (
+            _PROPERTY_CACHE_HARD_TTL_SECONDS if has_zillow and has_redfin else _PROPERTY_CACHE_DEGRADED_HARD_TTL_SECONDS
+        )
+        return max(int(hard_ttl - (_cache_age_seconds(payload) or 0)), 60)
+
+    async def _cache_property_response(
+        self,
+        address: str,
+        response: PropertyResponse,
+        str_estimate_source: str | None,
+        *,
+        ttl_seconds: int | None = None,
+        absent_retry_at: datetime | None = None,
+    ) -> None:
+        """Write a freshly built property: one ``prop_id`` blob plus an address pointer.
+
+        ``ttl_seconds`` overrides the hard TTL (e.g. for partial responses);
+        otherwise it is ``_property_cache_ttl``. ``absent_retry_at`` records
+        when an absent provider was last re-asked.
+        """
+        try:
+            serialized = response.model_dump()
+            serialized["valuation_formula_version"] = _PROPERTY_CACHE_FORMULA_VERSION
+            serialized["extraction_version"] = _PROPERTY_CACHE_EXTRACTION_VERSION
+            # Cache-only meta: lets the staleness check distinguish
+            # "STR data deliberately skipped (provider had it)" from
+            # "AirROI fetch failed — retry after 4h".
+            serialized["str_estimate_source"] = str_estimate_source
+            if absent_retry_at is not None:
+                serialized["absent_retry_at"] = absent_retry_at.isoformat()
+            _cache_ttl = ttl_seconds or self._property_cache_ttl(serialized)
+            await self._cache.set_property(address, serialized, ttl_seconds=_cache_ttl)
+            logger.info(f"Cached property: {address} (backend={'redis' if self._cache.use_redis else 'memory'})")
+        except Exception as e:
+            logger.warning(f"Failed to cache property: {e}")
 
     async def get_property_export_data(self, address: str) -> dict[str, Any]:
         """
@@ -1031,7 +1691,19 @@ class PropertyService:
             axesso_export = {}
         else:
             response, _, axesso_export = result
-        # Build verdict input from property response
+        verdict_input = self.build_verdict_input(response)
+        verdict_result = compute_iq_verdict(verdict_input) if verdict_input is not None else None
+        # Strip internal key from raw RentCast for export
+        raw_rentcast_export = {k: v for k, v in rentcast_raw.items() if k != "_merged"}
+        return {
+            "raw_rentcast": raw_rentcast_export,
+            "raw_axesso": axesso_export,
+            "property": response.model_dump(mode="json"),
+            "verdict": verdict_result.model_dump(mode="json") if verdict_result else None,
+        }
+
+    def build_verdict_input(self, response: PropertyResponse) -> IQVerdictInput | None:
+        """Build the IQ Verdict input for a property, or None without a usable price."""
         valuations = response.valuations
         listing = response.listing
         details = response.details
@@ -1055,6 +1727,8 @@ class PropertyService:
             or _positive_float(valuations.current_value_avm)
             or _positive_float(valuations.market_price)
         )
+        if list_price is None:
+            return None
         monthly_rent = rentals.monthly_rent_ltr or 0
         listing_status_val = getattr(listing, "listing_status", None) if listing is not None else None
         if listing_status_val is None and listing is not None and isinstance(listing, dict):
@@ -1064,44 +1738,33 @@ class PropertyService:
             and str(listing_status_val).upper() not in ("OFF_MARKET", "SOLD", "FOR_RENT", "OTHER")
             and (list_price_val or 0) > 0
         )
-        verdict_result = None
-        if list_price is not None:
-            # Same no-fabrication tax rule as _estimate_taxes: provider data first,
-            # else value x regional rate from the resolved price (never flat 1.2%
-            # of an unrelated number). list_price is guaranteed positive here.
-            response_zip = response.address.zip_code if response.address else None
-            verdict_taxes = (
-                market.property_taxes_annual
-                if market.property_taxes_annual is not None
-                else self._taxes_from_value(list_price, response_zip)
-            )
-            verdict_input = IQVerdictInput(
-                list_price=list_price,
-                monthly_rent=monthly_rent,
-                property_taxes=verdict_taxes,
-                insurance=market.insurance_annual,
-                hoa_fees_monthly=market.hoa_fees_monthly,
-                bedrooms=details.bedrooms or 3,
-                bathrooms=float(details.bathrooms or 2),
-                sqft=details.square_footage,
-                arv=valuations.arv or (list_price * 1.15),
-                average_daily_rate=rentals.average_daily_rate,
-                occupancy_rate=rentals.occupancy_rate or 0.75,
-                is_listed=is_listed,
-                zestimate=valuations.zestimate,
-                current_value_avm=valuations.current_value_avm,
-                tax_assessed_value=valuations.tax_assessed_value,
-                listing_status=listing_status_val,
-            )
-            verdict_result = compute_iq_verdict(verdict_input)
-        # Strip internal key from raw RentCast for export
-        raw_rentcast_export = {k: v for k, v in rentcast_raw.items() if k != "_merged"}
-        return {
-            "raw_rentcast": raw_rentcast_export,
-            "raw_axesso": axesso_export,
-            "property": response.model_dump(mode="json"),
-            "verdict": verdict_result.model_dump(mode="json") if verdict_result else None,
-        }
+        # Same no-fabrication tax rule as _estimate_taxes: provider data first,
+        # else value x regional rate from the resolved price (never flat 1.2%
+        # of an unrelated number). list_price is guaranteed positive here.
+        response_zip = response.address.zip_code if response.address else None
+        verdict_taxes = (
+            market.property_taxes_annual
+            if market.property_taxes_annual is not None
+            else self._taxes_from_value(list_price, response_zip)
+        )
+        return IQVerdictInput(
+            list_price=list_price,
+            monthly_rent=monthly_rent,
+            property_taxes=verdict_taxes,
+            insurance=market.insurance_annual,
+            hoa_fees_monthly=market.hoa_fees_monthly,
+            bedrooms=details.bedrooms or 3,
+            bathrooms=float(details.bathrooms or 2),
+            sqft=details.square_footage,
+            arv=valuations.arv or (list_price * 1.15),
+            average_daily_rate=rentals.average_daily_rate,
+            occupancy_rate=rentals.occupancy_rate or 0.75,
+            is_listed=is_listed,
+            zestimate=valuations.zestimate,
+            current_value_avm=valuations.current_value_avm,
+            tax_assessed_value=valuations.tax_assessed_value,
+            listing_status=listing_status_val,
+        )
 
     def _parse_address(self, address: str, data: dict | None = None) -> Address:
         """Parse address into components."""
@@ -1222,37 +1885,113 @@ class PropertyService:
         return axesso_data, zpid_str, elapsed_ms
 
     async def _fetch_zillow_enrichment(self, zpid: str) -> tuple[dict[str, Any], float]:
-        """Fetch tax history, schools, accessibility scores, and zestimate trend in parallel."""
+        """Tax history, schools, accessibility scores, and zestimate trend for ``zpid``.
+
+        Each part is served from its own long-lived zpid cache entry; only
+        missing parts are fetched (in parallel) before returning. Parts past
+        their refresh age are served as-is and re-fetched in the background.
+        """
         t0 = time.perf_counter()
-        out: dict[str, Any] = {
-            "tax_history": [],
-            "nearby_schools": [],
-            "zestimate_history": [],
-        }
         zpid_str = str(zpid).strip()
         if not zpid_str:
-            return out, 0.0
+            return self._zillow_enrichment_fields({}), 0.0
+        parts: dict[str, Any] = {}
         try:
-            tax_resp, schools_resp, access_resp, zest_resp = await asyncio.gather(
-                self.zillow.get_price_tax_history(zpid=zpid_str),
-                self.zillow.get_nearby_schools(zpid=zpid_str),
-                self.zillow.get_accessibility_scores(zpid=zpid_str),
-                self.zillow.get_zestimate_history(zpid=zpid_str),
-                return_exceptions=True,
-            )
-            if not isinstance(tax_resp, Exception) and tax_resp.success and tax_resp.data:
-                out["tax_history"] = ZillowDataExtractor.parse_tax_history(tax_resp.data)
-            if not isinstance(schools_resp, Exception) and schools_resp.success and schools_resp.data:
-                out["nearby_schools"] = ZillowDataExtractor.parse_nearby_schools(schools_resp.data)
-            if not isinstance(access_resp, Exception) and access_resp.success and access_resp.data:
-                scores = ZillowDataExtractor.extract_scores(access_resp.data)
-                out.update({k: v for k, v in scores.items() if v is not None})
-            if not isinstance(zest_resp, Exception) and zest_resp.success and zest_resp.data:
-                out["zestimate_history"] = ZillowDataExtractor.parse_zestimate_history(zest_resp.data)
+            parts, missing, stale = await self._read_zillow_enrichment_cache(zpid_str)
+            if missing:
+                fetched = await asyncio.gather(
+                    *(self._fetch_zillow_enrichment_part(part, zpid_str) for part in missing)
+                )
+                parts.update({part: data for part, data in zip(missing, fetched, strict=True) if data is not None})
+            # Only once the missing parts are in, so the refresh doesn't compete with them.
+            if stale:
+                self._schedule_enrichment_refresh(zpid_str, stale)
         except Exception as e:
             logger.warning("Zillow enrichment failed for zpid %s: %s", zpid_str, e)
         elapsed_ms = (time.perf_counter() - t0) * 1000
-        return out, elapsed_ms
+        return self._zillow_enrichment_fields(parts), elapsed_ms
+
+    async def _read_zillow_enrichment_cache(self, zpid: str) -> tuple[dict[str, Any], list[str], list[str]]:
+        """Cached enrichment parts for ``zpid``, the parts missing from cache, and the stale ones.
+
+        Parts past their refresh age are returned as-is; callers re-fetch them
+        in the background with ``_schedule_enrichment_refresh``.
+        """
+        keys = {part: self._zillow_enrichment_key(part, zpid) for part in _ZILLOW_ENRICHMENT_SOURCES}
+        cached = await self._cache.get_many(keys.values())
+        now = time.time()
+        parts: dict[str, Any] = {}
+        missing: list[str] = []
+        stale: list[str] = []
+        for part, key in keys.items():
+            entry = cached.get(key)
+            if not isinstance(entry, dict) or "data" not in entry:
+                missing.append(part)
+                continue
+            parts[part] = entry["data"]
+            if now - entry.get("fetched_at", 0) > _ZILLOW_ENRICHMENT_REFRESH_SECONDS[part]:
+                stale.append(part)
+        return parts, missing, stale
+
+    @staticmethod
+    def _zillow_enrichment_fields(parts: dict[str, Any]) -> dict[str, Any]:
+        """Flatten enrichment parts into the fields ``_build_property_response`` reads."""
+        out: dict[str, Any] = {
+            "tax_history": parts.get("tax_history") or [],
+            "nearby_schools": parts.get("nearby_schools") or [],
+            "zestimate_history": parts.get("zestimate_history") or [],
+        }
+        scores = parts.get("accessibility_scores") or {}
+        out.update({k: v for k, v in scores.items() if v is not None})
+        return out
+
+    @staticmethod
+    def _zillow_enrichment_key(part: str, zpid: str) -> str:
+        return CacheService.generate_key(_provider_payload_prefix(f"zillow_{part}"), zpid)
+
+    async def _fetch_zillow_enrichment_part(self, part: str, zpid: str) -> Any | None:
+        """Fetch, parse and cache one enrichment part; ``None`` when the call failed.
+
+        An empty answer or a 404 is cached as an empty result (e.g. no
+        schools nearby) so it is not re-requested on every rebuild.
+        """
+        method, parse = _ZILLOW_ENRICHMENT_SOURCES[part]
+        try:
+            resp = await getattr(self.zillow, method)(zpid=zpid)
+            if resp.success and resp.data:
+                data = parse(resp.data)
+            elif resp.success or resp.status_code == 404:
+                data = {} if part == "accessibility_scores" else []
+            else:
+                return None
+        except Exception as e:
+            logger.warning("Zillow %s failed for zpid %s: %s", part, zpid, e)
+            return None
+        await self._cache.set(
+            self._zillow_enrichment_key(part, zpid),
+            {"data": data, "fetched_at": time.time()},
+            ttl_seconds=_ZILLOW_ENRICHMENT_TTL_SECONDS[part],
+        )
+        return data
+
+    def _schedule_enrichment_refresh(self, zpid: str, parts: list[str]) -> None:
+        """Re-fetch stale enrichment parts in the background (one refresh per zpid).
+
+        Runs at prefetch priority, outside any request deadline, and is
+        skipped while the AXESSO budget is too low for it.
+        """
+
+        async def _refresh() -> None:
+            budget = getattr(self.zillow, "budget", None)
+            if budget is not None and not await budget.has_headroom(Priority.PREFETCH):
+                logger.info("Zillow enrichment refresh for zpid %s deferred — provider budget low", zpid)
+                return
+            with outbound_priority(Priority.PREFETCH):
+                await asyncio.gather(*(self._fetch_zillow_enrichment_part(part, zpid) for part in parts))
+
+        with deadline.no_deadline():
+            if self._search_flight.spawn(f"enrich:{zpid}", _refresh):
+                logger.info("Refreshing stale Zillow enrichment for zpid %s: %s", zpid, ", ".join(parts))
 
     def _unwrap_axesso_property(self, raw: dict[str, Any]) -> dict[str, Any]:
         """
@@ -1708,9 +2447,12 @@ class PropertyService:
         except Exception:
             return None, None
 
-    async def _enrich_comps_with_photos(self, comps: list[dict[str, Any]], max_concurrency: int = 5) -> None:
-        """Attach Zillow photo URL to comps when missing."""
-        sem = asyncio.Semaphore(max_concurrency)
+    async def _enrich_comps_with_photos(self, comps: list[dict[str, Any]]) -> None:
+        """Attach Zillow photo URL to comps when missing.
+
+        Lookups run concurrently; uncached ones are paced by the AXESSO
+        concurrency limiter.
+        """
 
         async def _fetch(comp: dict[str, Any]) -> None:
             if comp.get("imageUrl"):
@@ -1719,11 +2461,10 @@ class PropertyService:
             url = comp.get("url")
             if not zpid and not url:
                 return
-            async with sem:
-                try:
-                    res = await self.get_property_photos(zpid=zpid, url=url)
-                except Exception:
-                    return
+            try:
+                res = await self.get_property_photos(zpid=zpid, url=url)
+            except Exception:
+                return
             photos = res.get("photos") if isinstance(res, dict) else None
             if isinstance(photos, list) and photos:
                 first = photos[0]
@@ -0,0 +1,252 @@
+"""
+Fleet-wide provider quota budgets, enforced before each outbound call.
+
+Each configured provider gets a token bucket (``PROVIDER_RATE_LIMITS``,
+requests per second) and a monthly spend counter
+(``PROVIDER_MONTHLY_BUDGETS_USD`` / ``PROVIDER_COST_PER_REQUEST_USD``). Both
+live in Redis and are checked and charged by one Lua script, so every web
+worker and the Arq worker draw from the same budget and we stop *before* the
+provider starts answering 429.
+
+Budgets are shared by priority class (see ``concurrency_limiter.Priority``):
+each class may only spend down to its reserve (``PRIORITY_RESERVES``), so
+when a budget runs low map searches, then scheduled jobs, then background
+cache refreshes stop drawing from it while interactive searches still can.
+User-facing classes wait briefly for the bucket to refill; background
+classes are refused at once and defer (or keep serving stale cache).
+
+Providers without configured limits cost nothing to check. Without Redis
+the same rules apply per process; on a Redis error the call is allowed.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import time
+from datetime import UTC, datetime
+from typing import Any
+
+from app.core.config import settings
+from app.core.exceptions import ExternalAPIError
+from app.services.concurrency_limiter import Priority, current_priority
+
+logger = logging.getLogger(__name__)
+
+# Share of each budget (bucket capacity and monthly spend) a class must leave
+# for the classes above it.
+PRIORITY_RESERVES: dict[Priority, float] = {
+    Priority.INTERACTIVE: 0.0,
+    Priority.BULK: 0.1,
+    Priority.BACKGROUND: 0.25,
+    Priority.PREFETCH: 0.5,
+}
+# Classes that wait for the bucket to refill instead of being refused.
+_WAITING_PRIORITIES = frozenset({Priority.INTERACTIVE, Priority.BULK})
+# Longest a waiting class will wait for a token before giving up.
+_MAX_WAIT_SECONDS = 5.0
+# Bucket capacity, in seconds of sustained rate.
+_BURST_SECONDS = 2.0
+# Monthly counters outlive their month by a few days for reporting.
+_SPEND_TTL_SECONDS = 35 * 24 * 3600
+
+# Check (and optionally charge) one call against both budgets.
+# KEYS[1] = bucket hash, KEYS[2] = monthly spend counter
+# ARGV = now, rate, burst, token reserve, monthly budget, cost, spend reserve, charge (1/0), spend ttl
+# Returns {1, tokens left} when allowed, {0, seconds to wait} when the bucket is
+# short, {0, "-1"} when the monthly budget is. Floats travel as strings
+# (Lua numbers are truncated to integers on the way out).
+_CHECK_BUDGET_SCRIPT = """
+local now = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local burst = tonumber(ARGV[3])
+local tokens = burst
+if rate > 0 then
+    local state = redis.call("HMGET", KEYS[1], "tokens", "ts")
+    if state[1] then
+        tokens = math.min(burst, tonumber(state[1]) + math.max(now - tonumber(state[2]), 0) * rate)
+    end
+    if tokens - 1 < tonumber(ARGV[4]) then
+        return {0, tostring((1 + tonumber(ARGV[4]) - tokens) / rate)}
+    end
+end
+local budget = tonumber(ARGV[5])
+local cost = tonumber(ARGV[6])
+if budget > 0 and cost > 0 then
+    local spent = tonumber(redis.call("GET", KEYS[2]) or "0")
+    if spent + cost > budget - tonumber(ARGV[7]) then
+        return {0, "-1"}
+    end
+end
+if ARGV[8] == "1" then
+    if rate > 0 then
+        redis.call("HSET", KEYS[1], "tokens", tostring(tokens - 1), "ts", ARGV[1])
+        redis.call("EXPIRE", KEYS[1], math.ceil(burst / rate) + 60)
+    end
+    if budget > 0 and cost > 0 then
+        redis.call("INCRBYFLOAT", KEYS[2], ARGV[6])
+        redis.call("EXPIRE", KEYS[2], ARGV[9])
+    end
+end
+return {1, tostring(tokens - 1)}
+"""
+
+
+class ProviderBudgetExceeded(ExternalAPIError):
+    """A call was refused because its priority class has used up its share of a budget."""
+
+    def __init__(self, provider: str, priority: Priority, reason: str):
+        super().__init__(provider, f"{reason} budget reserved for higher-priority requests ({priority.value})")
+        self.code = "PROVIDER_BUDGET_EXCEEDED"
+        self.priority = priority
+        self.reason = reason
+
+
+class ProviderBudget:
+    """Rate and monthly-spend budget for one provider, shared through Redis."""
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        rate_per_second: float = 0.0,
+        monthly_budget_usd: float = 0.0,
+        cost_per_request_usd: float = 0.0,
+    ):
+        self.name = name
+        self.rate = max(rate_per_second, 0.0)
+        self.burst = max(self.rate * _BURST_SECONDS, 1.0) if self.rate else 0.0
+        self.monthly_budget = max(monthly_budget_usd, 0.0)
+        self.cost = max(cost_per_request_usd, 0.0)
+        # Local state for when Redis is unavailable: [tokens, ts] and spend per month.
+        self._local_bucket: list[float] | None = None
+        self._local_spend: dict[str, float] = {}
+
+    @property
+    def bucket_key(self) -> str:
+        return f"budget:rate:{self.name}"
+
+    def spend_key(self, now: float) -> str:
+        return f"budget:spend:{self.name}:{datetime.fromtimestamp(now, UTC):%Y-%m}"
+
+    @staticmethod
+    def _cache():
+        from app.services.cache_service import get_cache_service
+
+        return get_cache_service()
+
+    def _reserves(self, priority: Priority) -> tuple[float, float]:
+        share = PRIORITY_RESERVES[priority]
+        return self.burst * share, self.monthly_budget * share
+
+    def _check_local(self, now: float, priority: Priority, charge: bool) -> tuple[bool, float]:
+        """Same rules as ``_CHECK_BUDGET_SCRIPT``, on this process's state."""
+        token_reserve, spend_reserve = self._reserves(priority)
+        tokens = self.burst
+        if self.rate:
+            if self._local_bucket is not None:
+                level, ts = self._local_bucket
+                tokens = min(self.burst, level + max(now - ts, 0.0) * self.rate)
+            if tokens - 1 < token_reserve:
+                return False, (1 + token_reserve - tokens) / self.rate
+        month = self.spend_key(now)
+        if self.monthly_budget and self.cost:
+            if self._local_spend.get(month, 0.0) + self.cost > self.monthly_budget - spend_reserve:
+                return False, -1.0
+        if charge:
+            if self.rate:
+                self._local_bucket = [tokens - 1, now]
+            if self.monthly_budget and self.cost:
+                self._local_spend[month] = self._local_spend.get(month, 0.0) + self.cost
+        return True, tokens - 1
+
+    async def _check(self, priority: Priority, *, charge: bool) -> tuple[bool, float]:
+        """Return ``(allowed, value)``: tokens left if allowed, else seconds to wait (``-1`` = month spent)."""
+        now = time.time()
+        cache = self._cache()
+        if not cache.use_redis:
+            return self._check_local(now, priority, charge)
+        token_reserve, spend_reserve = self._reserves(priority)
+        try:
+            allowed, value = await cache.redis_client.eval(
+                _CHECK_BUDGET_SCRIPT,
+                2,
+                self.bucket_key,
+                self.spend_key(now),
+                now,
+                self.rate,
+                self.burst,
+                token_reserve,
+                self.monthly_budget,
+                self.cost,
+                spend_reserve,
+                "1" if charge else "0",
+                _SPEND_TTL_SECONDS,
+            )
+        except Exception as e:
+            logger.debug("Provider budget %s check failed, allowing call: %s", self.name, e)
+            return True, math.inf
+        return bool(int(allowed)), float(value)
+
+    async def has_headroom(self, priority: Priority | None = None) -> bool:
+        """Whether a call at ``priority`` would be allowed now (charges nothing)."""
+        allowed, _ = await self._check(priority or current_priority(), charge=False)
+        return allowed
+
+    async def acquire(self, priority: Priority | None = None) -> None:
+        """Charge one call, waiting for the bucket to refill if the class may wait.
+
+        Raises ``ProviderBudgetExceeded`` when the call should not go out.
+        """
+        priority = priority or current_priority()
+        deadline = time.monotonic() + _MAX_WAIT_SECONDS
+        while True:
+            allowed, value = await self._check(priority, charge=True)
+            if allowed:
+                return
+            if value < 0:
+                raise ProviderBudgetExceeded(self.name, priority, "monthly")
+            if priority not in _WAITING_PRIORITIES or time.monotonic() + value > deadline:
+                raise ProviderBudgetExceeded(self.name, priority, "rate")
+            await asyncio.sleep(value)
+
+    async def snapshot(self) -> dict[str, Any]:
+        """Configured limits and this month's spend, for health endpoints."""
+        now = time.time()
+        spent = self._local_spend.get(self.spend_key(now), 0.0)
+        cache = self._cache()
+        if cache.use_redis:
+            try:
+                spent = float(await cache.redis_client.get(self.spend_key(now)) or 0.0)
+            except Exception:
+                spent = None
+        return {
+            "rate_per_second": self.rate or None,
+            "monthly_budget_usd": self.monthly_budget or None,
+            "cost_per_request_usd": self.cost or None,
+            "spent_this_month_usd": round(spent, 2) if spent is not None else None,
+        }
+
+
+_budgets: dict[str, ProviderBudget | None] = {}
+
+
+def get_provider_budget(name: str) -> ProviderBudget | None:
+    """Return the budget configured for provider ``name``, or ``None`` if it is unlimited."""
+    if name not in _budgets:
+        key = name.lower()
+        rate = settings.provider_rate_limits.get(key, 0.0)
+        monthly = settings.provider_monthly_budgets_usd.get(key, 0.0)
+        cost = settings.provider_cost_per_request_usd.get(key, 0.0)
+        _budgets[name] = (
+            ProviderBudget(name, rate_per_second=rate, monthly_budget_usd=monthly, cost_per_request_usd=cost)
+            if rate > 0 or (monthly > 0 and cost > 0)
+            else None
+        )
+    return _budgets[name]
+
+
+async def budget_snapshots() -> dict[str, dict[str, Any]]:
+    """Snapshot of every configured provider budget in this process."""
+    return {name: await budget.snapshot() for name, budget in sorted(_budgets.items()) if budget is not None}
@@ -0,0 +1,158 @@
+"""
+Prometheus metrics for outbound provider calls.
+
+``BaseAPIClient`` reports every attempt here; the series are registered in
+the default ``prometheus_client`` registry and so appear on the ``/metrics``
+endpoint that ``prometheus_fastapi_instrumentator`` already serves:
+
+- ``provider_request_duration_seconds`` (histogram): one observation per
+  attempt, by provider, endpoint, status class and attempt number.
+- ``provider_retries_total``: attempts retried after a 429, 502/503 or timeout.
+- ``provider_rate_limited_total``: 429 responses.
+- ``provider_circuit_open_total``: calls short-circuited by an open breaker.
+- ``provider_cost_usd_total``: spend on successful calls, priced per endpoint
+  (``PROVIDER_ENDPOINT_COSTS_USD``) or per provider
+  (``PROVIDER_COST_PER_REQUEST_USD``).
+
+Every series also carries an ``origin`` label: the route template of the API
+request that made the call (set by ``CallOriginMiddleware``), or the name of
+the job it ran under (``call_origin("job:...")``). Calls made outside either
+are labelled ``"other"``.
+
+Without ``prometheus_client`` installed every function here is a no-op.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterator, MutableMapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+try:
+    from prometheus_client import Counter, Histogram
+
+    _LABELS = ("provider", "endpoint", "origin")
+    _REQUEST_DURATION = Histogram(
+        "provider_request_duration_seconds",
+        "Latency of one outbound provider request attempt.",
+        (*_LABELS, "status_class", "attempt"),
+        buckets=(0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 4.0, 8.0, 15.0, 30.0),
+    )
+    _RETRIES = Counter(
+        "provider_retries_total",
+        "Outbound provider request attempts that were retried.",
+        (*_LABELS, "reason"),
+    )
+    _RATE_LIMITED = Counter(
+        "provider_rate_limited_total",
+        "Outbound provider requests answered with HTTP 429.",
+        _LABELS,
+    )
+    _CIRCUIT_OPEN = Counter(
+        "provider_circuit_open_total",
+        "Outbound provider calls short-circuited by an open circuit breaker.",
+        _LABELS,
+    )
+    _COST = Counter(
+        "provider_cost_usd_total",
+        "Estimated provider spend in USD, from configured unit prices.",
+        _LABELS,
+    )
+    METRICS_ENABLED = True
+except ImportError:  # pragma: no cover - exercised only without prometheus_client
+    METRICS_ENABLED = False
+
+# Explicit origin (job name), or the ASGI scope of the API request being served.
+_origin: ContextVar[str | None] = ContextVar("provider_call_origin", default=None)
+_request_scope: ContextVar[MutableMapping[str, Any] | None] = ContextVar("provider_call_scope", default=None)
+
+
+@contextmanager
+def call_origin(origin: str) -> Iterator[None]:
+    """Label provider calls made in this context (and tasks it spawns) with ``origin``."""
+    token = _origin.set(origin)
+    try:
+        yield
+    finally:
+        _origin.reset(token)
+
+
+@contextmanager
+def request_scope(scope: MutableMapping[str, Any]) -> Iterator[None]:
+    """Label provider calls made while serving ``scope`` with its route template.
+
+    The route is read from the scope when a call is recorded, since routing
+    only matches it after the middleware has run.
+    """
+    token = _request_scope.set(scope)
+    try:
+        yield
+    finally:
+        _request_scope.reset(token)
+
+
+def current_origin() -> str:
+    """Route template or job name the current provider call belongs to."""
+    origin = _origin.get()
+    if origin is not None:
+        return origin
+    scope = _request_scope.get()
+    if scope is None:
+        return "other"
+    route_path = getattr(scope.get("route"), "path", None)
+    return f"{scope.get('method', 'GET')} {route_path}" if route_path else "unmatched"
+
+
+def status_class(status_code: int | None, outcome: str | None = None) -> str:
+    """``"2xx"``..``"5xx"`` for HTTP responses, else the outcome (``"timeout"``, ``"error"``)."""
+    if status_code is None:
+        return outcome or "error"
+    return f"{status_code // 100}xx"
+
+
+def unit_cost(provider: str, endpoint: str) -> float:
+    """Configured USD price of one successful ``endpoint`` call (0 when unpriced)."""
+    key = provider.lower()
+    endpoint_costs = settings.provider_endpoint_costs_usd
+    return endpoint_costs.get(f"{key}:{endpoint.lower()}", settings.provider_cost_per_request_usd.get(key, 0.0))
+
+
+def observe_attempt(
+    provider: str,
+    endpoint: str,
+    attempt: int,
+    seconds: float,
+    status_code: int | None,
+    outcome: str | None = None,
+) -> None:
+    """Record one attempt's latency and, on success, its cost."""
+    if not METRICS_ENABLED:
+        return
+    origin = current_origin()
+    _REQUEST_DURATION.labels(provider, endpoint, origin, status_class(status_code, outcome), str(attempt)).observe(
+        seconds
+    )
+    if status_code == 429:
+        _RATE_LIMITED.labels(provider, endpoint, origin).inc()
+    if status_code is not None and 200 <= status_code < 300:
+        cost = unit_cost(provider, endpoint)
+        if cost > 0:
+            _COST.labels(provider, endpoint, origin).inc(cost)
+
+
+def record_retry(provider: str, endpoint: str, reason: str) -> None:
+    """Record that an attempt is about to be retried (``reason``: ``"429"``, ``"5xx"``, ``"timeout"``)."""
+    if METRICS_ENABLED:
+        _RETRIES.labels(provider, endpoint, current_origin(), reason).inc()
+
+
+def record_circuit_open(provider: str, endpoint: str) -> None:
+    """Record a call refused by an open circuit breaker."""
+    if METRICS_ENABLED:
+        _CIRCUIT_OPEN.labels(provider, endpoint, current_origin()).inc()
@@ -3,6 +3,10 @@ Resilience utilities for external API calls.
 
 Lightweight circuit-breaker + retry implementation (stdlib only).
 When the project adds `tenacity`, this module can delegate to it.
+
+Breaker state is shared by every worker and replica through Redis (see
+``CircuitBreaker``), so the fleet stops calling a failing provider together
+instead of each process paying its own timeouts to find out.
 """
 
 from __future__ import annotations
@@ -11,20 +15,47 @@ import asyncio
 import logging
 import random
 import time
-from collections import defaultdict
 from collections.abc import Callable
+from enum import StrEnum
 from functools import wraps
 from typing import Any, TypeVar
 
-from app.core.exceptions import ExternalAPIError
+from app.core.exceptions import DealGapIQError, ExternalAPIError
+from app.services import deadline
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
-_circuit_state: dict[str, dict[str, Any]] = defaultdict(
-    lambda: {"failures": 0, "last_failure": 0.0, "state": "CLOSED"}
-)
+# Each process re-reads the shared state at most this often; within that
+# window the local copy answers, so a closed circuit costs no round trip.
+_CIRCUIT_SYNC_SECONDS = 1.0
+# Failure counts of a provider that stops failing without a recorded success
+# (e.g. no traffic) expire instead of accumulating forever.
+_CIRCUIT_STATE_TTL_SECONDS = 3600
+
+# Atomically count one failure; opens the circuit at the threshold and keeps
+# an open circuit open (pushing back its recovery window).
+# KEYS[1] = state hash; ARGV = now, threshold, ttl
+_RECORD_FAILURE_SCRIPT = """
+local failures = redis.call("HINCRBY", KEYS[1], "failures", 1)
+redis.call("HSET", KEYS[1], "last_failure", ARGV[1])
+local state = "closed"
+if failures >= tonumber(ARGV[2]) or redis.call("HGET", KEYS[1], "state") == "open" then
+    state = "open"
+end
+redis.call("HSET", KEYS[1], "state", state)
+redis.call("EXPIRE", KEYS[1], ARGV[3])
+return {failures, state}
+"""
+
+
+class CircuitState(StrEnum):
+    """Circuit breaker states."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
 
 
 class CircuitOpenError(ExternalAPIError):
@@ -34,33 +65,173 @@ class CircuitOpenError(ExternalAPIError):
         self,
         message: str = "Data providers are temporarily unavailable. Please try again in a few minutes.",
     ):
-        super().__init__(message=message, code="PROVIDER_CIRCUIT_OPEN")
+        # ExternalAPIError would prefix the message with a service name; keep
+        # the user-facing text as-is and only share its type and attributes.
+        DealGapIQError.__init__(self, message=message, code="PROVIDER_CIRCUIT_OPEN")
+        self.service = "provider"
+        self.status_code = None
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker for one provider, shared across processes.
+
+    Failure count, open flag and last failure time live in the Redis hash
+    ``circuit:<name>``; each process keeps a local copy it refreshes at most
+    every ``_CIRCUIT_SYNC_SECONDS``. After ``failure_threshold`` consecutive
+    failures the circuit opens and requests fail fast. Once
+    ``recovery_timeout`` has passed the circuit is half-open and a single
+    probe request, across all workers, is let through; its success closes the
+    circuit everywhere, its failure restarts the recovery window.
+
+    Without Redis the same rules apply per process.
+    """
+
+    def __init__(self, name: str, failure_threshold: int = 3, recovery_timeout: float = 30.0):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.failures = 0
+        self.last_failure = 0.0  # epoch seconds, comparable across hosts
+        self._open = False
+        self._synced_at = float("-inf")
+        # Local probe guard (monotonic deadline): keeps this process to one
+        # probe even when the shared lock fails open on a Redis error.
+        self._probe_until = 0.0
+        # Lock token of the probe this process has out, if any.
+        self.probe_token: str | None = None
+
+    @property
+    def key(self) -> str:
+        return f"circuit:{self.name}"
+
+    @property
+    def state(self) -> CircuitState:
+        if not self._open:
+            return CircuitState.CLOSED
+        if time.time() - self.last_failure >= self.recovery_timeout:
+            return CircuitState.HALF_OPEN
+        return CircuitState.OPEN
 
+    @staticmethod
+    def _cache():
+        from app.services.cache_service import get_cache_service
 
-def _is_circuit_open(name: str, threshold: int, timeout: float) -> bool:
-    state = _circuit_state[name]
-    if state["state"] == "OPEN":
-        if time.time() - state["last_failure"] > timeout:
-            state["state"] = "HALF_OPEN"
-            logger.info("Circuit breaker %s moved to HALF_OPEN", name)
+        return get_cache_service()
+
+    def _redis(self):
+        cache = self._cache()
+        return cache.redis_client if cache.use_redis else None
+
+    def _apply(self, failures: int, last_failure: float, is_open: bool) -> None:
+        if is_open and not self._open:
+            logger.warning("Circuit breaker OPEN for provider: %s (%d failures)", self.name, failures)
+        elif self._open and not is_open:
+            logger.info("Circuit breaker CLOSED for provider: %s", self.name)
+        self.failures = failures
+        self.last_failure = last_failure
+        self._open = is_open
+        self._probe_until = 0.0
+
+    async def _sync(self) -> None:
+        """Refresh the local copy from Redis if it is older than the sync interval."""
+        if time.monotonic() - self._synced_at < _CIRCUIT_SYNC_SECONDS:
+            return
+        self._synced_at = time.monotonic()
+        redis = self._redis()
+        if redis is None:
+            return
+        try:
+            shared = await redis.hgetall(self.key)
+        except Exception as e:
+            logger.debug("Circuit breaker %s sync failed, using local state: %s", self.name, e)
+            return
+        self._apply(
+            int(shared.get("failures", 0)),
+            float(shared.get("last_failure", 0.0)),
+            shared.get("state") == "open",
+        )
+
+    async def allow(self) -> bool:
+        """Whether a request may go out now."""
+        await self._sync()
+        state = self.state
+        if state == CircuitState.CLOSED:
+            return True
+        if state == CircuitState.OPEN:
             return False
+        # Half-open: one probe fleet-wide. The lock outlives a hung probe by
+        # at most one recovery window.
+        if time.monotonic() < self._probe_until:
+            return False
+        token = await self._cache().acquire_lock(f"{self.key}:probe", max(int(self.recovery_timeout), 1))
+        if token is None:
+            return False
+        self._probe_until = time.monotonic() + self.recovery_timeout
+        self.probe_token = token
+        logger.info("Circuit breaker %s HALF_OPEN — sending probe", self.name)
         return True
-    return False
 
+    async def release_probe(self, token: str) -> None:
+        """Hand back the probe ``allow`` let through (``token`` = its ``probe_token``).
+
+        After a success or failure this only frees the lock early; after a
+        probe that recorded no outcome it lets the next request probe.
+        """
+        if token != self.probe_token:
+            return
+        self.probe_token = None
+        self._probe_until = 0.0
+        await self._cache().release_lock(f"{self.key}:probe", token)
 
-def _record_success(name: str) -> None:
-    state = _circuit_state[name]
-    state["failures"] = 0
-    state["state"] = "CLOSED"
+    async def record_success(self) -> None:
+        """Close the circuit (everywhere, if it was not already closed here)."""
+        if not self._open and self.failures == 0:
+            return
+        await self.reset()
 
+    async def record_failure(self) -> None:
+        """Count one failed request, opening the circuit at the threshold."""
+        now = time.time()
+        redis = self._redis()
+        if redis is not None:
+            try:
+                failures, state = await redis.eval(
+                    _RECORD_FAILURE_SCRIPT, 1, self.key, now, self.failure_threshold, _CIRCUIT_STATE_TTL_SECONDS
+                )
+                self._apply(int(failures), now, state == "open")
+                self._synced_at = time.monotonic()
+                return
+            except Exception as e:
+                logger.debug("Circuit breaker %s shared update failed, counting locally: %s", self.name, e)
+        failures = self.failures + 1
+        self._apply(failures, now, self._open or failures >= self.failure_threshold)
 
-def _record_failure(name: str, threshold: int) -> None:
-    state = _circuit_state[name]
-    state["failures"] += 1
-    state["last_failure"] = time.time()
-    if state["failures"] >= threshold:
-        state["state"] = "OPEN"
-        logger.warning("Circuit breaker OPEN for provider: %s", name)
+    async def reset(self) -> None:
+        """Reset the circuit breaker to closed state."""
+        self._apply(0, 0.0, False)
+        redis = self._redis()
+        if redis is None:
+            return
+        try:
+            await redis.delete(self.key)
+        except Exception as e:
+            logger.debug("Circuit breaker %s shared reset failed: %s", self.name, e)
+
+
+_breakers: dict[str, CircuitBreaker] = {}
+
+
+def get_circuit_breaker(name: str, failure_threshold: int = 3, recovery_timeout: float = 30.0) -> CircuitBreaker:
+    """Return this process's breaker for ``name``, creating it on first use.
+
+    Every caller naming the same provider shares one breaker (and one Redis
+    state); the first caller's thresholds apply.
+    """
+    breaker = _breakers.get(name)
+    if breaker is None:
+        breaker = _breakers[name] = CircuitBreaker(name, failure_threshold, recovery_timeout)
+    return breaker
 
 
 def resilient(
@@ -74,28 +245,39 @@ def resilient(
     Decorator adding retry + circuit breaker to async functions.
 
     Retries with jittered exponential backoff. Opens circuit after N failures.
+    A retry whose backoff would overrun the request deadline
+    (``app.services.deadline``) is not attempted.
     """
 
     def decorator(fn: Callable[..., T]) -> Callable[..., T]:
+        breaker = get_circuit_breaker(name, circuit_breaker_threshold, circuit_breaker_timeout)
+
         @wraps(fn)
         async def wrapper(*args: Any, **kwargs: Any) -> T:
-            if _is_circuit_open(name, circuit_breaker_threshold, circuit_breaker_timeout):
+            if not await breaker.allow():
                 raise CircuitOpenError(f"Circuit open for provider '{name}'")
+            probe = breaker.probe_token
+            try:
+                return await _call_with_retries(*args, **kwargs)
+            finally:
+                if probe is not None:
+                    await breaker.release_probe(probe)
 
+        async def _call_with_retries(*args: Any, **kwargs: Any) -> T:
             last_exc: Exception | None = None
             for attempt in range(1, max_attempts + 1):
                 try:
                     result = await fn(*args, **kwargs)
-                    _record_success(name)
+                    await breaker.record_success()
                     return result
                 except CircuitOpenError:
                     # Do not retry when the circuit is already open
                     raise
                 except Exception as exc:
                     last_exc = exc
-                    _record_failure(name, circuit_breaker_threshold)
-                    if attempt < max_attempts:
-                        delay = min(4.0, 0.5 * (2 ** (attempt - 1))) * (0.5 + random.random())
+                    await breaker.record_failure()
+                    delay = min(4.0, 0.5 * (2 ** (attempt - 1))) * (0.5 + random.random())
+                    if attempt < max_attempts and deadline.allows(delay):
                         logger.warning(
                             "Provider %s failed (attempt %d/%d) — retrying in %.1fs: %s",
                             name,
@@ -107,6 +289,7 @@ def resilient(
                         await asyncio.sleep(delay)
                     else:
                         logger.error("Provider %s exhausted retries: %s", name, exc)
+                        break
 
             assert last_exc is not None
             raise last_exc
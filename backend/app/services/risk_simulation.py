@@ -0,0 +1,194 @@
+"""
+Monte Carlo deal-risk simulation.
+
+Draws correlated scenarios for six drivers — market rent, LTR vacancy,
+appreciation, loan rate, rehab overrun and STR occupancy — and runs every
+path through the batch LTR / STR / flip calculators in one vectorized pass.
+Each strategy's outcome (annual cash flow, or net profit for a flip) is
+summarized as percentiles, probability of a loss, 95% value-at-risk and
+expected shortfall; LTR also gets an IRR distribution over the hold period.
+
+Driver model (standard normals correlated through ``DRIVER_CORRELATION``):
+  - rent, rehab overrun: log-normal multipliers on the base value (rent also
+    scales STR ADR)
+  - vacancy, appreciation, loan rate, STR occupancy: base + spread x z,
+    clipped to calculator bounds
+  - the loan-rate shock applies to the flip's hard-money rate too, and the
+    appreciation shock moves the flip ARV over its holding period
+  - shocked rent, ADR, ARV and rehab are clipped to the calculator bounds,
+    so a tail draw on a large but valid input stays a valid scenario
+
+Pure function: no I/O. Results are reproducible for a given ``seed``.
+"""
+
+import secrets
+
+import numpy as np
+
+from app.schemas.analytics import (
+    RiskDistribution,
+    RiskSimulationInput,
+    RiskSimulationResponse,
+    StrategyRiskResult,
+)
+from app.schemas.property import AllAssumptions
+from app.services.assumption_resolver import build_flip_params, build_ltr_params, build_str_params
+from app.services.calculators import calculate_flip_batch, calculate_ltr_batch, calculate_str_batch
+
+DRIVERS = ("rent", "vacancy", "appreciation", "interest_rate", "rehab_overrun", "str_occupancy")
+
+# Rent moves with appreciation and STR occupancy and against vacancy; higher
+# rates cool appreciation. Rehab overrun is independent.
+DRIVER_CORRELATION = np.array(
+    [
+        # rent  vac   appr  rate  rehab  occ
+        [1.0, -0.5, 0.5, 0.0, 0.0, 0.4],
+        [-0.5, 1.0, -0.3, 0.0, 0.0, -0.4],
+        [0.5, -0.3, 1.0, -0.3, 0.0, 0.2],
+        [0.0, 0.0, -0.3, 1.0, 0.0, 0.0],
+        [0.0, 0.0, 0.0, 0.0, 1.0, 0.0],
+        [0.4, -0.4, 0.2, 0.0, 0.0, 1.0],
+    ]
+)
+_CHOLESKY = np.linalg.cholesky(DRIVER_CORRELATION)
+
+PERCENTILES = (5, 10, 25, 50, 75, 90, 95)
+
+# Calculator input bounds (``validate_financial_inputs``); ADR has none
+# there, so it is held to the request's own limit.
+MAX_RATE = 0.30
+MAX_MONTHLY_RENT = 1_000_000
+MAX_ADR = 100_000
+MAX_ARV = 100_000_000
+MAX_REHAB = 10_000_000
+
+
+def draw_drivers(paths: int, seed: int) -> dict[str, np.ndarray]:
+    """Correlated standard-normal draws, one column per driver."""
+    rng = np.random.default_rng(seed)
+    z = rng.standard_normal((paths, len(DRIVERS))) @ _CHOLESKY.T
+    return {name: z[:, i] for i, name in enumerate(DRIVERS)}
+
+
+def _distribution(values: np.ndarray) -> RiskDistribution:
+    points = np.nanpercentile(values, PERCENTILES)
+    return RiskDistribution(
+        mean=float(np.nanmean(values)),
+        std=float(np.nanstd(values)),
+        percentiles={f"p{p}": float(v) for p, v in zip(PERCENTILES, points, strict=True)},
+    )
+
+
+def _risk(metric: str, values: np.ndarray, irr: np.ndarray | None = None) -> StrategyRiskResult:
+    p5 = float(np.percentile(values, 5))
+    tail = values[values <= p5]
+    irr_defined = irr[np.isfinite(irr)] if irr is not None else None
+    return StrategyRiskResult(
+        metric=metric,
+        distribution=_distribution(values),
+        probability_negative=float(np.mean(values < 0)),
+        value_at_risk_95=max(0.0, -p5),
+        expected_shortfall_95=max(0.0, -float(tail.mean())),
+        irr=_distribution(irr_defined) if irr_defined is not None and irr_defined.size else None,
+    )
+
+
+def irr_bisection(cash_flows: np.ndarray, lo: float = -0.99, hi: float = 10.0, iterations: int = 60) -> np.ndarray:
+    """Per-row IRR of ``cash_flows`` (rows x periods, period 0 first) by bisection.
+
+    NaN where NPV does not change sign on ``[lo, hi]`` (e.g. no cash invested).
+    """
+    periods = np.arange(cash_flows.shape[1])
+
+    def npv(rate: np.ndarray) -> np.ndarray:
+        return (cash_flows / (1 + rate[:, np.newaxis]) ** periods).sum(axis=1)
+
+    low = np.full(cash_flows.shape[0], lo)
+    high = np.full(cash_flows.shape[0], hi)
+    npv_low = npv(low)
+    bracketed = np.sign(npv_low) != np.sign(npv(high))
+    for _ in range(iterations):
+        mid = (low + high) / 2
+        npv_mid = npv(mid)
+        same_side = np.sign(npv_mid) == np.sign(npv_low)
+        low = np.where(same_side, mid, low)
+        npv_low = np.where(same_side, npv_mid, npv_low)
+        high = np.where(same_side, high, mid)
+    return np.where(bracketed, (low + high) / 2, np.nan)
+
+
+def simulate_deal_risk(input_data: RiskSimulationInput, assumptions: AllAssumptions) -> RiskSimulationResponse:
+    """Run ``input_data.paths`` correlated scenarios through the LTR/STR/flip calculators."""
+    a = assumptions
+    if input_data.insurance is not None:
+        a.operating.insurance_annual = input_data.insurance
+    seed = input_data.seed if input_data.seed is not None else secrets.randbelow(2**32)
+    z = draw_drivers(input_data.paths, seed)
+    spreads = input_data.spreads
+
+    price = input_data.purchase_price
+    taxes, hoa = input_data.property_taxes, input_data.hoa_fees_monthly
+    rent_factor = np.exp(spreads.rent * z["rent"])
+    rate_shock = spreads.interest_rate * z["interest_rate"]
+    appreciation = a.appreciation_rate + spreads.appreciation * z["appreciation"]
+    results: dict[str, StrategyRiskResult] = {}
+
+    if "ltr" in input_data.strategies:
+        rent = np.minimum(input_data.monthly_rent * rent_factor, MAX_MONTHLY_RENT)
+        params = build_ltr_params(a, price, rent, taxes, hoa)
+        ltr = calculate_ltr_batch(
+            **{
+                **params,
+                "vacancy_rate": np.clip(a.operating.vacancy_rate + spreads.vacancy * z["vacancy"], 0.0, 1.0),
+                "interest_rate": np.clip(a.financing.interest_rate + rate_shock, 0.0, MAX_RATE),
+                "appreciation_rate": appreciation,
+            }
+        )
+        # Invest the cash to close, collect each year's cash flow, sell at the horizon.
+        years = input_data.horizon_years
+        projection = ltr["ten_year_projection"]
+        flows = np.zeros((input_data.paths, years + 1))
+        flows[:, 0] = -ltr["total_cash_required"]
+        flows[:, 1:] = projection["cash_flow"][:, :years]
+        flows[:, years] += (
+            projection["equity"][:, years - 1] - projection["property_value"][:, years - 1] * a.flip.selling_costs_pct
+        )
+        results["ltr"] = _risk("annual_cash_flow", ltr["annual_cash_flow"], irr_bisection(flows))
+
+    if "str" in input_data.strategies and input_data.average_daily_rate:
+        occupancy = input_data.occupancy_rate or 0.75
+        params = build_str_params(
+            a,
+            price,
+            np.minimum(input_data.average_daily_rate * rent_factor, MAX_ADR),
+            np.clip(occupancy + spreads.str_occupancy * z["str_occupancy"], 0.01, 1.0),
+            taxes,
+            hoa,
+        )
+        str_ = calculate_str_batch(
+            **{**params, "interest_rate": np.clip(a.financing.interest_rate + rate_shock, 0.0, MAX_RATE)}
+        )
+        results["str"] = _risk("annual_cash_flow", str_["annual_cash_flow"])
+
+    if "flip" in input_data.strategies:
+        arv = min(input_data.arv or price * 1.06, MAX_ARV)
+        params = build_flip_params(a, price, arv, taxes)
+        if input_data.rehab_cost is not None:
+            params["renovation_budget"] = input_data.rehab_cost
+        held_years = params["holding_period_months"] / 12
+        flip = calculate_flip_batch(
+            **{
+                **params,
+                "arv": np.clip(arv * (1 + spreads.appreciation * z["appreciation"] * held_years), 1.0, MAX_ARV),
+                "renovation_budget": np.minimum(
+                    params["renovation_budget"] * np.exp(spreads.rehab_overrun * z["rehab_overrun"]), MAX_REHAB
+                ),
+                "hard_money_rate": np.clip(params["hard_money_rate"] + rate_shock, 0.0, MAX_RATE),
+            },
+            hoa_monthly=hoa,
+        )
+        results["flip"] = _risk("net_profit", flip["net_profit_before_tax"])
+
+    return RiskSimulationResponse(
+        paths=input_data.paths, seed=seed, horizon_years=input_data.horizon_years, strategies=results
+    )
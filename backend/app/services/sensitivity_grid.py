@@ -0,0 +1,178 @@
+"""
+Vectorized sensitivity grids for ``POST /api/v1/sensitivity/analyze``.
+
+Sweeps one to three variables together (e.g. purchase price × interest
+rate × rent) and evaluates LTR, STR and flip over every combination in one
+pass of the batch calculators. The whole grid is built from a single
+property snapshot and one assumption set: each axis becomes a column of
+calculator inputs, so no cell copies the assumptions or touches a cache.
+
+Baselines follow ``property_service.calculate_analytics`` (Zestimate, then
+AVM, for price; RentCast rent; Mashvisor-derived ADR when AXESSO has none)
+and calculator parameters come from the ``assumption_resolver`` builders.
+Values that scale with price there (insurance from ``insurance_pct``, STR
+maintenance, a flip ARV and rehab budget derived from price) scale with the
+price axis here too, and the Mashvisor monthly STR revenue scales with
+the ADR and occupancy axes.
+"""
+
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+from app.schemas.property import AllAssumptions, PropertyResponse, StrategyType
+from app.services.assumption_resolver import build_flip_params, build_ltr_params, build_str_params
+from app.services.calculators import calculate_flip_batch, calculate_ltr_batch, calculate_str_batch
+
+GRID_VARIABLES = (
+    "purchase_price",
+    "interest_rate",
+    "down_payment_pct",
+    "monthly_rent",
+    "occupancy_rate",
+    "average_daily_rate",
+)
+
+# Response metric name -> calculator result key, per strategy.
+GRID_METRICS: dict[StrategyType, dict[str, str]] = {
+    StrategyType.LONG_TERM_RENTAL: {"ltr_cash_flow": "annual_cash_flow", "ltr_coc": "cash_on_cash_return"},
+    StrategyType.SHORT_TERM_RENTAL: {"str_cash_flow": "annual_cash_flow", "str_coc": "cash_on_cash_return"},
+    StrategyType.FIX_AND_FLIP: {"flip_profit": "net_profit_before_tax", "flip_roi": "roi"},
+}
+
+MAX_GRID_AXES = 3
+
+
+@dataclass(frozen=True)
+class GridAxis:
+    """One swept variable: its baseline and the values at each ``range_pct`` step."""
+
+    variable: str
+    baseline_value: float
+    range_pct: list[float]
+    values: np.ndarray
+
+
+@dataclass(frozen=True)
+class SensitivityGrid:
+    """Dense metric cubes, indexed ``[i, j, k]`` by the axes in request order."""
+
+    axes: list[GridAxis]
+    metrics: dict[str, np.ndarray]
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        return tuple(len(axis.values) for axis in self.axes)
+
+
+def property_baselines(property_data: PropertyResponse, assumptions: AllAssumptions) -> dict[str, Any]:
+    """Baseline inputs for the grid, extracted as ``calculate_analytics`` does."""
+    valuations, rentals, market = property_data.valuations, property_data.rentals, property_data.market
+    str_stats = rentals.str_market_stats
+    mashvisor_monthly = str_stats.monthly_revenue_per_bed if str_stats else None
+    adr = rentals.average_daily_rate or (
+        mashvisor_monthly / 30 / (rentals.occupancy_rate or 0.65) if mashvisor_monthly else None
+    )
+    occupancy = rentals.occupancy_rate or 0.75
+    if occupancy > 1:
+        occupancy = occupancy / 100
+    return {
+        "purchase_price": assumptions.financing.purchase_price
+        or valuations.zestimate
+        or valuations.current_value_avm
+        or 0,
+        "interest_rate": assumptions.financing.interest_rate,
+        "down_payment_pct": assumptions.financing.down_payment_pct,
+        "monthly_rent": rentals.monthly_rent_ltr or 0,
+        "occupancy_rate": occupancy,
+        "average_daily_rate": adr,
+        "property_taxes_annual": market.property_taxes_annual or 0,
+        "hoa_monthly": market.hoa_fees_monthly or 0,
+        "arv_flip": valuations.arv_flip,
+        "str_monthly_revenue": mashvisor_monthly,
+    }
+
+
+def compute_sensitivity_grid(
+    property_data: PropertyResponse,
+    assumptions: AllAssumptions,
+    axes: list[tuple[str, list[float]]],
+    strategies: list[StrategyType] | None = None,
+) -> SensitivityGrid:
+    """Evaluate LTR/STR/flip metrics over the cartesian product of ``axes``.
+
+    Each axis is ``(variable, range_pct)``; a step ``p`` sets the variable to
+    ``baseline * (1 + p)``. STR is skipped when the property has no ADR.
+
+    Raises ``ValueError`` for an unknown, repeated or zero-baseline variable,
+    and ``CalculationInputError`` when a cell's inputs are out of bounds.
+    """
+    if not 1 <= len(axes) <= MAX_GRID_AXES:
+        raise ValueError(f"A sensitivity grid takes 1 to {MAX_GRID_AXES} variables")
+    base = property_baselines(property_data, assumptions)
+
+    grid_axes: list[GridAxis] = []
+    for variable, range_pct in axes:
+        if variable not in GRID_VARIABLES:
+            raise ValueError(f"Unknown variable: {variable}")
+        if any(axis.variable == variable for axis in grid_axes):
+            raise ValueError(f"Variable {variable} appears more than once")
+        baseline = base[variable]
+        if not baseline:
+            raise ValueError(f"No baseline {variable} for this property to vary")
+        values = baseline * (1 + np.asarray(range_pct, dtype=np.float64))
+        grid_axes.append(GridAxis(variable, baseline, list(range_pct), values))
+
+    # Every cell as one row: swept variables become columns, the rest stay scalars.
+    inputs = {k: v for k, v in base.items() if k in GRID_VARIABLES}
+    mesh = np.meshgrid(*(axis.values for axis in grid_axes), indexing="ij")
+    for axis, column in zip(grid_axes, mesh, strict=True):
+        inputs[axis.variable] = column.ravel()
+    shape = mesh[0].shape
+
+    price = inputs["purchase_price"]
+    taxes, hoa = base["property_taxes_annual"], base["hoa_monthly"]
+    financing = {"interest_rate": inputs["interest_rate"], "down_payment_pct": inputs["down_payment_pct"]}
+    selected = set(strategies or GRID_METRICS)
+    results: dict[StrategyType, dict[str, Any]] = {}
+
+    if StrategyType.LONG_TERM_RENTAL in selected:
+        params = build_ltr_params(assumptions, price, inputs["monthly_rent"], taxes, hoa)
+        results[StrategyType.LONG_TERM_RENTAL] = calculate_ltr_batch(**{**params, **financing})
+
+    if StrategyType.SHORT_TERM_RENTAL in selected and base["average_daily_rate"]:
+        params = build_str_params(
+            assumptions, price, inputs["average_daily_rate"], inputs["occupancy_rate"], taxes, hoa
+        )
+        # The Mashvisor monthly figure replaces ADR x occupancy revenue, so it
+        # scales with the ADR and occupancy axes rather than pinning them.
+        revenue_override = base["str_monthly_revenue"]
+        if revenue_override:
+            revenue_override = (
+                revenue_override
+                * (inputs["average_daily_rate"] / base["average_daily_rate"])
+                * (inputs["occupancy_rate"] / base["occupancy_rate"])
+            )
+        results[StrategyType.SHORT_TERM_RENTAL] = calculate_str_batch(
+            **{**params, **financing}, monthly_revenue_override=revenue_override
+        )
+
+    if StrategyType.FIX_AND_FLIP in selected:
+        arv_flip = base["arv_flip"] or price * 1.06
+        params = build_flip_params(assumptions, price, arv_flip, taxes)
+        results[StrategyType.FIX_AND_FLIP] = calculate_flip_batch(**params, hoa_monthly=hoa)
+
+    metrics = {
+        name: np.asarray(result[key], dtype=np.float64).reshape(shape)
+        for strategy, result in results.items()
+        for name, key in GRID_METRICS[strategy].items()
+    }
+    return SensitivityGrid(axes=grid_axes, metrics=metrics)
+
+
+def grid_to_lists(values: np.ndarray) -> Any:
+    """Nested lists for JSON, with non-finite cells as ``None``."""
+    cells = values.astype(object)
+    cells[~np.isfinite(values)] = None
+    return cells.tolist()
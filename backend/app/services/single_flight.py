@@ -0,0 +1,162 @@
+"""
+Single-flight request coalescing.
+
+When several callers ask for the same expensive result at once (e.g. a burst
+of ``POST /properties/search`` for one uncached address), only one of them
+should do the work; the rest wait for and share its result.
+
+Two layers:
+
+- In-process: concurrent callers of ``SingleFlight.do`` with the same key
+  await one shared task.
+- Cross-worker: ``SingleFlight.do_exclusive`` takes a short Redis lock
+  (``CacheService.acquire_lock``). Workers that lose the race poll the cache
+  for the winner's result instead of repeating the work, and fall back to
+  doing it themselves if the winner fails or takes too long (never past the
+  caller's request deadline).
+
+Background work (stale-while-revalidate refreshes) uses ``spawn`` plus
+``try_exclusive``: at most one refresh per key runs in a process, and a
+worker skips the refresh entirely when another one already holds the lock.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
+
+from app.services import deadline
+from app.services.cache_service import CacheService
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Coalesce concurrent calls for the same key into one execution."""
+
+    def __init__(
+        self,
+        cache: CacheService | None = None,
+        *,
+        lock_ttl_seconds: int = 60,
+        wait_timeout_seconds: float = 30.0,
+        poll_interval_seconds: float = 0.25,
+    ):
+        self._cache = cache
+        self.lock_ttl_seconds = lock_ttl_seconds
+        self.wait_timeout_seconds = wait_timeout_seconds
+        self.poll_interval_seconds = poll_interval_seconds
+        self._inflight: dict[str, asyncio.Future[Any]] = {}
+
+    def in_flight(self, key: str) -> bool:
+        """True while a call for ``key`` is running in this process."""
+        return key in self._inflight
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """Run ``fn`` once per key; concurrent callers share its result.
+
+        The shared task is shielded, so a caller that is cancelled (e.g. the
+        client disconnected) does not cancel the work other callers await.
+        """
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(fn())
+            self._inflight[key] = future
+            future.add_done_callback(lambda f: self._forget(key, f))
+        else:
+            logger.info("single_flight key=%s joined in-flight call", key)
+        return await asyncio.shield(future)
+
+    def spawn(self, key: str, fn: Callable[[], Awaitable[Any]]) -> bool:
+        """Start ``fn`` in the background unless a call for ``key`` is running.
+
+        Returns True when a new task was started. Failures are swallowed, so
+        ``fn`` should log its own errors.
+        """
+        if key in self._inflight:
+            return False
+        future = asyncio.ensure_future(fn())
+        self._inflight[key] = future
+        future.add_done_callback(lambda f: self._forget(key, f))
+        return True
+
+    async def try_exclusive(self, key: str, fn: Callable[[], Awaitable[T]]) -> T | None:
+        """Run ``fn`` under the cross-worker lock on ``key``, or skip it.
+
+        Returns ``None`` without running ``fn`` when another worker holds the
+        lock (it is already doing the same work).
+        """
+        if self._cache is None:
+            return await fn()
+        lock_key = f"lock:{key}"
+        token = await self._cache.acquire_lock(lock_key, self.lock_ttl_seconds)
+        if token is None:
+            logger.info("single_flight key=%s held by another worker — skipping", key)
+            return None
+        try:
+            return await fn()
+        finally:
+            await self._cache.release_lock(lock_key, token)
+
+    async def do_exclusive(
+        self,
+        key: str,
+        fn: Callable[[], Awaitable[T]],
+        poll: Callable[[], Awaitable[T | None]],
+        on_deadline: Callable[[], Awaitable[T]] | None = None,
+    ) -> T:
+        """Run ``fn`` under a cross-worker lock on ``key``.
+
+        If another worker holds the lock, poll for its result with ``poll``
+        (typically a cache read) until it appears, the lock is released, or
+        ``wait_timeout_seconds`` or the request deadline elapses — then run
+        ``fn`` ourselves. When the deadline passes while the holder is still
+        working, ``on_deadline`` (if given) answers instead of ``fn``, so the
+        holder's work is not repeated.
+        """
+        if self._cache is None:
+            return await fn()
+
+        lock_key = f"lock:{key}"
+        token = await self._cache.acquire_lock(lock_key, self.lock_ttl_seconds)
+        if token is not None:
+            try:
+                return await fn()
+            finally:
+                await self._cache.release_lock(lock_key, token)
+
+        logger.info("single_flight key=%s held by another worker — waiting for its result", key)
+        wait_seconds = self.wait_timeout_seconds
+        time_left = deadline.remaining()
+        if time_left is not None:
+            wait_seconds = min(wait_seconds, max(time_left, 0.0))
+        give_up_at = time.monotonic() + wait_seconds
+        lock_held = True
+        while (left := give_up_at - time.monotonic()) > 0:
+            await asyncio.sleep(min(self.poll_interval_seconds, left))
+            # Check the lock before reading so a result written just before
+            # the holder released it is still picked up.
+            lock_held = await self._cache.exists(lock_key)
+            result = await poll()
+            if result is not None:
+                return result
+            if not lock_held:
+                break
+        if on_deadline is not None and lock_held and deadline.expired():
+            logger.info("single_flight key=%s deadline passed while the peer is still working", key)
+            return await on_deadline()
+        logger.info("single_flight key=%s peer produced no result — fetching locally", key)
+        return await fn()
+
+    def _forget(self, key: str, future: asyncio.Future[Any]) -> None:
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+        # Mark the exception retrieved so a failure nobody awaited (every
+        # waiter cancelled) doesn't log "exception was never retrieved".
+        if not future.cancelled():
+            future.exception()
@@ -13,19 +13,34 @@ Uses BaseAPIClient for shared request logic including:
 - Retry with exponential backoff
 - Rate limit handling
 - Circuit breaker pattern
+
+With a secondary key configured, interactive requests can be hedged: when the
+primary key has not answered by its observed p90 latency, the same request is
+sent on the secondary key and whichever succeeds first wins (see
+``RequestHedger``).
 """
 
 import asyncio
 import logging
+import statistics
+import time
+from collections import deque
+from contextvars import ContextVar
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from enum import StrEnum
 from typing import Any
 
 from app.services.base_client import BaseAPIClient
+from app.services.concurrency_limiter import Priority, current_priority
 
 logger = logging.getLogger(__name__)
 
+# Key used by requests in the current context. Hedged and fallback requests
+# set it per task rather than swapping ``ZillowClient.api_key``, which every
+# concurrent caller shares.
+_api_key_override: ContextVar[str | None] = ContextVar("axesso_api_key_override", default=None)
+
 
 class ZillowEndpoint(StrEnum):
     """Available AXESSO Zillow API endpoints."""
@@ -61,6 +76,68 @@ class ZillowAPIResponse:
     zpid: str | None = None
 
 
+class RequestHedger:
+    """Hedge timing, budget and win-rate stats for one client.
+
+    The hedge delay is the p90 of recent primary-key latencies, so about one
+    request in ten is slow enough to be hedged. Each request earns
+    ``budget_ratio`` of a hedge token (up to ``max_tokens``) and each hedge
+    spends one, so hedges can never add more than ``budget_ratio`` extra
+    provider calls however slow the primary gets.
+    """
+
+    def __init__(
+        self,
+        *,
+        budget_ratio: float = 0.1,
+        max_tokens: float = 10.0,
+        min_samples: int = 20,
+        window: int = 200,
+    ):
+        self.budget_ratio = budget_ratio
+        self.max_tokens = max_tokens
+        self.min_samples = min_samples
+        self._latencies: deque[float] = deque(maxlen=window)
+        self._tokens = 0.0
+        self.requests = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+        self.over_budget = 0
+
+    def record_latency(self, seconds: float) -> None:
+        self._latencies.append(seconds)
+
+    def delay(self) -> float | None:
+        """Seconds to wait on the primary before hedging, or ``None`` until enough samples."""
+        if len(self._latencies) < self.min_samples:
+            return None
+        return statistics.quantiles(self._latencies, n=10)[-1]
+
+    def on_request(self) -> None:
+        self.requests += 1
+        self._tokens = min(self._tokens + self.budget_ratio, self.max_tokens)
+
+    def try_spend(self) -> bool:
+        """Take one hedge token; ``False`` (and counted) when the budget is spent."""
+        if self._tokens < 1:
+            self.over_budget += 1
+            return False
+        self._tokens -= 1
+        self.hedged += 1
+        return True
+
+    def snapshot(self) -> dict[str, Any]:
+        delay = self.delay()
+        return {
+            "requests": self.requests,
+            "hedged": self.hedged,
+            "hedge_wins": self.hedge_wins,
+            "win_rate": round(self.hedge_wins / self.hedged, 3) if self.hedged else None,
+            "over_budget": self.over_budget,
+            "delay_ms": round(delay * 1000, 1) if delay is not None else None,
+        }
+
+
 class ZillowClient(BaseAPIClient["ZillowAPIResponse"]):
     """
     Comprehensive Zillow data client via AXESSO API.
@@ -88,6 +165,7 @@ class ZillowClient(BaseAPIClient["ZillowAPIResponse"]):
         api_key: str,
         base_url: str = "https://api.axesso.de/zil",
         fallback_api_key: str | None = None,
+        hedge_requests: bool = False,
     ):
         super().__init__(
             api_key=api_key,
@@ -96,8 +174,13 @@ class ZillowClient(BaseAPIClient["ZillowAPIResponse"]):
             connect_timeout=5.0,
             max_retries=3,
             enable_circuit_breaker=True,
+            # Map search fans out dozens of concurrent AXESSO calls per request.
+            max_connections=50,
+            max_keepalive_connections=20,
+            http2=True,
         )
         self.fallback_api_key = (fallback_api_key or "").strip() or None
+        self.hedger = RequestHedger() if hedge_requests and self.fallback_api_key else None
 
     def _get_headers(self) -> dict[str, str]:
         """Get authenticated headers for AXESSO API.
@@ -106,9 +189,10 @@ class ZillowClient(BaseAPIClient["ZillowAPIResponse"]):
         (Azure API Management standard) so requests succeed regardless of which
         header the gateway is currently configured to read.
         """
+        api_key = _api_key_override.get() or self.api_key
         return {
-            "axesso-api-key": self.api_key,
-            "Ocp-Apim-Subscription-Key": self.api_key,
+            "axesso-api-key": api_key,
+            "Ocp-Apim-Subscription-Key": api_key,
             "Accept": "application/json",
             "Content-Type": "application/json",
         }
@@ -143,6 +227,10 @@ class ZillowClient(BaseAPIClient["ZillowAPIResponse"]):
         """Return provider name for logging."""
         return "AXESSO/Zillow"
 
+    def _get_limiter_name(self) -> str:
+        """Share one concurrency window with ``AXESSOClient`` (same upstream)."""
+        return "AXESSO"
+
     async def _make_request(
         self,
         endpoint: str,
@@ -151,37 +239,95 @@ class ZillowClient(BaseAPIClient["ZillowAPIResponse"]):
         json_data: dict[str, Any] | None = None,
         **response_kwargs,
     ) -> ZillowAPIResponse:
-        """Make request; on 502/503/401/403 retry once with secondary key if configured."""
-        result = await super()._make_request(
-            endpoint=endpoint,
-            params=params,
-            method=method,
-            json_data=json_data,
-            **response_kwargs,
-        )
-        if result.success or not self.fallback_api_key or result.status_code not in (502, 503, 401, 403):
+        """Make request (hedged on the secondary key when enabled); on
+        502/503/401/403 retry once with secondary key if configured."""
+        request = {"endpoint": endpoint, "params": params, "method": method, "json_data": json_data, **response_kwargs}
+        result, tried_secondary = await self._primary_or_hedged(request)
+        if (
+            result.success
+            or tried_secondary
+            or not self.fallback_api_key
+            or result.status_code not in (502, 503, 401, 403)
+        ):
             return result
         logger.info(
             "ext_api provider=AXESSO endpoint=%s status=%s retrying with secondary key",
             endpoint,
             result.status_code,
         )
-        old_key = self.api_key
-        self.api_key = self.fallback_api_key
+        result2 = await self._request_with_key(self.fallback_api_key, request)
+        return result2 if result2.success else result
+
+    async def _request_with_key(self, api_key: str | None, request: dict[str, Any]) -> ZillowAPIResponse:
+        """Run one request with ``api_key`` (``None`` = primary) in its headers."""
+        token = _api_key_override.set(api_key)
         try:
-            result2 = await super()._make_request(
-                endpoint=endpoint,
-                params=params,
-                method=method,
-                json_data=json_data,
-                **response_kwargs,
-            )
-            if result2.success:
-                return result2
+            return await super()._make_request(**request)
         finally:
-            self.api_key = old_key
+            _api_key_override.reset(token)
+
+    async def _timed_primary(self, request: dict[str, Any]) -> ZillowAPIResponse:
+        """Primary-key request that feeds the hedger's latency window."""
+        t0 = time.monotonic()
+        try:
+            result = await self._request_with_key(None, request)
+        except asyncio.CancelledError:
+            # Lost to the hedge: it took at least this long.
+            self.hedger.record_latency(time.monotonic() - t0)
+            raise
+        if result.success:
+            self.hedger.record_latency(time.monotonic() - t0)
         return result
 
+    async def _primary_or_hedged(self, request: dict[str, Any]) -> tuple[ZillowAPIResponse, bool]:
+        """Send on the primary key, hedging on the secondary once it is slower than p90.
+
+        Only interactive requests are hedged; bulk and background work is not
+        worth a second provider call. Returns the result and whether the
+        secondary key has already been tried.
+        """
+        if self.hedger is None or current_priority() is not Priority.INTERACTIVE:
+            return await self._request_with_key(None, request), False
+        self.hedger.on_request()
+        delay = self.hedger.delay()
+        primary = asyncio.create_task(self._timed_primary(request))
+        pending: set[asyncio.Task[ZillowAPIResponse]] = {primary}
+        try:
+            if delay is None:
+                return await primary, False
+            done, _ = await asyncio.wait(pending, timeout=delay)
+            if done or not self.hedger.try_spend():
+                return await primary, False
+
+            logger.info(
+                "ext_api provider=AXESSO endpoint=%s hedging on secondary key after %.0fms",
+                request["endpoint"],
+                delay * 1000,
+            )
+            hedge = asyncio.create_task(self._request_with_key(self.fallback_api_key, request))
+            pending.add(hedge)
+            failed: ZillowAPIResponse | None = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    result = task.result()
+                    if result.success:
+                        if task is hedge:
+                            self.hedger.hedge_wins += 1
+                        return result, True
+                    if failed is None or task is primary:
+                        failed = result
+            return failed, True
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def get_health_status(self) -> dict[str, Any]:
+        status = super().get_health_status()
+        if self.hedger is not None:
+            status["hedging"] = self.hedger.snapshot()
+        return status
+
     async def _make_zillow_request(
         self, endpoint: ZillowEndpoint, params: dict[str, Any] | None = None
     ) -> ZillowAPIResponse:
@@ -934,8 +1080,10 @@ def create_zillow_client(
     api_key: str,
     base_url: str | None = None,
     fallback_api_key: str | None = None,
+    hedge_requests: bool = False,
 ) -> ZillowClient:
-    """Create configured Zillow client. Optional fallback key is tried on 502/503/401/403."""
+    """Create configured Zillow client. Optional fallback key is tried on 502/503/401/403,
+    and with ``hedge_requests`` also races slow interactive requests."""
     if base_url:
-        return ZillowClient(api_key, base_url, fallback_api_key=fallback_api_key)
-    return ZillowClient(api_key, fallback_api_key=fallback_api_key)
+        return ZillowClient(api_key, base_url, fallback_api_key=fallback_api_key, hedge_requests=hedge_requests)
+    return ZillowClient(api_key, fallback_api_key=fallback_api_key, hedge_requests=hedge_requests)
@@ -52,6 +52,9 @@ async def startup(ctx: dict) -> None:
 async def shutdown(ctx: dict) -> None:
     """Worker shutdown hook."""
     logger.info("Arq worker shutting down...")
+    from app.services.base_client import close_api_clients
+
+    await close_api_clients()
 
 
 # ------------------------------------------------------------------
@@ -19,6 +19,7 @@ from datetime import UTC, datetime
 from typing import Any
 
 from app.services.cache_service import get_cache_service
+from app.services.provider_metrics import call_origin
 
 logger = logging.getLogger(__name__)
 
@@ -66,11 +67,15 @@ async def record_heartbeat(job_id: str, *, error: str | None = None) -> None:
 
 
 def with_heartbeat(job_id: str, fn: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
-    """Wrap a job coroutine so every run records a heartbeat (success or error)."""
+    """Wrap a job coroutine so every run records a heartbeat (success or error).
+
+    Provider calls the job makes are labelled ``job:<job_id>`` in provider metrics.
+    """
 
     async def _wrapped(*args: Any, **kwargs: Any) -> Any:
         try:
-            result = await fn(*args, **kwargs)
+            with call_origin(f"job:{job_id}"):
+                result = await fn(*args, **kwargs)
         except Exception as exc:
             try:
                 await record_heartbeat(job_id, error=f"{type(exc).__name__}: {exc}")
@@ -110,13 +115,14 @@ async def evaluate_job_health(now: datetime | None = None) -> dict[str, Any]:
     cache = get_cache_service()
     now = now or datetime.now(UTC)
 
-    scheduler_hb = await cache.get(_key(SCHEDULER_HEARTBEAT_ID)) or {}
+    heartbeats = await cache.get_many(_key(job_id) for job_id in (SCHEDULER_HEARTBEAT_ID, *EXPECTED_JOBS))
+    scheduler_hb = heartbeats.get(_key(SCHEDULER_HEARTBEAT_ID)) or {}
     scheduler_started = _parse_ts(scheduler_hb.get("last_success"))
 
     jobs: dict[str, Any] = {}
     degraded = False
     for job_id, max_stale in EXPECTED_JOBS.items():
-        payload = await cache.get(_key(job_id)) or {}
+        payload = heartbeats.get(_key(job_id)) or {}
         last_success = _parse_ts(payload.get("last_success"))
 
         if last_success is not None:
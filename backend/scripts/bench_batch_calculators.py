@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark: underwriting throughput of the strategy calculators.
+
+Draws N property/assumption combinations per strategy and reports rows per
+second for:
+  - scalar   ``calculate_<strategy>`` called once per row (sampled)
+  - batch    ``calculate_<strategy>_batch`` over all N rows at once
+
+Usage:
+  cd backend && python scripts/bench_batch_calculators.py [rows]
+"""
+
+import os
+import sys
+import time
+from collections.abc import Callable
+from typing import Any
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.services.calculators import (
+    calculate_brrrr,
+    calculate_brrrr_batch,
+    calculate_flip,
+    calculate_flip_batch,
+    calculate_house_hack,
+    calculate_house_hack_batch,
+    calculate_ltr,
+    calculate_ltr_batch,
+    calculate_str,
+    calculate_str_batch,
+    calculate_wholesale,
+    calculate_wholesale_batch,
+)
+
+SCALAR_SAMPLE = 2000
+
+
+def _inputs(rows: int, rng: np.random.Generator) -> dict[str, dict[str, Any]]:
+    price = rng.uniform(100_000, 1_500_000, rows)
+    rate = rng.uniform(0.03, 0.09, rows)
+    rent = price * rng.uniform(0.005, 0.012, rows)
+    return {
+        "ltr": dict(
+            purchase_price=price,
+            monthly_rent=rent,
+            property_taxes_annual=price * 0.012,
+            down_payment_pct=rng.uniform(0.05, 0.3, rows),
+            interest_rate=rate,
+            loan_term_years=30,
+            closing_costs_pct=0.03,
+            vacancy_rate=0.05,
+            property_management_pct=0.08,
+            maintenance_pct=0.05,
+            insurance_annual=price * 0.01,
+            utilities_monthly=100.0,
+            landscaping_annual=600.0,
+            pest_control_annual=200.0,
+            appreciation_rate=0.04,
+            rent_growth_rate=0.03,
+            expense_growth_rate=0.025,
+        ),
+        "str": dict(
+            purchase_price=price,
+            average_daily_rate=rng.uniform(80, 600, rows),
+            occupancy_rate=rng.uniform(0.4, 0.85, rows),
+            property_taxes_annual=price * 0.012,
+            down_payment_pct=0.2,
+            interest_rate=rate,
+            loan_term_years=30,
+            closing_costs_pct=0.03,
+            furniture_setup_cost=6000.0,
+            platform_fees_pct=0.15,
+            str_management_pct=0.1,
+            cleaning_cost_per_turnover=150.0,
+            cleaning_fee_revenue=75.0,
+            avg_length_of_stay_days=4,
+            supplies_monthly=100.0,
+            additional_utilities_monthly=125.0,
+            insurance_annual=price * 0.01,
+            maintenance_annual=2400.0,
+            landscaping_annual=600.0,
+            pest_control_annual=200.0,
+        ),
+        "brrrr": dict(
+            market_value=price,
+            arv=price * rng.uniform(1.1, 1.5, rows),
+            monthly_rent_post_rehab=rent,
+            property_taxes_annual=price * 0.012,
+            purchase_discount_pct=0.15,
+            down_payment_pct=0.2,
+            interest_rate=rate,
+            loan_term_years=30,
+            closing_costs_pct=0.03,
+            renovation_budget=price * 0.15,
+            contingency_pct=0.1,
+            holding_period_months=4,
+            monthly_holding_costs=1500.0,
+            refinance_ltv=0.75,
+            refinance_interest_rate=rate,
+            refinance_term_years=30,
+            refinance_closing_costs=3500.0,
+            vacancy_rate=0.05,
+            operating_expense_pct=0.1,
+            insurance_annual=price * 0.01,
+        ),
+        "flip": dict(
+            market_value=price,
+            arv=price * rng.uniform(1.1, 1.5, rows),
+            purchase_discount_pct=0.2,
+            hard_money_ltv=0.9,
+            hard_money_rate=0.12,
+            closing_costs_pct=0.03,
+            renovation_budget=price * 0.15,
+            contingency_pct=0.1,
+            holding_period_months=rng.uniform(3, 9, rows),
+            property_taxes_annual=price * 0.012,
+            insurance_annual=price * 0.01,
+            utilities_monthly=200.0,
+            selling_costs_pct=0.08,
+            capital_gains_rate=0.15,
+        ),
+        "house_hack": dict(
+            purchase_price=price,
+            monthly_rent_per_room=rng.uniform(500, 1400, rows),
+            rooms_rented=2,
+            property_taxes_annual=price * 0.012,
+            down_payment_pct=0.035,
+            interest_rate=rate,
+            loan_term_years=30,
+            closing_costs_pct=0.03,
+            fha_mip_rate=0.0055,
+            insurance_annual=price * 0.01,
+        ),
+        "wholesale": dict(
+            arv=price,
+            estimated_rehab_costs=price * 0.15,
+            assignment_fee=rng.uniform(5_000, 30_000, rows),
+            marketing_costs=1500.0,
+            earnest_money_deposit=1000.0,
+            arv_discount_pct=0.3,
+            days_to_close=45,
+        ),
+    }
+
+
+def _row(columns: dict[str, Any], i: int) -> dict[str, Any]:
+    return {k: (float(v[i]) if isinstance(v, np.ndarray) else v) for k, v in columns.items()}
+
+
+def _rate(fn: Callable[[], Any], rows: int) -> float:
+    best = min(_timed(fn) for _ in range(3))
+    return rows / best
+
+
+def _timed(fn: Callable[[], Any]) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    inputs = _inputs(rows, np.random.default_rng(0))
+    kernels = {
+        "ltr": (calculate_ltr, calculate_ltr_batch),
+        "str": (calculate_str, calculate_str_batch),
+        "brrrr": (calculate_brrrr, calculate_brrrr_batch),
+        "flip": (calculate_flip, calculate_flip_batch),
+        "house_hack": (calculate_house_hack, calculate_house_hack_batch),
+        "wholesale": (calculate_wholesale, calculate_wholesale_batch),
+    }
+    sample = min(rows, SCALAR_SAMPLE)
+    print(f"{rows} combinations per strategy (scalar timed on {sample})")
+    print(f"  {'strategy':<12} {'scalar rows/s':>14} {'batch rows/s':>14} {'speedup':>8}")
+    for name, (scalar_fn, batch_fn) in kernels.items():
+        columns = inputs[name]
+        scalar_rows = [_row(columns, i) for i in range(sample)]
+        scalar = _rate(lambda fn=scalar_fn, rs=scalar_rows: [fn(**r) for r in rs], sample)
+        batch = _rate(lambda fn=batch_fn, cols=columns: fn(**cols), rows)
+        print(f"  {name:<12} {scalar:14,.0f} {batch:14,.0f} {batch / scalar:7.0f}x")
+
+
+if __name__ == "__main__":
+    main()
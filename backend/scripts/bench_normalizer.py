@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark: per-property CPU cost of ``DataNormalizer.normalize``.
+
+Runs the normalizer over recorded provider payloads -- the raw responses
+the search path keeps in the provider payload cache (``--address``, one or
+more already-searched addresses, read from ``REDIS_URL``) -- or, without
+them, over one production-shaped synthetic set (RentCast property record
+with market statistics, a full AXESSO property payload, Redfin and Realtor
+estimates). Reports:
+  - field mapping, path walking   FIELD_MAPPING resolved by splitting and
+                                  walking each dotted path per call (before)
+  - field mapping, compiled       the precompiled accessors (now)
+  - normalize                     the whole ``normalize`` call
+followed by the cost of each pass ``normalize`` runs after FIELD_MAPPING
+(each timed on a copy of the merged fields, copy included).
+
+Usage:
+  cd backend && python scripts/bench_normalizer.py [iterations] [--address ADDRESS ...]
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import timeit
+from datetime import UTC, datetime
+from typing import Any
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.services.api_clients import DataNormalizer
+from app.services.cache_service import CacheService
+from app.services.property_service import (
+    _PROVIDER_PAYLOAD_NAMES,
+    PropertyService,
+    _provider_payload_fields,
+)
+
+Inputs = dict[str, Any]
+
+
+def _rentcast() -> dict[str, Any]:
+    """RentCast /properties record merged with /avm value + rent and /markets stats."""
+    return {
+        "formattedAddress": "953 Banyan Dr, Delray Beach, FL 33483",
+        "propertyType": "Single Family",
+        "bedrooms": 3,
+        "bathrooms": 2,
+        "squareFootage": 1850,
+        "lotSize": 7405,
+        "yearBuilt": 1962,
+        "latitude": 26.4545,
+        "longitude": -80.0621,
+        "lastSalePrice": 415000,
+        "lastSaleDate": "2016-05-20T00:00:00.000Z",
+        "price": 612000,
+        "priceRangeLow": 560000,
+        "priceRangeHigh": 665000,
+        "rent": 3900,
+        "rentRangeLow": 3500,
+        "rentRangeHigh": 4300,
+        "propertyTaxes": {str(y): {"year": y, "total": 6100 + (y - 2010) * 95} for y in range(2010, 2025)},
+        "taxAssessments": {
+            str(y): {"year": y, "value": 300000 + (y - 2010) * 9000, "land": 150000, "improvements": 150000}
+            for y in range(2010, 2025)
+        },
+        "features": {
+            "architectureType": "Ranch",
+            "coolingType": "Central",
+            "exteriorType": "Stucco",
+            "fireplace": False,
+            "floorCount": 1,
+            "garage": True,
+            "garageSpaces": 2,
+            "heatingType": "Electric",
+            "pool": True,
+            "roofType": "Shingle",
+            "viewType": "Water",
+        },
+        "ownerOccupied": False,
+        "owner": {
+            "names": ["Jane Doe", "John Doe"],
+            "type": "Individual",
+            "mailingAddress": {"addressLine1": "12 Elm St", "city": "Albany", "state": "NY", "zipCode": "12207"},
+        },
+        "history": {f"20{y:02d}-05-20": {"event": "Sale", "price": 300000 + y * 5000} for y in range(5, 17)},
+        "market_statistics": {
+            "saleData": {
+                "medianDaysOnMarket": 41,
+                "averageDaysOnMarket": 52.5,
+                "minDaysOnMarket": 3,
+                "maxDaysOnMarket": 240,
+                "totalListings": 312,
+                "newListings": 44,
+                "medianPrice": 585000,
+                "averagePricePerSquareFoot": 341.7,
+                "history": {f"2024-{m:02d}": {"medianPrice": 570000 + m * 1000} for m in range(1, 13)},
+            },
+            "rentalData": {
+                "averageRent": 3650,
+                "medianRent": 3500,
+                "minRent": 1800,
+                "maxRent": 9000,
+                "averageRentPerSquareFoot": 2.1,
+                "medianDaysOnMarket": 28,
+                "totalListings": 180,
+                "newListings": 31,
+            },
+        },
+    }
+
+
+def _axesso() -> dict[str, Any]:
+    """AXESSO property-v2 payload: listing, resoFacts, price history, photos."""
+    return {
+        "zpid": 46491558,
+        "homeType": "SINGLE_FAMILY",
+        "homeStatus": "FOR_SALE",
+        "keystoneHomeStatus": "ForSale",
+        "price": 629000,
+        "bedrooms": 3,
+        "bathrooms": 2,
+        "livingArea": 1864,
+        "lotAreaValue": 0.17,
+        "yearBuilt": 1962,
+        "zestimate": 618400,
+        "zestimateLowPercent": "6",
+        "zestimateHighPercent": "7",
+        "rentZestimate": 3925,
+        "lastSoldPrice": 415000,
+        "taxAssessedValue": 426274,
+        "annualTaxAmount": 7431,
+        "monthlyHoaFee": None,
+        "daysOnZillow": 36,
+        "timeOnZillow": "36 days",
+        "brokerageName": "Lang Realty",
+        "latitude": 26.45449,
+        "longitude": -80.06213,
+        "stories": 1,
+        "hasPool": True,
+        "hasGarage": True,
+        "parkingSpaces": 2,
+        "pageViewCount": 1843,
+        "favoriteCount": 57,
+        "description": "Renovated ranch on an oversized lot east of Federal. " * 12,
+        "listingSubType": {"isFSBA": True, "isForeclosure": False, "isBankOwned": False},
+        "attributionInfo": {
+            "agentName": "Pat Agent",
+            "agentPhoneNumber": "561-555-0100",
+            "agentEmail": "pat@example.com",
+            "brokerName": "Lang Realty",
+            "brokerPhoneNumber": "561-555-0101",
+            "mlsId": "RX-10987654",
+        },
+        "mortgageZHLRates": {
+            "thirtyYearFixedBucket": {"rate": 6.71, "rateSource": "ZGMI"},
+            "fifteenYearFixedBucket": {"rate": 5.94, "rateSource": "ZGMI"},
+            "arm5Bucket": {"rate": 6.88, "rateSource": "ZGMI"},
+        },
+        "resoFacts": {
+            "heating": ["Central", "Electric"],
+            "cooling": ["Central Air", "Ceiling Fan(s)"],
+            "roofType": "Shingle",
+            "exteriorMaterial": ["Block", "Stucco"],
+            "foundationDetails": ["Slab"],
+            "hoaFee": None,
+            "isNewConstruction": False,
+            "atAGlanceFacts": [{"factLabel": f"Fact {i}", "factValue": f"Value {i}"} for i in range(12)],
+            "appliances": ["Dishwasher", "Dryer", "Microwave", "Range", "Refrigerator", "Washer"],
+            "interiorFeatures": [f"Feature {i}" for i in range(20)],
+            "rooms": [{"roomType": f"Room {i}", "roomArea": 120 + i} for i in range(10)],
+        },
+        "priceHistory": [
+            {
+                "date": f"20{24 - i // 4:02d}-{12 - (i % 4) * 3:02d}-01",
+                "time": 1700000000000 - i * 7_776_000_000,
+                "event": "Listed for sale" if i == 3 else ("Price change" if i < 3 else "Sold"),
+                "price": 629000 + i * 8000,
+                "priceChangeRate": -0.012,
+                "source": "BeachesMLS",
+            }
+            for i in range(30)
+        ],
+        "taxHistory": [{"time": 1700000000000 - i * 31_536_000_000, "taxPaid": 7431 - i * 120} for i in range(20)],
+        "nearbyHomes": [{"zpid": 46491500 + i, "price": 500000 + i * 10000, "livingArea": 1700 + i} for i in range(10)],
+        "photos": [{"url": f"https://photos.example.com/{i}.jpg", "caption": ""} for i in range(40)],
+    }
+
+
+def _redfin() -> dict[str, Any]:
+    return {"redfin_estimate": 621500, "redfin_rental_estimate": 3875, "listing_price": 629000}
+
+
+def _realtor() -> dict[str, Any]:
+    return {"realtor_estimate": 604200, "realtor_rental_estimate": 3800}
+
+
+def _path_walk(data: dict[str, Any] | None, field: str) -> Any:
+    """The per-call dotted-path resolution ``normalize`` used before the accessors were compiled."""
+    if data is None or field is None:
+        return None
+    value: Any = data
+    for key in field.split("."):
+        if isinstance(value, dict) and key in value:
+            value = value[key]
+        else:
+            return None
+    if field in ("propertyTaxes", "taxAssessments") and isinstance(value, dict):
+        years = [k for k in value.keys() if k.isdigit()]
+        if not years:
+            return None
+        year_data = value.get(max(years), {})
+        leaf = "total" if field == "propertyTaxes" else "value"
+        return year_data.get(leaf) if isinstance(year_data, dict) else None
+    return value
+
+
+def _synthetic() -> Inputs:
+    return {"rentcast": _rentcast(), "axesso": _axesso(), "redfin": _redfin(), "realtor": _realtor()}
+
+
+async def _recorded(addresses: list[str]) -> list[Inputs]:
+    """``normalize`` inputs rebuilt from the provider payload cache, one set per cached address."""
+    from app.core.config import settings
+
+    service = PropertyService()
+    cache = CacheService(redis_url=settings.REDIS_URL)
+    recorded = []
+    for address in addresses:
+        keys = {provider: service._provider_payload_key(provider, address) for provider in _PROVIDER_PAYLOAD_NAMES}
+        cached = await cache.get_many(keys.values())
+        fields: Inputs = {}
+        for provider, key in keys.items():
+            entry = cached.get(key)
+            if isinstance(entry, dict):
+                fields.update(_provider_payload_fields(provider, (*entry["payload"], 0.0)))
+        fields.pop("zillow_zpid", None)
+        if fields:
+            recorded.append(fields)
+        else:
+            print(f"no cached provider payloads for {address!r}")
+    return recorded
+
+
+def _per_call_us(fn, iterations: int) -> float:
+    return min(timeit.repeat(fn, number=iterations, repeat=3)) / iterations * 1e6
+
+
+def _bench(inputs: Inputs, iterations: int) -> None:
+    rentcast, axesso = inputs.get("rentcast"), inputs.get("axesso")
+    redfin, realtor, mashvisor = inputs.get("redfin"), inputs.get("realtor"), inputs.get("mashvisor")
+    normalizer = DataNormalizer()
+    timestamp = datetime.now(UTC)
+
+    def path_walking() -> list[tuple[Any, Any]]:
+        return [
+            (_path_walk(rentcast, rc) if rc else None, _path_walk(axesso, ax) if ax else None)
+            for rc, ax, _ in DataNormalizer.FIELD_MAPPING.values()
+        ]
+
+    def compiled() -> list[tuple[Any, Any]]:
+        return [
+            (rc_get(rentcast) if rc_get else None, ax_get(axesso) if ax_get else None)
+            for _, rc_get, ax_get, _ in DataNormalizer._FIELD_ACCESSORS
+        ]
+
+    def normalize() -> tuple[dict[str, Any], dict[str, Any]]:
+        return normalizer.normalize(
+            rentcast, axesso, timestamp, redfin_data=redfin, realtor_data=realtor, mashvisor_data=mashvisor
+        )
+
+    assert path_walking() == compiled()
+
+    cases = {
+        "field mapping, path walking": path_walking,
+        "field mapping, compiled": compiled,
+        "normalize": normalize,
+    }
+    size = sum(len(json.dumps(payload, default=str)) for payload in inputs.values())
+    print(f"provider payloads ({', '.join(sorted(inputs))}): {size} bytes JSON, {iterations} iterations")
+    for name, fn in cases.items():
+        print(f"  {name:<28} {_per_call_us(fn, iterations):8.1f} µs/property")
+
+    merged, provenance = normalize()
+    market_stats = rentcast.get("market_statistics") if rentcast else None
+    passes = {
+        "redfin": lambda: normalizer._inject_redfin_data(dict(merged), dict(provenance), redfin, timestamp),
+        "realtor": lambda: normalizer._inject_realtor_data(dict(merged), dict(provenance), realtor, timestamp),
+        "mashvisor": lambda: normalizer._inject_mashvisor_data(dict(merged), dict(provenance), mashvisor, timestamp),
+        "property features": lambda: normalizer._extract_property_features(dict(merged), rentcast, axesso),
+        "market statistics": lambda: normalizer._extract_market_statistics(dict(merged), market_stats),
+        "listing info": lambda: normalizer._extract_listing_info(
+            dict(merged), axesso, timestamp, dict(provenance), rentcast
+        ),
+        "iq estimates": lambda: normalizer._compute_iq_estimates(dict(merged), dict(provenance), timestamp),
+    }
+    for name, fn in passes.items():
+        print(f"    {name:<26} {_per_call_us(fn, iterations):8.1f} µs/property")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("iterations", nargs="?", type=int, default=2000)
+    parser.add_argument(
+        "--address", action="append", default=[], help="benchmark this address's cached provider payloads"
+    )
+    args = parser.parse_args()
+
+    inputs = asyncio.run(_recorded(args.address)) if args.address else []
+    if not inputs:
+        print("using the synthetic provider set")
+        inputs = [_synthetic()]
+    for recorded in inputs:
+        _bench(recorded, args.iterations)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark: per-hit CPU cost of turning a cached property into a response.
+
+Compares, for one realistic cached PropertyResponse payload:
+  - response_model   validate, then FastAPI's response_model pass: dump,
+                     re-validate, dump to JSON mode, json.dumps
+                     (both endpoints before)
+  - model_dump_json  validate, then serialize in pydantic-core
+                     (POST /properties/search now)
+  - raw json         encode_json(payload), no model at all
+                     (GET /properties/{property_id} now)
+
+Usage:
+  cd backend && python scripts/bench_property_cache_hit.py [iterations]
+"""
+import json
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.schemas.property import PropertyResponse
+from app.services.cache_service import encode_json
+from app.services.property_service import PropertyService
+
+
+def _payload() -> dict:
+    """Mock property padded to a production-sized payload, as read from Redis."""
+    svc = PropertyService()
+    data = svc.get_mock_property().model_dump()
+    data["tax_history"] = [
+        {"year": 2000 + i, "tax_paid": 8000.0 + i * 120, "assessed_value": 400000.0 + i * 9000} for i in range(20)
+    ]
+    data["zestimate_history"] = [{"date": f"2024-{m:02d}-01", "value": 500000 + m * 1500} for m in range(1, 13)]
+    data["provenance"]["fields"] = {
+        f"field_{i}": {"source": "zillow", "fetched_at": "2026-01-01T00:00:00+00:00", "confidence": "high"}
+        for i in range(40)
+    }
+    return json.loads(json.dumps(data, default=str))
+
+
+def main() -> None:
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    payload = _payload()
+
+    def response_model() -> bytes:
+        dumped = PropertyResponse(**payload).model_dump(by_alias=True)
+        content = PropertyResponse.model_validate(dumped).model_dump(mode="json")
+        return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode()
+
+    cases = {
+        "response_model": response_model,
+        "model_dump_json": lambda: PropertyResponse(**payload).model_dump_json().encode(),
+        "raw json": lambda: encode_json(payload),
+    }
+    print(f"payload: {len(json.dumps(payload))} bytes JSON, {iterations} iterations")
+    baseline = None
+    for name, fn in cases.items():
+        per_hit_us = min(timeit.repeat(fn, number=iterations, repeat=3)) / iterations * 1e6
+        baseline = baseline or per_hit_us
+        print(f"  {name:<16} {per_hit_us:8.1f} µs/hit  ({baseline / per_hit_us:4.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
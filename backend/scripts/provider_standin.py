@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+Offline stand-in for the external property-data providers.
+
+Serves recorded provider responses so the property pipeline can be
+benchmarked and load-tested (``tests/load/locustfile.py``,
+``scripts/chaos_test.py``) without spending RentCast / AXESSO / Mashvisor /
+AirROI money. Point the backend at it with::
+
+    PROVIDER_STANDIN_URL=http://127.0.0.1:8765
+
+and every ``BaseAPIClient`` sends ``<url>/<provider>/<endpoint>`` here
+instead (provider = ``rentcast``, ``axesso``, ``redfin``, ``realtor``,
+``mashvisor``, ``airroi``).
+
+Modes:
+  serve   Replay fixtures. A request is answered with the fixture recorded
+          for the same endpoint and query params; with no exact match, one
+          of the endpoint's other fixtures is picked deterministically from
+          the params (so load tests can vary addresses); with none, 404.
+  record  Forward each request (with the client's own auth headers) to the
+          real upstream from app settings and save the response as a fixture.
+          Run the pipeline once against it to capture a fixture set.
+
+Fixtures are JSON files ``<fixtures>/<provider>/<endpoint>/<params-hash>.json``
+holding ``{"endpoint", "params", "status", "body"}``. None are committed (recorded
+responses carry real owner and listing data), so ``serve`` answers 404 until
+``record`` has been run once against the real providers::
+
+    cd backend && python scripts/provider_standin.py record
+    PROVIDER_STANDIN_URL=http://127.0.0.1:8765 uvicorn app.main:app
+    # search a handful of addresses, then stop both and serve
+
+Fault injection (serve mode) comes from a JSON profile, keyed by provider
+with ``"default"`` applying to the rest::
+
+    {
+      "default": {"latency": {"dist": "lognormal", "median_ms": 250, "sigma": 0.5}},
+      "axesso": {"latency": {"dist": "uniform", "min_ms": 400, "max_ms": 1800},
+                 "error_rate": 0.02, "rate_limit_rate": 0.05}
+    }
+
+Latency distributions: ``fixed`` (``ms``), ``uniform`` (``min_ms``,
+``max_ms``), ``lognormal`` (``median_ms``, ``sigma``). ``error_rate`` answers
+503, ``rate_limit_rate`` answers 429 with ``Retry-After``.
+
+Usage:
+  cd backend && python scripts/provider_standin.py serve [--port 8765] [--profile profile.json] [--seed 1]
+  cd backend && python scripts/provider_standin.py record [--port 8765]
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import os
+import random
+import sys
+from pathlib import Path
+from typing import Any
+
+import httpx
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.core.config import settings
+
+DEFAULT_FIXTURES = Path(__file__).resolve().parent.parent / "tests" / "fixtures" / "providers"
+
+# Request headers not forwarded upstream when recording.
+_HOP_HEADERS = {"host", "content-length", "connection", "accept-encoding"}
+
+
+def upstream_urls() -> dict[str, str]:
+    """Real base URL of each provider, from the same settings the clients use."""
+    return {
+        "rentcast": settings.RENTCAST_URL,
+        "axesso": settings.AXESSO_URL,
+        "redfin": f"https://{settings.RAPIDAPI_HOST}",
+        "realtor": f"https://{settings.REALTOR_RAPIDAPI_HOST}",
+        "mashvisor": f"https://{settings.MASHVISOR_RAPIDAPI_HOST}",
+        "airroi": settings.AIRROI_API_URL,
+    }
+
+
+def params_key(params: dict[str, str]) -> str:
+    """Stable short hash of a request's query params."""
+    canonical = json.dumps(sorted(params.items()), separators=(",", ":"))
+    return hashlib.sha256(canonical.encode()).hexdigest()[:16]
+
+
+class FixtureStore:
+    """Recorded responses on disk, indexed by provider, endpoint and params."""
+
+    def __init__(self, root: Path):
+        self.root = root
+        self._by_endpoint: dict[tuple[str, str], dict[str, dict[str, Any]]] = {}
+
+    def _dir(self, provider: str, endpoint: str) -> Path:
+        return self.root / provider / endpoint.strip("/").replace("/", "__")
+
+    def load(self) -> int:
+        """Index every fixture under the root; returns how many were found."""
+        self._by_endpoint.clear()
+        count = 0
+        for path in sorted(self.root.glob("*/*/*.json")):
+            fixture = json.loads(path.read_text())
+            endpoint_fixtures = self._by_endpoint.setdefault((path.parent.parent.name, fixture["endpoint"]), {})
+            endpoint_fixtures[path.stem] = fixture
+            count += 1
+        return count
+
+    def lookup(self, provider: str, endpoint: str, params: dict[str, str]) -> dict[str, Any] | None:
+        """Exact fixture for these params, else a deterministic pick among the endpoint's fixtures."""
+        fixtures = self._by_endpoint.get((provider, endpoint))
+        if not fixtures:
+            return None
+        key = params_key(params)
+        if key in fixtures:
+            return fixtures[key]
+        keys = sorted(fixtures)
+        return fixtures[keys[int(key, 16) % len(keys)]]
+
+    def save(self, provider: str, endpoint: str, params: dict[str, str], status: int, body: Any) -> Path:
+        directory = self._dir(provider, endpoint)
+        directory.mkdir(parents=True, exist_ok=True)
+        key = params_key(params)
+        fixture = {"endpoint": endpoint, "params": params, "status": status, "body": body}
+        path = directory / f"{key}.json"
+        path.write_text(json.dumps(fixture, indent=2, sort_keys=True))
+        self._by_endpoint.setdefault((provider, endpoint), {})[key] = fixture
+        return path
+
+
+class FaultProfile:
+    """Per-provider latency distribution, error rate and 429 rate."""
+
+    def __init__(self, profile: dict[str, dict[str, Any]], rng: random.Random):
+        self.profile = profile
+        self.rng = rng
+
+    def _settings(self, provider: str) -> dict[str, Any]:
+        return self.profile.get(provider) or self.profile.get("default") or {}
+
+    def latency_seconds(self, provider: str) -> float:
+        latency = self._settings(provider).get("latency") or {}
+        dist = latency.get("dist", "fixed")
+        if dist == "uniform":
+            ms = self.rng.uniform(latency.get("min_ms", 0), latency.get("max_ms", 0))
+        elif dist == "lognormal":
+            ms = self.rng.lognormvariate(0.0, latency.get("sigma", 0.5)) * latency.get("median_ms", 0)
+        else:
+            ms = latency.get("ms", 0)
+        return max(ms, 0) / 1000
+
+    def injected_status(self, provider: str) -> int | None:
+        """429 or 503 when this request should fail, else ``None``."""
+        cfg = self._settings(provider)
+        roll = self.rng.random()
+        rate_limit_rate = cfg.get("rate_limit_rate", 0.0)
+        if roll < rate_limit_rate:
+            return 429
+        if roll < rate_limit_rate + cfg.get("error_rate", 0.0):
+            return 503
+        return None
+
+
+def create_app(store: FixtureStore, *, faults: FaultProfile | None = None, record: bool = False) -> FastAPI:
+    """Stand-in app: replays ``store`` (with ``faults``), or records into it."""
+    app = FastAPI(title="Provider stand-in", docs_url=None, redoc_url=None, openapi_url=None)
+    upstreams = upstream_urls()
+    upstream_client = httpx.AsyncClient(timeout=30.0) if record else None
+
+    @app.api_route("/{provider}/{endpoint:path}", methods=["GET", "POST", "PUT", "DELETE"])
+    async def provider_call(provider: str, endpoint: str, request: Request) -> JSONResponse:
+        params = dict(request.query_params)
+
+        if upstream_client is not None:
+            if provider not in upstreams:
+                return JSONResponse({"error": f"unknown provider {provider!r}"}, status_code=404)
+            headers = {k: v for k, v in request.headers.items() if k.lower() not in _HOP_HEADERS}
+            upstream = await upstream_client.request(
+                request.method,
+                f"{upstreams[provider].rstrip('/')}/{endpoint}",
+                params=params,
+                headers=headers,
+                content=await request.body(),
+            )
+            try:
+                body = upstream.json()
+            except ValueError:
+                return JSONResponse({"error": "non-JSON upstream response"}, status_code=upstream.status_code)
+            if upstream.status_code != 429:
+                path = store.save(provider, endpoint, params, upstream.status_code, body)
+                print(f"recorded {provider}/{endpoint} {upstream.status_code} -> {path}")
+            return JSONResponse(body, status_code=upstream.status_code)
+
+        if faults is not None:
+            await asyncio.sleep(faults.latency_seconds(provider))
+            injected = faults.injected_status(provider)
+            if injected == 429:
+                return JSONResponse({"message": "Too many requests"}, status_code=429, headers={"Retry-After": "1"})
+            if injected is not None:
+                return JSONResponse({"message": "Service unavailable"}, status_code=injected)
+
+        fixture = store.lookup(provider, endpoint, params)
+        if fixture is None:
+            return JSONResponse({"error": f"no fixture for {provider}/{endpoint}"}, status_code=404)
+        return JSONResponse(fixture["body"], status_code=fixture["status"])
+
+    if upstream_client is not None:
+        app.router.add_event_handler("shutdown", upstream_client.aclose)
+    return app
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Offline stand-in for the external property-data providers.")
+    parser.add_argument("mode", choices=["serve", "record"])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--fixtures", type=Path, default=DEFAULT_FIXTURES)
+    parser.add_argument("--profile", type=Path, help="JSON fault-injection profile (serve mode)")
+    parser.add_argument("--seed", type=int, help="seed latency and fault injection for repeatable runs")
+    args = parser.parse_args()
+
+    store = FixtureStore(args.fixtures)
+    count = store.load()
+    if args.mode == "record":
+        app = create_app(store, record=True)
+        print(f"recording into {args.fixtures} ({count} fixtures already present)")
+    else:
+        profile = json.loads(args.profile.read_text()) if args.profile else {}
+        app = create_app(store, faults=FaultProfile(profile, random.Random(args.seed)))  # noqa: S311
+        print(f"serving {count} fixtures from {args.fixtures}")
+        if not count:
+            print("no fixtures: every request will 404 -- run `provider_standin.py record` first")
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
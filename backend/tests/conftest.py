@@ -21,11 +21,13 @@ from __future__ import annotations
 
 import asyncio
 import os
-from collections.abc import AsyncGenerator, Generator
+from collections.abc import AsyncGenerator, Callable, Generator
 from datetime import UTC, datetime
 from pathlib import Path
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 
+import httpx
 import pytest
 
 # Set test environment before importing app modules
@@ -79,6 +81,7 @@ from app.models.lender import Lender
 from app.repositories.role_repository import role_repo
 from app.repositories.user_repository import user_repo
 from app.services.auth_service import auth_service
+from app.services.base_client import BaseAPIClient, BaseAPIResponse
 from scripts.seed_cash_buyers import load_buyers
 from scripts.seed_cash_buyers import row_values as buyer_row_values
 from scripts.seed_geo_cities import load_cities
@@ -379,3 +382,53 @@ def mock_email_service():
     mock.send_welcome_email = AsyncMock(return_value={"success": True})
     mock.send_password_changed_email = AsyncMock(return_value={"success": True})
     return mock
+
+
+class DummyAPIClient(BaseAPIClient[BaseAPIResponse]):
+    """Bare ``BaseAPIClient`` for exercising the shared request path; ``provider``
+    names its circuit breaker, limiter and budget."""
+
+    def __init__(self, provider: str = "Dummy", **kwargs: Any):
+        self.provider = provider
+        kwargs.setdefault("api_key", "k")
+        kwargs.setdefault("base_url", "https://example.test")
+        super().__init__(**kwargs)
+
+    def _get_headers(self) -> dict[str, str]:
+        return {"X-Api-Key": self.api_key}
+
+    def _create_response(
+        self,
+        success: bool,
+        data: dict[str, Any] | None,
+        error: str | None,
+        status_code: int | None,
+        raw_response: dict[str, Any] | None = None,
+        **kwargs,
+    ) -> BaseAPIResponse:
+        return BaseAPIResponse(success=success, data=data, error=error, status_code=status_code)
+
+    def _get_provider_name(self) -> str:
+        return self.provider
+
+
+@pytest.fixture
+async def dummy_api_client():
+    """Factory for ``DummyAPIClient``s whose pooled HTTP client is a
+    ``MockTransport`` around ``handler`` (none given: the real pool, opened
+    lazily). Every client made is closed at teardown."""
+    made: list[DummyAPIClient] = []
+
+    def make(
+        handler: Callable[[httpx.Request], Any] | None = None, provider: str = "Dummy", **kwargs: Any
+    ) -> DummyAPIClient:
+        client = DummyAPIClient(provider, **kwargs)
+        if handler is not None:
+            client._http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            client._http_client_loop = asyncio.get_running_loop()
+        made.append(client)
+        return client
+
+    yield make
+    for client in made:
+        await client.aclose()
@@ -8,6 +8,14 @@ Usage:
 
 Then open http://localhost:8089 to configure and start the test.
 
+To load-test without calling (and paying) the real data providers, run the
+backend against the offline stand-in (see scripts/provider_standin.py).
+No fixtures are committed, so record a set once against the real providers
+(run `provider_standin.py record` and search a few addresses through it),
+then serve it:
+    python scripts/provider_standin.py serve --profile <latency profile>
+    PROVIDER_STANDIN_URL=http://127.0.0.1:8765 uvicorn app.main:app
+
 Targets (at 100 concurrent users):
     - p99 latency < 2s
     - Zero 5xx errors
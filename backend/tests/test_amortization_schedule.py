@@ -0,0 +1,121 @@
+"""
+Tests for columnar amortization schedules (AmortizationTable in
+app/schemas/proforma.py, built by proforma_generator.calculate_amortization_schedule):
+
+  1. The closed-form columns match the month-by-month recurrence.
+  2. Yearly rollups match summing the year's rows; zeros past the term.
+  3. The table serializes to, and validates from, the list-of-rows JSON.
+  4. A generated proforma dumps and exports to Excel with the schedule.
+"""
+
+import math
+from datetime import UTC, datetime
+from io import BytesIO
+
+import pytest
+from openpyxl import load_workbook
+from pydantic import BaseModel
+
+from app.schemas.proforma import AmortizationRow, AmortizationTable
+from app.schemas.property import (
+    Address,
+    DataQuality,
+    MarketData,
+    PropertyDetails,
+    PropertyResponse,
+    ProvenanceMap,
+    RentalData,
+    ValuationData,
+)
+from app.services.calculators import calculate_monthly_mortgage
+from app.services.proforma_exporter import ProformaExcelExporter
+from app.services.proforma_generator import calculate_amortization_schedule, generate_proforma_data
+
+
+def _recurrence(principal: float, annual_rate: float, term_years: int) -> list[dict]:
+    payment = calculate_monthly_mortgage(principal, annual_rate, term_years)
+    balance, cumulative_principal, cumulative_interest = principal, 0.0, 0.0
+    rows = []
+    for month in range(1, term_years * 12 + 1):
+        interest = balance * annual_rate / 12
+        principal_payment = payment - interest
+        cumulative_principal += principal_payment
+        cumulative_interest += interest
+        rows.append(
+            {
+                "month": month,
+                "year": math.ceil(month / 12),
+                "payment_number": month,
+                "beginning_balance": balance,
+                "scheduled_payment": payment,
+                "principal_payment": principal_payment,
+                "interest_payment": interest,
+                "ending_balance": max(0, balance - principal_payment),
+                "cumulative_principal": cumulative_principal,
+                "cumulative_interest": cumulative_interest,
+            }
+        )
+        balance = rows[-1]["ending_balance"]
+    return rows
+
+
+@pytest.mark.parametrize(("principal", "annual_rate", "term_years"), [(320_000, 0.07, 30), (90_000, 0.0, 15)])
+def test_columns_match_the_monthly_recurrence(principal, annual_rate, term_years):
+    schedule, summary = calculate_amortization_schedule(principal, annual_rate, term_years)
+    expected = _recurrence(principal, annual_rate, term_years)
+
+    assert len(schedule) == term_years * 12
+    for row, ref in zip(schedule.to_dicts(), expected, strict=True):
+        assert row == pytest.approx(ref, abs=1e-6)
+    assert schedule[-1].ending_balance == 0
+    assert summary.total_interest == pytest.approx(expected[-1]["cumulative_interest"], abs=1e-6)
+
+
+def test_year_totals_match_the_rows():
+    schedule, _ = calculate_amortization_schedule(250_000, 0.065, 30)
+
+    for year in (1, 7, 30):
+        rows = [row for row in schedule if row.year == year]
+        interest, principal, balance = schedule.year_totals(year)
+        assert interest == pytest.approx(sum(row.interest_payment for row in rows))
+        assert principal == pytest.approx(sum(row.principal_payment for row in rows))
+        assert balance == rows[-1].ending_balance
+    assert schedule.year_totals(31) == (0, 0, 0)
+
+
+def test_table_serializes_as_a_list_of_rows():
+    class Holder(BaseModel):
+        schedule: AmortizationTable
+
+    schedule, _ = calculate_amortization_schedule(180_000, 0.06, 2)
+    holder = Holder(schedule=schedule)
+
+    dumped = holder.model_dump()["schedule"]
+    assert dumped == [row.model_dump() for row in schedule]
+    assert Holder.model_validate_json(holder.model_dump_json()).schedule == schedule
+    assert Holder(schedule=list(schedule[:3])).schedule == schedule[:3]
+    assert isinstance(schedule[5], AmortizationRow) and schedule[5].month == 6
+    assert Holder.model_json_schema()["properties"]["schedule"]["type"] == "array"
+
+
+async def test_generated_proforma_dumps_and_exports_the_schedule():
+    prop = PropertyResponse(
+        property_id="amort-test",
+        address=Address(street="1 Main St", city="Austin", state="TX", zip_code="78701", full_address="1 Main St"),
+        details=PropertyDetails(),
+        valuations=ValuationData(current_value_avm=400_000),
+        rentals=RentalData(monthly_rent_ltr=2600),
+        market=MarketData(property_taxes_annual=5200),
+        provenance=ProvenanceMap(),
+        data_quality=DataQuality(completeness_score=90),
+        fetched_at=datetime.now(UTC),
+    )
+    proforma = await generate_proforma_data(prop)
+
+    rows = proforma.model_dump(mode="json")["amortization_schedule"]
+    assert len(rows) == len(proforma.amortization_schedule)
+    assert rows[0]["beginning_balance"] == proforma.financing.loan_amount
+
+    sheet = load_workbook(BytesIO(ProformaExcelExporter(proforma).generate().getvalue()))["Loan Amortization"]
+    assert sheet.max_row == len(rows) + 1
+    assert sheet.cell(row=2, column=3).value == pytest.approx(rows[0]["beginning_balance"])
@@ -0,0 +1,76 @@
+"""
+Tests for the pooled HTTP client owned by ``BaseAPIClient``:
+
+  1. One ``httpx.AsyncClient`` is reused across requests (keep-alive).
+  2. ``aclose`` / ``close_api_clients`` release it and the next request
+     transparently opens a fresh pool.
+  3. ``PROVIDER_STANDIN_URL`` redirects every client to the offline stand-in.
+"""
+
+import httpx
+
+from app.core.config import settings
+from app.services.base_client import close_api_clients, open_api_clients
+
+
+def _recording(seen: list[httpx.Request]):
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, json={"ok": True})
+
+    return handler
+
+
+async def test_requests_reuse_one_pooled_client(dummy_api_client):
+    seen: list[httpx.Request] = []
+    client = dummy_api_client(_recording(seen), base_url="https://example.test/")
+    pooled = client._http_client
+
+    first = await client._make_request("a", {"x": 1, "skip": None})
+    second = await client._make_request("b")
+
+    assert first.success and second.success
+    assert client._http_client is pooled
+    assert [str(r.url) for r in seen] == ["https://example.test/a?x=1", "https://example.test/b"]
+    assert seen[0].headers["X-Api-Key"] == "k"
+    await client.aclose()
+
+
+async def test_aclose_releases_pool_and_next_use_reopens(dummy_api_client):
+    client = dummy_api_client(_recording([]))
+    pooled = client._http_client
+
+    await client.aclose()
+    assert pooled.is_closed
+    assert client._http_client is None
+
+    reopened = client._get_http_client()
+    assert reopened is not pooled and not reopened.is_closed
+    await client.aclose()
+
+
+async def test_open_and_close_all_registered_clients(dummy_api_client):
+    clients = [dummy_api_client() for _ in range(2)]
+
+    await open_api_clients()
+    assert all(c._http_client is not None and not c._http_client.is_closed for c in clients)
+
+    await close_api_clients()
+    assert all(c._http_client is None for c in clients)
+
+
+async def test_pool_limits_follow_constructor(dummy_api_client):
+    client = dummy_api_client(max_connections=7, max_keepalive_connections=3)
+    assert client.limits.max_connections == 7
+    assert client.limits.max_keepalive_connections == 3
+
+
+async def test_standin_url_redirects_requests_under_the_provider_prefix(dummy_api_client, monkeypatch):
+    monkeypatch.setattr(settings, "PROVIDER_STANDIN_URL", "http://127.0.0.1:8765/")
+    seen: list[httpx.Request] = []
+    client = dummy_api_client(_recording(seen))
+
+    await client._make_request("avm/value", {"address": "1 Main St"})
+
+    assert str(seen[0].url) == "http://127.0.0.1:8765/dummy/avm/value?address=1%20Main%20St"
+    await client.aclose()
@@ -0,0 +1,137 @@
+"""
+Tests for batch property analysis (app/services/batch_analysis_service.py):
+
+  1. CSV uploads are read with or without an ``address`` header.
+  2. Addresses are validated and deduplicated; invalid ones are reported
+     in-stream instead of failing the batch.
+  3. Uncached and stale fetches respect the concurrency ceiling while fresh
+     cache hits skip it.
+  4. Each ok result carries an IQ Verdict; search failures become error lines.
+"""
+
+import asyncio
+
+import pytest
+
+from app.core.exceptions import ExternalAPIError
+from app.services import batch_analysis_service
+from app.services.batch_analysis_service import addresses_from_csv, analyze_addresses
+from app.services.cache_service import CacheService
+from app.services.property_service import PropertyService
+
+ADDRESS = "1451 NW 10 St, Boca Raton, FL 33486"
+OTHER = "953 Banyan Dr, Delray Beach, FL 33483"
+
+
+@pytest.fixture
+def fake_search(monkeypatch):
+    """Route batch searches to the mock property and track concurrency."""
+    svc = PropertyService()
+    mock = svc.get_mock_property()
+    cache = CacheService(redis_url=None)
+    stats = {"calls": [], "active": 0, "peak": 0, "fail": set(), "fresh": set()}
+
+    async def _search(address, **kwargs):
+        stats["calls"].append(address)
+        stats["active"] += 1
+        stats["peak"] = max(stats["peak"], stats["active"])
+        try:
+            await asyncio.sleep(0.01)
+            if address in stats["fail"]:
+                raise ExternalAPIError("RentCast", "unavailable")
+            return mock.model_copy(update={"property_id": f"id-{address[:4]}"})
+        finally:
+            stats["active"] -= 1
+
+    async def _is_fresh(address):
+        return address in stats["fresh"]
+
+    monkeypatch.setattr(batch_analysis_service.property_service, "search_property", _search)
+    monkeypatch.setattr(batch_analysis_service.property_service, "cached_property_is_fresh", _is_fresh)
+    monkeypatch.setattr(batch_analysis_service, "get_cache_service", lambda: cache)
+    return stats, cache
+
+
+async def _collect(addresses, **kwargs):
+    return [result async for result in analyze_addresses(addresses, **kwargs)]
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# CSV parsing
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+def test_csv_with_address_columns():
+    content = b"\xef\xbb\xbfAddress,City,State,Zip\n1451 NW 10 St,Boca Raton,FL,33486\n,,,\n953 Banyan Dr,,,\n"
+    assert addresses_from_csv(content) == [ADDRESS, "953 Banyan Dr"]
+
+
+def test_csv_without_header_joins_unquoted_parts():
+    content = f'{ADDRESS}\n"{OTHER}"\n\n'.encode()
+    assert addresses_from_csv(content) == [ADDRESS, OTHER]
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Streaming analysis
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+async def test_dedupes_and_reports_invalid_addresses(fake_search):
+    stats, _ = fake_search
+
+    results = await _collect([ADDRESS, "not an address", f"  {ADDRESS.upper()} ", OTHER])
+
+    assert sorted(stats["calls"]) == sorted([ADDRESS, OTHER])
+    by_address = {r.address: r for r in results}
+    assert by_address["not an address"].status == "error"
+    assert by_address["not an address"].indexes == [1]
+    assert by_address[ADDRESS].indexes == [0, 2]
+    assert by_address[ADDRESS].status == "ok"
+    assert by_address[ADDRESS].verdict is not None
+    assert "dealScore" in by_address[ADDRESS].verdict
+
+
+async def test_uncached_fetches_respect_concurrency(fake_search):
+    stats, _ = fake_search
+    addresses = [f"{100 + i} Main St, Boca Raton, FL 33486" for i in range(8)]
+
+    results = await _collect(addresses, concurrency=2)
+
+    assert len(results) == 8
+    assert stats["peak"] == 2
+
+
+async def test_fresh_cached_addresses_skip_the_fetch_queue(fake_search):
+    stats, cache = fake_search
+    addresses = [f"{100 + i} Main St, Boca Raton, FL 33486" for i in range(4)]
+    for address in addresses:
+        await cache.set(CacheService.property_key(address), "cached-id", 60)
+    stats["fresh"].update(addresses)
+
+    results = await _collect(addresses, concurrency=1)
+
+    assert all(r.cached for r in results)
+    assert stats["peak"] == 4
+
+
+async def test_stale_cached_addresses_respect_concurrency(fake_search):
+    stats, cache = fake_search
+    addresses = [f"{100 + i} Main St, Boca Raton, FL 33486" for i in range(4)]
+    for address in addresses:
+        await cache.set(CacheService.property_key(address), "cached-id", 60)
+
+    results = await _collect(addresses, concurrency=1)
+
+    assert all(r.cached for r in results)
+    assert stats["peak"] == 1
+
+
+async def test_search_failure_becomes_error_line(fake_search):
+    stats, _ = fake_search
+    stats["fail"].add(OTHER)
+
+    results = {r.address: r for r in await _collect([ADDRESS, OTHER])}
+
+    assert results[OTHER].status == "error"
+    assert results[OTHER].error == "RentCast API error: unavailable"
+    assert results[ADDRESS].status == "ok"
@@ -0,0 +1,148 @@
+"""
+Tests for the compact cache codec and single-copy property storage:
+
+  1. ``encode_compact`` / ``decode_compact`` round-trip, compress large
+     payloads, and still read plain JSON written before a prefix switched.
+  2. Compact-prefix keys go through the binary Redis pool.
+  3. ``set_property`` stores one ``prop_id`` blob plus an address pointer.
+  4. ``get_cached_property_json`` serves the cached payload as the same JSON
+     the response model would produce, without building the model.
+"""
+
+import json
+from datetime import UTC, datetime
+
+from app.services.cache_service import CacheService, decode_compact, encode_compact
+from app.services.property.cache import _PROPERTY_CACHE_FORMULA_VERSION
+from app.services.property_service import PropertyService
+
+
+def _property_payload() -> dict:
+    return {
+        "property_id": "abc123",
+        "address": {"full_address": "953 Banyan Dr, Delray Beach, FL 33483"},
+        "fetched_at": datetime(2026, 1, 1, tzinfo=UTC),
+        "price_history": [{"date": f"2020-01-{d:02d}", "price": 500000 + d, "event": "Listed"} for d in range(1, 29)],
+    }
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Codec
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+def test_round_trip_and_compression():
+    payload = _property_payload()
+    blob = encode_compact(payload)
+    as_json = json.dumps(payload, default=str).encode()
+
+    assert blob[:1] == b"\x02"
+    assert len(blob) < len(as_json) / 2
+    decoded = decode_compact(blob)
+    assert decoded["price_history"] == payload["price_history"]
+    assert datetime.fromisoformat(decoded["fetched_at"]) == payload["fetched_at"]
+
+
+def test_small_values_are_not_compressed():
+    assert encode_compact("abc123")[:1] == b"\x01"
+    assert decode_compact(encode_compact({"a": 1})) == {"a": 1}
+
+
+def test_plain_json_still_decodes():
+    assert decode_compact(b'{"a": 1}') == {"a": 1}
+    assert decode_compact('{"a": 1}') == {"a": 1}
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# CacheService storage
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+class _FakeRedis:
+    def __init__(self):
+        self.store: dict[str, bytes | str] = {}
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def setex(self, key, ttl, value):
+        self.store[key] = value
+
+    def pipeline(self, transaction=True):
+        return _FakePipeline(self)
+
+
+class _FakePipeline:
+    def __init__(self, redis: _FakeRedis):
+        self.redis = redis
+        self.queued: dict[str, bytes | str] = {}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def setex(self, key, ttl, value):
+        self.queued[key] = value
+
+    async def execute(self):
+        self.redis.store.update(self.queued)
+
+
+def _redis_backed_cache() -> tuple[CacheService, _FakeRedis, _FakeRedis]:
+    cache = CacheService(redis_url=None)
+    text, binary = _FakeRedis(), _FakeRedis()
+    cache.use_redis = True
+    cache.redis_client = text
+    cache._redis_binary = binary
+    return cache, text, binary
+
+
+async def test_property_blob_is_stored_once_behind_address_pointer():
+    cache, text, binary = _redis_backed_cache()
+    address = "953 Banyan Dr, Delray Beach, FL 33483"
+    payload = _property_payload()
+
+    assert await cache.set_property(address, payload)
+
+    assert json.loads(text.store[CacheService.property_key(address)]) == "abc123"
+    assert list(binary.store) == [CacheService.property_id_key("abc123")]
+    assert binary.store[CacheService.property_id_key("abc123")][:1] == b"\x02"
+
+    cached = await cache.get_property(address)
+    assert cached["property_id"] == "abc123"
+    assert cached == await cache.get_property_by_id("abc123")
+
+
+async def test_inline_legacy_payload_is_returned_as_is():
+    cache, text, _ = _redis_backed_cache()
+    address = "953 Banyan Dr, Delray Beach, FL 33483"
+    text.store[CacheService.property_key(address, namespace="")] = json.dumps({"property_id": "old"})
+
+    assert await cache.get_property(address, namespace="") == {"property_id": "old"}
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Model-free JSON for cached properties
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+async def test_cached_property_json_matches_model_serialization(monkeypatch):
+    svc = PropertyService()
+    svc._cache = CacheService(redis_url=None)
+
+    async def fixed_insurance_pct() -> float:
+        return 0.01
+
+    monkeypatch.setattr(svc, "_resolve_insurance_pct", fixed_insurance_pct)
+
+    payload = json.loads(json.dumps(svc.get_mock_property().model_dump(), default=str))
+    payload["valuation_formula_version"] = _PROPERTY_CACHE_FORMULA_VERSION
+    await svc._cache.set_property_by_id(payload["property_id"], payload)
+
+    model = await svc.get_cached_property(payload["property_id"])
+    raw = await svc.get_cached_property_json(payload["property_id"])
+
+    assert json.loads(raw) == json.loads(model.model_dump_json())
+    assert await svc.get_cached_property_json("missing") is None
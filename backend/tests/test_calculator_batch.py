@@ -0,0 +1,361 @@
+"""Parity tests for the vectorized batch calculators (app/services/calculators/batch.py).
+
+Every batch kernel must reproduce its scalar calculator bit-for-bit: each
+row of a batch result is compared with ``==`` (no tolerance) against the
+scalar function called on that row's inputs. Rows come from the golden LTR
+fixture, the ``test_calculators`` base scenarios, seeded random draws and
+hand-picked edge cases (0% rates, seller carry, interest-only notes,
+over-funded deals, missing optional inputs).
+"""
+
+import json
+import math
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pytest
+
+from app.services.calculators import (
+    CalculationInputError,
+    calculate_brrrr,
+    calculate_brrrr_batch,
+    calculate_flip,
+    calculate_flip_batch,
+    calculate_house_hack,
+    calculate_house_hack_batch,
+    calculate_ltr,
+    calculate_ltr_batch,
+    calculate_str,
+    calculate_str_batch,
+    calculate_wholesale,
+    calculate_wholesale_batch,
+)
+
+GOLDEN_DIR = Path(__file__).parent / "golden"
+RANDOM_ROWS = 200
+
+
+def _golden_ltr_row() -> dict[str, Any]:
+    params = json.loads((GOLDEN_DIR / "valuation_ltr_standard.json").read_text())["clientParams"]
+    return dict(
+        purchase_price=350_000.0,
+        monthly_rent=params["monthlyRent"],
+        property_taxes_annual=params["propertyTaxesAnnual"],
+        down_payment_pct=params["downPaymentPct"],
+        interest_rate=params["interestRate"],
+        loan_term_years=params["loanTermYears"],
+        closing_costs_pct=0.03,
+        vacancy_rate=params["vacancyRate"],
+        property_management_pct=params["managementPct"],
+        maintenance_pct=params["maintenancePct"],
+        insurance_annual=params["insuranceAnnual"],
+        utilities_monthly=params["utilitiesAnnual"] / 12,
+        landscaping_annual=params["otherAnnualExpenses"],
+        pest_control_annual=0.0,
+        appreciation_rate=0.05,
+        rent_growth_rate=0.05,
+        expense_growth_rate=0.03,
+    )
+
+
+def _random_rows(base: dict[str, Any], draws: dict[str, tuple[str, Any, Any]], seed: int) -> list[dict[str, Any]]:
+    """``RANDOM_ROWS`` copies of ``base`` with ``draws`` (name -> (kind, lo, hi)) resampled."""
+    rng = np.random.default_rng(seed)
+    rows = []
+    for _ in range(RANDOM_ROWS):
+        row = dict(base)
+        for name, (kind, lo, hi) in draws.items():
+            row[name] = int(rng.integers(lo, hi + 1)) if kind == "int" else float(rng.uniform(lo, hi))
+        rows.append(row)
+    return rows
+
+
+def _columns(rows: list[dict[str, Any]]) -> dict[str, list[Any]]:
+    return {name: [row[name] for row in rows] for name in rows[0]}
+
+
+def _same(batch_value: Any, scalar_value: Any) -> bool:
+    if scalar_value is None:
+        return math.isnan(batch_value)
+    if isinstance(scalar_value, str):
+        return batch_value == scalar_value
+    return float(batch_value) == float(scalar_value) or (math.isnan(batch_value) and math.isnan(scalar_value))
+
+
+def _assert_parity(batch: dict[str, Any], scalar_results: list[dict[str, Any]]) -> None:
+    assert set(batch) == set(scalar_results[0])
+    for i, expected in enumerate(scalar_results):
+        for key, scalar_value in expected.items():
+            if key == "ten_year_projection":
+                for year, scalar_year in enumerate(scalar_value):
+                    for field, value in scalar_year.items():
+                        got = batch[key][field][i, year]
+                        assert _same(got, value), (i, key, year, field, got, value)
+            elif key == "seasonality_analysis":
+                assert len(batch[key]) == len(scalar_value)
+                for batch_season, scalar_season in zip(batch[key], scalar_value, strict=True):
+                    for field, value in scalar_season.items():
+                        got = batch_season[field][i] if field in ("adr", "revenue") else batch_season[field]
+                        assert _same(got, value), (i, key, field, got, value)
+            else:
+                got = batch[key][i]
+                assert _same(got, scalar_value), (i, key, got, scalar_value)
+
+
+def _check(scalar_fn, batch_fn, rows: list[dict[str, Any]], **shared: Any) -> None:
+    _assert_parity(batch_fn(**_columns(rows), **shared), [scalar_fn(**row, **shared) for row in rows])
+
+
+# =====================================================
+# Strategies
+# =====================================================
+
+_LTR_DRAWS = {
+    "purchase_price": ("float", 50_000, 2_000_000),
+    "monthly_rent": ("float", 0, 15_000),
+    "down_payment_pct": ("float", -0.2, 1.0),
+    "interest_rate": ("float", 0.0, 0.12),
+    "loan_term_years": ("int", 1, 40),
+    "vacancy_rate": ("float", 0.0, 0.2),
+    "rent_growth_rate": ("float", -0.02, 0.08),
+    "appreciation_rate": ("float", -0.05, 0.1),
+    "rehab_costs": ("float", 0, 80_000),
+    "seller_carry_amount": ("float", 0, 150_000),
+    "seller_carry_rate": ("float", 0.0, 0.08),
+    "seller_carry_term_years": ("int", 0, 30),
+    "seller_carry_interest_only": ("int", 0, 1),
+}
+
+
+def test_ltr_batch_matches_scalar():
+    golden = _golden_ltr_row()
+    base = {
+        **golden,
+        "hoa_monthly": 0.0,
+        "rehab_costs": 0.0,
+        "seller_carry_amount": 0.0,
+        "seller_carry_rate": 0.0,
+        "seller_carry_term_years": 30,
+        "seller_carry_interest_only": False,
+    }
+    edge = [
+        base,
+        {**base, "interest_rate": 0.0},
+        {**base, "monthly_rent": 0.0},
+        {**base, "down_payment_pct": 1.0},
+        {**base, "down_payment_pct": -0.1, "seller_carry_amount": 50_000.0},
+        {**base, "seller_carry_amount": 70_000.0, "seller_carry_rate": 0.0, "seller_carry_interest_only": True},
+        {**base, "seller_carry_amount": 70_000.0, "seller_carry_rate": 0.05, "seller_carry_term_years": 0},
+    ]
+    _check(calculate_ltr, calculate_ltr_batch, edge + _random_rows(base, _LTR_DRAWS, seed=22))
+
+
+def test_str_batch_matches_scalar():
+    base = dict(
+        purchase_price=350_000.0,
+        average_daily_rate=200.0,
+        occupancy_rate=0.75,
+        property_taxes_annual=4200.0,
+        down_payment_pct=0.20,
+        interest_rate=0.06,
+        loan_term_years=30,
+        closing_costs_pct=0.03,
+        furniture_setup_cost=6000.0,
+        platform_fees_pct=0.15,
+        str_management_pct=0.10,
+        cleaning_cost_per_turnover=200.0,
+        cleaning_fee_revenue=75.0,
+        avg_length_of_stay_days=6,
+        supplies_monthly=100.0,
+        additional_utilities_monthly=0.0,
+        insurance_annual=3500.0,
+        maintenance_annual=2500.0,
+        landscaping_annual=0.0,
+        pest_control_annual=0.0,
+        monthly_revenue_override=None,
+        seller_carry_amount=0.0,
+        seller_carry_rate=0.0,
+        seller_carry_term_years=30,
+        seller_carry_interest_only=False,
+    )
+    draws = {
+        "purchase_price": ("float", 80_000, 3_000_000),
+        "average_daily_rate": ("float", 40, 900),
+        "occupancy_rate": ("float", 0.1, 0.95),
+        "interest_rate": ("float", 0.0, 0.12),
+        "avg_length_of_stay_days": ("int", 1, 14),
+        "platform_fees_pct": ("float", 0.0, 0.5),
+        "str_management_pct": ("float", 0.0, 0.5),
+        "seller_carry_amount": ("float", 0, 100_000),
+        "seller_carry_interest_only": ("int", 0, 1),
+    }
+    edge = [
+        base,
+        {**base, "monthly_revenue_override": 6500.0},
+        {**base, "monthly_revenue_override": 0.0},
+        {**base, "interest_rate": 0.0, "platform_fees_pct": 0.6, "str_management_pct": 0.5},
+    ]
+    rows = edge + _random_rows(base, draws, seed=23)
+    _check(calculate_str, calculate_str_batch, rows)
+    seasons = [{"season": "High", "months": 8, "occupancy": 0.9, "adr_multiplier": 1.3}, {"months": 4}]
+    _check(calculate_str, calculate_str_batch, rows[:20], seasonality=seasons)
+
+
+def test_brrrr_batch_matches_scalar():
+    base = dict(
+        market_value=200_000.0,
+        arv=300_000.0,
+        monthly_rent_post_rehab=2200.0,
+        property_taxes_annual=3000.0,
+        purchase_discount_pct=0.15,
+        down_payment_pct=0.20,
+        interest_rate=0.06,
+        loan_term_years=30,
+        closing_costs_pct=0.03,
+        renovation_budget=40_000.0,
+        contingency_pct=0.10,
+        holding_period_months=4,
+        monthly_holding_costs=2000.0,
+        refinance_ltv=0.75,
+        refinance_interest_rate=0.06,
+        refinance_term_years=30,
+        refinance_closing_costs=3500.0,
+        vacancy_rate=0.05,
+        operating_expense_pct=0.10,
+        insurance_annual=2000.0,
+        seller_carry_amount=0.0,
+        seller_carry_rate=0.0,
+        seller_carry_term_years=30,
+    )
+    draws = {
+        "market_value": ("float", 50_000, 1_000_000),
+        "arv": ("float", 60_000, 1_500_000),
+        "purchase_discount_pct": ("float", 0.0, 0.4),
+        "renovation_budget": ("float", 0, 200_000),
+        "holding_period_months": ("int", 1, 18),
+        "refinance_ltv": ("float", 0.5, 0.85),
+        "refinance_interest_rate": ("float", 0.0, 0.1),
+        "seller_carry_amount": ("float", 0, 60_000),
+        "seller_carry_rate": ("float", 0.0, 0.08),
+    }
+    edge = [base, {**base, "refinance_ltv": 0.95, "renovation_budget": 0.0}, {**base, "refinance_interest_rate": 0.0}]
+    _check(calculate_brrrr, calculate_brrrr_batch, edge + _random_rows(base, draws, seed=24))
+
+
+def test_flip_batch_matches_scalar():
+    base = dict(
+        market_value=250_000.0,
+        arv=350_000.0,
+        purchase_discount_pct=0.20,
+        hard_money_ltv=0.90,
+        hard_money_rate=0.12,
+        closing_costs_pct=0.03,
+        renovation_budget=50_000.0,
+        contingency_pct=0.10,
+        holding_period_months=6.0,
+        property_taxes_annual=3000.0,
+        insurance_annual=2500.0,
+        utilities_monthly=200.0,
+        selling_costs_pct=0.08,
+        capital_gains_rate=0.15,
+        seller_carry_amount=0.0,
+    )
+    draws = {
+        "market_value": ("float", 50_000, 1_000_000),
+        "arv": ("float", 60_000, 1_500_000),
+        "hard_money_ltv": ("float", 0.5, 1.0),
+        "hard_money_rate": ("float", 0.0, 0.15),
+        "renovation_budget": ("float", 0, 250_000),
+        "holding_period_months": ("float", 1, 24),
+        "selling_costs_pct": ("float", 0.0, 0.12),
+        "seller_carry_amount": ("float", 0, 60_000),
+    }
+    edge = [base, {**base, "holding_period_months": 0.0}, {**base, "selling_costs_pct": 1.0}]
+    _check(calculate_flip, calculate_flip_batch, edge + _random_rows(base, draws, seed=25))
+
+
+def test_house_hack_batch_matches_scalar():
+    base = dict(
+        purchase_price=300_000.0,
+        monthly_rent_per_room=800.0,
+        rooms_rented=2,
+        property_taxes_annual=3600.0,
+        down_payment_pct=0.035,
+        interest_rate=0.065,
+        loan_term_years=30,
+        closing_costs_pct=0.03,
+        fha_mip_rate=0.0055,
+        insurance_annual=3000.0,
+        conversion_cost=None,
+        unit2_rent=None,
+        seller_carry_amount=0.0,
+    )
+    draws = {
+        "purchase_price": ("float", 80_000, 1_200_000),
+        "monthly_rent_per_room": ("float", 0, 2000),
+        "rooms_rented": ("int", 0, 4),
+        "interest_rate": ("float", 0.0, 0.1),
+        "seller_carry_amount": ("float", 0, 50_000),
+    }
+    edge = [
+        base,
+        {**base, "conversion_cost": 40_000.0, "unit2_rent": 1400.0},
+        {**base, "conversion_cost": 40_000.0, "unit2_rent": 0.0},
+        {**base, "conversion_cost": 0.0, "unit2_rent": 1400.0},
+    ]
+    _check(calculate_house_hack, calculate_house_hack_batch, edge + _random_rows(base, draws, seed=26))
+
+
+def test_wholesale_batch_matches_scalar():
+    base = dict(
+        arv=400_000.0,
+        estimated_rehab_costs=50_000.0,
+        assignment_fee=15_000.0,
+        marketing_costs=500.0,
+        earnest_money_deposit=1000.0,
+        arv_discount_pct=0.30,
+        days_to_close=45,
+    )
+    draws = {
+        "arv": ("float", 50_000, 1_500_000),
+        "estimated_rehab_costs": ("float", 0, 200_000),
+        "assignment_fee": ("float", 0, 60_000),
+        "marketing_costs": ("float", 0, 20_000),
+        "arv_discount_pct": ("float", -0.2, 0.4),
+        "days_to_close": ("int", 0, 120),
+    }
+    edge = [
+        base,
+        {**base, "earnest_money_deposit": 0.0, "marketing_costs": 0.0},
+        {**base, "assignment_fee": 400.0},
+        {**base, "time_investment_hours": 0.0},
+    ]
+    rows = edge + _random_rows({**base, "time_investment_hours": 50.0}, draws, seed=27)
+    _check(calculate_wholesale, calculate_wholesale_batch, [{"time_investment_hours": 50.0, **row} for row in rows])
+
+
+# =====================================================
+# Inputs
+# =====================================================
+
+
+def test_scalars_broadcast_against_columns():
+    row = _golden_ltr_row()
+    batch = calculate_ltr_batch(**{**row, "interest_rate": [0.05, 0.06, 0.07]})
+
+    assert batch["monthly_pi"].shape == (3,)
+    assert batch["ten_year_projection"]["equity"].shape == (3, 10)
+    assert batch["monthly_pi"][1] == calculate_ltr(**row)["monthly_pi"]
+
+
+def test_invalid_row_reports_its_index_and_the_scalar_message():
+    row = _golden_ltr_row()
+    with pytest.raises(CalculationInputError, match=r"^Row 2: Interest rate exceeds maximum of 30%$"):
+        calculate_ltr_batch(**{**row, "interest_rate": [0.05, 0.06, 0.35]})
+
+
+def test_mismatched_column_lengths_are_rejected():
+    row = _golden_ltr_row()
+    with pytest.raises(CalculationInputError):
+        calculate_ltr_batch(**{**row, "interest_rate": [0.05, 0.06], "monthly_rent": [2000, 2100, 2200]})
@@ -0,0 +1,230 @@
+"""
+Tests for the shared circuit breaker (app/services/resilience.py):
+
+  1. A breaker opens after the failure threshold, lets one probe through once
+     the recovery window passes, and closes on the probe's success.
+  2. Two processes sharing Redis see each other's state: failures recorded by
+     one open the circuit for the other, only one of them sends the half-open
+     probe, and the probe's success closes it for both.
+  3. ``@resilient`` and ``BaseAPIClient`` use the same breaker per name, and
+     hand back a half-open probe that ended without an outcome (e.g. a 404).
+"""
+
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from app.services import resilience
+from app.services.cache_service import CacheService
+from app.services.resilience import CircuitBreaker, CircuitOpenError, CircuitState, get_circuit_breaker, resilient
+
+
+class _FakeRedis:
+    """Just enough Redis for the breaker: hashes, the failure script, SET NX, DEL."""
+
+    def __init__(self):
+        self.hashes: dict[str, dict[str, str]] = {}
+        self.strings: dict[str, str] = {}
+
+    async def hgetall(self, key):
+        return dict(self.hashes.get(key, {}))
+
+    async def eval(self, script, numkeys, key, now, threshold, ttl):
+        assert script == resilience._RECORD_FAILURE_SCRIPT
+        state = self.hashes.setdefault(key, {})
+        failures = int(state.get("failures", 0)) + 1
+        is_open = failures >= threshold or state.get("state") == "open"
+        state.update(failures=str(failures), last_failure=str(now), state="open" if is_open else "closed")
+        return [failures, state["state"]]
+
+    async def set(self, key, value, nx=False, ex=None):
+        if nx and key in self.strings:
+            return None
+        self.strings[key] = value
+        return True
+
+    async def delete(self, *keys):
+        for key in keys:
+            self.hashes.pop(key, None)
+            self.strings.pop(key, None)
+
+
+@pytest.fixture(autouse=True)
+def memory_cache():
+    """Breakers use an in-memory cache unless a test opts into shared Redis."""
+    cache = CacheService(redis_url=None)
+    with patch.object(CircuitBreaker, "_cache", staticmethod(lambda: cache)):
+        yield cache
+
+
+@pytest.fixture
+def shared_redis():
+    """Two 'workers' (breaker instances) backed by one fake Redis."""
+    redis = _FakeRedis()
+    cache = CacheService(redis_url=None)
+    cache.use_redis = True
+    cache.redis_client = redis
+    with patch.object(CircuitBreaker, "_cache", staticmethod(lambda: cache)):
+        yield redis
+
+
+def _expire_sync(*breakers: CircuitBreaker) -> None:
+    for breaker in breakers:
+        breaker._synced_at = float("-inf")
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Single process (no Redis)
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+async def test_opens_probes_once_and_closes():
+    breaker = CircuitBreaker("local-test", failure_threshold=2, recovery_timeout=30)
+    await breaker.record_failure()
+    assert await breaker.allow()
+    await breaker.record_failure()
+
+    assert breaker.state == CircuitState.OPEN
+    assert not await breaker.allow()
+
+    breaker.last_failure -= 31
+    assert breaker.state == CircuitState.HALF_OPEN
+    assert await breaker.allow()
+    assert not await breaker.allow()  # probe already in flight
+
+    await breaker.record_success()
+    assert breaker.state == CircuitState.CLOSED
+    assert await breaker.allow()
+
+
+async def test_failed_probe_restarts_recovery_window():
+    breaker = CircuitBreaker("local-probe-fail", failure_threshold=1, recovery_timeout=30)
+    await breaker.record_failure()
+    breaker.last_failure -= 31
+    assert breaker.state == CircuitState.HALF_OPEN
+
+    await breaker.record_failure()
+
+    assert breaker.state == CircuitState.OPEN
+
+
+async def test_released_probe_without_outcome_lets_the_next_one_through():
+    breaker = CircuitBreaker("local-probe-release", failure_threshold=1, recovery_timeout=30)
+    await breaker.record_failure()
+    breaker.last_failure -= 31
+    assert await breaker.allow()
+    probe = breaker.probe_token
+    assert not await breaker.allow()
+
+    await breaker.release_probe("someone-else")
+    assert not await breaker.allow()
+    await breaker.release_probe(probe)
+
+    assert breaker.state == CircuitState.HALF_OPEN
+    assert await breaker.allow()
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Shared through Redis
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+async def test_failures_on_one_worker_open_the_circuit_for_another(shared_redis):
+    worker_a = CircuitBreaker("shared", failure_threshold=3)
+    worker_b = CircuitBreaker("shared", failure_threshold=3)
+    assert await worker_b.allow()
+
+    for _ in range(3):
+        await worker_a.record_failure()
+    _expire_sync(worker_b)
+
+    assert not await worker_b.allow()
+    assert worker_b.failures == 3
+
+
+async def test_only_one_worker_sends_the_half_open_probe(shared_redis):
+    worker_a = CircuitBreaker("probe", failure_threshold=1, recovery_timeout=30)
+    worker_b = CircuitBreaker("probe", failure_threshold=1, recovery_timeout=30)
+    await worker_a.record_failure()
+    shared_redis.hashes["circuit:probe"]["last_failure"] = "0"
+    _expire_sync(worker_a, worker_b)
+
+    allowed = [await worker_a.allow(), await worker_b.allow()]
+
+    assert sorted(allowed) == [False, True]
+
+
+async def test_probe_success_closes_the_circuit_everywhere(shared_redis):
+    worker_a = CircuitBreaker("recover", failure_threshold=1)
+    worker_b = CircuitBreaker("recover", failure_threshold=1)
+    await worker_a.record_failure()
+    _expire_sync(worker_b)
+    assert not await worker_b.allow()
+
+    await worker_a.record_success()
+    _expire_sync(worker_b)
+
+    assert "circuit:recover" not in shared_redis.hashes
+    assert await worker_b.allow()
+    assert worker_b.state == CircuitState.CLOSED
+
+
+async def test_closed_circuit_reads_redis_at_most_once_per_interval(shared_redis):
+    breaker = CircuitBreaker("fast-path")
+    calls = 0
+    original = shared_redis.hgetall
+
+    async def _counting_hgetall(key):
+        nonlocal calls
+        calls += 1
+        return await original(key)
+
+    shared_redis.hgetall = _counting_hgetall
+    for _ in range(10):
+        assert await breaker.allow()
+        await breaker.record_success()
+
+    assert calls == 1
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Callers
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+async def test_resilient_raises_once_circuit_opens():
+    calls = 0
+
+    @resilient(name="resilient-test", max_attempts=1, circuit_breaker_threshold=2, circuit_breaker_timeout=30)
+    async def _flaky():
+        nonlocal calls
+        calls += 1
+        raise RuntimeError("provider down")
+
+    for _ in range(2):
+        with pytest.raises(RuntimeError):
+            await _flaky()
+    with pytest.raises(CircuitOpenError):
+        await _flaky()
+    assert calls == 2
+    assert get_circuit_breaker("resilient-test").state == CircuitState.OPEN
+
+
+async def test_client_probe_answered_404_releases_the_probe(dummy_api_client):
+    client = dummy_api_client(lambda request: httpx.Response(404, json={}), "ProbeDummy")
+    breaker = client.circuit_breaker
+    for _ in range(breaker.failure_threshold):
+        await breaker.record_failure()
+    breaker.last_failure -= breaker.recovery_timeout + 1
+
+    result = await client._make_request("missing")
+
+    assert result.status_code == 404
+    assert breaker.state == CircuitState.HALF_OPEN
+    assert breaker.probe_token is None
+    assert await breaker.allow()
+
+
+def test_same_name_shares_one_breaker():
+    assert get_circuit_breaker("shared-name") is get_circuit_breaker("shared-name", failure_threshold=9)
@@ -0,0 +1,254 @@
+"""
+Tests for the adaptive outbound concurrency limiter (app/services/concurrency_limiter.py):
+
+  1. Requests beyond the window queue, and the queue depth is visible.
+  2. The window halves on 429/5xx/timeouts (once per cooldown), shrinks on
+     latency far above the baseline, and grows additively only while full.
+  3. Bulk requests hold at most their share of the window and interactive
+     waiters are served first.
+  4. ``BaseAPIClient`` requests pass through their provider's limiter, and
+     AXESSO clients share one window.
+  5. Expired-listing validation waits for a slot outside its per-lookup
+     timeout, so a queued lookup is not kept unverified.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from app.schemas.property import MapListing
+from app.services import map_search_service
+from app.services.base_client import BaseAPIResponse
+from app.services.concurrency_limiter import (
+    AdaptiveConcurrencyLimiter,
+    Priority,
+    get_limiter,
+    outbound_priority,
+)
+
+
+async def _hold(limiter: AdaptiveConcurrencyLimiter, release: asyncio.Event, started: list[str], label: str):
+    async with limiter.slot():
+        started.append(label)
+        await release.wait()
+
+
+async def _settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Window
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+async def test_requests_beyond_window_queue():
+    limiter = AdaptiveConcurrencyLimiter("queue", initial_limit=2)
+    release = asyncio.Event()
+    started: list[str] = []
+
+    tasks = [asyncio.create_task(_hold(limiter, release, started, str(i))) for i in range(5)]
+    await _settle()
+
+    assert started == ["0", "1"]
+    assert limiter.queue_depth == 3
+    assert limiter.snapshot()["queue_depth"] == 3
+
+    release.set()
+    await asyncio.gather(*tasks)
+    assert limiter.in_flight == 0
+    assert limiter.queue_depth == 0
+
+
+async def test_cancelled_waiter_leaves_the_queue():
+    limiter = AdaptiveConcurrencyLimiter("cancel", initial_limit=1)
+    release = asyncio.Event()
+    holder = asyncio.create_task(_hold(limiter, release, [], "a"))
+    waiter = asyncio.create_task(_hold(limiter, release, [], "b"))
+    await _settle()
+
+    waiter.cancel()
+    await _settle()
+    release.set()
+    await holder
+
+    assert limiter.queue_depth == 0
+    assert limiter.in_flight == 0
+
+
+def test_overload_halves_once_per_cooldown():
+    limiter = AdaptiveConcurrencyLimiter("backoff", initial_limit=16, cooldown=60)
+
+    limiter.on_response(429, 0.1)
+    limiter.on_response(503, 0.1)
+    limiter.on_response(None, 5.0)
+
+    assert limiter.capacity == 8
+    assert limiter.throttled == 3
+
+
+def test_never_drops_below_min_limit():
+    limiter = AdaptiveConcurrencyLimiter("floor", initial_limit=2, min_limit=1, cooldown=0)
+    for _ in range(5):
+        limiter.on_response(429, 0.1)
+    assert limiter.capacity == 1
+
+
+def test_grows_additively_only_while_saturated():
+    limiter = AdaptiveConcurrencyLimiter("grow", initial_limit=4, max_limit=5)
+
+    limiter.on_response(200, 0.1)
+    assert limiter.limit == 4  # idle window does not grow
+
+    limiter.in_flight = 4
+    for _ in range(5):  # about one window of successes
+        limiter.on_response(200, 0.1)
+    assert limiter.capacity == 5
+
+    for _ in range(20):
+        limiter.on_response(200, 0.1)
+    assert limiter.capacity == 5  # capped at max_limit
+
+
+def test_latency_spike_shrinks_window():
+    limiter = AdaptiveConcurrencyLimiter("latency", initial_limit=10, cooldown=0)
+    for _ in range(20):
+        limiter.on_response(200, 0.1)
+
+    limiter.on_response(200, 1.0)
+
+    assert limiter.capacity == 9
+    assert limiter.throttled == 0
+
+
+def test_not_found_counts_as_success():
+    limiter = AdaptiveConcurrencyLimiter("404", initial_limit=4)
+    limiter.on_response(404, 0.1)
+    assert limiter.capacity == 4
+    assert limiter.throttled == 0
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Priorities
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+async def test_bulk_is_capped_at_its_share():
+    limiter = AdaptiveConcurrencyLimiter("bulk-cap", initial_limit=4, bulk_share=0.5)
+    release = asyncio.Event()
+    started: list[str] = []
+
+    with outbound_priority(Priority.BULK):
+        bulk = [asyncio.create_task(_hold(limiter, release, started, f"bulk{i}")) for i in range(4)]
+    await _settle()
+    interactive = asyncio.create_task(_hold(limiter, release, started, "interactive"))
+    await _settle()
+
+    assert started == ["bulk0", "bulk1", "interactive"]
+    assert limiter.snapshot()["queued_bulk"] == 2
+
+    release.set()
+    await asyncio.gather(*bulk, interactive)
+
+
+async def test_interactive_waiters_are_served_first():
+    limiter = AdaptiveConcurrencyLimiter("order", initial_limit=1)
+    gate = asyncio.Event()
+    release = asyncio.Event()
+    started: list[str] = []
+
+    first = asyncio.create_task(_hold(limiter, gate, started, "first"))
+    await _settle()
+    with outbound_priority(Priority.BULK):
+        bulk = asyncio.create_task(_hold(limiter, release, started, "bulk"))
+    await _settle()
+    interactive = asyncio.create_task(_hold(limiter, release, started, "interactive"))
+    await _settle()
+
+    gate.set()
+    await first
+    await _settle()
+
+    assert started == ["first", "interactive"]
+    release.set()
+    await asyncio.gather(bulk, interactive)
+    assert started[-1] == "bulk"
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# BaseAPIClient
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+@pytest.fixture
+async def dummy_client(dummy_api_client):
+    statuses: list[int] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(statuses.pop(0) if statuses else 200, json={"ok": True})
+
+    client = dummy_api_client(handler, "LimiterDummy", max_retries=1, enable_circuit_breaker=False)
+    client.limiter = AdaptiveConcurrencyLimiter("LimiterDummy", initial_limit=4, cooldown=0)
+    return client, statuses
+
+
+async def test_client_requests_feed_their_limiter(dummy_client):
+    client, statuses = dummy_client
+    statuses.extend([503])
+
+    result = await client._make_request("a")
+
+    assert not result.success
+    assert client.limiter.capacity == 2
+    assert client.limiter.in_flight == 0
+    assert client.get_health_status()["concurrency"]["limit"] == 2
+    await client.aclose()
+
+
+async def test_client_waits_for_a_free_slot(dummy_client):
+    client, _ = dummy_client
+    await client.limiter.acquire()
+    client.limiter.limit = 1
+
+    request = asyncio.create_task(client._make_request("a"))
+    await _settle()
+    assert client.limiter.queue_depth == 1
+
+    client.limiter.release(Priority.INTERACTIVE)
+    assert (await request).success
+    await client.aclose()
+
+
+def test_axesso_clients_share_one_limiter():
+    from app.services.api_clients import AXESSOClient
+    from app.services.zillow_client import ZillowClient
+
+    zillow = ZillowClient(api_key="k")
+    axesso = AXESSOClient(api_key="k")
+
+    assert zillow.limiter is axesso.limiter is get_limiter("AXESSO")
+    assert zillow.limiter.max_limit == 50
+
+
+async def test_expired_validation_timeout_excludes_the_wait_for_a_slot(monkeypatch):
+    class _RelistedZillow:
+        limiter = AdaptiveConcurrencyLimiter("axesso-test", initial_limit=2, bulk_share=0.5)
+
+        async def search_by_address(self, address):
+            with outbound_priority(Priority.BULK):
+                async with self.limiter.slot():
+                    await asyncio.sleep(0.03)
+            return BaseAPIResponse(success=True, data={"homeStatus": "FOR_SALE"}, error=None, status_code=200)
+
+    monkeypatch.setattr(map_search_service, "EXPIRED_VALIDATION_TIMEOUT_S", 0.1)
+    service = map_search_service.MapSearchService()
+    service.zillow = _RelistedZillow()
+    candidates = [
+        MapListing(id=str(i), address=f"{i} Main St", latitude=40.0, longitude=-74.0, source="rentcast")
+        for i in range(8)
+    ]
+
+    # One bulk slot: eight lookups take ~0.24 s in turn, each well inside its timeout.
+    assert await service._filter_expired_not_relisted(candidates) == []
@@ -0,0 +1,41 @@
+"""
+Tests for the precompiled FIELD_MAPPING accessors in DataNormalizer.
+"""
+
+from datetime import UTC, datetime
+
+from app.services.api_clients import DataNormalizer, _compile_field_path
+
+
+def test_compiled_paths_resolve_plain_nested_and_latest_year_fields() -> None:
+    rentcast = {
+        "bedrooms": 3,
+        "propertyTaxes": {"2023": {"year": 2023, "total": 6100}, "2024": {"year": 2024, "total": 6471}},
+        "taxAssessments": {"notes": "n/a"},
+    }
+    axesso = {"mortgageZHLRates": {"thirtyYearFixedBucket": {"rate": 6.71}}, "rentalData": None}
+
+    assert _compile_field_path("bedrooms")(rentcast) == 3
+    assert _compile_field_path("propertyTaxes")(rentcast) == 6471
+    assert _compile_field_path("taxAssessments")(rentcast) is None
+    assert _compile_field_path("mortgageZHLRates.thirtyYearFixedBucket.rate")(axesso) == 6.71
+    assert _compile_field_path("rentalData.averageRent")(axesso) is None
+    assert _compile_field_path("bedrooms")(None) is None
+    assert _compile_field_path(None) is None
+
+
+def test_normalize_merges_mapped_fields_with_provenance() -> None:
+    timestamp = datetime(2026, 1, 1, tzinfo=UTC)
+    rentcast = {"bedrooms": 3, "squareFootage": 1850, "propertyTaxes": {"2024": {"total": 6471}}}
+    axesso = {"bedrooms": 4, "livingArea": 1864, "mortgageZHLRates": {"arm5Bucket": {"rate": 6.88}}}
+
+    normalized, provenance = DataNormalizer().normalize(rentcast, axesso, timestamp)
+
+    assert normalized["bedrooms"] == 3 * 0.6 + 4 * 0.4  # >15% apart: weighted merge
+    assert provenance["bedrooms"]["source"] == "merged"
+    assert normalized["square_footage"] == 1850
+    assert provenance["square_footage"]["raw_values"] == {"rentcast": 1850, "axesso": 1864}
+    assert normalized["property_taxes_annual"] == 6471
+    assert normalized["mortgage_rate_arm5"] == 6.88
+    assert provenance["mortgage_rate_arm5"]["fetched_at"] == timestamp.isoformat()
+    assert provenance["zestimate"]["source"] == "missing"
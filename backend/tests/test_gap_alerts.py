@@ -95,3 +95,17 @@ async def test_owned_properties_are_not_checked(db_session, watched_property, st
     result = await send_gap_alerts(db_session)
     assert result["checked"] == 0
     assert stubbed_services["pushes"] == []
+
+
+async def test_low_provider_budget_defers_the_run(db_session, watched_property, stubbed_services, monkeypatch):
+    async def no_headroom(priority):
+        return False
+
+    monkeypatch.setattr(gap_alert_jobs.property_service, "provider_budgets_allow", no_headroom)
+    stubbed_services["price"] = 450_000
+
+    result = await send_gap_alerts(db_session)
+    assert result["checked"] == 0
+    assert result["deferred"] == 1
+    await db_session.refresh(watched_property)
+    assert watched_property.price_checked_at is None
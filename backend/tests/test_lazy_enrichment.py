@@ -0,0 +1,124 @@
+"""
+Tests for deferred Zillow enrichment (``PROPERTY_LAZY_ENRICHMENT``):
+
+  1. A lazy build makes no enrichment calls and marks enrichment pending,
+     unless every part is already cached.
+  2. ``get_property_enrichment`` fetches the deferred enrichment once for
+     concurrent callers and writes it back into the cached property.
+  3. The write-back keeps the entry's TTL class instead of extending it.
+  4. Uncached properties have no enrichment.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from app.core.config import settings
+from app.services.cache_service import CacheService
+from app.services.property.cache import _PROPERTY_CACHE_DEGRADED_HARD_TTL_SECONDS
+from app.services.property_service import PropertyService, ProviderPayloads
+from app.services.single_flight import SingleFlight
+
+ADDRESS = "953 Banyan Dr, Delray Beach, FL 33483"
+ZPID = "46491558"
+
+
+class _FakeZillow:
+    """Enrichment endpoints of ``ZillowClient``; counts calls per method."""
+
+    RESPONSES = {
+        "get_price_tax_history": {"priceHistory": []},
+        "get_nearby_schools": {"schools": [{"name": "Banyan Elementary", "rating": 8}]},
+        "get_accessibility_scores": {"walkScore": 72, "transitScore": 30, "bikeScore": 55},
+        "get_zestimate_history": {},
+    }
+
+    def __init__(self) -> None:
+        self.calls: dict[str, int] = {}
+
+    def __getattr__(self, method: str):
+        if method not in self.RESPONSES:
+            raise AttributeError(method)
+
+        async def call(zpid: str) -> SimpleNamespace:
+            self.calls[method] = self.calls.get(method, 0) + 1
+            await asyncio.sleep(0.01)
+            data = self.RESPONSES[method]
+            return SimpleNamespace(success=True, data=data, status_code=200)
+
+        return call
+
+
+@pytest.fixture
+def service(monkeypatch) -> PropertyService:
+    monkeypatch.setattr(settings, "PROPERTY_LAZY_ENRICHMENT", True)
+    svc = PropertyService()
+    svc._cache = CacheService(redis_url=None)
+    svc._search_flight = SingleFlight(svc._cache)
+    svc.airroi = None
+    svc.zillow = _FakeZillow()
+    return svc
+
+
+async def _build(svc: PropertyService):
+    payloads = ProviderPayloads(axesso={"zpid": ZPID, "price": 300000}, zillow_zpid=ZPID)
+    response, source = await svc._build_property_response(ADDRESS, payloads, zpid=None, insurance_pct=0.01, timings={})
+    await svc._cache_property_response(ADDRESS, response, source)
+    return response
+
+
+async def test_lazy_build_defers_enrichment(service):
+    response = await _build(service)
+
+    assert response.data_quality.enrichment_pending
+    assert response.nearby_schools is None
+    assert service.zillow.calls == {}
+
+
+async def test_lazy_build_uses_fully_cached_enrichment(service):
+    await service._fetch_zillow_enrichment(ZPID)
+    service.zillow.calls.clear()
+
+    response = await _build(service)
+
+    assert not response.data_quality.enrichment_pending
+    assert response.market.walk_score == 72
+    assert service.zillow.calls == {}
+
+
+async def test_enrichment_endpoint_fetches_once_and_writes_back(service):
+    response = await _build(service)
+
+    results = await asyncio.gather(*(service.get_property_enrichment(response.property_id) for _ in range(3)))
+
+    assert all(r.walk_score == 72 for r in results)
+    assert results[0].nearby_schools
+    assert all(count == 1 for count in service.zillow.calls.values())
+    cached = await service.get_cached_property(response.property_id)
+    assert not cached.data_quality.enrichment_pending
+    assert cached.market.transit_score == 30
+
+    await service.get_property_enrichment(response.property_id)
+    assert all(count == 1 for count in service.zillow.calls.values())
+
+
+async def test_enrichment_write_back_keeps_the_degraded_ttl(service, monkeypatch):
+    service.redfin = object()  # Redfin configured but no estimate: degraded entry
+    response = await _build(service)
+    assert response.valuations.redfin_estimate is None
+    ttls = []
+    set_property = service._cache.set_property_by_id
+
+    async def spy(property_id, payload, ttl_seconds=None):
+        ttls.append(ttl_seconds)
+        return await set_property(property_id, payload, ttl_seconds=ttl_seconds)
+
+    monkeypatch.setattr(service._cache, "set_property_by_id", spy)
+    await service.get_property_enrichment(response.property_id)
+
+    assert ttls and all(0 < ttl <= _PROPERTY_CACHE_DEGRADED_HARD_TTL_SECONDS for ttl in ttls)
+
+
+async def test_uncached_property_has_no_enrichment(service):
+    assert await service.get_property_enrichment("missing") is None
@@ -0,0 +1,316 @@
+"""
+Tests for the two-tier cache:
+
+  1. ``LocalLRUCache`` evicts least-recently-used entries to stay within its
+     byte budget, rejects oversized entries and expires by TTL.
+  2. Hot key prefixes are served from L1 without a Redis round trip, with
+     TTLs capped per prefix; other keys always go to Redis.
+  3. Deletes drop the local copy and publish an invalidation; the listener
+     drops keys published by other workers.
+  4. The in-memory fallback is bounded by the same LRU.
+  5. ``get_many`` / ``set_many`` / ``delete_many`` take one round trip per
+     Redis pool and behave the same in the memory fallback.
+"""
+
+import asyncio
+from unittest.mock import patch
+
+from app.services.cache_service import INVALIDATION_CHANNEL, CacheService
+from app.services.local_cache import LocalLRUCache
+
+# ─────────────────────────────────────────────────────────────────────────────
+# LocalLRUCache
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+def test_evicts_least_recently_used_to_fit_budget():
+    lru = LocalLRUCache(max_bytes=30, max_item_bytes=30)
+    lru.set("a", b"x" * 10, 60)
+    lru.set("b", b"x" * 10, 60)
+    lru.set("c", b"x" * 10, 60)
+    assert lru.get("a") is not None  # "b" is now the least recently used
+
+    lru.set("d", b"x" * 10, 60)
+
+    assert "b" not in lru
+    assert {k for k in "acd" if k in lru} == {"a", "c", "d"}
+    assert lru.bytes_used == 30
+
+
+def test_rejects_oversized_entries_and_drops_previous_value():
+    lru = LocalLRUCache(max_bytes=100, max_item_bytes=10)
+    lru.set("k", b"small", 60)
+
+    assert lru.set("k", b"x" * 11, 60) is False
+    assert "k" not in lru
+    assert lru.bytes_used == 0
+
+
+def test_entries_expire():
+    lru = LocalLRUCache(max_bytes=100)
+    with patch("app.services.local_cache.time.monotonic", return_value=1000.0):
+        lru.set("k", b"v", 5)
+        lru.set("other", b"v", 60)
+    with patch("app.services.local_cache.time.monotonic", return_value=1005.0):
+        assert lru.get("k") is None
+        assert lru.purge_expired() == 0
+        assert len(lru) == 1
+    assert lru.bytes_used == 1
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# L1 in front of Redis
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+class _FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.queued: list[tuple[str, bytes | str]] = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def setex(self, key, ttl, value):
+        self.queued.append((key, value))
+
+    async def execute(self):
+        self.redis.round_trips += 1
+        self.redis.store.update(self.queued)
+
+
+class _FakeRedis:
+    def __init__(self):
+        self.store: dict[str, bytes | str] = {}
+        self.gets = 0
+        self.round_trips = 0
+        self.published: list[tuple[str, str]] = []
+
+    async def get(self, key):
+        self.gets += 1
+        return self.store.get(key)
+
+    async def mget(self, keys):
+        self.round_trips += 1
+        return [self.store.get(key) for key in keys]
+
+    async def setex(self, key, ttl, value):
+        self.store[key] = value
+
+    def pipeline(self, transaction=True):
+        return _FakePipeline(self)
+
+    async def delete(self, *keys):
+        self.round_trips += 1
+        for key in keys:
+            self.store.pop(key, None)
+
+    async def publish(self, channel, message):
+        self.published.append((channel, message))
+
+
+def _redis_backed_cache() -> tuple[CacheService, _FakeRedis]:
+    cache = CacheService(redis_url=None)
+    redis = _FakeRedis()
+    cache.use_redis = True
+    cache.redis_client = redis
+    cache._redis_binary = redis
+    return cache, redis
+
+
+async def test_hot_keys_are_served_from_l1():
+    cache, redis = _redis_backed_cache()
+    redis.store["defaults:assumptions"] = '{"a": 1}'
+
+    assert await cache.get("defaults:assumptions") == {"a": 1}
+    assert await cache.get("defaults:assumptions") == {"a": 1}
+    assert redis.gets == 1
+
+
+async def test_other_keys_always_read_redis():
+    cache, redis = _redis_backed_cache()
+    await cache.set("calc:abc:123", {"a": 1}, 3600)
+
+    assert await cache.get("calc:abc:123") == {"a": 1}
+    assert redis.gets == 1
+    assert "calc:abc:123" not in cache._memory_cache
+
+
+async def test_l1_ttl_is_capped_per_prefix():
+    cache, _ = _redis_backed_cache()
+    with patch("app.services.local_cache.time.monotonic", return_value=1000.0):
+        await cache.set("defaults:assumptions", {"a": 1}, 600)
+    with patch("app.services.local_cache.time.monotonic", return_value=1061.0):
+        assert "defaults:assumptions" not in cache._memory_cache
+
+
+async def test_l1_copies_are_independent():
+    cache, _ = _redis_backed_cache()
+    await cache.set("defaults:assumptions", {"a": [1]}, 600)
+
+    (await cache.get("defaults:assumptions"))["a"].append(2)
+
+    assert await cache.get("defaults:assumptions") == {"a": [1]}
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Invalidation
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+async def test_delete_drops_l1_and_publishes():
+    cache, redis = _redis_backed_cache()
+    await cache.set("defaults:assumptions", {"a": 1}, 600)
+
+    await cache.delete("defaults:assumptions")
+
+    assert await cache.get("defaults:assumptions") is None
+    assert redis.published == [(INVALIDATION_CHANNEL, "defaults:assumptions")]
+
+
+async def test_delete_of_non_l1_key_is_not_published():
+    cache, redis = _redis_backed_cache()
+    await cache.delete("calc:abc:123")
+    assert redis.published == []
+
+
+async def test_clear_property_cache_publishes_address_key():
+    cache, redis = _redis_backed_cache()
+    address = "953 Banyan Dr, Delray Beach, FL 33483"
+    await cache.set_property(address, {"property_id": "abc123"})
+    assert await cache.get_property(address) == {"property_id": "abc123"}
+
+    await cache.clear_property_cache(address)
+
+    assert await cache.get_property(address) is None
+    assert redis.published == [(INVALIDATION_CHANNEL, CacheService.property_key(address))]
+
+
+class _FakePubSub:
+    def __init__(self, messages):
+        self.messages = list(messages)
+        self.subscribed: list[str] = []
+
+    async def subscribe(self, channel):
+        self.subscribed.append(channel)
+
+    async def get_message(self, ignore_subscribe_messages=False, timeout=0.0):
+        if self.messages:
+            return self.messages.pop(0)
+        await asyncio.sleep(0.01)
+        return None
+
+    async def reset(self):
+        pass
+
+
+async def test_listener_drops_keys_published_by_other_workers():
+    cache, redis = _redis_backed_cache()
+    pubsub = _FakePubSub([])
+    redis.pubsub = lambda: pubsub
+
+    await cache.start_invalidation_listener()
+    await asyncio.sleep(0.02)
+    await cache.set("defaults:assumptions", {"a": 1}, 600)
+    await cache.set("provider:v1:rentcast:abc", {"b": 2}, 600)
+    pubsub.messages.append({"type": "message", "data": "defaults:assumptions"})
+    await asyncio.sleep(0.05)
+
+    assert pubsub.subscribed == [INVALIDATION_CHANNEL]
+    assert "defaults:assumptions" not in cache._memory_cache
+    assert "provider:v1:rentcast:abc" in cache._memory_cache
+
+    pubsub.messages.append({"type": "message", "data": "*"})
+    await asyncio.sleep(0.05)
+    assert len(cache._memory_cache) == 0
+    await cache.close()
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# In-memory fallback
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+async def test_memory_fallback_is_bounded():
+    cache = CacheService(redis_url=None)
+    cache._memory_cache = LocalLRUCache(max_bytes=200, max_item_bytes=200)
+
+    for i in range(20):
+        await cache.set(f"calc:{i}", {"value": "x" * 20}, 3600)
+
+    assert cache._memory_cache.bytes_used <= 200
+    assert await cache.get("calc:0") is None
+    assert await cache.get("calc:19") == {"value": "x" * 20}
+
+
+async def test_memory_fallback_locks():
+    cache = CacheService(redis_url=None)
+    token = await cache.acquire_lock("lock:a", 30)
+
+    assert token is not None
+    assert await cache.acquire_lock("lock:a", 30) is None
+    assert await cache.release_lock("lock:a", "wrong") is False
+    assert await cache.release_lock("lock:a", token) is True
+    assert await cache.acquire_lock("lock:a", 30) is not None
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Batched operations
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+async def test_set_many_and_get_many_take_one_round_trip():
+    cache, redis = _redis_backed_cache()
+    items = {f"calc:{i}": {"value": i} for i in range(5)}
+
+    assert await cache.set_many(items, 3600) is True
+    assert redis.round_trips == 1
+
+    found = await cache.get_many([*items, "calc:missing"])
+    assert found == items
+    assert redis.round_trips == 2
+
+
+async def test_get_many_serves_l1_keys_locally():
+    cache, redis = _redis_backed_cache()
+    await cache.set("defaults:assumptions", {"a": 1}, 600)
+    await cache.set("calc:1", {"b": 2}, 600)
+
+    found = await cache.get_many(["defaults:assumptions", "calc:1"])
+
+    assert found == {"defaults:assumptions": {"a": 1}, "calc:1": {"b": 2}}
+    assert redis.round_trips == 1
+
+
+async def test_set_property_writes_blob_and_pointer_in_one_pipeline():
+    cache, redis = _redis_backed_cache()
+    address = "953 Banyan Dr, Delray Beach, FL 33483"
+
+    await cache.set_property(address, {"property_id": "abc123"})
+
+    assert redis.round_trips == 2  # one pipeline per pool: binary blob, text pointer
+    assert redis.store[CacheService.property_key(address)] == '"abc123"'
+    assert redis.store[CacheService.property_id_key("abc123")][:1] == b"\x01"
+
+
+async def test_delete_many_deletes_and_publishes_l1_keys():
+    cache, redis = _redis_backed_cache()
+    await cache.set_many({"provider:v1:rentcast:a": [1], "calc:1": 1}, 600)
+
+    await cache.delete_many(["provider:v1:rentcast:a", "calc:1"])
+
+    assert redis.store == {}
+    assert redis.published == [(INVALIDATION_CHANNEL, "provider:v1:rentcast:a")]
+    assert await cache.get("provider:v1:rentcast:a") is None
+
+
+async def test_batched_operations_in_memory_fallback():
+    cache = CacheService(redis_url=None)
+    await cache.set_many({"a": 1, "b": {"c": 2}}, 60)
+
+    assert await cache.get_many(["a", "b", "z"]) == {"a": 1, "b": {"c": 2}}
+    assert await cache.delete_many(["a"]) is True
+    assert await cache.get_many(["a", "b"]) == {"b": {"c": 2}}
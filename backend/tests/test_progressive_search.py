@@ -0,0 +1,163 @@
+"""
+Tests for progressive property search (``search_property_progressive``):
+
+  1. A cold search yields a partial preview as each provider but the last
+     answers, then the complete response; previews skip AirROI and enrichment.
+  2. A provider that answers without data yields no preview.
+  3. A cached search yields only the complete response.
+  4. The stream endpoint charges the search once, before the first partial
+     preview (or the complete property when there is none), so a client
+     that disconnects early is still metered.
+"""
+
+import asyncio
+import sys
+from contextlib import asynccontextmanager
+from typing import Any
+
+import pytest
+
+from app.routers import property as property_router
+from app.schemas.property import AllAssumptions, PropertySearchRequest
+from app.services.cache_service import CacheService
+from app.services.property.cache import CACHE_FRESH
+from app.services.property_service import PropertyService
+from app.services.single_flight import SingleFlight
+
+property_service_module = sys.modules[PropertyService.__module__]
+
+ADDRESS = "953 Banyan Dr, Delray Beach, FL 33483"
+
+_DELAYS = {"rentcast": 0.01, "axesso": 0.02, "redfin": 0.03, "realtor": 0.04, "mashvisor": 0.05}
+
+
+@pytest.fixture
+def service(monkeypatch) -> tuple[PropertyService, dict[str, Any]]:
+    svc = PropertyService()
+    svc._cache = CacheService(redis_url=None)
+    svc._search_flight = SingleFlight(svc._cache)
+    state: dict[str, Any] = {"builds": [], "empty": set()}
+
+    def fake_provider(name, result):
+        async def fetch(*args, **kwargs):
+            await asyncio.sleep(_DELAYS[name])
+            if name in state["empty"]:
+                return (None,) * (len(result) - 1) + (result[-1],)
+            return result
+
+        return fetch
+
+    async def fixed_insurance_pct() -> float:
+        return 0.01
+
+    async def fake_build(address, payloads, *, zpid, insurance_pct, timings, preview=False):
+        state["builds"].append((payloads, preview))
+        return svc.get_mock_property(), None
+
+    monkeypatch.setattr(svc, "_resolve_insurance_pct", fixed_insurance_pct)
+    monkeypatch.setattr(svc, "_build_property_response", fake_build)
+    monkeypatch.setattr(svc, "_fetch_rentcast_provider", fake_provider("rentcast", ({"price": 1}, 5.0)))
+    monkeypatch.setattr(svc, "_fetch_zillow_provider", fake_provider("axesso", ({"zpid": "1"}, "1", 5.0)))
+    monkeypatch.setattr(svc, "_fetch_redfin_provider", fake_provider("redfin", ({"redfin_estimate": 1}, 5.0)))
+    monkeypatch.setattr(svc, "_fetch_realtor_provider", fake_provider("realtor", ({"realtor_estimate": 1}, 5.0)))
+    monkeypatch.setattr(svc, "_fetch_mashvisor_provider", fake_provider("mashvisor", ({"str_adr": 1}, 5.0)))
+    return svc, state
+
+
+async def _collect(svc: PropertyService) -> list[tuple[str, Any]]:
+    return [event async for event in svc.search_property_progressive(ADDRESS)]
+
+
+async def test_cold_search_streams_a_preview_per_provider(service):
+    svc, state = service
+
+    events = await asyncio.wait_for(_collect(svc), timeout=1.0)
+
+    stages = [stage for stage, _ in events]
+    assert stages == ["rentcast", "axesso", "redfin", "realtor", "complete"]
+    first = events[0][1]
+    assert first.data_quality.is_partial
+    assert first.data_quality.pending_sources == ["axesso", "mashvisor", "realtor", "redfin"]
+    assert events[3][1].data_quality.pending_sources == ["mashvisor"]
+    assert not events[-1][1].data_quality.is_partial
+
+    previews = [payloads for payloads, preview in state["builds"] if preview]
+    assert previews[0].rentcast == {"price": 1} and previews[0].axesso is None
+    assert previews[1].zillow_zpid == "1"
+    assert [preview for _, preview in state["builds"]] == [True] * 4 + [False]
+
+
+async def test_provider_without_data_yields_no_preview(service):
+    svc, state = service
+    state["empty"].add("redfin")
+
+    events = await asyncio.wait_for(_collect(svc), timeout=1.0)
+
+    stages = [stage for stage, _ in events]
+    assert stages == ["rentcast", "axesso", "realtor", "complete"]
+    assert events[-2][1].data_quality.pending_sources == ["mashvisor"]
+
+
+async def test_cached_search_yields_only_the_complete_response(service, monkeypatch):
+    svc, state = service
+    # The mock property lacks the IQ estimate fields a real cache entry needs.
+    monkeypatch.setattr(property_service_module, "_classify_cached_property", lambda *a, **kw: (CACHE_FRESH, None))
+    await svc.search_property(ADDRESS)
+    state["builds"].clear()
+
+    events = await _collect(svc)
+
+    assert [stage for stage, _ in events] == ["complete"]
+    assert state["builds"] == []
+
+
+async def _open_stream(svc: PropertyService, monkeypatch) -> tuple[Any, list[str]]:
+    """Start ``POST /properties/search/stream`` for an anonymous caller; returns its frames and the charges."""
+    charged: list[str] = []
+
+    async def preflight(*args):
+        return False, None, None
+
+    async def assumptions(*args, **kwargs):
+        return AllAssumptions()
+
+    async def charge(db, user, full_address, metering):
+        charged.append(full_address)
+
+    @asynccontextmanager
+    async def session():
+        yield None
+
+    monkeypatch.setattr(property_router, "property_service", svc)
+    monkeypatch.setattr(property_router, "_preflight_search_metering", preflight)
+    monkeypatch.setattr(property_router, "resolve_assumptions", assumptions)
+    monkeypatch.setattr(property_router, "_charge_search", charge)
+    monkeypatch.setattr(property_router, "get_session_factory", lambda: session)
+
+    response = await property_router.search_property_stream(
+        PropertySearchRequest(address=ADDRESS), http_request=None, db=None, current_user=None
+    )
+    return response.body_iterator, charged
+
+
+async def test_stream_charges_once_before_sending_the_property(service, monkeypatch):
+    svc, _ = service
+    events, charged = await _open_stream(svc, monkeypatch)
+
+    async for frame in events:
+        if frame.startswith("event: property"):
+            break
+    await events.aclose()  # client disconnects on the complete property
+
+    assert charged == [ADDRESS]
+
+
+async def test_stream_charges_before_the_first_partial(service, monkeypatch):
+    svc, _ = service
+    events, charged = await _open_stream(svc, monkeypatch)
+
+    frame = await anext(events)
+    await events.aclose()  # client disconnects on the first preview
+
+    assert frame.startswith("event: partial")
+    assert charged == [ADDRESS]
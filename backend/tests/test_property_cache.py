@@ -2,10 +2,27 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+
+from app.services.cache_service import CacheService
 from app.services.property.cache import (
+    _PROPERTY_CACHE_EXTRACTION_VERSION,
     _PROPERTY_CACHE_FORMULA_VERSION,
+    _PROPERTY_CACHE_NAMESPACE,
+    _ZILLOW_ENRICHMENT_REFRESH_SECONDS,
+    CACHE_FRESH,
+    CACHE_INVALID,
+    CACHE_REVALIDATE,
+    _classify_cached_property,
     _should_invalidate_cache,
+    _stale_providers,
+    _upgrade_cached_property,
 )
+from app.services.property_service import PropertyService
+from app.services.single_flight import SingleFlight
 
 
 def _base_good_payload() -> dict:
@@ -117,3 +134,387 @@ def test_str_provider_skip_not_invalidated() -> None:
         payload, redfin_enabled=False, str_estimates_enabled=True
     )
     assert should is False
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Stale-while-revalidate classification
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+def _hours_ago(hours: float) -> str:
+    return (datetime.now(UTC) - timedelta(hours=hours)).isoformat()
+
+
+def test_recent_payload_is_fresh() -> None:
+    payload = _base_good_payload()
+    payload["fetched_at"] = _hours_ago(1)
+    assert _classify_cached_property(payload, redfin_enabled=False) == (CACHE_FRESH, None)
+
+
+def test_payload_past_soft_ttl_is_revalidated_not_invalidated() -> None:
+    payload = _base_good_payload()
+    payload["fetched_at"] = _hours_ago(7)
+    state, reason = _classify_cached_property(payload, redfin_enabled=False)
+    assert state == CACHE_REVALIDATE
+    assert reason == "soft TTL exceeded"
+
+
+def test_provider_absent_retry_is_served_stale() -> None:
+    """Redfin missing for > 4h: still servable, refresh in the background."""
+    payload = _base_good_payload()
+    payload["fetched_at"] = _hours_ago(5)
+    state, reason = _classify_cached_property(payload, redfin_enabled=True)
+    assert state == CACHE_REVALIDATE
+    assert reason == "Redfin data absent > 4h"
+
+
+def test_structural_problem_wins_over_absent_retry() -> None:
+    """A legacy formula version must re-fetch synchronously even when a
+    provider-absent retry would also apply."""
+    payload = _base_good_payload()
+    payload["fetched_at"] = _hours_ago(5)
+    payload["valuation_formula_version"] = "10"
+    state, reason = _classify_cached_property(payload, redfin_enabled=True)
+    assert state == CACHE_INVALID
+    assert reason == "pre-valuation-snapshot-v5"
+
+
+def test_missing_entry_is_invalid() -> None:
+    assert _classify_cached_property(None)[0] == CACHE_INVALID
+
+
+async def test_stale_hit_served_immediately_with_one_background_refresh(monkeypatch) -> None:
+    svc = PropertyService()
+    svc._cache = CacheService(redis_url=None)
+    svc._search_flight = SingleFlight(svc._cache)
+    svc.redfin = None
+
+    async def fixed_insurance_pct() -> float:
+        return 0.01
+
+    refreshed = asyncio.Event()
+    refreshes = 0
+
+    async def fake_fetch_and_cache(address, zpid, insurance_pct, timings, **kwargs):
+        nonlocal refreshes
+        refreshes += 1
+        await asyncio.sleep(0.01)
+        refreshed.set()
+        return svc.get_mock_property()
+
+    monkeypatch.setattr(svc, "_resolve_insurance_pct", fixed_insurance_pct)
+    monkeypatch.setattr(svc, "_fetch_and_cache_property", fake_fetch_and_cache)
+
+    address = "953 Banyan Dr, Delray Beach, FL 33483"
+    stale = svc.get_mock_property().model_dump(mode="json")
+    stale["valuation_formula_version"] = _PROPERTY_CACHE_FORMULA_VERSION
+    stale["valuations"].update(zestimate=506900, value_iq_estimate=500000)
+    stale["zpid"] = "46491558"
+    stale["listing"] = {"listing_status": "FOR_SALE"}
+    stale["fetched_at"] = _hours_ago(7)
+    await svc._cache.set_property(address, stale)
+
+    first = await svc.search_property(address)
+    second = await svc.search_property(address)
+    assert first.property_id == stale["property_id"]
+    assert second.property_id == stale["property_id"]
+
+    await asyncio.wait_for(refreshed.wait(), timeout=1)
+    assert refreshes == 1
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Versioned namespaces + lazy migration
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+def test_namespace_follows_formula_and_extraction_versions() -> None:
+    assert _PROPERTY_CACHE_NAMESPACE == f"v{_PROPERTY_CACHE_FORMULA_VERSION}.{_PROPERTY_CACHE_EXTRACTION_VERSION}"
+    address = "953 Banyan Dr, Delray Beach, FL 33483"
+    assert CacheService.property_key(address).startswith(f"property:{_PROPERTY_CACHE_NAMESPACE}:")
+    assert CacheService.property_key(address, namespace="") == CacheService.generate_key("property", address)
+    assert CacheService.property_id_key("abc", namespace="") == "prop_id:abc"
+
+
+def test_upgrade_keeps_current_formula_entry_and_stamps_extraction() -> None:
+    upgraded = _upgrade_cached_property(_base_good_payload())
+    assert upgraded is not None
+    assert upgraded["extraction_version"] == _PROPERTY_CACHE_EXTRACTION_VERSION
+
+
+def test_upgrade_rejects_other_formula_or_extraction_version() -> None:
+    payload = _base_good_payload()
+    payload["valuation_formula_version"] = "10"
+    assert _upgrade_cached_property(payload) is None
+
+    payload = _base_good_payload()
+    payload["extraction_version"] = "0"
+    assert _upgrade_cached_property(payload) is None
+
+
+async def test_pre_namespace_entry_is_migrated_without_refetch(monkeypatch) -> None:
+    svc = PropertyService()
+    svc._cache = CacheService(redis_url=None)
+    svc._search_flight = SingleFlight(svc._cache)
+    svc.redfin = None
+
+    async def fixed_insurance_pct() -> float:
+        return 0.01
+
+    async def no_fetch(*args, **kwargs):
+        raise AssertionError("providers must not be called for a migratable entry")
+
+    monkeypatch.setattr(svc, "_resolve_insurance_pct", fixed_insurance_pct)
+    monkeypatch.setattr(svc, "_fetch_and_cache_property", no_fetch)
+
+    address = "953 Banyan Dr, Delray Beach, FL 33483"
+    legacy = svc.get_mock_property().model_dump(mode="json")
+    legacy["valuation_formula_version"] = _PROPERTY_CACHE_FORMULA_VERSION
+    legacy["valuations"].update(zestimate=506900, value_iq_estimate=500000)
+    legacy["zpid"] = "46491558"
+    legacy["listing"] = {"listing_status": "FOR_SALE"}
+    legacy["fetched_at"] = _hours_ago(1)
+    # Pre-namespace layout: full payload inline under the address key.
+    await svc._cache.set(CacheService.property_key(address, namespace=""), legacy)
+
+    result = await svc.search_property(address)
+    assert result.property_id == legacy["property_id"]
+
+    migrated = await svc._cache.get_property(address)
+    assert migrated["extraction_version"] == _PROPERTY_CACHE_EXTRACTION_VERSION
+    assert await svc._cache.get_property_by_id(legacy["property_id"]) is not None
+    assert (await svc.get_cached_property(legacy["property_id"])).property_id == legacy["property_id"]
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Provider-level raw payload cache
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+def test_stale_reason_names_only_the_responsible_provider() -> None:
+    assert _stale_providers("hoa_fees_monthly missing on HOA-likely property") == {"axesso"}
+    assert _stale_providers("Redfin data absent > 4h") == {"redfin"}
+    assert _stale_providers("pre-valuation-snapshot-v5") == frozenset()
+    assert _stale_providers("soft TTL exceeded") == frozenset()
+    assert _stale_providers("IQ estimate data missing") == {"rentcast", "axesso", "redfin", "realtor", "mashvisor"}
+
+
+async def test_missing_hoa_refetches_only_axesso(monkeypatch) -> None:
+    svc = PropertyService()
+    svc._cache = CacheService(redis_url=None)
+    svc._search_flight = SingleFlight(svc._cache)
+    calls: dict[str, int] = {}
+
+    def fake_provider(name, result):
+        async def fetch(*args, **kwargs):
+            calls[name] = calls.get(name, 0) + 1
+            return result
+
+        return fetch
+
+    async def fixed_insurance_pct() -> float:
+        return 0.01
+
+    async def fake_build(address, payloads, *, zpid, insurance_pct, timings):
+        return svc.get_mock_property(), None
+
+    monkeypatch.setattr(svc, "_resolve_insurance_pct", fixed_insurance_pct)
+    monkeypatch.setattr(svc, "_build_property_response", fake_build)
+    monkeypatch.setattr(svc, "_fetch_rentcast_provider", fake_provider("rentcast", ({"price": 1}, 5.0)))
+    monkeypatch.setattr(svc, "_fetch_zillow_provider", fake_provider("axesso", ({"zpid": "1"}, "1", 5.0)))
+    monkeypatch.setattr(svc, "_fetch_redfin_provider", fake_provider("redfin", ({"redfin_estimate": 1}, 5.0)))
+    monkeypatch.setattr(svc, "_fetch_realtor_provider", fake_provider("realtor", ({"realtor_estimate": 1}, 5.0)))
+    monkeypatch.setattr(svc, "_fetch_mashvisor_provider", fake_provider("mashvisor", ({"str_adr": 1}, 5.0)))
+
+    address = "953 Banyan Dr, Delray Beach, FL 33483"
+    await svc.search_property(address)
+    assert calls == {"rentcast": 1, "axesso": 1, "redfin": 1, "realtor": 1, "mashvisor": 1}
+
+    condo = _base_good_payload()
+    condo["details"]["property_type"] = "Condo"
+    await svc._cache.set_property(address, condo)
+
+    await svc.search_property(address)
+    assert calls == {"rentcast": 1, "axesso": 2, "redfin": 1, "realtor": 1, "mashvisor": 1}
+
+
+class _FakeZillow:
+    """Enrichment endpoints of ``ZillowClient``; counts calls per method."""
+
+    def __init__(self) -> None:
+        self.calls: dict[str, int] = {}
+        self.status = {"get_nearby_schools": 404}
+
+    def __getattr__(self, method: str):
+        if not method.startswith("get_"):
+            raise AttributeError(method)
+
+        async def call(zpid: str) -> SimpleNamespace:
+            self.calls[method] = self.calls.get(method, 0) + 1
+            status = self.status.get(method, 200)
+            data = {"walkScore": 80} if method == "get_accessibility_scores" else None
+            return SimpleNamespace(success=status == 200 and data is not None, data=data, status_code=status)
+
+        return call
+
+
+async def test_zillow_enrichment_is_cached_per_zpid() -> None:
+    svc = PropertyService()
+    svc._cache = CacheService(redis_url=None)
+    svc._search_flight = SingleFlight(svc._cache)
+    svc.zillow = _FakeZillow()
+    svc.zillow.status["get_zestimate_history"] = 503
+
+    first, _ = await svc._fetch_zillow_enrichment("46491558")
+    second, _ = await svc._fetch_zillow_enrichment("46491558")
+
+    assert first["walk_score"] == second["walk_score"] == 80
+    assert second["nearby_schools"] == []
+    # Scores and the 404 are cached; the failed zestimate history is retried.
+    assert svc.zillow.calls == {
+        "get_price_tax_history": 2,
+        "get_nearby_schools": 1,
+        "get_accessibility_scores": 1,
+        "get_zestimate_history": 2,
+    }
+
+
+async def test_stale_zillow_enrichment_is_served_then_refreshed() -> None:
+    svc = PropertyService()
+    svc._cache = CacheService(redis_url=None)
+    svc._search_flight = SingleFlight(svc._cache)
+    svc.zillow = _FakeZillow()
+    key = svc._zillow_enrichment_key("accessibility_scores", "46491558")
+    old = time.time() - _ZILLOW_ENRICHMENT_REFRESH_SECONDS["accessibility_scores"] - 1
+    await svc._cache.set(key, {"data": {"walk_score": 10}, "fetched_at": old})
+
+    served, _ = await svc._fetch_zillow_enrichment("46491558")
+    assert served["walk_score"] == 10
+    assert "get_accessibility_scores" not in svc.zillow.calls
+
+    await svc._search_flight._inflight["enrich:46491558"]
+    assert svc.zillow.calls["get_accessibility_scores"] == 1
+    assert (await svc._cache.get(key))["data"] == {"walk_score": 80, "transit_score": None, "bike_score": None}
+
+
+def _fake_providers(svc: PropertyService, monkeypatch, calls: dict[str, int]) -> None:
+    def fake_provider(name, result):
+        async def fetch(*args, **kwargs):
+            calls[name] = calls.get(name, 0) + 1
+            return result
+
+        return fetch
+
+    monkeypatch.setattr(svc, "_fetch_rentcast_provider", fake_provider("rentcast", ({"price": 1}, 5.0)))
+    monkeypatch.setattr(svc, "_fetch_zillow_provider", fake_provider("axesso", ({"zpid": "1"}, "1", 5.0)))
+    monkeypatch.setattr(svc, "_fetch_redfin_provider", fake_provider("redfin", ({"redfin_estimate": 1}, 5.0)))
+    monkeypatch.setattr(svc, "_fetch_realtor_provider", fake_provider("realtor", ({"realtor_estimate": 1}, 5.0)))
+    monkeypatch.setattr(svc, "_fetch_mashvisor_provider", fake_provider("mashvisor", ({"str_adr": 1}, 5.0)))
+
+
+async def test_rebuild_from_cached_payloads_keeps_the_oldest_fetch_time(monkeypatch) -> None:
+    svc = PropertyService()
+    svc._cache = CacheService(redis_url=None)
+    calls: dict[str, int] = {}
+    _fake_providers(svc, monkeypatch, calls)
+    address = "953 Banyan Dr, Delray Beach, FL 33483"
+    old = datetime.now(UTC) - timedelta(hours=20)
+    await svc._cache.set(
+        svc._provider_payload_key("rentcast", address),
+        {"payload": [{"price": 1}], "fetched_at": old.isoformat()},
+        3600,
+    )
+
+    payloads = await svc._fetch_provider_payloads(address, None, {})
+    assert payloads.fetched_at == old
+    assert "rentcast" not in calls
+
+    # A soft-TTL refresh re-buys parts older than the soft TTL.
+    payloads = await svc._fetch_provider_payloads(address, None, {}, max_age_seconds=6 * 3600)
+    assert calls["rentcast"] == 1
+    assert datetime.now(UTC) - payloads.fetched_at < timedelta(minutes=1)
+
+
+def test_absent_retry_waits_from_the_last_retry() -> None:
+    payload = _base_good_payload()
+    payload["fetched_at"] = _hours_ago(5)
+    payload["absent_retry_at"] = _hours_ago(1)
+    assert _classify_cached_property(payload, redfin_enabled=True)[0] == CACHE_FRESH
+
+    payload["absent_retry_at"] = _hours_ago(4.5)
+    assert _classify_cached_property(payload, redfin_enabled=True) == (CACHE_REVALIDATE, "Redfin data absent > 4h")
+
+
+async def test_zillow_less_property_is_retried_once_per_window(monkeypatch) -> None:
+    svc = PropertyService()
+    svc._cache = CacheService(redis_url=None)
+    svc._search_flight = SingleFlight(svc._cache)
+    svc.redfin = svc.airroi = None
+    calls: dict[str, int] = {}
+    _fake_providers(svc, monkeypatch, calls)
+    address = "953 Banyan Dr, Delray Beach, FL 33483"
+
+    entry = svc.get_mock_property().model_dump(mode="json")
+    entry["valuation_formula_version"] = _PROPERTY_CACHE_FORMULA_VERSION
+    entry["zpid"] = None
+    entry["valuations"].update(zestimate=None, value_iq_estimate=500000)
+    entry["listing"] = {"listing_status": "FOR_SALE"}
+    entry["fetched_at"] = _hours_ago(5)
+
+    async def fixed_insurance_pct() -> float:
+        return 0.01
+
+    async def fake_build(address, payloads, *, zpid, insurance_pct, timings):
+        # Zillow still has nothing; the rebuild is as old as its oldest payload.
+        return svc.get_mock_property().model_validate({**entry, "fetched_at": payloads.fetched_at}), None
+
+    monkeypatch.setattr(svc, "_resolve_insurance_pct", fixed_insurance_pct)
+    monkeypatch.setattr(svc, "_build_property_response", fake_build)
+    await svc._cache.set(
+        svc._provider_payload_key("rentcast", address),
+        {"payload": [{"price": 1}, 5.0], "fetched_at": _hours_ago(5)},
+        3600,
+    )
+    await svc._cache.set_property(address, entry)
+    refresh_key = f"refresh:{CacheService.property_key(address)}"
+
+    for _ in range(2):
+        await svc.search_property(address)
+        if svc._search_flight.in_flight(refresh_key):
+            await svc._search_flight._inflight[refresh_key]
+
+    assert calls["axesso"] == 1
+    assert "rentcast" not in calls
+
+
+async def test_clear_cached_property_drops_provider_payloads(monkeypatch) -> None:
+    svc = PropertyService()
+    svc._cache = CacheService(redis_url=None)
+    calls: dict[str, int] = {}
+    _fake_providers(svc, monkeypatch, calls)
+    address = "953 Banyan Dr, Delray Beach, FL 33483"
+
+    await svc._fetch_provider_payloads(address, None, {})
+    await svc._cache.set_property(address, _base_good_payload())
+    await svc.clear_cached_property(address)
+
+    assert await svc._cache.get_property(address) is None
+    await svc._fetch_provider_payloads(address, None, {})
+    assert calls == {"rentcast": 2, "axesso": 2, "redfin": 2, "realtor": 2, "mashvisor": 2}
+
+
+async def test_cached_property_is_fresh_only_for_a_plain_hit() -> None:
+    svc = PropertyService()
+    svc._cache = CacheService(redis_url=None)
+    address = "953 Banyan Dr, Delray Beach, FL 33483"
+    assert await svc.cached_property_is_fresh(address) is False
+
+    stale = _base_good_payload()
+    stale["fetched_at"] = (datetime.now(UTC) - timedelta(hours=7)).isoformat()
+    await svc._cache.set_property(address, stale)
+    assert await svc.cached_property_is_fresh(address) is False
+
+    fresh = _base_good_payload()
+    fresh["fetched_at"] = datetime.now(UTC).isoformat()
+    await svc._cache.set_property(address, fresh)
+    assert await svc.cached_property_is_fresh(address) is True
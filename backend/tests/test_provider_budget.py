@@ -0,0 +1,207 @@
+"""
+Tests for fleet-wide provider budgets (app/services/provider_budget.py):
+
+  1. The token bucket refuses calls past its rate, and lower priority classes
+     stop at their reserve while interactive calls may drain it.
+  2. Interactive calls wait for a refill; background calls are refused at once.
+  3. The monthly spend cap is charged per call and honours the same reserves.
+  4. Two workers sharing Redis draw from one bucket.
+  5. ``BaseAPIClient`` refuses a call over budget without calling the
+     provider or counting it as a provider failure.
+  6. Unconfigured providers have no budget.
+"""
+
+import asyncio
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from app.core.config import settings
+from app.services import provider_budget
+from app.services.cache_service import CacheService
+from app.services.concurrency_limiter import Priority, outbound_priority
+from app.services.provider_budget import ProviderBudget, ProviderBudgetExceeded, get_provider_budget
+
+
+class _FakeRedis:
+    """Runs the budget script's rules on in-memory hashes and counters."""
+
+    def __init__(self):
+        self.hashes: dict[str, dict[str, str]] = {}
+        self.counters: dict[str, float] = {}
+
+    async def eval(self, script, numkeys, bucket_key, spend_key, now, rate, burst, reserve, budget, cost, *rest):
+        assert script == provider_budget._CHECK_BUDGET_SCRIPT
+        spend_reserve, charge, _ttl = rest
+        tokens = burst
+        if rate > 0:
+            state = self.hashes.get(bucket_key)
+            if state:
+                tokens = min(burst, float(state["tokens"]) + max(now - float(state["ts"]), 0) * rate)
+            if tokens - 1 < reserve:
+                return [0, str((1 + reserve - tokens) / rate)]
+        if budget > 0 and cost > 0 and self.counters.get(spend_key, 0.0) + cost > budget - spend_reserve:
+            return [0, "-1"]
+        if charge == "1":
+            if rate > 0:
+                self.hashes[bucket_key] = {"tokens": str(tokens - 1), "ts": str(now)}
+            if budget > 0 and cost > 0:
+                self.counters[spend_key] = self.counters.get(spend_key, 0.0) + cost
+        return [1, str(tokens - 1)]
+
+    async def get(self, key):
+        value = self.counters.get(key)
+        return None if value is None else str(value)
+
+
+@pytest.fixture(autouse=True)
+def memory_cache():
+    """Budgets use an in-memory cache unless a test opts into shared Redis."""
+    cache = CacheService(redis_url=None)
+    with patch.object(ProviderBudget, "_cache", staticmethod(lambda: cache)):
+        yield cache
+
+
+@pytest.fixture
+def shared_redis():
+    redis = _FakeRedis()
+    cache = CacheService(redis_url=None)
+    cache.use_redis = True
+    cache.redis_client = redis
+    with patch.object(ProviderBudget, "_cache", staticmethod(lambda: cache)):
+        yield redis
+
+
+@pytest.fixture
+def frozen_clock():
+    """Pin wall-clock time so the bucket does not refill between calls."""
+    with patch("app.services.provider_budget.time.time", return_value=1_700_000_000.0) as clock:
+        yield clock
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Rate
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+async def test_bucket_refuses_calls_past_its_burst(frozen_clock):
+    budget = ProviderBudget("rate", rate_per_second=2)  # burst of 4
+
+    for _ in range(4):
+        await budget.acquire(Priority.INTERACTIVE)
+
+    assert not await budget.has_headroom(Priority.INTERACTIVE)
+    with pytest.raises(ProviderBudgetExceeded):
+        await budget.acquire(Priority.BACKGROUND)
+
+
+async def test_lower_priorities_stop_at_their_reserve(frozen_clock):
+    budget = ProviderBudget("reserve", rate_per_second=5)  # burst of 10
+
+    prefetched = 0
+    while await budget.has_headroom(Priority.PREFETCH):
+        await budget.acquire(Priority.PREFETCH)
+        prefetched += 1
+
+    assert prefetched == 5  # half the bucket is held back from prefetch
+    assert await budget.has_headroom(Priority.BACKGROUND)
+    assert await budget.has_headroom(Priority.INTERACTIVE)
+
+
+async def test_interactive_waits_for_refill_background_does_not():
+    budget = ProviderBudget("wait", rate_per_second=50)  # burst of 100
+    budget._local_bucket = [0.0, provider_budget.time.time()]
+
+    with pytest.raises(ProviderBudgetExceeded) as refused:
+        await budget.acquire(Priority.BACKGROUND)
+    assert refused.value.reason == "rate"
+
+    await asyncio.wait_for(budget.acquire(Priority.INTERACTIVE), timeout=1.0)
+
+
+async def test_acquire_uses_the_context_priority(frozen_clock):
+    budget = ProviderBudget("context", rate_per_second=1)  # burst of 2
+    budget._local_bucket = [1.2, frozen_clock.return_value]
+
+    with outbound_priority(Priority.PREFETCH), pytest.raises(ProviderBudgetExceeded):
+        await budget.acquire()
+    await budget.acquire()  # interactive by default
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Monthly spend
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+async def test_monthly_budget_is_charged_per_call(frozen_clock):
+    budget = ProviderBudget("spend", monthly_budget_usd=1.0, cost_per_request_usd=0.25)
+
+    for _ in range(3):
+        await budget.acquire(Priority.BACKGROUND)  # 0.75 spent; 0.25 reserved
+    with pytest.raises(ProviderBudgetExceeded) as refused:
+        await budget.acquire(Priority.BACKGROUND)
+    assert refused.value.reason == "monthly"
+
+    await budget.acquire(Priority.INTERACTIVE)
+    assert not await budget.has_headroom(Priority.INTERACTIVE)
+    assert (await budget.snapshot())["spent_this_month_usd"] == 1.0
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Shared through Redis
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+async def test_workers_share_one_bucket(shared_redis, frozen_clock):
+    worker_a = ProviderBudget("shared", rate_per_second=1)  # burst of 2
+    worker_b = ProviderBudget("shared", rate_per_second=1)
+
+    await worker_a.acquire(Priority.INTERACTIVE)
+    await worker_a.acquire(Priority.INTERACTIVE)
+
+    assert not await worker_b.has_headroom(Priority.INTERACTIVE)
+    assert float(shared_redis.hashes["budget:rate:shared"]["tokens"]) == 0
+
+
+async def test_shared_spend_is_reported(shared_redis, frozen_clock):
+    budget = ProviderBudget("reported", monthly_budget_usd=10, cost_per_request_usd=0.5)
+    await budget.acquire()
+
+    assert (await budget.snapshot())["spent_this_month_usd"] == 0.5
+    assert shared_redis.counters == {"budget:spend:reported:2023-11": 0.5}
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# BaseAPIClient
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+async def test_client_refuses_over_budget_call_without_sending(dummy_api_client, frozen_clock):
+    sent: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(request)
+        return httpx.Response(200, json={"ok": True})
+
+    client = dummy_api_client(handler, "BudgetDummy", max_retries=1)
+    client.budget = ProviderBudget("BudgetDummy", rate_per_second=1)
+
+    with outbound_priority(Priority.BACKGROUND):
+        assert (await client._make_request("a")).success
+        refused = await client._make_request("b")
+
+    assert not refused.success
+    assert "budget" in refused.error
+    assert len(sent) == 1
+    assert client._failure_count == 0
+    await client.aclose()
+
+
+def test_unconfigured_provider_has_no_budget(monkeypatch):
+    monkeypatch.setattr(settings, "PROVIDER_RATE_LIMITS", "Configured=3")
+    monkeypatch.setattr(provider_budget, "_budgets", {})
+
+    assert get_provider_budget("Unconfigured") is None
+    budget = get_provider_budget("Configured")
+    assert budget is not None and budget.rate == 3
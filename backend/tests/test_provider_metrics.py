@@ -0,0 +1,107 @@
+"""
+Tests for provider call metrics (app/services/provider_metrics.py):
+
+  1. Each attempt is observed by provider, endpoint, status class and attempt,
+     labelled with the job or route that made the call.
+  2. Retries, 429s and circuit-open short-circuits are counted.
+  3. Successful calls are charged at the endpoint price, falling back to the
+     provider's per-request price.
+"""
+
+from typing import Any
+
+import httpx
+import pytest
+from prometheus_client import REGISTRY
+
+from app.core.config import settings
+from app.services import provider_metrics
+from app.services.concurrency_limiter import AdaptiveConcurrencyLimiter
+from app.services.provider_metrics import call_origin, request_scope
+
+
+def _sample(name: str, **labels: str) -> float:
+    return REGISTRY.get_sample_value(name, {"provider": "MetricsDummy", **labels}) or 0.0
+
+
+@pytest.fixture
+async def dummy_client(dummy_api_client, monkeypatch):
+    statuses: list[int] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(statuses.pop(0) if statuses else 200, json={"ok": True})
+
+    async def no_sleep(_seconds: float) -> None:
+        return None
+
+    monkeypatch.setattr("app.services.base_client.asyncio.sleep", no_sleep)
+    client = dummy_api_client(handler, "MetricsDummy", max_retries=3, enable_circuit_breaker=False)
+    client.limiter = AdaptiveConcurrencyLimiter("MetricsDummy", initial_limit=4)
+    return client, statuses
+
+
+async def test_attempts_are_observed_with_their_job_origin(dummy_client):
+    client, statuses = dummy_client
+    statuses.extend([429, 503])
+    labels = {"endpoint": "observed", "origin": "job:metrics_test"}
+    before_ok = _sample("provider_request_duration_seconds_count", status_class="2xx", attempt="3", **labels)
+    before_429 = _sample("provider_rate_limited_total", **labels)
+    before_retry = _sample("provider_retries_total", reason="5xx", **labels)
+
+    with call_origin("job:metrics_test"):
+        result = await client._make_request("observed")
+
+    assert result.success
+    assert (
+        _sample("provider_request_duration_seconds_count", status_class="2xx", attempt="3", **labels) == before_ok + 1
+    )
+    assert _sample("provider_rate_limited_total", **labels) == before_429 + 1
+    assert _sample("provider_retries_total", reason="5xx", **labels) == before_retry + 1
+
+
+def test_origin_is_the_matched_route_template():
+    class _Route:
+        path = "/api/v1/properties/{property_id}/enrichment"
+
+    scope: dict[str, Any] = {"method": "GET"}
+    assert provider_metrics.current_origin() == "other"
+    with request_scope(scope):
+        assert provider_metrics.current_origin() == "unmatched"
+        scope["route"] = _Route()
+        assert provider_metrics.current_origin() == "GET /api/v1/properties/{property_id}/enrichment"
+        with call_origin("job:override"):
+            assert provider_metrics.current_origin() == "job:override"
+
+
+async def test_circuit_open_short_circuits_are_counted(dummy_client):
+    client, _ = dummy_client
+
+    class _OpenBreaker:
+        async def allow(self) -> bool:
+            return False
+
+    client.circuit_breaker = _OpenBreaker()
+    before = _sample("provider_circuit_open_total", endpoint="blocked", origin="other")
+
+    result = await client._make_request("blocked")
+
+    assert not result.success
+    assert _sample("provider_circuit_open_total", endpoint="blocked", origin="other") == before + 1
+
+
+async def test_successful_calls_are_charged_at_the_endpoint_price(dummy_client, monkeypatch):
+    client, statuses = dummy_client
+    monkeypatch.setattr(settings, "PROVIDER_COST_PER_REQUEST_USD", "MetricsDummy=0.01")
+    monkeypatch.setattr(settings, "PROVIDER_ENDPOINT_COSTS_USD", "MetricsDummy:calculator/estimate=0.25")
+    priced = {"endpoint": "calculator/estimate", "origin": "other"}
+    default = {"endpoint": "lookup", "origin": "other"}
+    before_priced = _sample("provider_cost_usd_total", **priced)
+    before_default = _sample("provider_cost_usd_total", **default)
+
+    await client._make_request("calculator/estimate")
+    await client._make_request("lookup")
+    statuses.append(404)
+    await client._make_request("lookup")
+
+    assert _sample("provider_cost_usd_total", **priced) == pytest.approx(before_priced + 0.25)
+    assert _sample("provider_cost_usd_total", **default) == pytest.approx(before_default + 0.01)
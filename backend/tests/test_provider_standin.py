@@ -0,0 +1,151 @@
+"""
+Tests for the offline provider stand-in (scripts/provider_standin.py):
+
+  1. ``FixtureStore.lookup`` answers exact params with their fixture and
+     other params with a deterministic pick among the endpoint's fixtures.
+  2. ``FaultProfile`` injects 429 (with ``Retry-After``), 503 and latency
+     per provider, with ``"default"`` covering the rest.
+  3. Record mode forwards the client's auth headers upstream and saves the
+     response as a fixture, except for 429s.
+"""
+
+import random
+from typing import Any
+
+import httpx
+import pytest
+
+import scripts.provider_standin as standin
+from scripts.provider_standin import FaultProfile, FixtureStore, create_app, params_key
+
+ENDPOINT = "property-details"
+PARAMS = [{"address": f"{n} Main St"} for n in range(1, 4)]
+
+
+@pytest.fixture
+def store(tmp_path) -> FixtureStore:
+    recorded = FixtureStore(tmp_path)
+    for i, params in enumerate(PARAMS):
+        recorded.save("axesso", ENDPOINT, params, 200, {"zpid": i})
+    store = FixtureStore(tmp_path)
+    assert store.load() == len(PARAMS)
+    return store
+
+
+async def _call(app, path: str, **kwargs: Any) -> httpx.Response:
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://standin") as client:
+        return await client.get(path, **kwargs)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# FixtureStore
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+def test_lookup_prefers_the_exact_params(store):
+    for i, params in enumerate(PARAMS):
+        assert store.lookup("axesso", ENDPOINT, params)["body"] == {"zpid": i}
+
+
+def test_lookup_falls_back_to_a_deterministic_pick(store):
+    params = {"address": "99 Elm St"}
+    fixture = store.lookup("axesso", ENDPOINT, params)
+
+    keys = sorted(params_key(p) for p in PARAMS)
+    expected = keys[int(params_key(params), 16) % len(keys)]
+    assert params_key(fixture["params"]) == expected
+    assert store.lookup("axesso", ENDPOINT, dict(params)) is fixture
+    picks = {store.lookup("axesso", ENDPOINT, {"address": f"{n} Elm St"})["body"]["zpid"] for n in range(30)}
+    assert len(picks) > 1
+
+
+def test_lookup_without_fixtures_is_a_miss(store):
+    assert store.lookup("axesso", "other-endpoint", PARAMS[0]) is None
+    assert store.lookup("redfin", ENDPOINT, PARAMS[0]) is None
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# FaultProfile
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+def test_injected_status_follows_the_provider_rates():
+    faults = FaultProfile(
+        {"default": {"error_rate": 1.0}, "axesso": {"rate_limit_rate": 1.0}, "redfin": {"error_rate": 0.0}},
+        random.Random(1),
+    )
+
+    assert faults.injected_status("axesso") == 429
+    assert faults.injected_status("rentcast") == 503
+    assert faults.injected_status("redfin") is None
+
+
+def test_latency_distributions():
+    faults = FaultProfile(
+        {
+            "default": {"latency": {"ms": 120}},
+            "axesso": {"latency": {"dist": "uniform", "min_ms": 400, "max_ms": 800}},
+            "redfin": {"latency": {"dist": "lognormal", "median_ms": 250, "sigma": 0.5}},
+        },
+        random.Random(1),
+    )
+
+    assert faults.latency_seconds("rentcast") == 0.12
+    assert all(0.4 <= faults.latency_seconds("axesso") <= 0.8 for _ in range(50))
+    assert all(faults.latency_seconds("redfin") > 0 for _ in range(50))
+    assert FaultProfile({}, random.Random(1)).latency_seconds("axesso") == 0
+
+
+async def test_served_faults(store):
+    app = create_app(
+        store,
+        faults=FaultProfile({"axesso": {"rate_limit_rate": 1.0}, "redfin": {"error_rate": 1.0}}, random.Random(1)),
+    )
+
+    rate_limited = await _call(app, f"/axesso/{ENDPOINT}", params=PARAMS[0])
+    assert rate_limited.status_code == 429
+    assert rate_limited.headers["retry-after"] == "1"
+    assert (await _call(app, f"/redfin/{ENDPOINT}", params=PARAMS[0])).status_code == 503
+
+    clean = create_app(store, faults=FaultProfile({}, random.Random(1)))
+    response = await _call(clean, f"/axesso/{ENDPOINT}", params=PARAMS[1])
+    assert response.status_code == 200
+    assert response.json() == {"zpid": 1}
+    assert (await _call(clean, "/axesso/unknown", params=PARAMS[1])).status_code == 404
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Record mode
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+async def test_record_mode_forwards_and_saves(tmp_path, monkeypatch):
+    seen: list[httpx.Request] = []
+    upstream = {"status": 200}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(upstream["status"], json={"zpid": 42})
+
+    real_client = httpx.AsyncClient
+    monkeypatch.setattr(standin, "upstream_urls", lambda: {"axesso": "https://axesso.example/"})
+    with monkeypatch.context() as patch:
+        # Only the upstream client, which create_app opens up front.
+        patch.setattr(httpx, "AsyncClient", lambda **kwargs: real_client(transport=httpx.MockTransport(handler)))
+        app = create_app(FixtureStore(tmp_path), record=True)
+
+    response = await _call(app, f"/axesso/{ENDPOINT}", params=PARAMS[0], headers={"X-Api-Key": "secret"})
+
+    assert response.status_code == 200
+    assert response.json() == {"zpid": 42}
+    assert str(seen[0].url.copy_with(query=None)) == f"https://axesso.example/{ENDPOINT}"
+    assert dict(seen[0].url.params) == PARAMS[0]
+    assert seen[0].headers["x-api-key"] == "secret"
+    replay = FixtureStore(tmp_path)
+    assert replay.load() == 1
+    assert replay.lookup("axesso", ENDPOINT, PARAMS[0])["body"] == {"zpid": 42}
+
+    upstream["status"] = 429
+    assert (await _call(app, f"/axesso/{ENDPOINT}", params=PARAMS[1])).status_code == 429
+    assert FixtureStore(tmp_path).load() == 1
+    assert (await _call(app, "/unknown/endpoint")).status_code == 404
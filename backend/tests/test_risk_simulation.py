@@ -0,0 +1,115 @@
+"""
+Tests for Monte Carlo deal-risk simulation (app/services/risk_simulation.py):
+
+  1. A seed reproduces a run exactly; the seed used is echoed back.
+  2. Driver draws follow DRIVER_CORRELATION.
+  3. The vectorized IRR matches known cash-flow IRRs and is NaN when undefined.
+  4. Tail metrics are consistent with the outcome distribution.
+  5. Shocked inputs stay within calculator bounds at the schema's limits;
+     calculator input errors surface as a 400.
+"""
+
+import numpy as np
+import pytest
+from fastapi import HTTPException
+
+from app.routers import analytics as analytics_router
+from app.schemas.analytics import RiskSimulationInput
+from app.schemas.property import AllAssumptions
+from app.services.calculators import CalculationInputError
+from app.services.risk_simulation import DRIVER_CORRELATION, draw_drivers, irr_bisection, simulate_deal_risk
+
+
+def _input(**overrides) -> RiskSimulationInput:
+    return RiskSimulationInput(
+        **{
+            "purchase_price": 400_000,
+            "monthly_rent": 2_800,
+            "property_taxes": 5_000,
+            "average_daily_rate": 220,
+            "occupancy_rate": 0.65,
+            "paths": 2_000,
+            "seed": 11,
+            **overrides,
+        }
+    )
+
+
+def test_seed_reproduces_the_run():
+    first = simulate_deal_risk(_input(), AllAssumptions())
+    second = simulate_deal_risk(_input(), AllAssumptions())
+    other = simulate_deal_risk(_input(seed=12), AllAssumptions())
+
+    assert first.seed == 11
+    assert first == second
+    assert other.strategies["ltr"].distribution != first.strategies["ltr"].distribution
+    assert simulate_deal_risk(_input(seed=None), AllAssumptions()).seed >= 0
+
+
+def test_driver_draws_follow_the_correlation_matrix():
+    draws = draw_drivers(50_000, seed=3)
+    sample = np.corrcoef(np.column_stack(list(draws.values())), rowvar=False)
+    assert np.abs(sample - DRIVER_CORRELATION).max() < 0.02
+
+
+def test_irr_bisection():
+    flows = np.array(
+        [
+            [-1000.0, 0.0, 1210.0],  # 10%
+            [-1000.0, 100.0, 1100.0],  # 10%
+            [-1000.0, 500.0, 500.0],  # 0%
+            [500.0, 100.0, 100.0],  # no cash invested: undefined
+        ]
+    )
+    irr = irr_bisection(flows)
+    assert irr[:3] == pytest.approx([0.10, 0.10, 0.0], abs=1e-9)
+    assert np.isnan(irr[3])
+
+
+def test_result_shape_and_tail_metrics():
+    result = simulate_deal_risk(_input(strategies=["ltr", "flip"]), AllAssumptions())
+
+    assert set(result.strategies) == {"ltr", "flip"}
+    ltr = result.strategies["ltr"]
+    p = ltr.distribution.percentiles
+    assert list(p) == ["p5", "p10", "p25", "p50", "p75", "p90", "p95"]
+    assert p["p5"] <= p["p50"] <= p["p95"]
+    assert 0 <= ltr.probability_negative <= 1
+    assert ltr.value_at_risk_95 == max(0.0, -p["p5"])
+    assert ltr.expected_shortfall_95 >= ltr.value_at_risk_95
+    assert ltr.irr is not None
+    assert result.strategies["flip"].metric == "net_profit"
+    assert result.strategies["flip"].irr is None
+
+
+def test_str_is_skipped_without_an_adr():
+    result = simulate_deal_risk(_input(average_daily_rate=None), AllAssumptions())
+    assert "str" not in result.strategies
+
+
+@pytest.mark.parametrize(
+    "overrides",
+    [
+        {"purchase_price": 100_000_000},
+        {"monthly_rent": 1_000_000, "average_daily_rate": 100_000},
+        {"arv": 100_000_000, "rehab_cost": 10_000_000},
+    ],
+)
+def test_shocks_at_schema_limits_stay_within_calculator_bounds(overrides):
+    result = simulate_deal_risk(_input(**overrides), AllAssumptions())
+    assert set(result.strategies) == {"ltr", "str", "flip"}
+
+
+async def test_calculation_input_error_is_a_bad_request(monkeypatch):
+    async def assumptions(*args, **kwargs):
+        return AllAssumptions()
+
+    def reject(*args):
+        raise CalculationInputError("Purchase price exceeds maximum of $100,000,000")
+
+    monkeypatch.setattr(analytics_router, "resolve_assumptions", assumptions)
+    monkeypatch.setattr(analytics_router, "simulate_deal_risk", reject)
+
+    with pytest.raises(HTTPException) as exc:
+        await analytics_router.simulate_risk(_input(), db=None)
+    assert exc.value.status_code == 400
@@ -0,0 +1,220 @@
+"""
+Tests for request-scoped deadlines (app/services/deadline.py) and partial
+property search results:
+
+  1. Nested deadlines only tighten; ``no_deadline`` lifts them.
+  2. ``BaseAPIClient`` cuts a request at the deadline, does not start a retry
+     backoff that would overrun it, and leaves the circuit breaker alone.
+  3. ``@resilient`` stops retrying at the deadline.
+  4. An interactive cold search answers at the deadline with the providers
+     that arrived, flagged partial; the late provider still finishes and the
+     cached property is completed in the background.
+  5. A search waiting on another worker's lock stops waiting at the deadline
+     and answers from cached provider payloads, without fetching or caching.
+  6. Bulk searches wait for every provider.
+"""
+
+import asyncio
+from datetime import UTC, datetime
+from typing import Any
+
+import httpx
+import pytest
+
+from app.core.config import settings
+from app.services import deadline
+from app.services.cache_service import CacheService
+from app.services.concurrency_limiter import AdaptiveConcurrencyLimiter, Priority, outbound_priority
+from app.services.property_service import PropertyService
+from app.services.resilience import resilient
+from app.services.single_flight import SingleFlight
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Deadline scopes
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+def test_nested_deadlines_only_tighten():
+    assert deadline.remaining() is None
+
+    with deadline.deadline_after(1.0):
+        with deadline.deadline_after(60.0):
+            assert deadline.remaining() <= 1.0
+        with deadline.deadline_after(0.5):
+            assert deadline.remaining() <= 0.5
+            assert not deadline.allows(0.5)
+            with deadline.no_deadline():
+                assert deadline.remaining() is None
+                assert deadline.allows(60.0)
+        assert not deadline.expired()
+
+    assert deadline.remaining() is None
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# BaseAPIClient / @resilient
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+@pytest.fixture
+async def dummy_client(dummy_api_client):
+    upstream = {"delay": 0.0, "status": 200, "calls": 0}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        upstream["calls"] += 1
+        await asyncio.sleep(upstream["delay"])
+        return httpx.Response(upstream["status"], json={"ok": True})
+
+    client = dummy_api_client(handler, "DeadlineDummy", max_retries=3)
+    client.limiter = AdaptiveConcurrencyLimiter("DeadlineDummy", initial_limit=4)
+    return client, upstream
+
+
+async def test_slow_request_is_cut_at_the_deadline(dummy_client):
+    client, upstream = dummy_client
+    upstream["delay"] = 1.0
+
+    with deadline.deadline_after(0.05):
+        result = await asyncio.wait_for(client._make_request("slow"), timeout=0.5)
+
+    assert not result.success
+    assert "deadline" in result.error
+    assert client._failure_count == 0
+    assert client.limiter.in_flight == 0
+
+
+async def test_expired_deadline_sends_nothing(dummy_client):
+    client, upstream = dummy_client
+
+    with deadline.deadline_after(0.01):
+        await asyncio.sleep(0.02)
+        result = await client._make_request("late")
+
+    assert not result.success
+    assert upstream["calls"] == 0
+
+
+async def test_no_retry_backoff_past_the_deadline(dummy_client):
+    client, upstream = dummy_client
+    upstream["status"] = 503
+
+    with deadline.deadline_after(0.5):
+        result = await asyncio.wait_for(client._make_request("flaky"), timeout=0.5)
+
+    assert result.status_code == 503  # the 1s backoff would overrun the deadline
+    assert upstream["calls"] == 1
+
+
+async def test_resilient_stops_retrying_at_the_deadline():
+    calls = 0
+
+    @resilient(name="deadline-test", max_attempts=3, circuit_breaker_threshold=100)
+    async def flaky() -> None:
+        nonlocal calls
+        calls += 1
+        raise RuntimeError("down")
+
+    with deadline.deadline_after(0.1), pytest.raises(RuntimeError):
+        await flaky()
+
+    assert calls == 1
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# PropertyService partial results
+# ─────────────────────────────────────────────────────────────────────────────
+
+ADDRESS = "953 Banyan Dr, Delray Beach, FL 33483"
+
+
+@pytest.fixture
+def service(monkeypatch) -> tuple[PropertyService, dict[str, Any]]:
+    svc = PropertyService()
+    svc._cache = CacheService(redis_url=None)
+    svc._search_flight = SingleFlight(svc._cache)
+    state: dict[str, Any] = {"calls": {}, "builds": [], "redfin_delay": 0.3}
+
+    def fake_provider(name, result, delay_key=None):
+        async def fetch(*args, **kwargs):
+            state["calls"][name] = state["calls"].get(name, 0) + 1
+            if delay_key:
+                await asyncio.sleep(state[delay_key])
+            return result
+
+        return fetch
+
+    async def fixed_insurance_pct() -> float:
+        return 0.01
+
+    async def fake_build(address, payloads, *, zpid, insurance_pct, timings, preview=False):
+        state["builds"].append(payloads)
+        return svc.get_mock_property(), None
+
+    monkeypatch.setattr(settings, "PROPERTY_SEARCH_DEADLINE_SECONDS", 0.05)
+    monkeypatch.setattr(svc, "_resolve_insurance_pct", fixed_insurance_pct)
+    monkeypatch.setattr(svc, "_build_property_response", fake_build)
+    monkeypatch.setattr(svc, "_fetch_rentcast_provider", fake_provider("rentcast", ({"price": 1}, 5.0)))
+    monkeypatch.setattr(svc, "_fetch_zillow_provider", fake_provider("axesso", ({"zpid": "1"}, "1", 5.0)))
+    monkeypatch.setattr(
+        svc, "_fetch_redfin_provider", fake_provider("redfin", ({"redfin_estimate": 1}, 300.0), "redfin_delay")
+    )
+    monkeypatch.setattr(svc, "_fetch_realtor_provider", fake_provider("realtor", ({"realtor_estimate": 1}, 5.0)))
+    monkeypatch.setattr(svc, "_fetch_mashvisor_provider", fake_provider("mashvisor", ({"str_adr": 1}, 5.0)))
+    return svc, state
+
+
+async def test_interactive_search_returns_partial_at_the_deadline(service):
+    svc, state = service
+
+    response = await asyncio.wait_for(svc.search_property(ADDRESS), timeout=0.2)
+
+    assert response.data_quality.is_partial
+    assert response.data_quality.pending_sources == ["redfin"]
+    assert state["builds"][0].redfin is None
+    assert state["builds"][0].axesso == {"zpid": "1"}
+    cached = await svc._cache.get_property(ADDRESS)
+    assert cached["data_quality"]["is_partial"]
+
+
+async def test_late_provider_completes_the_cached_property(service):
+    svc, state = service
+    await svc.search_property(ADDRESS)
+
+    completion = svc._search_flight._inflight[f"complete:{CacheService.property_key(ADDRESS)}"]
+    await asyncio.wait_for(completion, timeout=1.0)
+
+    assert state["builds"][-1].redfin == {"redfin_estimate": 1}
+    assert not state["builds"][-1].pending
+    assert state["calls"] == {"rentcast": 1, "axesso": 1, "redfin": 1, "realtor": 1, "mashvisor": 1}
+    cached = await svc._cache.get_property(ADDRESS)
+    assert not cached["data_quality"]["is_partial"]
+
+
+async def test_lock_loser_stops_waiting_at_the_deadline(service):
+    svc, state = service
+    assert await svc._cache.acquire_lock(f"lock:{CacheService.property_key(ADDRESS)}", 60) is not None
+    await svc._cache.set(
+        svc._provider_payload_key("rentcast", ADDRESS),
+        {"payload": [{"price": 1}], "fetched_at": datetime.now(UTC).isoformat()},
+        3600,
+    )
+
+    response = await asyncio.wait_for(svc.search_property(ADDRESS), timeout=0.5)
+
+    assert response.data_quality.is_partial
+    assert response.data_quality.pending_sources == ["axesso", "mashvisor", "realtor", "redfin"]
+    assert state["builds"][0].rentcast == {"price": 1}
+    assert state["calls"] == {}
+    assert await svc._cache.get_property(ADDRESS) is None
+
+
+async def test_bulk_search_waits_for_every_provider(service):
+    svc, state = service
+    state["redfin_delay"] = 0.1
+
+    with outbound_priority(Priority.BULK):
+        response = await svc.search_property(ADDRESS)
+
+    assert not response.data_quality.is_partial
+    assert state["builds"][0].redfin == {"redfin_estimate": 1}
+    assert len(state["builds"]) == 1
@@ -0,0 +1,144 @@
+"""
+Tests for vectorized sensitivity grids (app/services/sensitivity_grid.py):
+
+  1. Every cell of the cube equals the scalar calculator run on that cell's
+     inputs, built by the same assumption_resolver builders.
+  2. Price-derived inputs (insurance, STR maintenance, flip ARV) follow the
+     price axis.
+  3. Mashvisor monthly STR revenue scales with the ADR and occupancy axes.
+  4. Unknown, repeated and zero-baseline variables are rejected; STR is
+     skipped for a property without an ADR.
+"""
+
+from datetime import UTC, datetime
+from itertools import product
+
+import pytest
+from pydantic import ValidationError
+
+from app.schemas.property import (
+    Address,
+    AllAssumptions,
+    DataQuality,
+    MarketData,
+    PropertyDetails,
+    PropertyResponse,
+    ProvenanceMap,
+    RentalData,
+    SensitivityRequest,
+    StrategyType,
+    STRMarketStats,
+    ValuationData,
+)
+from app.services.assumption_resolver import build_flip_params, build_ltr_params, build_str_params
+from app.services.calculators import calculate_flip, calculate_ltr, calculate_str
+from app.services.sensitivity_grid import compute_sensitivity_grid, grid_to_lists
+
+
+def _property(**rentals) -> PropertyResponse:
+    return PropertyResponse(
+        property_id="grid-test",
+        address=Address(street="1 Main St", city="Austin", state="TX", zip_code="78701", full_address="1 Main St"),
+        details=PropertyDetails(),
+        valuations=ValuationData(current_value_avm=400_000),
+        rentals=RentalData(**{"monthly_rent_ltr": 2600, **rentals}),
+        market=MarketData(property_taxes_annual=5200, hoa_fees_monthly=40),
+        provenance=ProvenanceMap(),
+        data_quality=DataQuality(completeness_score=90),
+        fetched_at=datetime.now(UTC),
+    )
+
+
+PRICE_PCTS = [-0.1, 0.0, 0.1]
+RATE_PCTS = [-0.2, 0.0, 0.2]
+RENT_PCTS = [-0.05, 0.05]
+
+
+def test_grid_cells_match_scalar_calculators():
+    prop = _property(average_daily_rate=210, occupancy_rate=0.7)
+    assumptions = AllAssumptions()
+    base_rate = assumptions.financing.interest_rate
+
+    grid = compute_sensitivity_grid(
+        prop,
+        assumptions,
+        [("purchase_price", PRICE_PCTS), ("interest_rate", RATE_PCTS), ("monthly_rent", RENT_PCTS)],
+    )
+
+    assert grid.shape == (3, 3, 2)
+    assert set(grid.metrics) == {"ltr_cash_flow", "ltr_coc", "str_cash_flow", "str_coc", "flip_profit", "flip_roi"}
+    for (i, p), (j, r), (k, m) in product(enumerate(PRICE_PCTS), enumerate(RATE_PCTS), enumerate(RENT_PCTS)):
+        price, rate, rent = 400_000 * (1 + p), base_rate * (1 + r), 2600 * (1 + m)
+        ltr = calculate_ltr(**{**build_ltr_params(assumptions, price, rent, 5200, 40), "interest_rate": rate})
+        str_ = calculate_str(**{**build_str_params(assumptions, price, 210, 0.7, 5200, 40), "interest_rate": rate})
+        flip = calculate_flip(**build_flip_params(assumptions, price, price * 1.06, 5200), hoa_monthly=40)
+        assert grid.metrics["ltr_cash_flow"][i, j, k] == ltr["annual_cash_flow"]
+        assert grid.metrics["ltr_coc"][i, j, k] == ltr["cash_on_cash_return"]
+        assert grid.metrics["str_cash_flow"][i, j, k] == str_["annual_cash_flow"]
+        assert grid.metrics["flip_profit"][i, j, k] == flip["net_profit_before_tax"]
+
+
+def test_single_variable_sweep_and_strategy_filter():
+    grid = compute_sensitivity_grid(
+        _property(),
+        AllAssumptions(),
+        [("monthly_rent", [-0.1, 0.0, 0.1])],
+        strategies=[StrategyType.LONG_TERM_RENTAL, StrategyType.SHORT_TERM_RENTAL],
+    )
+
+    assert grid.axes[0].baseline_value == 2600
+    assert grid.axes[0].values.tolist() == [2600 * 0.9, 2600.0, 2600 * 1.1]
+    # No ADR on the property: STR is skipped, flip was not requested.
+    assert set(grid.metrics) == {"ltr_cash_flow", "ltr_coc"}
+    cash_flow = grid_to_lists(grid.metrics["ltr_cash_flow"])
+    assert cash_flow[0] < cash_flow[1] < cash_flow[2]
+
+
+def test_mashvisor_revenue_follows_adr_and_occupancy_axes():
+    prop = _property(
+        average_daily_rate=210, occupancy_rate=0.7, str_market_stats=STRMarketStats(monthly_revenue_per_bed=4800)
+    )
+    assumptions = AllAssumptions()
+    adr_pcts, occupancy_pcts = [-0.1, 0.0, 0.1], [-0.1, 0.0, 0.1]
+
+    grid = compute_sensitivity_grid(
+        prop,
+        assumptions,
+        [("average_daily_rate", adr_pcts), ("occupancy_rate", occupancy_pcts)],
+        strategies=[StrategyType.SHORT_TERM_RENTAL],
+    )
+
+    cash_flow = grid.metrics["str_cash_flow"]
+    assert cash_flow[0, 1] < cash_flow[1, 1] < cash_flow[2, 1]
+    assert cash_flow[1, 0] < cash_flow[1, 1] < cash_flow[1, 2]
+    for (i, a), (j, o) in product(enumerate(adr_pcts), enumerate(occupancy_pcts)):
+        adr, occupancy = 210 * (1 + a), 0.7 * (1 + o)
+        str_ = calculate_str(
+            **build_str_params(assumptions, 400_000, adr, occupancy, 5200, 40),
+            monthly_revenue_override=4800 * (1 + a) * (1 + o),
+        )
+        assert cash_flow[i, j] == pytest.approx(str_["annual_cash_flow"])
+
+
+@pytest.mark.parametrize(
+    ("axes", "message"),
+    [
+        ([("lot_size", [0.1])], "Unknown variable"),
+        ([("monthly_rent", [0.1]), ("monthly_rent", [0.2])], "more than once"),
+        ([("average_daily_rate", [0.1])], "No baseline"),
+    ],
+)
+def test_invalid_axes_are_rejected(axes, message):
+    with pytest.raises(ValueError, match=message):
+        compute_sensitivity_grid(_property(), AllAssumptions(), axes)
+
+
+def test_request_requires_a_variable_or_grid():
+    with pytest.raises(ValidationError, match="either variable or grid"):
+        SensitivityRequest(property_id="p", assumptions=AllAssumptions())
+    request = SensitivityRequest(
+        property_id="p",
+        assumptions=AllAssumptions(),
+        grid=[{"variable": "purchase_price"}, {"variable": "interest_rate", "range_pct": [-0.1, 0.1]}],
+    )
+    assert [axis.variable for axis in request.grid] == ["purchase_price", "interest_rate"]
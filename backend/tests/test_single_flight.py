@@ -0,0 +1,180 @@
+"""
+Tests for single-flight coalescing of concurrent property-search misses:
+
+  1. ``SingleFlight.do`` — concurrent callers of one key share one run.
+  2. ``SingleFlight.do_exclusive`` — a worker that loses the cross-worker
+     lock waits for the holder's cached result, and fetches locally when
+     the holder releases without producing one; past the request deadline
+     it answers with ``on_deadline`` instead.
+  3. ``PropertyService.search_property`` — a burst of cold searches for the
+     same address hits the providers exactly once.
+"""
+
+import asyncio
+
+import pytest
+
+from app.services import deadline
+from app.services.cache_service import CacheService
+from app.services.property_service import PropertyService, ProviderPayloads
+from app.services.single_flight import SingleFlight
+
+# ─────────────────────────────────────────────────────────────────────────────
+# SingleFlight primitives
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+async def test_concurrent_callers_share_one_execution():
+    flight = SingleFlight()
+    calls = 0
+
+    async def work() -> str:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return "result"
+
+    results = await asyncio.gather(*(flight.do("k", work) for _ in range(5)))
+    assert results == ["result"] * 5
+    assert calls == 1
+    assert not flight.in_flight("k")
+
+
+async def test_failure_propagates_to_every_waiter_and_is_not_cached():
+    flight = SingleFlight()
+
+    async def boom() -> str:
+        await asyncio.sleep(0.01)
+        raise RuntimeError("provider down")
+
+    results = await asyncio.gather(*(flight.do("k", boom) for _ in range(3)), return_exceptions=True)
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+    async def ok() -> str:
+        return "recovered"
+
+    assert await flight.do("k", ok) == "recovered"
+
+
+async def test_cancelled_waiter_does_not_cancel_shared_work():
+    flight = SingleFlight()
+
+    async def work() -> str:
+        await asyncio.sleep(0.02)
+        return "done"
+
+    first = asyncio.ensure_future(flight.do("k", work))
+    second = asyncio.ensure_future(flight.do("k", work))
+    await asyncio.sleep(0)
+    first.cancel()
+    assert await second == "done"
+
+
+async def test_lock_loser_waits_for_holder_result():
+    cache = CacheService(redis_url=None)
+    flight = SingleFlight(cache, poll_interval_seconds=0.01, wait_timeout_seconds=1.0)
+    token = await cache.acquire_lock("lock:k", 30)
+    assert token is not None
+
+    async def holder_finishes() -> None:
+        await asyncio.sleep(0.03)
+        await cache.set("k", "from-peer")
+        await cache.release_lock("lock:k", token)
+
+    async def local_fetch() -> str:
+        return "local"
+
+    holder = asyncio.ensure_future(holder_finishes())
+    result = await flight.do_exclusive("k", local_fetch, poll=lambda: cache.get("k"))
+    await holder
+    assert result == "from-peer"
+
+
+async def test_lock_loser_fetches_locally_when_holder_gives_up():
+    cache = CacheService(redis_url=None)
+    flight = SingleFlight(cache, poll_interval_seconds=0.01, wait_timeout_seconds=1.0)
+    token = await cache.acquire_lock("lock:k", 30)
+
+    async def holder_fails() -> None:
+        await asyncio.sleep(0.03)
+        await cache.release_lock("lock:k", token)
+
+    async def local_fetch() -> str:
+        return "local"
+
+    holder = asyncio.ensure_future(holder_fails())
+    result = await flight.do_exclusive("k", local_fetch, poll=lambda: cache.get("k"))
+    await holder
+    assert result == "local"
+
+
+async def test_lock_loser_stops_polling_at_the_request_deadline():
+    cache = CacheService(redis_url=None)
+    flight = SingleFlight(cache, poll_interval_seconds=0.01, wait_timeout_seconds=30.0)
+    await cache.acquire_lock("lock:k", 30)
+
+    async def local_fetch() -> str:
+        return "local"
+
+    async def fallback() -> str:
+        return "fallback" if deadline.expired() else "early"
+
+    with deadline.deadline_after(0.05):
+        result = await asyncio.wait_for(
+            flight.do_exclusive("k", local_fetch, poll=lambda: cache.get("k"), on_deadline=fallback), 0.5
+        )
+    assert result == "fallback"
+
+    with deadline.deadline_after(0.05):
+        result = await asyncio.wait_for(flight.do_exclusive("k", local_fetch, poll=lambda: cache.get("k")), 0.5)
+    assert result == "local"
+
+
+async def test_release_lock_requires_owner_token():
+    cache = CacheService(redis_url=None)
+    token = await cache.acquire_lock("lock:k", 30)
+    assert await cache.acquire_lock("lock:k", 30) is None
+    assert await cache.release_lock("lock:k", "not-the-owner") is False
+    assert await cache.release_lock("lock:k", token) is True
+    assert await cache.acquire_lock("lock:k", 30) is not None
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# PropertyService integration
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+@pytest.fixture
+def service(monkeypatch) -> PropertyService:
+    svc = PropertyService()
+    svc._cache = CacheService(redis_url=None)
+    svc._search_flight = SingleFlight(svc._cache)
+
+    async def fixed_insurance_pct() -> float:
+        return 0.01
+
+    monkeypatch.setattr(svc, "_resolve_insurance_pct", fixed_insurance_pct)
+    return svc
+
+
+async def test_burst_of_cold_searches_fetches_providers_once(service, monkeypatch):
+    fetches = 0
+
+    async def fake_fetch(address, zpid, timings, refetch=frozenset(), max_age_seconds=None):
+        nonlocal fetches
+        fetches += 1
+        await asyncio.sleep(0.02)
+        return ProviderPayloads()
+
+    async def fake_build(address, payloads, *, zpid, insurance_pct, timings):
+        return service.get_mock_property(), None
+
+    monkeypatch.setattr(service, "_fetch_provider_payloads", fake_fetch)
+    monkeypatch.setattr(service, "_build_property_response", fake_build)
+
+    address = "953 Banyan Dr, Delray Beach, FL 33483"
+    variants = [address, address.upper(), f"  {address}, USA"]
+    results = await asyncio.gather(*(service.search_property(a) for a in variants * 3))
+
+    assert fetches == 1
+    assert len({id(r) for r in results}) == 1
@@ -0,0 +1,173 @@
+"""
+Tests for hedged AXESSO requests (app/services/zillow_client.py):
+
+  1. A primary slower than the observed p90 is hedged on the secondary key;
+     the first success wins and the other request is cancelled.
+  2. No hedge while the primary is fast, before enough latency samples, for
+     non-interactive priorities, or once the hedge budget is spent.
+  3. When both keys fail the primary's failure is returned and the
+     secondary is not retried a second time.
+  4. The 502/503 fallback sends the secondary key per request instead of
+     swapping the client's key under concurrent callers.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from app.services.concurrency_limiter import AdaptiveConcurrencyLimiter, Priority, outbound_priority
+from app.services.zillow_client import RequestHedger, ZillowClient
+
+
+class _Upstream:
+    """Mock AXESSO: per-key latency and status, records which keys were called."""
+
+    def __init__(self):
+        self.delay = {"primary": 0.0, "secondary": 0.0}
+        self.status = {"primary": 200, "secondary": 200}
+        self.calls: list[str] = []
+        self.cancelled: list[str] = []
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        key = request.headers["axesso-api-key"]
+        self.calls.append(key)
+        try:
+            await asyncio.sleep(self.delay[key])
+        except asyncio.CancelledError:
+            self.cancelled.append(key)
+            raise
+        return httpx.Response(self.status[key], json={"zpid": "1", "key": key})
+
+
+@pytest.fixture
+async def hedged_client():
+    upstream = _Upstream()
+    client = ZillowClient(api_key="primary", fallback_api_key="secondary", hedge_requests=True)
+    client.max_retries = 1
+    client.circuit_breaker = None
+    client.limiter = AdaptiveConcurrencyLimiter("AXESSO-test", initial_limit=8)
+    client._http_client = httpx.AsyncClient(transport=httpx.MockTransport(upstream.handler))
+    client._http_client_loop = asyncio.get_running_loop()
+    yield client, upstream
+    await client.aclose()
+
+
+def _prime(hedger: RequestHedger, latency: float = 0.01, tokens: float = 1.0) -> None:
+    for _ in range(hedger.min_samples):
+        hedger.record_latency(latency)
+    hedger._tokens = tokens - hedger.budget_ratio  # on_request adds one increment back
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Hedging
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+async def test_slow_primary_is_hedged_and_secondary_wins(hedged_client):
+    client, upstream = hedged_client
+    _prime(client.hedger)
+    upstream.delay["primary"] = 1.0
+
+    result = await asyncio.wait_for(client.search_by_address("1 Main St"), timeout=0.5)
+    await asyncio.sleep(0)
+
+    assert result.success
+    assert result.data["key"] == "secondary"
+    assert upstream.calls == ["primary", "secondary"]
+    assert upstream.cancelled == ["primary"]
+    stats = client.get_health_status()["hedging"]
+    assert stats["hedged"] == 1
+    assert stats["hedge_wins"] == 1
+    assert stats["win_rate"] == 1.0
+
+
+async def test_primary_still_wins_if_it_answers_first(hedged_client):
+    client, upstream = hedged_client
+    _prime(client.hedger)
+    upstream.delay["primary"] = 0.05
+    upstream.delay["secondary"] = 1.0
+
+    result = await client.search_by_address("1 Main St")
+
+    assert result.data["key"] == "primary"
+    assert client.hedger.hedged == 1
+    assert client.hedger.hedge_wins == 0
+
+
+async def test_fast_primary_is_not_hedged(hedged_client):
+    client, upstream = hedged_client
+    _prime(client.hedger, latency=0.5)
+
+    result = await client.search_by_address("1 Main St")
+
+    assert result.data["key"] == "primary"
+    assert upstream.calls == ["primary"]
+    assert client.hedger.hedged == 0
+
+
+async def test_no_hedge_before_enough_samples(hedged_client):
+    client, upstream = hedged_client
+    upstream.delay["primary"] = 0.05
+
+    await client.search_by_address("1 Main St")
+
+    assert upstream.calls == ["primary"]
+    assert len(client.hedger._latencies) == 1
+
+
+async def test_bulk_requests_are_not_hedged(hedged_client):
+    client, upstream = hedged_client
+    _prime(client.hedger)
+    upstream.delay["primary"] = 0.05
+
+    with outbound_priority(Priority.BULK):
+        await client.search_by_address("1 Main St")
+
+    assert upstream.calls == ["primary"]
+    assert client.hedger.requests == 0
+
+
+async def test_hedge_budget_caps_extra_calls(hedged_client):
+    client, upstream = hedged_client
+    _prime(client.hedger, tokens=0.0)
+    upstream.delay["primary"] = 0.05
+
+    await client.search_by_address("1 Main St")
+
+    assert upstream.calls == ["primary"]
+    assert client.hedger.over_budget == 1
+
+
+async def test_both_failing_returns_primary_failure_once(hedged_client):
+    client, upstream = hedged_client
+    _prime(client.hedger)
+    upstream.delay["primary"] = 0.05
+    upstream.status = {"primary": 503, "secondary": 401}
+
+    result = await client.search_by_address("1 Main St")
+
+    assert not result.success
+    assert result.status_code == 503
+    assert sorted(upstream.calls) == ["primary", "secondary"]
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Fallback key
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+async def test_fallback_key_does_not_leak_to_concurrent_requests(hedged_client):
+    client, upstream = hedged_client
+    client.hedger = None
+    upstream.status["primary"] = 503
+    upstream.delay["secondary"] = 0.05
+
+    failing = asyncio.create_task(client.search_by_address("1 Main St"))
+    await asyncio.sleep(0.02)  # fallback on the secondary key is now in flight
+    upstream.status["primary"] = 200
+    other = await client.search_by_address("2 Main St")
+
+    assert (await failing).data["key"] == "secondary"
+    assert other.data["key"] == "primary"
+    assert client.api_key == "primary"